@@ -482,7 +482,7 @@ theorem slotCount_add_one_le_capOf_of_not_forbidden (dupAllowed : Code → Bool)
 
 /-- One step of the multi-slot fold: choose this slot's result value given the
 already-assigned prefix and the later slots' current values. Mirrors the body
-of the `for slot in _ordered_slots()` loop in `pick_loadout`:
+of the `for slot in ordered_slots()` loop in `pick_loadout`:
 * no feasible candidate → keep the slot as-is;
 * empty slot → fill with the argmax ONLY at a strictly positive score;
 * filled slot → swap to the argmax only on a STRICT score improvement. -/
@@ -821,7 +821,7 @@ theorem pickSlotStep_empty_zero_stays_empty (dupAllowed : Code → Bool) (inv :
 
 /-- **Property 4 (Determinism)**: `pickLoadout` is a pure function of its
 inputs. The fold is deterministic by construction — no dict iteration, no
-nondeterministic ordering. The Python `_ordered_slots()` helper produces the
+nondeterministic ordering. The Python `ordered_slots()` helper produces the
 SORTED slot list once; this theorem is the Lean-side guarantee that the
 modeled fold ALONE determines the output (no hidden state). -/
 theorem pickLoadout_deterministic
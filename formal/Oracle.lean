@@ -371,7 +371,7 @@ abstract `skillEffect : Item → Int` keyed by item code — binding the abstrac
 Gather benefit to the per-item integer the live Python `gather_score` returns.
 The 15th int (`isUtilityFill`, 0/1) flags the artifact-type utility-fill items
 whose Gather benefit is the flat utility (`Item.flatUtil`) rather than
-`-gatherValue` — the `_UTILITY_FILL_TYPES` fast-path in the live `_benefit`.
+`-gatherValue` — the `UTILITY_FILL_TYPES` fast-path in the live `_benefit`.
 The Rank benefit is the SAME `Formal.GearValue.rankValue` def `runRankValue`
 consumes, applied to the block's own `Item` and reassembled into the abstract
 `rankOf : Item → Int` keyed by code — binding the abstract `Purpose.rank` benefit
@@ -0,0 +1,330 @@
+"""Re-drive the real decision stack over recorded cycles and measure it.
+
+The other `cycles` harnesses (`trace_lockstep`, `level_cost_replay`,
+`trace_characterize`) check what production DID against a model. None of them
+can say how long a decision takes, because none of them runs one: `cycles`
+recorded the outcome of each decision and not the state it was made in. Rows
+written under `play --learn --record-states N` carry that state in
+`Cycle.state_json` (every Nth cycle), and this harness replays it —
+`GamePlayer.seed_offline` + `plan_from_state`, the same seam the `plan` CLI and
+the scenario harness use, so `StrategyEngine.decide`, `StrategyArbiter.select`
+and every `GOAPPlanner.plan` inside it run exactly as they do live, against one
+frozen GameData bundle.
+
+For every replayed row it reports:
+
+  * the whole decision's wall time (decide + select), as percentiles;
+  * per goal CLASS (the repr up to its first parenthesis, so
+    `GatherMaterials(copper_ore)` and `GatherMaterials(ash_wood)` pool): the
+    count of attempts, latency percentiles, mean nodes and the timeout count,
+    read from the arbiter's own `goals_tried` log;
+  * the decision diff: how often the replayed goal and first action
+    (`Action.action_key`, the identity `cycles.action_repr` stores) match what
+    the row recorded, and the most common disagreements.
+
+WHAT A DISAGREEMENT DOES AND DOES NOT MEAN. Each row is replayed by a FRESH
+player: no sticky commitment, no doomed memo, no gear-focus ledger. Those live
+in the arbiter's memory across cycles and are not part of `WorldState`, so a
+replay cannot restore them from a row, and a row whose live decision rode a
+commitment can legitimately diverge. The learning store, when replayed with
+history (the default), is read as it is NOW, not as it was at the row's
+timestamp. And a live cycle that reused a cached plan recorded that plan's next
+step without deciding at all. The diff is therefore a drift signal for
+comparing two builds over the same corpus, not a correctness verdict on one —
+run it before and after a change and compare.
+
+Rows are independent once replayed fresh, so they fan out over a process pool
+(a GOAP search is GIL-bound) and the results are re-sorted by
+`(character, cycle_index)`, which keeps the report identical for any `--jobs`.
+Rows without a stored state are counted and excluded, never reconstructed:
+a state rebuilt from the post-action scalars would be missing its inventory,
+equipment and bank, and would time a decision nobody made.
+
+    python -m formal.diff.decision_replay [--db learning.db] [--bundle gamedata.json]
+        [--character NAME] [--limit N] [--stride K] [--jobs J] [--no-history] [--json]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from collections import Counter, defaultdict
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from sqlmodel import Session as SqlSession
+from sqlmodel import col, func, select
+
+from artifactsmmo_cli.ai.game_data import GameData
+from artifactsmmo_cli.ai.game_data_cache import GameDataCache
+from artifactsmmo_cli.ai.learning.models import Cycle
+from artifactsmmo_cli.ai.learning.store import LearningStore
+from artifactsmmo_cli.ai.player import GamePlayer
+from artifactsmmo_cli.ai.world_state_codec import StateDecodeError, state_from_json
+from artifactsmmo_cli.config import Config
+from formal.diff.store_records import EmptyCorpusError
+
+DEFAULT_DB = Path.home() / ".cache" / "artifactsmmo" / "learning.db"
+DEFAULT_BUNDLE = GameDataCache(api_base_url=Config.model_fields["api_base_url"].default).path
+NO_GOAL = "<none>"
+NO_PLAN = "<no_plan>"
+"""The sentinels `GamePlayer.run` records on a no-plan cycle."""
+PERCENTILES = (50, 90, 99)
+TOP_DIFFS = 10
+
+
+@dataclass(frozen=True)
+class ReplayCase:
+    """One replayable `cycles` row."""
+
+    character: str
+    cycle_index: int
+    ts: str
+    state_json: str
+    recorded_goal: str | None
+    recorded_action: str | None
+
+
+@dataclass(frozen=True)
+class GoalAttempt:
+    """One entry of the arbiter's `goals_tried` log."""
+
+    goal: str
+    elapsed_ms: float
+    nodes: int
+    timed_out: bool
+
+
+@dataclass(frozen=True)
+class ReplayResult:
+    """What the replayed decision chose and what it cost."""
+
+    character: str
+    cycle_index: int
+    elapsed_ms: float
+    goal: str
+    action: str
+    recorded_goal: str | None
+    recorded_action: str | None
+    attempts: tuple[GoalAttempt, ...]
+    error: str | None = None
+
+
+@dataclass(frozen=True)
+class Corpus:
+    """The replayable rows, and how many rows were skipped for lack of a state."""
+
+    cases: list[ReplayCase]
+    without_state: int
+
+
+def load_cases(db_path: str, character: str | None = None, *, limit: int | None = None,
+               stride: int = 1) -> Corpus:
+    """Every `stride`-th row that carries a `state_json`, ordered by
+    `(character, cycle_index, id)`, capped at `limit`.
+
+    Raises `EmptyCorpusError` when nothing is replayable — a benchmark over zero
+    decisions reports nothing, and must not look like one that measured."""
+    store = LearningStore(db_path=db_path, character=character or "")
+    try:
+        with SqlSession(store._engine) as s:
+            scope = select(Cycle)
+            missing = select(func.count()).select_from(Cycle).where(col(Cycle.state_json).is_(None))
+            if character is not None:
+                scope = scope.where(col(Cycle.character) == character)
+                missing = missing.where(col(Cycle.character) == character)
+            rows = list(s.exec(scope.where(col(Cycle.state_json).is_not(None)).order_by(
+                col(Cycle.character), col(Cycle.cycle_index), col(Cycle.id))))
+            without_state = s.exec(missing).one()
+    finally:
+        store.close()
+    cases = [ReplayCase(character=r.character, cycle_index=r.cycle_index, ts=r.ts,
+                        state_json=r.state_json or "", recorded_goal=r.selected_goal,
+                        recorded_action=r.action_repr)
+             for r in rows[::max(1, stride)]][:limit]
+    if not cases:
+        raise EmptyCorpusError(
+            f"decision_replay found no rows with a recorded state in {db_path!r} "
+            f"(character={character!r}; {without_state} rows have no `state_json`: "
+            "record with `play --learn --record-states N`)")
+    return Corpus(cases=cases, without_state=without_state)
+
+
+# Process-local handles set once per worker by `_init_worker`, so the GameData
+# bundle is parsed once per process rather than once per row.
+_WORKER_GAME_DATA: GameData | None = None
+_WORKER_DB: str | None = None
+_WORKER_STORES: dict[str, LearningStore] = {}
+
+
+def _init_worker(bundle_path: str, db_path: str | None) -> None:
+    global _WORKER_GAME_DATA, _WORKER_DB
+    _WORKER_GAME_DATA = GameData.from_cache_bundle(json.loads(Path(bundle_path).read_text()))
+    _WORKER_DB = db_path
+    _WORKER_STORES.clear()
+
+
+def _history(character: str) -> LearningStore | None:
+    if _WORKER_DB is None:
+        return None
+    if character not in _WORKER_STORES:
+        _WORKER_STORES[character] = LearningStore(db_path=_WORKER_DB, character=character)
+    return _WORKER_STORES[character]
+
+
+def _attempt(entry: dict[str, object]) -> GoalAttempt:
+    return GoalAttempt(goal=str(entry.get("goal", "")), elapsed_ms=float(str(entry.get("elapsed_ms", 0.0))),
+                       nodes=int(str(entry.get("nodes", 0))), timed_out=bool(entry.get("timed_out", False)))
+
+
+def replay_case(case: ReplayCase) -> ReplayResult:
+    """Decide `case`'s state from scratch. Must run inside an initialised worker
+    (or after `_init_worker` in-process). A decode failure or a crash in the
+    decision stack is reported on the result, not raised, so one bad row cannot
+    take down a run over thousands."""
+    assert _WORKER_GAME_DATA is not None
+
+    def result(elapsed_ms: float, goal: str = NO_GOAL, action: str = NO_PLAN,
+               attempts: tuple[GoalAttempt, ...] = (), error: str | None = None) -> ReplayResult:
+        return ReplayResult(character=case.character, cycle_index=case.cycle_index, elapsed_ms=elapsed_ms,
+                            goal=goal, action=action, recorded_goal=case.recorded_goal,
+                            recorded_action=case.recorded_action, attempts=attempts, error=error)
+
+    try:
+        state = state_from_json(case.state_json)
+    except StateDecodeError as e:
+        return result(0.0, error=str(e))
+    player = GamePlayer(character=case.character, history=_history(case.character))
+    player.seed_offline(state, _WORKER_GAME_DATA)
+    started = time.perf_counter()
+    try:
+        report = player.plan_from_state()
+    except Exception as e:
+        return result((time.perf_counter() - started) * 1000.0, error=f"{type(e).__name__}: {e}")
+    elapsed_ms = (time.perf_counter() - started) * 1000.0
+    attempts = tuple(_attempt(entry) for entry in report.goals_tried)
+    if report.selected_goal is None or not report.plan:
+        return result(elapsed_ms, attempts=attempts)
+    return result(elapsed_ms, repr(report.selected_goal), report.plan[0].action_key(), attempts)
+
+
+def replay(cases: Sequence[ReplayCase], bundle_path: Path, db_path: str | None, *,
+           jobs: int | None = None) -> list[ReplayResult]:
+    """Replay every case; `db_path=None` replays without a learning store.
+    `jobs=1` runs in-process (no pool), which is what a profiler wants."""
+    if jobs == 1:
+        _init_worker(str(bundle_path), db_path)
+        results = [replay_case(case) for case in cases]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                                 initargs=(str(bundle_path), db_path)) as executor:
+            chunk = max(1, len(cases) // ((jobs or os.cpu_count() or 1) * 8))
+            results = list(executor.map(replay_case, cases, chunksize=chunk))
+    return sorted(results, key=lambda r: (r.character, r.cycle_index))
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile; 0.0 for no values."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * pct // 100))
+    return ordered[int(rank) - 1]
+
+
+def goal_class(goal_repr: str) -> str:
+    return goal_repr.split("(", 1)[0]
+
+
+def summarize(results: Sequence[ReplayResult], without_state: int) -> dict[str, object]:
+    """The report as plain data (what `--json` prints)."""
+    ok = [r for r in results if r.error is None]
+    latency = [r.elapsed_ms for r in ok]
+    by_goal: dict[str, list[GoalAttempt]] = defaultdict(list)
+    for r in ok:
+        for a in r.attempts:
+            by_goal[goal_class(a.goal)].append(a)
+    goals = {
+        name: {"attempts": len(atts),
+               **{f"p{p}_ms": percentile([a.elapsed_ms for a in atts], p) for p in PERCENTILES},
+               "mean_nodes": sum(a.nodes for a in atts) / len(atts),
+               "timeouts": sum(a.timed_out for a in atts)}
+        for name, atts in sorted(by_goal.items())
+    }
+    compared = [r for r in ok if r.recorded_goal is not None]
+    goal_diffs = Counter((r.recorded_goal, r.goal) for r in compared if r.goal != r.recorded_goal)
+    return {
+        "replayed": len(results),
+        "errors": len(results) - len(ok),
+        "without_state": without_state,
+        "decision": {f"p{p}_ms": percentile(latency, p) for p in PERCENTILES}
+        | {"max_ms": max(latency, default=0.0), "total_s": sum(latency) / 1000.0},
+        "goals": goals,
+        "agreement": {
+            "compared": len(compared),
+            "goal": sum(r.goal == r.recorded_goal for r in compared),
+            "action": sum(r.action == r.recorded_action for r in compared),
+        },
+        "top_goal_diffs": [{"recorded": rec, "replayed": rep, "count": n}
+                           for (rec, rep), n in goal_diffs.most_common(TOP_DIFFS)],
+        "error_samples": [asdict(r) for r in results if r.error is not None][:TOP_DIFFS],
+    }
+
+
+def render(summary: dict[str, object]) -> str:
+    decision = summary["decision"]
+    agreement = summary["agreement"]
+    goals = summary["goals"]
+    assert isinstance(decision, dict) and isinstance(agreement, dict) and isinstance(goals, dict)
+    compared = agreement["compared"] or 1
+    lines = [
+        "# decision replay",
+        f"replayed={summary['replayed']} errors={summary['errors']} "
+        f"excluded_without_state={summary['without_state']}",
+        "decision ms: " + " ".join(f"p{p}={decision[f'p{p}_ms']:.1f}" for p in PERCENTILES)
+        + f" max={decision['max_ms']:.1f} total={decision['total_s']:.1f}s",
+        f"agreement: goal {agreement['goal']}/{agreement['compared']} "
+        f"({100.0 * agreement['goal'] / compared:.1f}%), action {agreement['action']}/{agreement['compared']} "
+        f"({100.0 * agreement['action'] / compared:.1f}%)",
+        "",
+        f"{'goal class':<32}{'tries':>7}" + "".join(f"{f'p{p} ms':>10}" for p in PERCENTILES)
+        + f"{'nodes':>10}{'timeouts':>10}",
+    ]
+    for name, g in goals.items():
+        lines.append(f"{name:<32}{g['attempts']:>7}" + "".join(f"{g[f'p{p}_ms']:>10.1f}" for p in PERCENTILES)
+                     + f"{g['mean_nodes']:>10.0f}{g['timeouts']:>10}")
+    diffs = summary["top_goal_diffs"]
+    assert isinstance(diffs, list)
+    if diffs:
+        lines += ["", "most common goal disagreements (recorded -> replayed):"]
+        lines += [f"  {d['count']:>5}  {d['recorded']} -> {d['replayed']}" for d in diffs]
+    return "\n".join(lines)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0] if __doc__ else None)
+    parser.add_argument("--db", default=str(DEFAULT_DB), help="learning store to replay")
+    parser.add_argument("--bundle", type=Path, default=DEFAULT_BUNDLE, help="frozen GameData cache bundle")
+    parser.add_argument("--character", default=None)
+    parser.add_argument("--limit", type=int, default=None, help="replay at most N rows")
+    parser.add_argument("--stride", type=int, default=1, help="replay every K-th row")
+    parser.add_argument("--jobs", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--no-history", action="store_true", help="replay without the learning store")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+    try:
+        corpus = load_cases(args.db, args.character, limit=args.limit, stride=args.stride)
+    except EmptyCorpusError as exc:
+        print(f"decision_replay: {exc}", file=sys.stderr)
+        return 1
+    results = replay(corpus.cases, args.bundle, None if args.no_history else args.db, jobs=args.jobs)
+    summary = summarize(results, corpus.without_state)
+    print(json.dumps(summary, sort_keys=True) if args.json else render(summary))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,5 +1,9 @@
 """Mutation runner: each mutant the diff test fails to kill is a survivor -> gate fails."""
 import argparse
+import ast
+import importlib
+import importlib.machinery
+import importlib.util
 import os
 import queue
 import shutil
@@ -7,10 +11,15 @@ import subprocess
 import sys
 import tempfile
 import threading
+import traceback
+from collections.abc import Iterable, Sequence
 from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 from pathlib import Path
+from types import CodeType, ModuleType
+from typing import NoReturn
 
+import pytest
 from mutation_anchor import AnchorAmbiguous, AnchorNotFound, MatchKind, apply_anchor, find_anchor
 
 ROOT = Path(__file__).resolve().parents[2]
@@ -64,6 +73,10 @@ OWNED_COUNT_SRC = ROOT / "src" / "artifactsmmo_cli" / "ai" / "tiers" / "owned_co
 UPGRADE_SELECTION_SRC = ROOT / "src" / "artifactsmmo_cli" / "ai" / "goals" / "upgrade_selection.py"
 SCALAR_CORE_SRC = ROOT / "src" / "artifactsmmo_cli" / "ai" / "learning" / "scalar_core.py"
 PLANNER_SRC = ROOT / "src" / "artifactsmmo_cli" / "ai" / "planner.py"
+RELAXED_REACHABILITY_SRC = ROOT / "src" / "artifactsmmo_cli" / "ai" / "relaxed_reachability.py"
+FOOTPRINT_SRC = ROOT / "src" / "artifactsmmo_cli" / "ai" / "actions" / "footprint.py"
+DOMINANCE_SRC = ROOT / "src" / "artifactsmmo_cli" / "ai" / "dominance.py"
+REGRESSION_SRC = ROOT / "src" / "artifactsmmo_cli" / "ai" / "regression.py"
 ARBITER_SELECT_SRC = ROOT / "src" / "artifactsmmo_cli" / "ai" / "arbiter_select.py"
 TASK_DECISION_CORE_SRC = ROOT / "src" / "artifactsmmo_cli" / "ai" / "task_decision_core.py"
 LOW_YIELD_BOUNDARY_SRC = ROOT / "src" / "artifactsmmo_cli" / "ai" / "learning" / "low_yield_boundary.py"
@@ -353,6 +366,7 @@ COMPLETE_TASK_CORE_SRC = ROOT / "src" / "artifactsmmo_cli" / "ai" / "actions" /
 FUNDING_CORE_SRC = ROOT / "src" / "artifactsmmo_cli" / "ai" / "goals" / "funding_core.py"
 CURRENCY_AFFORD_CORE_SRC = ROOT / "src" / "artifactsmmo_cli" / "ai" / "goals" / "currency_afford_core.py"
 DOOMED_MEMO_SRC = ROOT / "src" / "artifactsmmo_cli" / "ai" / "doomed_memo.py"
+PLANNABILITY_SIGNATURE_SRC = ROOT / "src" / "artifactsmmo_cli" / "ai" / "plannability_signature.py"
 STRATEGY_DRIVER_SRC = ROOT / "src" / "artifactsmmo_cli" / "ai" / "strategy_driver.py"
 
 # (description, old, new) -- old strings matched to the actual current pathfinding.py text.
@@ -975,7 +989,7 @@ LOADOUT_PICKER_GATHER_MUTATIONS = [
 ]
 
 
-# loadout_picker (artifact utility-fill) mutation -- the `_UTILITY_FILL_TYPES`
+# loadout_picker (artifact utility-fill) mutation -- the `UTILITY_FILL_TYPES`
 # fast-path that scores an ARTIFACT by its flat utility (`armor_score` against an
 # empty monster attack) instead of `-gather_score` (= 0). Reverting it drops the
 # fast-path, so under Gather an artifact scores 0 and the empty-slot gate leaves
@@ -2137,49 +2151,130 @@ PLANNER_MUTATIONS = [
     # Move-prefix node sinks to the back of the heap and [Rest] (cost 10) pops
     # before [Move, Eat] — the now-affirmative optimality test fails.
     ("planner: re-introduce urgency heuristic (h = goal.heuristic -> goal.value)",
-     "                    # h = goal.heuristic(next_state, game_data): see h0 above.\n"
-     "                    # `goal.value` remains used by goal *selection* (StrategyArbiter,\n"
-     "                    # learning) — the planner's heuristic role is a distinct,\n"
-     "                    # admissible+consistent estimate (default 0.0 = Dijkstra).\n"
-     "                    h = goal.heuristic(next_state, game_data)",
-     "                    h = goal.value(next_state, game_data, history)"),
+     "                # h = goal.heuristic(next_state, game_data): see h0 above.\n"
+     "                # `goal.value` remains used by goal *selection* (StrategyArbiter,\n"
+     "                # learning) — the planner's heuristic role is a distinct,\n"
+     "                # admissible+consistent estimate (default 0.0 = Dijkstra).\n"
+     "                h = goal.heuristic(next_state, game_data)",
+     "                h = goal.value(next_state, game_data, history)"),
     # Negate `g` in the priority: `f_score=g + h` -> `f_score=-g + h`. With h=0
     # this orders the heap by -g (largest g first), so deep / expensive plans
     # pop first and the planner returns something other than the cheap optimum.
     ("planner: negate g in f (g + h -> -g + h)",
-     "                            f_score=g + h,",
-     "                            f_score=-g + h,"),
+     "                        f_score=g + h,",
+     "                        f_score=-g + h,"),
     # Skip the `is_applicable` filter: useless / inapplicable actions get
     # expanded into the heap with no state change but accumulating cost,
     # corrupting g and the returned plan. The optimality assertion fails.
     ("planner: skip is_applicable filter (always expand)",
-     "                    if not action.is_applicable(node.state, game_data):\n"
-     "                        continue",
-     "                    if False:\n"
-     "                        continue"),
+     "                if not action.is_applicable(node.state, game_data):\n"
+     "                    continue",
+     "                if False:\n"
+     "                    continue"),
     # Drop the request-budget floor: the edge cost falls back to the raw
     # cooldown, so a plan of many cheap actions beats a plan of few dear ones
     # even when the fleet is request-bound. Killed by
     # `test_request_budget_floor_flips_this_instance_to_the_single_step_plan`,
     # whose floored assertion returns [Move, EatAtTile] instead of [Rest].
     ("planner: drop the request-budget floor (max(cost, floor) -> cost)",
-     "                    g = node.g_score + max(\n"
-     "                        action.cost(node.state, game_data, history),\n"
-     "                        self.action_floor_seconds,\n"
-     "                    )",
-     "                    g = node.g_score + action.cost(node.state, game_data, history)"),
+     "                g = node.g_score + max(\n"
+     "                    action.cost(node.state, game_data, history),\n"
+     "                    self.action_floor_seconds,\n"
+     "                )",
+     "                g = node.g_score + action.cost(node.state, game_data, history)"),
     # Make the floor a FLAT RATE rather than a lower bound. Every action costs
     # one slot, distance stops mattering, and a dear action is silently
     # discounted. Killed by `test_request_budget_floor_is_a_lower_bound_not_a_
     # flat_rate`: at a 3s floor the two-step plan must still win, but under a
     # flat rate one action always beats two.
     ("planner: request-budget floor becomes a flat rate (max -> floor when set)",
-     "                    g = node.g_score + max(\n"
-     "                        action.cost(node.state, game_data, history),\n"
-     "                        self.action_floor_seconds,\n"
-     "                    )",
-     "                    g = node.g_score + (self.action_floor_seconds\n"
-     "                                        or action.cost(node.state, game_data, history))"),
+     "                g = node.g_score + max(\n"
+     "                    action.cost(node.state, game_data, history),\n"
+     "                    self.action_floor_seconds,\n"
+     "                )",
+     "                g = node.g_score + (self.action_floor_seconds\n"
+     "                                    or action.cost(node.state, game_data, history))"),
+]
+
+
+# `relaxed_reachability` — the delete-relaxation bound the planner refuses
+# goals on before searching. Its soundness rests on two things a mutant can
+# quietly break: abstaining on an action class it has no reading of, and
+# requiring no more than an action's `is_applicable` does — a craft reading
+# that drops its recipe inputs under-counts the chain's layers. Killed by
+# tests/test_ai/test_relaxed_reachability.py.
+RELAXED_REACHABILITY_MUTATIONS: list[tuple[str, str, str]] = [
+    ("relaxed: skip an unread action class instead of abstaining",
+     "        if relaxed is None:\n"
+     "            return None",
+     "        if relaxed is None:\n"
+     "            continue"),
+    ("relaxed: a craft no longer needs its recipe inputs",
+     "        return Relaxed(needs_items=frozenset(recipe), needs_skill=",
+     "        return Relaxed(needs_items=frozenset(), needs_skill="),
+]
+
+
+# Partial-order reduction: `actions/footprint.Footprint.commutes_with` and the
+# planner's revisit that wakes what a first visit skipped. A consume/release
+# pair passing as commuting lets the planner keep an order that is not
+# applicable and drop the one that is; dropping the wake loses successors
+# duplicate detection hid. Killed by tests/test_ai/test_action_footprint.py.
+FOOTPRINT_MUTATIONS: list[tuple[str, str, str]] = [
+    ("footprint: a consumer commutes with a releaser",
+     "                    or self.consumes & other.releases or self.releases & other.consumes)",
+     "                    or False)"),
+]
+
+PLANNER_REORDER_MUTATIONS: list[tuple[str, str, str]] = [
+    ("planner: an equally cheap revisit wakes nothing",
+     "                if slept is None or node.depth >= max_depth or node.g_score > slept[0] + _TIE_SECONDS:",
+     "                if True:"),
+]
+
+
+# HP dominance: `ai/dominance` and the planner's pruning on it. A frontier that
+# lets a sicker node dominate, or a registry that waves through a food the
+# search can reach, prunes plans that need the HP; dropping the wake loses the
+# successors a dominator skipped as reorderings. Killed by
+# tests/test_ai/test_dominance.py.
+DOMINANCE_MUTATIONS: list[tuple[str, str, str]] = [
+    ("dominance: a sicker node dominates",
+     "            if expanded.hp >= hp and expanded.g_score",
+     "            if expanded.g_score"),
+    ("dominance: a reachable food passes",
+     "        if action.foods & reachable:",
+     "        if False:"),
+]
+
+PLANNER_DOMINANCE_MUTATIONS: list[tuple[str, str, str]] = [
+    ("planner: an equally cheap dominated node wakes nothing",
+     "                if slept is None or node.depth >= max_depth or node.g_score > dominator.g_score + _TIE_SECONDS:",
+     "                if True:"),
+]
+
+
+# The regression tier: `ai/regression`. A craft that regresses to no inputs
+# closes the chain at its last leg; a gate read as met hands the refinement a
+# craft no leg grinds toward. Killed by tests/test_ai/test_regression.py.
+REGRESSION_MUTATIONS: list[tuple[str, str, str]] = [
+    ("regression: a craft needs no inputs",
+     "        need[material] = need.get(material, 0) + per_run * runs",
+     "        pass"),
+    ("regression: an ungrindable gate is met",
+     "                if grind_cost is None:\n                    continue",
+     "                if grind_cost is None:\n                    grind_cost = 0.0"),
+]
+
+
+# planner subgoal-refinement mutations -- the hierarchical tier's depth guard.
+# Killed by tests/test_ai/test_planner.py::TestSubgoalRefinement, whose
+# two-leg refinement of a max_depth-1 goal must fall back to the one-step flat
+# plan instead of returning the two-step concatenation.
+PLANNER_REFINE_MUTATIONS = [
+    ("planner: refined plan may exceed max_depth (drop the depth guard)",
+     "        if len(plan) > goal.max_depth:",
+     "        if False:"),
 ]
 
 
@@ -2560,8 +2655,20 @@ TASK_RESERVATION_MUTATIONS = [
 # since the cost is the Hypothesis test body, which is CPU-bound and embarrassingly
 # parallel. "serial" is the original in-place `uv run pytest` per mutant against
 # the real tree — slower, fully isolated, and the parity oracle for "parallel".
-_RUNNER = "parallel"
-# Worker count for parallel mode. Capped at 16; leaves headroom on the box.
+#
+# "forked" (default) drops the per-mutant interpreter altogether. Every fresh
+# `python -m pytest` re-imports the package, Hypothesis and the oracle client
+# before running a test body that is often shorter than the import — that, and
+# one resident interpreter per worker, is where the nightly sweep's ~36 min and
+# ~22GB went. The forked runner imports everything the kill-tests need ONCE in
+# this process, compiles each target's mutants up front (the schema: one code
+# object per mutant, selected by index), then forks one child per mutant. The
+# child shares the warm image copy-on-write, evicts only the modules that
+# import the target (directly or transitively), serves the selected mutant's
+# code in place of the target's through an import hook, and runs its kill-test
+# with `pytest.main`. Nothing is written to disk, so no tree is ever mutated.
+_RUNNER = "forked"
+# Worker count for the parallel and forked modes. Capped at 16; leaves headroom on the box.
 _WORKERS = min(16, (os.cpu_count() or 2) - 2)
 # Group filter: a group runs only when one of these substrings appears in its
 # src path or test path. None = run every group (the gate's full sweep).
@@ -2612,25 +2719,37 @@ def _probe(target_file: Path, desc: str, old: str, new: str, test_path: str,
     gate; only the last means the test suite is weak.
     """
     orig = target_file.read_text()
+    mutated = _mutated_text(orig, desc, old, new, survivors)
+    if mutated is None:
+        return
+    target_file.write_text(mutated)
     try:
-        mutated = apply_anchor(orig, old, new)
+        rc = _run_pytest(test_path, pythonpath)
+    finally:
+        target_file.write_text(orig)
+    _judge(desc, rc, test_path, survivors)
+
+
+def _mutated_text(orig: str, desc: str, old: str, new: str, survivors: list[str]) -> str | None:
+    """`orig` with the mutation applied, or None after recording a stale or
+    ambiguous anchor."""
+    try:
+        return apply_anchor(orig, old, new)
     except AnchorAmbiguous as exc:
         with _PRINT_LOCK:
             print(f"AMBIGUOUS ANCHOR: {desc}\n  {exc}")
         _AMBIGUOUS.append(desc)
         survivors.append(desc + " (ambiguous)")
-        return
     except AnchorNotFound:
         with _PRINT_LOCK:
             print(f"STALE MUTATION (text not found): {desc}")
         _STALE.append(desc)
         survivors.append(desc + " (stale)")
-        return
-    target_file.write_text(mutated)
-    try:
-        rc = _run_pytest(test_path, pythonpath)
-    finally:
-        target_file.write_text(orig)
+    return None
+
+
+def _judge(desc: str, rc: int, test_path: str, survivors: list[str]) -> None:
+    """Record one kill-test verdict."""
     # pytest rc: 0 = all passed (mutant SURVIVED), 1 = tests failed (killed).
     # >=2 is usage/collection/internal error or an external kill — the suite
     # never actually judged this mutant, so counting it as killed would inflate
@@ -2650,7 +2769,8 @@ def _probe(target_file: Path, desc: str, old: str, new: str, test_path: str,
 
 
 def _execute(units: list[_Unit], survivors: list[str]) -> None:
-    """Dispatch collected units. In parallel mode, src/artifactsmmo_cli targets
+    """Dispatch collected units. The forked runner covers every target, inside
+    src/ or not, since it never touches the tree. In parallel mode, src/artifactsmmo_cli targets
     run copy-isolated across workers (main tree untouched); the handful of
     formal/sim targets — outside the editable package, so not PYTHONPATH-
     shadowable — run serially in-place AFTER the parallel phase finishes, so the
@@ -2658,6 +2778,9 @@ def _execute(units: list[_Unit], survivors: list[str]) -> None:
     if _RUNNER == "serial":
         _execute_serial(units, survivors)
         return
+    if _RUNNER == "forked":
+        _execute_forked(units, survivors)
+        return
     parallel = [u for u in units if _SRC_ROOT in u[0].parents]
     serial = [u for u in units if _SRC_ROOT not in u[0].parents]
     if parallel:
@@ -2697,6 +2820,212 @@ def _execute_parallel(units: list[_Unit], survivors: list[str]) -> None:
         shutil.rmtree(tmp, ignore_errors=True)
 
 
+# --- forked runner -----------------------------------------------------------
+# Modules the forked runner may evict and re-import in a child: the package and
+# the repo's own formal/ and tests/ trees. Everything else (pytest, Hypothesis,
+# pydantic, the generated API client, ...) stays warm in every child.
+_FORK_ROOTS = (_SRC_ROOT, ROOT)
+_FORK_SCOPES = (_SRC_ROOT / _SRC_PKG, ROOT / "formal", ROOT / "tests")
+# Per-file import sets, so a file is parsed once however many targets need it.
+_IMPORTS: dict[Path, frozenset[str]] = {}
+
+
+class _MutantFinder:
+    """Meta-path hook that serves one precompiled mutant for one module name;
+    every other import falls through to the normal finders."""
+
+    def __init__(self, name: str, path: Path, code: CodeType) -> None:
+        self._name = name
+        self._loader = _MutantLoader(name, str(path), code)
+
+    def find_spec(self, fullname: str, path: Sequence[str] | None,
+                  target: ModuleType | None = None) -> importlib.machinery.ModuleSpec | None:
+        if fullname != self._name:
+            return None
+        return importlib.util.spec_from_file_location(fullname, self._loader.path, loader=self._loader)
+
+
+class _MutantLoader(importlib.machinery.SourceFileLoader):
+    """Source loader whose code is the mutant's, never the (clean) bytecode cache."""
+
+    def __init__(self, fullname: str, path: str, code: CodeType) -> None:
+        super().__init__(fullname, path)
+        self._code = code
+
+    def get_code(self, fullname: str) -> CodeType:
+        return self._code
+
+
+def _module_name(path: Path, roots: Sequence[Path] = _FORK_ROOTS) -> str:
+    """Dotted import name of `path`, relative to the first root containing it."""
+    root = next(r for r in roots if r in path.parents)
+    parts = path.relative_to(root).with_suffix("").parts
+    return ".".join(parts[:-1] if parts[-1] == "__init__" else parts)
+
+
+def _imports_of(path: Path, name: str) -> frozenset[str]:
+    """Every module name `path` may import, at any depth in the file (lazy
+    in-function imports included). `from pkg import x` yields both `pkg` and
+    `pkg.x`, since `x` may be a submodule; over-approximating only costs a
+    re-import."""
+    if path not in _IMPORTS:
+        is_pkg = path.name == "__init__.py"
+        found: set[str] = set()
+        for node in ast.walk(ast.parse(path.read_text(), str(path))):
+            if isinstance(node, ast.Import):
+                found.update(alias.name for alias in node.names)
+            elif isinstance(node, ast.ImportFrom):
+                base = node.module or ""
+                if node.level:
+                    package = name if is_pkg else name.rpartition(".")[0]
+                    anchor = package.split(".")[:len(package.split(".")) - (node.level - 1)]
+                    base = ".".join([*anchor, base] if base else anchor)
+                found.add(base)
+                found.update(f"{base}.{alias.name}" for alias in node.names)
+        _IMPORTS[path] = frozenset(found)
+    return _IMPORTS[path]
+
+
+def _scoped_modules(scopes: Sequence[Path] = _FORK_SCOPES) -> dict[str, Path]:
+    """Loaded modules whose source lives in one of `scopes`."""
+    out: dict[str, Path] = {}
+    for name, module in list(sys.modules.items()):
+        file = getattr(module, "__file__", None)
+        if file is None or not file.endswith(".py"):
+            continue
+        path = Path(file).resolve()
+        if any(scope == path.parent or scope in path.parents for scope in scopes):
+            out[name] = path
+    return out
+
+
+def _dependents(scopes: Sequence[Path] = _FORK_SCOPES) -> dict[str, set[str]]:
+    """Reverse import graph over the loaded in-scope modules: name -> importers."""
+    dependents: dict[str, set[str]] = {}
+    for name, path in _scoped_modules(scopes).items():
+        for dep in _imports_of(path, name):
+            dependents.setdefault(dep, set()).add(name)
+    return dependents
+
+
+def _importers(target: str, dependents: dict[str, set[str]]) -> frozenset[str]:
+    """`target` and every loaded in-scope module that imports it, transitively.
+    These are exactly the modules that can hold a reference to the clean
+    target's objects, so exactly the ones a child must evict."""
+    closure = {target}
+    frontier = [target]
+    while frontier:
+        for importer in dependents.get(frontier.pop(), ()):
+            if importer not in closure:
+                closure.add(importer)
+                frontier.append(importer)
+    return frozenset(closure)
+
+
+def _preload(test_paths: Iterable[str], cwd: Path) -> None:
+    """Import, in this process, everything the kill-tests import — except the
+    test modules themselves and the repo's `tests` package, which pytest must
+    import under its own assertion rewriting in each child. A module that fails
+    to import here is skipped; its child reports the real error."""
+    for test_path in test_paths:
+        path = (cwd / test_path).resolve()
+        for name in sorted(_imports_of(path, "")):
+            if not name or name.split(".")[0] == "tests" or name.rpartition(".")[2].startswith("test_"):
+                continue
+            try:
+                importlib.import_module(name)
+            except Exception:
+                continue
+
+
+def _fork_child(test_path: str, cwd: Path, mutant: "_Mutant | None") -> NoReturn:
+    """Child side of one fork: swap in the mutant (None = run the clean code)
+    and exit with the kill-test's pytest return code."""
+    status = 3
+    try:
+        os.chdir(cwd)
+        sys.dont_write_bytecode = True
+        if mutant is not None:
+            name, path, code, evict = mutant
+            for evicted in evict:
+                sys.modules.pop(evicted, None)
+            sys.meta_path.insert(0, _MutantFinder(name, path, code))
+        status = int(pytest.main([test_path, *_PYTEST_ARGS]))
+    except BaseException:
+        traceback.print_exc()
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(status)
+
+
+_Mutant = tuple[str, Path, CodeType, frozenset[str]]
+"""(module name, source path, compiled mutant, modules the child must evict)."""
+
+
+def _fork_batch(jobs: Sequence[tuple[int, str, _Mutant | None]], cwd: Path) -> Iterable[tuple[int, int]]:
+    """Fork one child per (key, kill-test, mutant), at most _WORKERS alive at
+    once; yield (key, pytest rc) as each child exits. A child killed by a
+    signal reads as rc 2 — the test never judged it, like a killed subprocess."""
+    running: dict[int, int] = {}
+    pending = list(reversed(jobs))
+    while pending or running:
+        while pending and len(running) < max(1, _WORKERS):
+            key, test_path, mutant = pending.pop()
+            pid = os.fork()
+            if pid == 0:
+                _fork_child(test_path, cwd, mutant)
+            running[pid] = key
+        pid, wait_status = os.wait()
+        rc = os.waitstatus_to_exitcode(wait_status)
+        yield running.pop(pid), rc if rc >= 0 else 2
+
+
+def _execute_forked(units: list[_Unit], survivors: list[str], *, cwd: Path = ROOT,
+                    roots: Sequence[Path] = _FORK_ROOTS, scopes: Sequence[Path] = _FORK_SCOPES) -> None:
+    """Run every unit in a forked child of this (warm) process.
+
+    Each distinct kill-test first runs once against the clean code: a test that
+    fails unmutated would "kill" every mutant bound to it, so its units are
+    reported as harness errors instead of being run."""
+    test_paths = sorted({u[4] for u in units})
+    if str(cwd) not in sys.path:
+        sys.path.insert(0, str(cwd))
+    _preload(test_paths, cwd)
+    dependents = _dependents(scopes)
+    baseline = dict(_fork_batch([(k, t, None) for k, t in enumerate(test_paths)], cwd))
+    broken = {t: baseline[k] for k, t in enumerate(test_paths) if baseline[k] != 0}
+    for t, rc in broken.items():
+        with _PRINT_LOCK:
+            print(f"HARNESS ERROR: kill-test fails on the CLEAN code (rc={rc}): {t}")
+    sources: dict[Path, str] = {}
+    evictions: dict[str, frozenset[str]] = {}
+    jobs: list[tuple[int, str, _Mutant | None]] = []
+    for k, (src, desc, old, new, test_path) in enumerate(units):
+        if src not in sources:
+            sources[src] = src.read_text()
+        mutated = _mutated_text(sources[src], desc, old, new, survivors)
+        if mutated is None:
+            continue
+        if test_path in broken:
+            _ERRORED.append(f"{desc} (kill-test fails unmutated: {test_path})")
+            survivors.append(desc + f" (harness rc={broken[test_path]})")
+            continue
+        try:
+            code = compile(mutated, str(src), "exec", dont_inherit=True)
+        except SyntaxError as exc:
+            with _PRINT_LOCK:
+                print(f"MUTANT DOES NOT COMPILE: {desc}\n  {exc}")
+            _judge(desc, 2, test_path, survivors)
+            continue
+        name = _module_name(src, roots)
+        if name not in evictions:
+            evictions[name] = _importers(name, dependents)
+        jobs.append((k, test_path, (name, src, code, evictions[name])))
+    for k, rc in _fork_batch(jobs, cwd):
+        _judge(units[k][1], rc, units[k][4], survivors)
+
+
 # Killed by formal/diff/test_leaf_attainable_diff.py (binds leaf_attainable_pure
 # to the proved Formal.LeafAttainable.leafAttainable).
 LEAF_ATTAINABLE_MUTATIONS = [
@@ -2771,6 +3100,22 @@ DOOMED_MEMO_MUTATIONS = [
      "        return cycle - set_at <= self._ttl(failures)"),
 ]
 
+# Killed by tests/test_ai/test_doomed_verdicts.py — the fleet-shared verdicts:
+# which sibling verdicts a character may trust, and how far their window runs.
+PLANNABILITY_SIGNATURE_MUTATIONS = [
+    ("plannability_signature: a verdict recorded with fewer skill unlocks covers",
+     "    return level >= current[0] and all(have.get(skill, 0) >= value for skill, value in current[1])",
+     "    return level >= current[0]"),
+]
+DOOMED_SHARED_MUTATIONS = [
+    ("doomed_memo: shared window not escalated past the sibling failures",
+     "            failures = 1 + max((v.failures for v in self._shared(goal_repr, sig, cycle)), default=0)",
+     "            failures = 1"),
+    ("doomed_memo: shared window never expires",
+     "            return any(verdict.expires_at > now for verdict in shared)",
+     "            return any(True for verdict in shared)"),
+]
+
 # Killed by tests/test_ai/test_combat.py — the learned-veto threshold that stops the
 # bot grinding marginal monsters (blue_slime 13%-loss trace 2026-06-15).
 # Task 1 lowered threshold 0.9 -> 0.4 so marginal grinds survive; mutation tightens
@@ -4078,7 +4423,10 @@ _ALL_SRCS = [
     SKILL_XP_CURVE_SRC, RECIPE_CLOSURE_SRC, TASK_FEASIBILITY_SRC, PREREQUISITE_GRAPH_SRC,
     OBJECTIVE_SRC, STRATEGY_SRC, BANK_SELECTION_SRC, KIT_SELECTION_SRC, STUCK_DETECTOR_SRC,
     PRIORITY_BAND_SRC, OWNED_COUNT_SRC, UPGRADE_SELECTION_SRC, SCALAR_CORE_SRC,
-    PLANNER_SRC, ARBITER_SELECT_SRC, TASK_DECISION_CORE_SRC,
+    PLANNER_SRC, RELAXED_REACHABILITY_SRC, FOOTPRINT_SRC, DOMINANCE_SRC,
+    REGRESSION_SRC, PLANNABILITY_SIGNATURE_SRC,
+    ARBITER_SELECT_SRC,
+    TASK_DECISION_CORE_SRC,
     LOW_YIELD_BOUNDARY_SRC, OBJECTIVE_STEP_FIGHT_CORE_SRC, DECIDE_KEY_SRC,
     CYCLES_FOR_PROGRESS_SRC,
     GATHER_APPLY_SRC,
@@ -5071,8 +5419,8 @@ NEAREST_TILE_MUTATIONS = [
     # Argmin -> argmax: pick the FARTHEST tile. Any list with two distinct keys
     # diverges from the Lean lex-min.
     ("nearest_tile: min -> max (argmin becomes argmax)",
-     "    return min(",
-     "    return max("),
+     "    return min(\n        tiles,\n",
+     "    return max(\n        tiles,\n"),
     # Drop the y-axis distance term: the metric ignores vertical distance, so two
     # tiles equal in x-distance but differing in y now mis-rank.
     ("nearest_tile: drop y-axis distance term",
@@ -6944,9 +7292,9 @@ PLAN_EXISTS_BUILD_ACTIONS_MUTATIONS = [
     # witness; planner returns []; test_planner_finds_plan_for_firing_means[
     # HP_CRITICAL] fires.
     ("plan_exists: drop RestAction from _build_actions",
-     "    actions: list[Action] = [\n"
+     "    return [\n"
      "        RestAction(),",
-     "    actions: list[Action] = [\n"
+     "    return [\n"
      "        # RestAction(),  # mutation: dropped",),
     # Drop DepositAllAction — DEPOSIT_FULL case has no actuator; planner
     # returns []; test_planner_finds_plan_for_firing_means[DEPOSIT_FULL] fires.
@@ -6957,7 +7305,8 @@ PLAN_EXISTS_BUILD_ACTIONS_MUTATIONS = [
     # actuator; planner returns []; test_planner_finds_plan_for_firing_means[
     # BANK_UNLOCK] fires (the only fight-rooted in-scope means).
     ("plan_exists: drop FightAction from _build_actions",
-     "        actions.append(FightAction(monster_code=monster_code, locations=frozenset(locs)))",
+     "        actions.append(FightAction(monster_code=monster_code, locations=frozenset(locs),\n"
+     "                                   distances=distances))",
      "        pass  # mutation: dropped FightAction append"),
     # Disable the items-task TaskTradeAction insertion block (BOTH the
     # quantity=k primary and the quantity=1 fallback). PURSUE_TASK then has
@@ -7191,6 +7540,20 @@ def _collect_all_groups() -> None:
               "formal/diff/test_scalarizer_diff.py", survivors)
     run_group(PLANNER_SRC, PLANNER_MUTATIONS,
               "formal/diff/test_planner_admissibility_diff.py", survivors)
+    run_group(PLANNER_SRC, PLANNER_REFINE_MUTATIONS,
+              "tests/test_ai/test_planner.py", survivors)
+    run_group(RELAXED_REACHABILITY_SRC, RELAXED_REACHABILITY_MUTATIONS,
+              "tests/test_ai/test_relaxed_reachability.py", survivors)
+    run_group(FOOTPRINT_SRC, FOOTPRINT_MUTATIONS,
+              "tests/test_ai/test_action_footprint.py", survivors)
+    run_group(PLANNER_SRC, PLANNER_REORDER_MUTATIONS,
+              "tests/test_ai/test_action_footprint.py", survivors)
+    run_group(DOMINANCE_SRC, DOMINANCE_MUTATIONS,
+              "tests/test_ai/test_dominance.py", survivors)
+    run_group(PLANNER_SRC, PLANNER_DOMINANCE_MUTATIONS,
+              "tests/test_ai/test_dominance.py", survivors)
+    run_group(REGRESSION_SRC, REGRESSION_MUTATIONS,
+              "tests/test_ai/test_regression.py", survivors)
     run_group(CANCEL_SELECTION_SRC, CANCEL_SELECTION_MUTATIONS,
               "tests/test_ai/test_cancel_selection.py", survivors)
     run_group(ARBITER_SELECT_SRC, ARBITER_SELECT_MUTATIONS,
@@ -7445,6 +7808,10 @@ def _collect_all_groups() -> None:
               "formal/diff/test_currency_afford_diff.py", survivors)
     run_group(DOOMED_MEMO_SRC, DOOMED_MEMO_MUTATIONS,
               "formal/diff/test_doomed_memo_diff.py", survivors)
+    run_group(DOOMED_MEMO_SRC, DOOMED_SHARED_MUTATIONS,
+              "tests/test_ai/test_doomed_verdicts.py", survivors)
+    run_group(PLANNABILITY_SIGNATURE_SRC, PLANNABILITY_SIGNATURE_MUTATIONS,
+              "tests/test_ai/test_doomed_verdicts.py", survivors)
     run_group(STRATEGY_DRIVER_SRC, STRATEGY_DRIVER_MUTATIONS,
               "tests/test_ai/test_strategy_driver_tiered.py", survivors)
     run_group(EMPTY_SLOT_FILLS_SRC, EMPTY_SLOT_FILLS_MUTATIONS,
@@ -7643,11 +8010,12 @@ def _parse_args(argv: list[str]) -> None:
                         help="resolve every anchor against its source and exit; "
                              "runs no tests (seconds, not an hour). Always checks "
                              "all groups, ignoring --only")
-    parser.add_argument("--runner", choices=("parallel", "serial"), default=_RUNNER,
-                        help="parallel (private-copy worker threads, default) or "
+    parser.add_argument("--runner", choices=("forked", "parallel", "serial"), default=_RUNNER,
+                        help="forked (warm forked child per mutant, default), parallel "
+                             "(private-copy worker threads, one subprocess per mutant) or "
                              "serial (in-place per-mutant subprocess, parity oracle)")
     parser.add_argument("--workers", type=int, default=_WORKERS,
-                        help=f"parallel worker count (default: {_WORKERS})")
+                        help=f"forked/parallel worker count (default: {_WORKERS})")
     parser.add_argument("--only", default=None,
                         help="comma-separated substrings; run only groups whose "
                              "src or test path matches one (default: all groups)")
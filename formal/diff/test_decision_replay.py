@@ -0,0 +1,106 @@
+"""Tests for `formal.diff.decision_replay` — replaying recorded decision states
+through the real `GamePlayer.plan_from_state` seam against the scenario
+fixture bundle.
+
+`tmp_db_path` is defined locally, as in `test_store_records.py`.
+"""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from artifactsmmo_cli.ai.learning.models import Cycle
+from artifactsmmo_cli.ai.learning.store import LearningStore
+from artifactsmmo_cli.ai.world_state_codec import state_to_json
+from formal.diff.decision_replay import (
+    NO_GOAL,
+    NO_PLAN,
+    ReplayCase,
+    goal_class,
+    load_cases,
+    main,
+    percentile,
+    render,
+    replay,
+    summarize,
+)
+from formal.diff.store_records import EmptyCorpusError
+from tests.test_ai.fixtures import make_state
+
+_BUNDLE = Path(__file__).resolve().parents[2] / "tests" / "test_ai" / "scenarios" / "fixtures" / "gamedata_bundle.json"
+
+
+@pytest.fixture
+def tmp_db_path():
+    with tempfile.NamedTemporaryFile(suffix=".db", delete=False) as f:
+        path = f.name
+    yield path
+    if os.path.exists(path):
+        os.unlink(path)
+
+
+def _row(cycle_index, state_json, goal="GatherMaterials(copper_ore)", action="gather:copper_rocks"):
+    return Cycle(ts="2026-10-18T00:00:00+00:00", cycle_index=cycle_index, outcome="ok",
+                 action_repr=action, action_class="GatherAction", selected_goal=goal,
+                 level=1, xp=0, hp=120, max_hp=120, delta_xp=0, delta_hp=0,
+                 inventory_used=0, inventory_max=100, delta_inv_used=0, state_json=state_json)
+
+
+def _seed(db_path, character="hero"):
+    store = LearningStore(db_path=db_path, character=character)
+    store.start_session()
+    store.record_cycle(_row(0, None))
+    for i in range(1, 4):
+        store.record_cycle(_row(i, state_to_json(make_state(character=character, hp=120, max_hp=120))))
+    store.close()
+
+
+def test_rows_without_a_state_are_counted_and_excluded(tmp_db_path):
+    _seed(tmp_db_path)
+    corpus = load_cases(tmp_db_path, "hero")
+    assert [c.cycle_index for c in corpus.cases] == [1, 2, 3]
+    assert corpus.without_state == 1
+    assert [c.cycle_index for c in load_cases(tmp_db_path, stride=2, limit=1).cases] == [1]
+
+
+def test_nothing_replayable_is_an_error_not_an_empty_report(tmp_db_path):
+    _seed(tmp_db_path)
+    with pytest.raises(EmptyCorpusError, match="no rows with a recorded state"):
+        load_cases(tmp_db_path, "nobody-else")
+    assert main(["--db", tmp_db_path, "--character", "nobody-else"]) == 1
+
+
+def test_replay_is_identical_in_process_and_across_a_pool(tmp_db_path):
+    _seed(tmp_db_path)
+    cases = load_cases(tmp_db_path).cases
+    serial = replay(cases, _BUNDLE, tmp_db_path, jobs=1)
+    pooled = replay(cases, _BUNDLE, None, jobs=2)
+    assert [r.cycle_index for r in serial] == [1, 2, 3]
+    assert all(r.error is None for r in serial + pooled)
+    assert [(r.goal, r.action) for r in serial] == [(r.goal, r.action) for r in pooled]
+    assert all(r.attempts and r.elapsed_ms > 0 for r in serial)
+
+
+def test_summary_reports_latency_goal_classes_and_agreement(tmp_db_path, capsys):
+    _seed(tmp_db_path)
+    corpus = load_cases(tmp_db_path)
+    results = replay(corpus.cases, _BUNDLE, tmp_db_path, jobs=1)
+    broken = replay([ReplayCase("hero", 9, "", "{}", None, None)], _BUNDLE, None, jobs=1)
+    summary = summarize(results + broken, corpus.without_state)
+    assert (summary["replayed"], summary["errors"], summary["without_state"]) == (4, 1, 1)
+    assert broken[0].goal == NO_GOAL and broken[0].action == NO_PLAN
+    assert summary["agreement"]["compared"] == 3
+    assert summary["goals"] and all(g["attempts"] > 0 for g in summary["goals"].values())
+    assert "# decision replay" in render(summary)
+    assert main(["--db", tmp_db_path, "--bundle", str(_BUNDLE), "--jobs", "1", "--json"]) == 0
+    assert json.loads(capsys.readouterr().out)["replayed"] == 3
+
+
+def test_percentile_is_nearest_rank():
+    assert percentile([], 50) == 0.0
+    assert percentile([5.0, 1.0, 3.0, 2.0, 4.0], 50) == 3.0
+    assert percentile([1.0, 2.0], 99) == 2.0
+    assert goal_class("GatherMaterials(copper_ore, 3)") == "GatherMaterials"
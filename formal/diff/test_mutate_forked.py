@@ -0,0 +1,73 @@
+"""Tests for the forked mutation runner in `formal/diff/mutate.py`.
+
+The runner forks, so it is driven in a fresh interpreter (a forked child of an
+xdist worker would inherit its threads) over a throwaway package: `core.bump`
+is the mutation target, `user` imports it and `other` does not, which is
+enough to pin the verdict buckets and the eviction closure.
+"""
+
+import json
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+_HERE = Path(__file__).resolve().parent
+
+_DRIVER = textwrap.dedent("""
+    import json, sys
+    from pathlib import Path
+    sys.path.insert(0, sys.argv[1])
+    import mutate
+
+    tree = Path(sys.argv[2])
+    core = tree / "toypkg" / "core.py"
+    mutate._WORKERS = 2
+    units = [
+        (core, "bump: +1 -> +2", "    return x + 1", "    return x + 2", "test_toy.py"),
+        (core, "bump: commute the sum", "    return x + 1", "    return 1 + x", "test_toy.py"),
+        (core, "bump: stale anchor", "    return x - 1", "    return x", "test_toy.py"),
+        (core, "bump: syntax error", "    return x + 1", "    return x +", "test_toy.py"),
+        (core, "bump: bound to a broken test", "    return x + 1", "    return x + 2", "test_broken.py"),
+    ]
+    survivors = []
+    mutate._execute_forked(units, survivors, cwd=tree, roots=(tree,), scopes=(tree,))
+    mutate._preload(["test_toy.py"], tree)
+    evicted = mutate._importers("toypkg.core", mutate._dependents((tree,)))
+    print(json.dumps({"survivors": survivors, "stale": mutate._STALE, "errored": mutate._ERRORED,
+                      "evicted": sorted(evicted), "clean": core.read_text()}))
+""")
+
+
+def _tree(root: Path) -> Path:
+    pkg = root / "toypkg"
+    pkg.mkdir()
+    (pkg / "__init__.py").write_text("")
+    (pkg / "core.py").write_text("def bump(x):\n    return x + 1\n")
+    (pkg / "user.py").write_text("from .core import bump\n\n\ndef twice(x):\n    return bump(x) * 2\n")
+    (pkg / "other.py").write_text("VALUE = 1\n")
+    (root / "test_toy.py").write_text(
+        "from toypkg.other import VALUE\nfrom toypkg.user import twice\n\n\n"
+        "def test_twice():\n    assert twice(VALUE) == 4\n")
+    (root / "test_broken.py").write_text("def test_always_fails():\n    assert False\n")
+    return root
+
+
+def test_forked_runner_sorts_every_mutant_into_its_bucket(tmp_path):
+    tree = _tree(tmp_path)
+    proc = subprocess.run([sys.executable, "-c", _DRIVER, str(_HERE), str(tree)],
+                          capture_output=True, text=True, cwd=tree, timeout=300)
+    assert proc.returncode == 0, proc.stderr
+    out = json.loads(proc.stdout.strip().splitlines()[-1])
+    assert "killed: bump: +1 -> +2" in proc.stdout
+    assert out["survivors"] == [
+        "bump: stale anchor (stale)",
+        "bump: syntax error (harness rc=2)",
+        "bump: bound to a broken test (harness rc=1)",
+        "bump: commute the sum",
+    ]
+    assert out["stale"] == ["bump: stale anchor"]
+    assert out["errored"] == ["bump: syntax error (pytest rc=2: test_toy.py)",
+                              "bump: bound to a broken test (kill-test fails unmutated: test_broken.py)"]
+    assert out["evicted"] == ["toypkg.core", "toypkg.user"]
+    assert out["clean"] == "def bump(x):\n    return x + 1\n"
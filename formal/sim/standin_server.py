@@ -0,0 +1,241 @@
+"""StandinServer — the HTTP half of the offline stand-in for the live API.
+
+Serves a `StandinWorld` over a stdlib `ThreadingHTTPServer` with the three
+behaviours the bot's pacing is built around and the live server is the only
+other source of:
+
+  * Per-bucket sliding-window rate limits, declared in `/my/rates`' own shape
+    (`{bucket: {window: limit}}`) and served back from `/my/rates`, so
+    `play --all` divides exactly the budget it is then held to. Buckets are
+    classified the way `GamePlayer._acquire_*` charges them: `/my/{name}/
+    action/*` is `action`, every other `/my/*` and `/accounts/*` read is
+    `account`, everything else `data`.
+  * HTTP 429 with an integer `Retry-After` (seconds until the binding
+    window's oldest request ages out) when a bucket is exhausted. A throttled
+    request is NOT counted against the window, as on the live server.
+  * A fixed per-request latency, slept outside every lock so concurrent
+    characters overlap their round-trips as they would over the network.
+
+Point the CLI at it with ``ARTIFACTSMMO_API_URL=<server.url>``; any bearer
+token is accepted. `throughput.py` wires both and reports the result.
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+import math
+import threading
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, replace
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, cast
+from urllib.parse import parse_qsl, urlsplit
+
+from formal.sim.standin_world import StandinError, StandinWorld
+
+BUCKETS: tuple[str, ...] = ("account", "data", "action")
+WINDOW_SECONDS: dict[str, float] = {"second": 1.0, "minute": 60.0, "hour": 3600.0, "day": 86400.0}
+
+DEFAULT_RATES: dict[str, dict[str, int]] = {
+    "account": {"second": 10, "hour": 300},
+    "data": {"second": 10, "minute": 200, "hour": 2000},
+    "action": {"second": 10, "minute": 100, "hour": 5000},
+}
+"""The documented per-IP limits (docs/PLAN_multi_character.md's table). The
+live values are whatever the live `/my/rates` says; pass that payload's
+limits as `rates` to mirror it."""
+
+
+def bucket_of(path: str) -> str:
+    """The rate bucket a request path is charged to."""
+    if path.startswith("/my/") and "/action/" in path:
+        return "action"
+    if path.startswith(("/my/", "/accounts/")):
+        return "account"
+    return "data"
+
+
+@dataclass(frozen=True)
+class BucketLoad:
+    """Requests one bucket admitted and refused."""
+
+    requests: int = 0
+    throttled: int = 0
+    retry_after_seconds: float = 0.0
+
+
+class RateWindows:
+    """One bucket's sliding windows over a shared timestamp log."""
+
+    def __init__(self, limits: Mapping[str, int]) -> None:
+        self.limits = dict(limits)
+        self._spans = {WINDOW_SECONDS[name]: limit for name, limit in limits.items()}
+        self._stamps: list[float] = []
+
+    def _prune(self, now: float) -> None:
+        if self._spans:
+            del self._stamps[:bisect.bisect_right(self._stamps, now - max(self._spans))]
+
+    def _used(self, now: float, span: float) -> int:
+        return len(self._stamps) - bisect.bisect_right(self._stamps, now - span)
+
+    def admit(self, now: float) -> float | None:
+        """Record a request at `now` and return None, or return the seconds
+        until every full window has room again (and record nothing)."""
+        self._prune(now)
+        wait = 0.0
+        for span, limit in self._spans.items():
+            used = self._used(now, span)
+            if used >= limit:
+                oldest = self._stamps[len(self._stamps) - used + (used - limit)]
+                wait = max(wait, oldest + span - now)
+        if wait > 0:
+            return wait
+        self._stamps.append(now)
+        return None
+
+    def describe(self, now: float) -> dict[str, dict[str, Any]]:
+        """`/my/rates`' per-window `{limit, remaining, reset}` for this bucket."""
+        self._prune(now)
+        out: dict[str, dict[str, Any]] = {}
+        for name, limit in self.limits.items():
+            span = WINDOW_SECONDS[name]
+            used = self._used(now, span)
+            oldest = self._stamps[-used] if used else now
+            out[name] = {"limit": limit, "remaining": max(0, limit - used),
+                         "reset": datetime.fromtimestamp(oldest + span, tz=timezone.utc).isoformat()}
+        return out
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def _respond(self) -> None:
+        standin = cast(_HTTPServer, self.server).standin
+        parts = urlsplit(self.path)
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        status, body, headers = standin.handle(self.command, parts.path, dict(parse_qsl(parts.query)), raw)
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    do_GET = _respond
+    do_POST = _respond
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """Silence the per-request stderr line."""
+
+
+class _HTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    standin: StandinServer
+
+
+class StandinServer:
+    """HTTP front for a `StandinWorld`: rate windows, 429s, latency, routing."""
+
+    def __init__(
+        self,
+        world: StandinWorld,
+        *,
+        rates: Mapping[str, Mapping[str, int]] = DEFAULT_RATES,
+        latency_seconds: float = 0.0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.world = world
+        self.latency_seconds = latency_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._windows = {bucket: RateWindows(rates.get(bucket, {})) for bucket in BUCKETS}
+        self._load = {bucket: BucketLoad() for bucket in BUCKETS}
+        self._httpd = _HTTPServer((host, port), _Handler)
+        self._httpd.standin = self
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+    def start(self) -> StandinServer:
+        """Serve on a daemon thread; returns self."""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="standin-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving (if started) and release the socket."""
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def __enter__(self) -> StandinServer:
+        return self.start()
+
+    def __exit__(self, *exc: object) -> None:
+        self.stop()
+
+    def load(self) -> dict[str, BucketLoad]:
+        """Per-bucket counters so far."""
+        with self._lock:
+            return dict(self._load)
+
+    def rates(self) -> dict[str, Any]:
+        """The `/my/rates` body: every bucket's windows, plus the two
+        member-only buckets the schema requires and nothing here limits."""
+        with self._lock:
+            now = self._clock()
+            data = {bucket: windows.describe(now) for bucket, windows in self._windows.items()}
+        return {"data": {**data, "simulation": {}, "assistant": {}}}
+
+    def handle(
+        self, method: str, path: str, query: Mapping[str, str], raw: bytes,
+    ) -> tuple[int, dict[str, Any], dict[str, str]]:
+        """(status, JSON body, extra headers) for one request."""
+        bucket = bucket_of(path)
+        with self._lock:
+            wait = self._windows[bucket].admit(self._clock())
+            load = self._load[bucket]
+            if wait is None:
+                self._load[bucket] = replace(load, requests=load.requests + 1)
+            else:
+                retry_after = math.ceil(wait)
+                self._load[bucket] = replace(load, throttled=load.throttled + 1,
+                                             retry_after_seconds=load.retry_after_seconds + retry_after)
+        if wait is not None:
+            return 429, {"error": {"code": 429, "message": "Too many requests."}}, {"Retry-After": str(retry_after)}
+        if self.latency_seconds > 0:
+            time.sleep(self.latency_seconds)
+        try:
+            return 200, self._route(method, path, query, raw), {}
+        except StandinError as e:
+            return e.code, {"error": {"code": e.code, "message": e.message}}, {}
+        except (AttributeError, KeyError, TypeError, ValueError) as e:
+            return 422, {"error": {"code": 422, "message": f"Invalid request: {e!r}"}}, {}
+
+    def _route(self, method: str, path: str, query: Mapping[str, str], raw: bytes) -> dict[str, Any]:
+        if method == "GET":
+            if path == "/my/rates":
+                return self.rates()
+            return self.world.read(path, query)
+        parts = path.strip("/").split("/", 3)
+        if len(parts) != 4 or parts[0] != "my" or parts[2] != "action":
+            raise StandinError(404, f"{path} is not served by the stand-in.")
+        try:
+            body = json.loads(raw) if raw else {}
+        except json.JSONDecodeError:
+            raise StandinError(422, "Request body is not JSON.")
+        return {"data": self.world.act(parts[1], parts[3], body)}
@@ -0,0 +1,859 @@
+"""StandinWorld — the game state behind the offline stand-in server.
+
+`FakeServer` is the OPERATIONAL semantics of four Tier-1 axioms, called
+in-process on a `WorldState`. Nothing there speaks HTTP, so nothing there can
+measure what the bot's throughput actually depends on: request pacing against
+server-side cooldowns, the per-bucket rate windows, 429 back-off and the
+round-trip cost of every read. `StandinWorld` is the state half of a local
+stand-in for the live API (`standin_server.StandinServer` is the HTTP half):
+one account, N characters, a bank, a Grand Exchange book, and the static
+catalog, all served in the live API's JSON shapes so the generated client
+parses every response exactly as it parses the real server's.
+
+SHAPE-FAITHFUL, NOT VALUE-FAITHFUL. Every response carries every field its
+OpenAPI schema requires (the tests round-trip each one through the generated
+`from_dict`), and every rule the bot's pacing depends on is enforced: an action
+inside the previous cooldown is rejected with 499, an action at the wrong tile
+with 598, a full inventory with 497, a missing item with 478. The VALUES are
+deliberately simple: a deterministic alternating-hit fight, one-in-`rate`
+drops from a seeded RNG, flat per-action cooldown seconds
+(`COOLDOWN_SECONDS`, scaled by `cooldown_scale` so an hour of play can run in
+a minute), and a linear XP curve. Access conditions, transition costs, event
+spawns, pending items and achievements progress are not modelled. Use it to
+measure the CLIENT — requests per action, blocked time, 429 handling — never
+to tune game-value estimates.
+
+The catalog comes from a `GameData` cache bundle (the raw API dicts
+`GameData.from_cache_bundle` reads; `tests/test_ai/scenarios/fixtures/
+gamedata_bundle.json` is one), not from `game_data_snapshot.json`: the
+snapshot is a reduced projection with no maps, NPC stock or tasks, so it
+cannot back `/maps`, movement, the bank tile or a tasks master.
+
+Thread-safe: one lock serialises every read and action, and every payload is
+a deep copy taken under it, so `ThreadingHTTPServer` handlers can call in
+concurrently.
+"""
+
+from __future__ import annotations
+
+import copy
+import math
+import random
+import threading
+import time
+import uuid
+from collections import Counter
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass, replace
+from datetime import datetime, timezone
+from typing import Any
+
+from artifactsmmo_cli.ai.elements import ELEMENTS
+
+ACCOUNT = "standin"
+"""The one account every stand-in character belongs to."""
+
+SKILLS: tuple[str, ...] = (
+    "mining", "woodcutting", "fishing", "weaponcrafting", "gearcrafting",
+    "jewelrycrafting", "cooking", "alchemy",
+)
+EQUIPMENT_SLOTS: tuple[str, ...] = (
+    "weapon", "rune", "shield", "helmet", "body_armor", "leg_armor", "boots", "ring1", "ring2",
+    "amulet", "artifact1", "artifact2", "artifact3", "utility1", "utility2", "bag",
+)
+INVENTORY_SLOTS = 20
+BASE_INVENTORY_ITEMS = 100
+MAX_LEVEL = 50
+MAX_FIGHT_TURNS = 100
+UTILITY_STACK = 100
+BANK_EXPANSION_SLOTS = 20
+
+COOLDOWN_SECONDS: dict[str, float] = {
+    "movement": 5.0,        # per tile walked
+    "transition": 5.0,
+    "fight": 2.0,           # per fight turn
+    "gathering": 25.0,
+    "crafting": 10.0,       # per unit crafted
+    "recycling": 10.0,      # per unit recycled
+    "rest_min": 3.0,
+    "rest_per_hp": 0.2,
+    "default": 3.0,         # bank, GE, NPC, task, equip, use, delete
+}
+"""Unscaled cooldown seconds per action family. Round numbers in the live
+server's ballpark; `StandinWorld.cooldown_scale` multiplies every one."""
+
+_STAT_EFFECTS: dict[str, str] = {
+    "hp": "max_hp", "critical_strike": "critical_strike", "initiative": "initiative",
+    "haste": "haste", "wisdom": "wisdom", "prospecting": "prospecting", "threat": "threat",
+    "dmg": "dmg", "inventory_space": "inventory_max_items",
+    **{f"attack_{e}": f"attack_{e}" for e in ELEMENTS},
+    **{f"dmg_{e}": f"dmg_{e}" for e in ELEMENTS},
+    **{f"res_{e}": f"res_{e}" for e in ELEMENTS},
+}
+"""Item effect code -> the character field an equipped item adds it to."""
+
+_HEAL_EFFECTS = ("heal", "restore")
+
+
+class StandinError(Exception):
+    """A request the live server would reject: `code` is its HTTP status and
+    the `error.code` of the `ErrorResponseSchema` body."""
+
+    def __init__(self, code: int, message: str) -> None:
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+@dataclass(frozen=True)
+class CharacterLoad:
+    """What one character did against the stand-in.
+
+    `idle_seconds` is the server's view of blocked time: for every accepted
+    action, how long the character had been off cooldown before it arrived.
+    A client that acted the instant each cooldown ended would score 0; rate
+    governors, 429 back-off, planning and read round-trips all land here."""
+
+    actions: int = 0
+    cooldown_rejections: int = 0
+    errors: int = 0
+    cooldown_seconds: float = 0.0
+    idle_seconds: float = 0.0
+
+
+def max_hp_at(level: int) -> int:
+    """Unequipped max HP: 115 + 5 per level, the line every captured row of
+    `character_base_stats.json` sits on."""
+    return 115 + 5 * level
+
+
+def max_xp_at(level: int) -> int:
+    """XP to the next level. Linear; only the shape (finite, rising) matters."""
+    return 150 * level
+
+
+def _iso(epoch: float) -> str:
+    return datetime.fromtimestamp(epoch, tz=timezone.utc).isoformat()
+
+
+def _page(rows: list[dict[str, Any]], query: Mapping[str, str]) -> dict[str, Any]:
+    size = max(1, min(100, int(query.get("size", "50"))))
+    page = max(1, int(query.get("page", "1")))
+    start = (page - 1) * size
+    return {"data": rows[start:start + size], "total": len(rows), "page": page, "size": size,
+            "pages": max(1, math.ceil(len(rows) / size))}
+
+
+def _matching(rows: Iterable[dict[str, Any]], query: Mapping[str, str]) -> list[dict[str, Any]]:
+    """Rows whose top-level field equals every query parameter naming one.
+    Parameters that name no field (`content_type`, `hide_blocked_maps`, ...)
+    are ignored rather than emulated."""
+    filters = {k: v for k, v in query.items() if k not in ("page", "size")}
+    out = []
+    for row in rows:
+        if all(k not in row or str(row[k]) == v for k, v in filters.items()):
+            out.append(row)
+    return out
+
+
+class StandinWorld:
+    """One account's characters, bank and GE book over a static catalog."""
+
+    def __init__(
+        self,
+        bundle: Mapping[str, Any],
+        characters: Iterable[str],
+        *,
+        cooldown_scale: float = 1.0,
+        seed: int = 0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.cooldown_scale = cooldown_scale
+        self._clock = clock
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._catalog: dict[str, list[dict[str, Any]]] = {
+            key: list(bundle.get(key, [])) for key in (
+                "items", "monsters", "resources", "maps", "npcs", "tasks", "events", "effects",
+                "achievements")
+        }
+        self._items = {i["code"]: i for i in self._catalog["items"]}
+        self._monsters = {m["code"]: m for m in self._catalog["monsters"]}
+        self._resources = {r["code"]: r for r in self._catalog["resources"]}
+        self._npc_items = {(n["npc"], n["code"]): n for n in self._catalog["npcs"]}
+        self._tiles = {(m["layer"], m["x"], m["y"]): m for m in self._catalog["maps"]}
+        self._maps_by_id = {m["map_id"]: m for m in self._catalog["maps"]}
+        bank = dict(bundle.get("bank") or {})
+        self._bank: dict[str, Any] = {
+            "slots": bank.get("slots", 50), "expansions": bank.get("expansions", 0),
+            "next_expansion_cost": bank.get("next_expansion_cost", 4500), "gold": bank.get("gold", 0),
+        }
+        self._bank_items: Counter[str] = Counter()
+        self._orders: dict[str, dict[str, Any]] = {}
+        self._task_rewards: dict[str, dict[str, Any]] = {}
+        self._characters = {name: self._new_character(name) for name in characters}
+        self._ready_at: dict[str, float] = {}
+        self._load = {name: CharacterLoad() for name in self._characters}
+        self._actions: dict[str, Callable[[dict[str, Any], Any], tuple[str, float, dict[str, Any]]]] = {
+            "move": self._move, "transition": self._transition, "rest": self._rest,
+            "fight": self._fight, "gathering": self._gathering, "crafting": self._crafting,
+            "recycling": self._recycling, "use": self._use, "delete": self._delete,
+            "equip": self._equip, "unequip": self._unequip,
+            "bank/deposit/item": self._deposit_item, "bank/withdraw/item": self._withdraw_item,
+            "bank/deposit/gold": self._deposit_gold, "bank/withdraw/gold": self._withdraw_gold,
+            "bank/buy_expansion": self._buy_expansion,
+            "npc/buy": self._npc_buy, "npc/sell": self._npc_sell,
+            "grandexchange/create_sell_order": self._ge_create_sell,
+            "grandexchange/create_buy_order": self._ge_create_buy,
+            "grandexchange/buy": self._ge_buy, "grandexchange/fill": self._ge_fill,
+            "grandexchange/cancel": self._ge_cancel,
+            "task/new": self._task_new, "task/complete": self._task_complete,
+            "task/cancel": self._task_cancel, "task/trade": self._task_trade,
+        }
+
+    # ----- characters -------------------------------------------------------
+
+    def _new_character(self, name: str) -> dict[str, Any]:
+        spawn = self._tiles.get(("overworld", 0, 0), {"map_id": 0})
+        char: dict[str, Any] = {
+            "name": name, "account": ACCOUNT, "skin": "men1", "level": 1, "xp": 0,
+            "max_xp": max_xp_at(1), "gold": 0, "speed": 0,
+            "hp": max_hp_at(1), "max_hp": max_hp_at(1),
+            "x": 0, "y": 0, "layer": "overworld", "map_id": spawn["map_id"],
+            "cooldown": 0, "cooldown_expiration": _iso(self._clock()),
+            "task": "", "task_type": "", "task_progress": 0, "task_total": 0,
+            "inventory_max_items": BASE_INVENTORY_ITEMS, "effects": [],
+            "inventory": [{"slot": i, "code": "", "quantity": 0} for i in range(1, INVENTORY_SLOTS + 1)],
+        }
+        for skill in SKILLS:
+            char.update({f"{skill}_level": 1, f"{skill}_xp": 0, f"{skill}_max_xp": max_xp_at(1)})
+        for slot in EQUIPMENT_SLOTS:
+            char[f"{slot}_slot"] = ""
+        char["utility1_slot_quantity"] = 0
+        char["utility2_slot_quantity"] = 0
+        if "wooden_stick" in self._items:
+            char["weapon_slot"] = "wooden_stick"
+        self._refresh_stats(char)
+        return char
+
+    def _refresh_stats(self, char: dict[str, Any]) -> None:
+        """Recompute every gear-derived stat from the level and equipped items."""
+        stats: Counter[str] = Counter(
+            {"max_hp": max_hp_at(char["level"]), "initiative": 100,
+             "inventory_max_items": BASE_INVENTORY_ITEMS})
+        for slot in EQUIPMENT_SLOTS:
+            item = self._items.get(char[f"{slot}_slot"])
+            if item is None or slot.startswith("utility"):
+                continue
+            for effect in item["effects"]:
+                if (field_name := _STAT_EFFECTS.get(effect["code"])) is not None:
+                    stats[field_name] += effect["value"]
+        for field_name in set(_STAT_EFFECTS.values()):
+            char[field_name] = stats[field_name]
+        char["hp"] = min(char["hp"], char["max_hp"])
+
+    def _character(self, name: str) -> dict[str, Any]:
+        char = self._characters.get(name)
+        if char is None:
+            raise StandinError(498, "Character not found.")
+        return char
+
+    def _tile(self, char: dict[str, Any]) -> dict[str, Any] | None:
+        return self._tiles.get((char["layer"], char["x"], char["y"]))
+
+    def _content(self, char: dict[str, Any], kind: str) -> str:
+        """The code of the `kind` content on the character's tile, or 598."""
+        tile = self._tile(char)
+        content = (tile or {}).get("interactions", {}).get("content") or {}
+        if content.get("type") != kind:
+            raise StandinError(598, f"No {kind} on this map.")
+        return str(content["code"])
+
+    def _grant_xp(self, char: dict[str, Any], prefix: str, xp: int) -> None:
+        level_key, xp_key, max_key = f"{prefix}level", f"{prefix}xp", f"{prefix}max_xp"
+        char[xp_key] += xp
+        while char[level_key] < MAX_LEVEL and char[xp_key] >= char[max_key]:
+            char[xp_key] -= char[max_key]
+            char[level_key] += 1
+            char[max_key] = max_xp_at(char[level_key])
+        if not prefix:
+            self._refresh_stats(char)
+
+    # ----- inventory ----------------------------------------------------------
+
+    @staticmethod
+    def _inventory(char: dict[str, Any]) -> Counter[str]:
+        return Counter({s["code"]: s["quantity"] for s in char["inventory"] if s["code"]})
+
+    @staticmethod
+    def _store(char: dict[str, Any], counts: Counter[str]) -> None:
+        """Write `counts` back, keeping each held code in its slot. Validates
+        fully before touching the character, so a 497 leaves it unchanged."""
+        if counts.total() > char["inventory_max_items"]:
+            raise StandinError(497, "Character inventory is full.")
+        slots = [dict(s) for s in char["inventory"]]
+        placed = set()
+        for slot in slots:
+            if slot["code"] and counts[slot["code"]] > 0:
+                slot["quantity"] = counts[slot["code"]]
+                placed.add(slot["code"])
+            else:
+                slot["code"], slot["quantity"] = "", 0
+        for code, qty in counts.items():
+            if qty <= 0 or code in placed:
+                continue
+            free = next((s for s in slots if not s["code"]), None)
+            if free is None:
+                raise StandinError(497, "Character inventory is full.")
+            free["code"], free["quantity"] = code, qty
+        char["inventory"] = slots
+
+    @staticmethod
+    def _take(counts: Counter[str], code: str, qty: int) -> None:
+        if qty < 1 or counts[code] < qty:
+            raise StandinError(478, "Missing item or insufficient quantity.")
+        counts[code] -= qty
+
+    def _item(self, code: str) -> dict[str, Any]:
+        item = self._items.get(code)
+        if item is None:
+            raise StandinError(404, "Item not found.")
+        return item
+
+    def _roll(self, drops: Iterable[Mapping[str, Any]]) -> list[dict[str, Any]]:
+        """One-in-`rate` per drop, quantity uniform in [min, max]."""
+        out = []
+        for drop in drops:
+            if self._rng.randrange(max(1, drop["rate"])) == 0:
+                out.append({"code": drop["code"],
+                            "quantity": self._rng.randint(drop["min_quantity"], drop["max_quantity"])})
+        return out
+
+    # ----- actions ------------------------------------------------------------
+
+    def act(self, name: str, action: str, body: Any) -> dict[str, Any]:
+        """Run `POST /my/{name}/action/{action}` and return its `data` payload.
+
+        Enforces the cooldown first (499, counted as a rejection), then the
+        action's own rules; the cooldown starts only when the action succeeds."""
+        with self._lock:
+            char = self._character(name)
+            load = self._load[name]
+            handler = self._actions.get(action)
+            if handler is None:
+                self._load[name] = replace(load, errors=load.errors + 1)
+                raise StandinError(404, f"Action {action!r} is not modelled by the stand-in.")
+            now = self._clock()
+            ready = self._ready_at.get(name)
+            if ready is not None and now < ready:
+                self._load[name] = replace(load, cooldown_rejections=load.cooldown_rejections + 1)
+                raise StandinError(499, f"Character in cooldown: {ready - now:.2f} seconds remaining.")
+            try:
+                reason, seconds, payload = handler(char, body or {})
+            except StandinError:
+                self._load[name] = replace(load, errors=load.errors + 1)
+                raise
+            seconds *= self.cooldown_scale
+            self._ready_at[name] = now + seconds
+            whole = math.ceil(seconds)
+            char["cooldown"] = whole
+            char["cooldown_expiration"] = _iso(now + seconds)
+            self._load[name] = replace(
+                load, actions=load.actions + 1, cooldown_seconds=load.cooldown_seconds + seconds,
+                idle_seconds=load.idle_seconds + (max(0.0, now - ready) if ready is not None else 0.0))
+            cooldown = {"total_seconds": whole, "remaining_seconds": whole, "started_at": _iso(now),
+                        "expiration": _iso(now + seconds), "reason": reason}
+            if "characters" not in payload:
+                payload["character"] = char
+            return copy.deepcopy({"cooldown": cooldown, **payload})
+
+    def _move(self, char: dict[str, Any], body: Any) -> tuple[str, float, dict[str, Any]]:
+        if "map_id" in body:
+            dest = self._maps_by_id.get(body["map_id"])
+            if dest is not None and dest["layer"] != char["layer"]:
+                dest = None
+        else:
+            dest = self._tiles.get((char["layer"], body.get("x"), body.get("y")))
+        if dest is None:
+            raise StandinError(404, "Map not found.")
+        if dest["access"]["type"] == "blocked":
+            raise StandinError(596, "Map is blocked.")
+        if (dest["x"], dest["y"]) == (char["x"], char["y"]):
+            raise StandinError(490, "Character already at this location.")
+        path = [[char["x"], char["y"]]]
+        while path[-1] != [dest["x"], dest["y"]]:
+            x, y = path[-1]
+            if x != dest["x"]:
+                path.append([x + (1 if dest["x"] > x else -1), y])
+            else:
+                path.append([x, y + (1 if dest["y"] > y else -1)])
+        char.update(x=dest["x"], y=dest["y"], map_id=dest["map_id"])
+        return "movement", COOLDOWN_SECONDS["movement"] * (len(path) - 1), {"destination": dest, "path": path}
+
+    def _transition(self, char: dict[str, Any], body: Any) -> tuple[str, float, dict[str, Any]]:
+        transition = ((self._tile(char) or {}).get("interactions", {}).get("transition"))
+        if not transition:
+            raise StandinError(404, "No transition on this map.")
+        dest = self._maps_by_id.get(transition["map_id"])
+        if dest is None:
+            raise StandinError(404, "Map not found.")
+        char.update(x=dest["x"], y=dest["y"], layer=dest["layer"], map_id=dest["map_id"])
+        return "transition", COOLDOWN_SECONDS["transition"], {
+            "destination": dest, "transition": {**transition, "conditions": transition.get("conditions", [])}}
+
+    def _rest(self, char: dict[str, Any], body: Any) -> tuple[str, float, dict[str, Any]]:
+        restored = char["max_hp"] - char["hp"]
+        char["hp"] = char["max_hp"]
+        seconds = max(COOLDOWN_SECONDS["rest_min"], restored * COOLDOWN_SECONDS["rest_per_hp"])
+        return "rest", seconds, {"hp_restored": restored}
+
+    def _fight(self, char: dict[str, Any], body: Any) -> tuple[str, float, dict[str, Any]]:
+        monster = self._monsters.get(self._content(char, "monster"))
+        if monster is None:
+            raise StandinError(404, "Monster not found.")
+        if self._inventory(char).total() >= char["inventory_max_items"]:
+            raise StandinError(497, "Character inventory is full.")
+        hit = max(1, sum(
+            round(char[f"attack_{e}"] * (1 + (char["dmg"] + char[f"dmg_{e}"]) / 100)
+                  * (1 - monster[f"res_{e}"] / 100)) for e in ELEMENTS))
+        taken = max(0, sum(round(monster[f"attack_{e}"] * (1 - char[f"res_{e}"] / 100)) for e in ELEMENTS))
+        hp, monster_hp = char["hp"], monster["hp"]
+        player_turn = char["initiative"] >= monster["initiative"]
+        turns = 0
+        while hp > 0 and monster_hp > 0 and turns < MAX_FIGHT_TURNS:
+            turns += 1
+            if player_turn:
+                monster_hp -= hit
+            else:
+                hp -= taken
+            player_turn = not player_turn
+        won = monster_hp <= 0
+        result: dict[str, Any] = {"character_name": char["name"], "xp": 0, "gold": 0, "drops": [],
+                                  "final_hp": max(1, hp)}
+        if won:
+            result["xp"] = 10 * monster["level"]
+            result["gold"] = self._rng.randint(monster["min_gold"], monster["max_gold"])
+            result["drops"] = self._roll(monster["drops"])
+            counts = self._inventory(char)
+            counts.update({d["code"]: d["quantity"] for d in result["drops"]})
+            self._store(char, counts)
+        char["hp"] = result["final_hp"]
+        if won:
+            char["gold"] += result["gold"]
+            self._grant_xp(char, "", result["xp"])
+            if char["task_type"] == "monsters" and char["task"] == monster["code"]:
+                char["task_progress"] = min(char["task_total"], char["task_progress"] + 1)
+        fight = {"result": "win" if won else "loss", "turns": turns, "opponent": monster["code"],
+                 "logs": [], "characters": [result]}
+        return "fight", COOLDOWN_SECONDS["fight"] * turns, {"fight": fight, "characters": [char]}
+
+    def _gathering(self, char: dict[str, Any], body: Any) -> tuple[str, float, dict[str, Any]]:
+        resource = self._resources.get(self._content(char, "resource"))
+        if resource is None:
+            raise StandinError(404, "Resource not found.")
+        skill = resource["skill"]
+        if char[f"{skill}_level"] < resource["level"]:
+            raise StandinError(493, "Skill level too low.")
+        items = self._roll(resource["drops"])
+        counts = self._inventory(char)
+        counts.update({d["code"]: d["quantity"] for d in items})
+        self._store(char, counts)
+        xp = 5 + 2 * resource["level"]
+        self._grant_xp(char, f"{skill}_", xp)
+        return "gathering", COOLDOWN_SECONDS["gathering"], {"details": {"xp": xp, "items": items}}
+
+    def _crafting(self, char: dict[str, Any], body: Any) -> tuple[str, float, dict[str, Any]]:
+        item = self._item(body.get("code", ""))
+        craft = item.get("craft")
+        if not craft:
+            raise StandinError(404, "Craft not found.")
+        qty = int(body.get("quantity", 1))
+        if self._content(char, "workshop") != craft["skill"]:
+            raise StandinError(598, "Wrong workshop for this craft.")
+        if char[f"{craft['skill']}_level"] < craft["level"]:
+            raise StandinError(493, "Skill level too low.")
+        counts = self._inventory(char)
+        for need in craft["items"]:
+            self._take(counts, need["code"], need["quantity"] * qty)
+        made = craft["quantity"] * qty
+        counts[item["code"]] += made
+        self._store(char, counts)
+        xp = 10 * max(1, craft["level"]) * qty
+        self._grant_xp(char, f"{craft['skill']}_", xp)
+        return "crafting", COOLDOWN_SECONDS["crafting"] * qty, {
+            "details": {"xp": xp, "items": [{"code": item["code"], "quantity": made}]}}
+
+    def _recycling(self, char: dict[str, Any], body: Any) -> tuple[str, float, dict[str, Any]]:
+        item = self._item(body.get("code", ""))
+        craft = item.get("craft")
+        if not craft or not item.get("recyclable", True):
+            raise StandinError(473, "This item cannot be recycled.")
+        qty = int(body.get("quantity", 1))
+        if self._content(char, "workshop") != craft["skill"]:
+            raise StandinError(598, "Wrong workshop for this item.")
+        counts = self._inventory(char)
+        self._take(counts, item["code"], qty)
+        back = [{"code": need["code"], "quantity": max(1, need["quantity"] // 2) * qty} for need in craft["items"]]
+        counts.update({d["code"]: d["quantity"] for d in back})
+        self._store(char, counts)
+        return "recycling", COOLDOWN_SECONDS["recycling"] * qty, {"details": {"items": back}}
+
+    def _use(self, char: dict[str, Any], body: Any) -> tuple[str, float, dict[str, Any]]:
+        item = self._item(body.get("code", ""))
+        if item["type"] != "consumable":
+            raise StandinError(476, "This item is not a consumable.")
+        qty = int(body.get("quantity", 1))
+        counts = self._inventory(char)
+        self._take(counts, item["code"], qty)
+        self._store(char, counts)
+        heal = sum(e["value"] for e in item["effects"] if e["code"] in _HEAL_EFFECTS) * qty
+        char["hp"] = min(char["max_hp"], char["hp"] + heal)
+        return "use", COOLDOWN_SECONDS["default"], {"item": item}
+
+    def _delete(self, char: dict[str, Any], body: Any) -> tuple[str, float, dict[str, Any]]:
+        code, qty = body.get("code", ""), int(body.get("quantity", 1))
+        counts = self._inventory(char)
+        self._take(counts, code, qty)
+        self._store(char, counts)
+        return "delete_item", COOLDOWN_SECONDS["default"], {"item": {"code": code, "quantity": qty}}
+
+    def _equip(self, char: dict[str, Any], body: Any) -> tuple[str, float, dict[str, Any]]:
+        moves = list(body) if isinstance(body, list) else [body]
+        items = [self._equip_one(char, move) for move in moves]
+        return "equip", COOLDOWN_SECONDS["default"], {"items": items}
+
+    def _equip_one(self, char: dict[str, Any], body: Any) -> dict[str, Any]:
+        slot = str(body.get("slot", ""))
+        if slot not in EQUIPMENT_SLOTS:
+            raise StandinError(422, f"Unknown slot {slot!r}.")
+        item = self._item(body.get("code", ""))
+        qty = int(body.get("quantity", 1)) if slot.startswith("utility") else 1
+        if item["type"] != slot.rstrip("123"):
+            raise StandinError(422, "Item type does not fit this slot.")
+        if item["level"] > char["level"]:
+            raise StandinError(496, "Character level is too low for this item.")
+        current = char[f"{slot}_slot"]
+        twins = [s for s in EQUIPMENT_SLOTS if s != slot and s.rstrip("123") == slot.rstrip("123")]
+        if not slot.startswith("ring") and any(char[f"{s}_slot"] == item["code"] for s in twins):
+            raise StandinError(485, "This item is already equipped.")
+        stacked = current == item["code"] and slot.startswith("utility")
+        held = char[f"{slot}_slot_quantity"] if slot.startswith("utility") else 1
+        if stacked and held + qty > UTILITY_STACK:
+            raise StandinError(484, "Utility slot is full.")
+        counts = self._inventory(char)
+        self._take(counts, item["code"], qty)
+        if current and not stacked:
+            # The live server swaps: the worn item goes back to the bag.
+            counts[current] += held
+        self._store(char, counts)
+        char[f"{slot}_slot"] = item["code"]
+        if slot.startswith("utility"):
+            char[f"{slot}_slot_quantity"] = held + qty if stacked else qty
+        self._refresh_stats(char)
+        return {"slot": slot, "item": item}
+
+    def _unequip(self, char: dict[str, Any], body: Any) -> tuple[str, float, dict[str, Any]]:
+        moves = list(body) if isinstance(body, list) else [body]
+        items = [self._unequip_one(char, move) for move in moves]
+        return "unequip", COOLDOWN_SECONDS["default"], {"items": items}
+
+    def _unequip_one(self, char: dict[str, Any], body: Any) -> dict[str, Any]:
+        slot = str(body.get("slot", ""))
+        if slot not in EQUIPMENT_SLOTS:
+            raise StandinError(422, f"Unknown slot {slot!r}.")
+        code = char[f"{slot}_slot"]
+        if not code:
+            raise StandinError(491, "Equipment slot is empty.")
+        held = char[f"{slot}_slot_quantity"] if slot.startswith("utility") else 1
+        qty = min(held, int(body.get("quantity", held)))
+        counts = self._inventory(char)
+        counts[code] += qty
+        self._store(char, counts)
+        if slot.startswith("utility"):
+            char[f"{slot}_slot_quantity"] -= qty
+            if char[f"{slot}_slot_quantity"] == 0:
+                char[f"{slot}_slot"] = ""
+        else:
+            char[f"{slot}_slot"] = ""
+        self._refresh_stats(char)
+        return {"slot": slot, "item": self._items[code]}
+
+    def _bank_rows(self) -> list[dict[str, Any]]:
+        return [{"code": c, "quantity": q} for c, q in sorted(self._bank_items.items()) if q > 0]
+
+    def _deposit_item(self, char: dict[str, Any], body: Any) -> tuple[str, float, dict[str, Any]]:
+        self._content(char, "bank")
+        moves = list(body) if isinstance(body, list) else [body]
+        counts = self._inventory(char)
+        bank = Counter(self._bank_items)
+        for move in moves:
+            self._take(counts, move.get("code", ""), int(move.get("quantity", 0)))
+            bank[move["code"]] += int(move["quantity"])
+        if len(+bank) > self._bank["slots"]:
+            raise StandinError(462, "Bank is full.")
+        self._store(char, counts)
+        self._bank_items = +bank
+        return "deposit_item", COOLDOWN_SECONDS["default"], {"items": moves, "bank": self._bank_rows()}
+
+    def _withdraw_item(self, char: dict[str, Any], body: Any) -> tuple[str, float, dict[str, Any]]:
+        self._content(char, "bank")
+        moves = list(body) if isinstance(body, list) else [body]
+        counts = self._inventory(char)
+        bank = Counter(self._bank_items)
+        for move in moves:
+            code, qty = move.get("code", ""), int(move.get("quantity", 0))
+            if qty < 1 or bank[code] < qty:
+                raise StandinError(404, "Item not found in the bank.")
+            bank[code] -= qty
+            counts[code] += qty
+        self._store(char, counts)
+        self._bank_items = +bank
+        return "withdraw_item", COOLDOWN_SECONDS["default"], {"items": moves, "bank": self._bank_rows()}
+
+    def _deposit_gold(self, char: dict[str, Any], body: Any) -> tuple[str, float, dict[str, Any]]:
+        self._content(char, "bank")
+        qty = int(body.get("quantity", 0))
+        if qty < 1 or char["gold"] < qty:
+            raise StandinError(492, "Insufficient gold.")
+        char["gold"] -= qty
+        self._bank["gold"] += qty
+        return "deposit_gold", COOLDOWN_SECONDS["default"], {"bank": {"quantity": self._bank["gold"]}}
+
+    def _withdraw_gold(self, char: dict[str, Any], body: Any) -> tuple[str, float, dict[str, Any]]:
+        self._content(char, "bank")
+        qty = int(body.get("quantity", 0))
+        if qty < 1 or self._bank["gold"] < qty:
+            raise StandinError(460, "Insufficient gold in the bank.")
+        self._bank["gold"] -= qty
+        char["gold"] += qty
+        return "withdraw_gold", COOLDOWN_SECONDS["default"], {"bank": {"quantity": self._bank["gold"]}}
+
+    def _buy_expansion(self, char: dict[str, Any], body: Any) -> tuple[str, float, dict[str, Any]]:
+        self._content(char, "bank")
+        price = self._bank["next_expansion_cost"]
+        if char["gold"] < price:
+            raise StandinError(492, "Insufficient gold.")
+        char["gold"] -= price
+        self._bank.update(slots=self._bank["slots"] + BANK_EXPANSION_SLOTS,
+                          expansions=self._bank["expansions"] + 1, next_expansion_cost=price * 2)
+        return "buy_bank_expansion", COOLDOWN_SECONDS["default"], {"transaction": {"price": price}}
+
+    def _npc_trade(self, char: dict[str, Any], body: Any, side: str) -> tuple[str, float, dict[str, Any]]:
+        npc = self._content(char, "npc")
+        code, qty = body.get("code", ""), int(body.get("quantity", 1))
+        offer = self._npc_items.get((npc, code))
+        price = (offer or {}).get(f"{side}_price")
+        if offer is None or price is None:
+            raise StandinError(441 if side == "buy" else 442, f"This NPC does not {side} this item.")
+        total, currency = price * qty, offer["currency"]
+        counts = self._inventory(char)
+        if side == "buy":
+            if currency == "gold":
+                if char["gold"] < total:
+                    raise StandinError(492, "Insufficient gold.")
+            else:
+                self._take(counts, currency, total)
+            counts[code] += qty
+        else:
+            self._take(counts, code, qty)
+            if currency != "gold":
+                counts[currency] += total
+        self._store(char, counts)
+        if currency == "gold":
+            char["gold"] += -total if side == "buy" else total
+        transaction = {"code": code, "quantity": qty, "currency": currency, "price": price, "total_price": total}
+        return f"{side}_npc", COOLDOWN_SECONDS["default"], {"transaction": transaction}
+
+    def _npc_buy(self, char: dict[str, Any], body: Any) -> tuple[str, float, dict[str, Any]]:
+        return self._npc_trade(char, body, "buy")
+
+    def _npc_sell(self, char: dict[str, Any], body: Any) -> tuple[str, float, dict[str, Any]]:
+        return self._npc_trade(char, body, "sell")
+
+    def _ge_create(self, char: dict[str, Any], body: Any, side: str) -> tuple[str, float, dict[str, Any]]:
+        self._content(char, "grand_exchange")
+        code, qty, price = body.get("code", ""), int(body.get("quantity", 0)), int(body.get("price", 0))
+        self._item(code)
+        if qty < 1 or price < 1:
+            raise StandinError(422, "Quantity and price must be positive.")
+        if side == "sell":
+            counts = self._inventory(char)
+            self._take(counts, code, qty)
+            self._store(char, counts)
+        elif char["gold"] < qty * price:
+            raise StandinError(492, "Insufficient gold.")
+        else:
+            char["gold"] -= qty * price
+        now = _iso(self._clock())
+        order_id = uuid.UUID(int=self._rng.getrandbits(128)).hex
+        self._orders[order_id] = {"id": order_id, "type": side, "code": code, "quantity": qty, "price": price,
+                                  "created_at": now, "account": ACCOUNT}
+        created = {"id": order_id, "created_at": now, "code": code, "quantity": qty, "price": price,
+                   "total_price": qty * price}
+        return "sell_ge" if side == "sell" else "create_buy_order_ge", COOLDOWN_SECONDS["default"], {"order": created}
+
+    def _ge_create_sell(self, char: dict[str, Any], body: Any) -> tuple[str, float, dict[str, Any]]:
+        return self._ge_create(char, body, "sell")
+
+    def _ge_create_buy(self, char: dict[str, Any], body: Any) -> tuple[str, float, dict[str, Any]]:
+        return self._ge_create(char, body, "buy")
+
+    def _ge_order(self, body: Any, side: str) -> tuple[dict[str, Any], int]:
+        order = self._orders.get(str(body.get("id", "")))
+        if order is None or order["type"] != side:
+            raise StandinError(404, "Order not found.")
+        qty = int(body.get("quantity", 0))
+        if qty < 1 or qty > order["quantity"]:
+            raise StandinError(434, "This order does not hold that quantity.")
+        return order, qty
+
+    def _settle(self, order: dict[str, Any], qty: int) -> dict[str, Any]:
+        order["quantity"] -= qty
+        if order["quantity"] == 0:
+            del self._orders[order["id"]]
+        return {"id": order["id"], "code": order["code"], "quantity": qty, "price": order["price"],
+                "total_price": qty * order["price"]}
+
+    def _ge_buy(self, char: dict[str, Any], body: Any) -> tuple[str, float, dict[str, Any]]:
+        """Buy from a sell order. The seller is this account, so the proceeds
+        land in the shared bank (the live server routes them through pending
+        items, which the stand-in does not model)."""
+        self._content(char, "grand_exchange")
+        order, qty = self._ge_order(body, "sell")
+        total = qty * order["price"]
+        if char["gold"] < total:
+            raise StandinError(492, "Insufficient gold.")
+        counts = self._inventory(char)
+        counts[order["code"]] += qty
+        self._store(char, counts)
+        char["gold"] -= total
+        self._bank["gold"] += total
+        return "buy_ge", COOLDOWN_SECONDS["default"], {"order": self._settle(order, qty)}
+
+    def _ge_fill(self, char: dict[str, Any], body: Any) -> tuple[str, float, dict[str, Any]]:
+        """Sell into a buy order; the bought items land in the shared bank."""
+        self._content(char, "grand_exchange")
+        order, qty = self._ge_order(body, "buy")
+        counts = self._inventory(char)
+        self._take(counts, order["code"], qty)
+        self._store(char, counts)
+        char["gold"] += qty * order["price"]
+        self._bank_items[order["code"]] += qty
+        return "fill_buy_order_ge", COOLDOWN_SECONDS["default"], {"order": self._settle(order, qty)}
+
+    def _ge_cancel(self, char: dict[str, Any], body: Any) -> tuple[str, float, dict[str, Any]]:
+        self._content(char, "grand_exchange")
+        order = self._orders.get(str(body.get("id", "")))
+        if order is None:
+            raise StandinError(404, "Order not found.")
+        if order["type"] == "sell":
+            counts = self._inventory(char)
+            counts[order["code"]] += order["quantity"]
+            self._store(char, counts)
+        else:
+            char["gold"] += order["quantity"] * order["price"]
+        return "cancel_ge", COOLDOWN_SECONDS["default"], {"order": self._settle(order, order["quantity"])}
+
+    def _task_new(self, char: dict[str, Any], body: Any) -> tuple[str, float, dict[str, Any]]:
+        kind = self._content(char, "tasks_master")
+        if char["task"]:
+            raise StandinError(489, "Character already has a task.")
+        pool = [t for t in self._catalog["tasks"] if t["type"] == kind and t["level"] <= char["level"]]
+        if not pool:
+            raise StandinError(404, "No task available.")
+        task = self._rng.choice(pool)
+        total = self._rng.randint(task["min_quantity"], task["max_quantity"])
+        char.update(task=task["code"], task_type=kind, task_progress=0, task_total=total)
+        self._task_rewards[char["name"]] = task["rewards"]
+        return "task", COOLDOWN_SECONDS["default"], {
+            "task": {"code": task["code"], "type": kind, "total": total, "rewards": task["rewards"]}}
+
+    def _task_complete(self, char: dict[str, Any], body: Any) -> tuple[str, float, dict[str, Any]]:
+        self._content(char, "tasks_master")
+        if not char["task"]:
+            raise StandinError(487, "Character has no task.")
+        if char["task_progress"] < char["task_total"]:
+            raise StandinError(488, "Task is not completed.")
+        rewards = self._task_rewards.pop(char["name"], {"items": [], "gold": 0})
+        counts = self._inventory(char)
+        counts.update({r["code"]: r["quantity"] for r in rewards["items"]})
+        self._store(char, counts)
+        char["gold"] += rewards["gold"]
+        char.update(task="", task_type="", task_progress=0, task_total=0)
+        return "task", COOLDOWN_SECONDS["default"], {"rewards": rewards}
+
+    def _task_cancel(self, char: dict[str, Any], body: Any) -> tuple[str, float, dict[str, Any]]:
+        self._content(char, "tasks_master")
+        if not char["task"]:
+            raise StandinError(487, "Character has no task.")
+        counts = self._inventory(char)
+        self._take(counts, "tasks_coin", 1)
+        self._store(char, counts)
+        self._task_rewards.pop(char["name"], None)
+        char.update(task="", task_type="", task_progress=0, task_total=0)
+        return "task", COOLDOWN_SECONDS["default"], {}
+
+    def _task_trade(self, char: dict[str, Any], body: Any) -> tuple[str, float, dict[str, Any]]:
+        self._content(char, "tasks_master")
+        code, qty = body.get("code", ""), int(body.get("quantity", 0))
+        if char["task_type"] != "items" or char["task"] != code:
+            raise StandinError(474, "This item is not the character's task.")
+        if char["task_progress"] + qty > char["task_total"]:
+            raise StandinError(475, "Task already holds enough of this item.")
+        counts = self._inventory(char)
+        self._take(counts, code, qty)
+        self._store(char, counts)
+        char["task_progress"] += qty
+        return "task", COOLDOWN_SECONDS["default"], {"trade": {"code": code, "quantity": qty}}
+
+    # ----- reads --------------------------------------------------------------
+
+    _CATALOG_ROUTES: dict[str, str] = {
+        "/items": "items", "/monsters": "monsters", "/resources": "resources", "/maps": "maps",
+        "/npcs/items": "npcs", "/tasks/list": "tasks", "/events": "events", "/effects": "effects",
+        "/achievements": "achievements",
+    }
+
+    def read(self, path: str, query: Mapping[str, str]) -> dict[str, Any]:
+        """The full response body for `GET path`; 404 for an unserved route."""
+        with self._lock:
+            return copy.deepcopy(self._read(path.rstrip("/") or "/", query))
+
+    def _read(self, path: str, query: Mapping[str, str]) -> dict[str, Any]:
+        if path in self._CATALOG_ROUTES:
+            return _page(_matching(self._catalog[self._CATALOG_ROUTES[path]], query), query)
+        if path in ("/events/active", "/raids", "/my/pending_items"):
+            return _page([], query)
+        if path == "/":
+            return {"data": {"version": "standin", "server_time": _iso(self._clock()), "max_level": MAX_LEVEL,
+                             "max_skill_level": MAX_LEVEL, "characters_online": len(self._characters),
+                             "rate_limits": []}}
+        if path == "/my/details":
+            return {"data": {"username": ACCOUNT, "email": f"{ACCOUNT}@localhost", "member": False,
+                             "status": "standard", "skins": [], "gems": 0, "achievements_points": 0,
+                             "banned": False}}
+        if path == "/my/characters":
+            return {"data": [self._characters[n] for n in sorted(self._characters)]}
+        if path == "/my/bank":
+            return {"data": dict(self._bank)}
+        if path == "/my/bank/items":
+            return _page(_matching(self._bank_rows(), query), query)
+        if path in ("/grandexchange/orders", "/my/grandexchange/orders"):
+            return _page(_matching(sorted(self._orders.values(), key=lambda o: o["created_at"]), query), query)
+        parts = path.strip("/").split("/")
+        if len(parts) == 2 and parts[0] == "characters":
+            return {"data": self._character(parts[1])}
+        if len(parts) == 3 and parts[0] == "accounts" and parts[2] == "achievements":
+            return _page(self._catalog["achievements"], query)
+        if len(parts) == 2 and parts[0] == "achievements":
+            found = next((a for a in self._catalog["achievements"] if a["code"] == parts[1]), None)
+            if found is not None:
+                return {"data": found}
+        raise StandinError(404, f"{path} is not served by the stand-in.")
+
+    # ----- metrics ------------------------------------------------------------
+
+    def load(self) -> dict[str, CharacterLoad]:
+        """Per-character counters so far."""
+        with self._lock:
+            return dict(self._load)
@@ -0,0 +1,273 @@
+"""Throughput harness: N characters against the offline stand-in server.
+
+Starts a `StandinServer` over a fresh `StandinWorld`, drives every character
+for a fixed wall-clock duration, and reports what the server saw:
+
+  * actions/hour, per character and in total;
+  * blocked time — per character, the seconds it sat off cooldown before its
+    next action arrived (`CharacterLoad.idle_seconds`), and the share of the
+    run its cooldowns actually covered;
+  * requests, 429s and handed-out Retry-After seconds per rate bucket.
+
+Two drivers:
+
+  * ``scripted`` (default): one thread per character running a fixed
+    fight/rest/deposit loop through the generated client, honouring each
+    cooldown and each 429's Retry-After. It has no planner, so it is the
+    ceiling a client can reach under the given cooldowns, limits and latency.
+  * ``play``: the real bot, ``artifactsmmo play --all`` in a subprocess
+    pointed at the stand-in through ``ARTIFACTSMMO_API_URL``, with ``HOME`` in
+    a temp dir so the game-data cache and learning DB are the stand-in's own.
+    The gap between the two is what planning, reads and rate governors cost.
+
+Usage:
+  uv run python -m formal.sim.throughput --characters 5 --duration 120 \\
+      --driver play --cooldown-scale 0.1 --latency-ms 40
+
+Cooldowns are scaled by ``--cooldown-scale``, so actions/hour is per WALL
+hour at that scale; compare runs only at the same scale.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections.abc import Mapping, Sequence
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+import httpx
+from artifactsmmo_api_client import AuthenticatedClient
+from artifactsmmo_api_client.api.characters.get_character_characters_name_get import sync as get_character
+from artifactsmmo_api_client.api.my_characters.action_deposit_bank_item_my_name_action_bank_deposit_item_post import (
+    sync as action_deposit_bank_item,
+)
+from artifactsmmo_api_client.api.my_characters.action_fight_my_name_action_fight_post import sync as action_fight
+from artifactsmmo_api_client.api.my_characters.action_move_my_name_action_move_post import sync as action_move
+from artifactsmmo_api_client.api.my_characters.action_rest_my_name_action_rest_post import sync as action_rest
+from artifactsmmo_api_client.models.character_response_schema import CharacterResponseSchema
+from artifactsmmo_api_client.models.character_schema import CharacterSchema
+from artifactsmmo_api_client.models.destination_schema import DestinationSchema
+from artifactsmmo_api_client.models.fight_request_schema import FightRequestSchema
+from artifactsmmo_api_client.models.simple_item_schema import SimpleItemSchema
+from artifactsmmo_api_client.types import Unset
+
+from artifactsmmo_cli.rate_limit_detector import detect_rate_limited_response
+from artifactsmmo_cli.rate_limited_error import RateLimitedError
+from artifactsmmo_cli.utils.retry_after import retry_after_seconds
+from formal.sim.standin_server import DEFAULT_RATES, BucketLoad, StandinServer
+from formal.sim.standin_world import CharacterLoad, StandinWorld
+
+DEFAULT_BUNDLE = Path(__file__).resolve().parents[2] / "tests" / "test_ai" / "scenarios" / "fixtures" / (
+    "gamedata_bundle.json")
+DRIVERS = ("scripted", "play")
+TOKEN = "standin"
+PLAY_SHUTDOWN_SECONDS = 30.0
+
+
+@dataclass(frozen=True)
+class ThroughputReport:
+    """One run's server-side measurements."""
+
+    driver: str
+    elapsed_seconds: float
+    cooldown_scale: float
+    latency_seconds: float
+    characters: Mapping[str, CharacterLoad]
+    buckets: Mapping[str, BucketLoad]
+
+    def per_hour(self, count: float) -> float:
+        return count * 3600.0 / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    @property
+    def actions(self) -> int:
+        return sum(load.actions for load in self.characters.values())
+
+    @property
+    def actions_per_hour(self) -> float:
+        return self.per_hour(self.actions)
+
+    @property
+    def idle_seconds(self) -> float:
+        return sum(load.idle_seconds for load in self.characters.values())
+
+    def to_json(self) -> str:
+        return json.dumps({**asdict(self), "actions": self.actions, "actions_per_hour": self.actions_per_hour},
+                          sort_keys=True)
+
+    def render(self) -> str:
+        lines = [
+            f"driver={self.driver} elapsed={self.elapsed_seconds:.1f}s cooldown_scale={self.cooldown_scale:g} "
+            f"latency={self.latency_seconds * 1000:.0f}ms",
+            f"total: {self.actions} actions, {self.actions_per_hour:.0f} actions/h, "
+            f"{self.idle_seconds:.1f}s blocked",
+            "",
+            f"{'character':<14}{'actions':>9}{'act/h':>9}{'cooldown%':>11}{'blocked s':>11}{'499s':>7}{'errors':>8}",
+        ]
+        for name, load in sorted(self.characters.items()):
+            busy = min(100.0, 100.0 * load.cooldown_seconds / self.elapsed_seconds) if self.elapsed_seconds else 0.0
+            lines.append(f"{name:<14}{load.actions:>9}{self.per_hour(load.actions):>9.0f}{busy:>11.1f}"
+                         f"{load.idle_seconds:>11.1f}{load.cooldown_rejections:>7}{load.errors:>8}")
+        lines += ["", f"{'bucket':<14}{'requests':>9}{'req/h':>9}{'429s':>7}{'retry-after s':>15}"]
+        for bucket, b in self.buckets.items():
+            lines.append(f"{bucket:<14}{b.requests:>9}{self.per_hour(b.requests):>9.0f}{b.throttled:>7}"
+                         f"{b.retry_after_seconds:>15.0f}")
+        return "\n".join(lines)
+
+
+def _tile_of(bundle: Mapping[str, Any], kind: str, code: str | None = None) -> tuple[int, int]:
+    """The overworld tile nearest spawn holding `kind` (and `code`) content."""
+    tiles = [(abs(m["x"]) + abs(m["y"]), m["x"], m["y"]) for m in bundle["maps"]
+             if m["layer"] == "overworld" and (c := m["interactions"]["content"]) is not None
+             and c["type"] == kind and (code is None or c["code"] == code)]
+    if not tiles:
+        raise ValueError(f"bundle has no overworld {kind} {code or ''} tile")
+    _, x, y = min(tiles)
+    return x, y
+
+
+def _wait_out(character: CharacterSchema, stop: threading.Event) -> None:
+    expiration = character.cooldown_expiration
+    if isinstance(expiration, Unset) or expiration is None:
+        return
+    stop.wait(max(0.0, (expiration - datetime.now(timezone.utc)).total_seconds()))
+
+
+def scripted_character(
+    url: str, name: str, stop: threading.Event, *, monster: tuple[int, int], bank: tuple[int, int],
+) -> None:
+    """Fight at `monster`, rest below half HP, bank everything when the bag is
+    80% full — until `stop` is set."""
+    with AuthenticatedClient(
+        base_url=url, token=TOKEN, raise_on_unexpected_status=False,
+        httpx_args={"event_hooks": {"response": [detect_rate_limited_response]}}) as client:
+        attempt = 0
+        while not stop.is_set():
+            try:
+                response = get_character(client=client, name=name)
+                if not isinstance(response, CharacterResponseSchema) or isinstance(response.data, Unset):
+                    stop.wait(1.0)
+                    continue
+                char = response.data
+                held = [s for s in (char.inventory or []) if not isinstance(s, Unset) and s.code]
+                full = sum(s.quantity for s in held) >= 0.8 * char.inventory_max_items
+                pos = (char.x, char.y)
+                result: Any
+                if char.hp * 2 < char.max_hp:
+                    result = action_rest(client=client, name=name)
+                elif full and pos != bank:
+                    result = action_move(client=client, name=name, body=DestinationSchema(x=bank[0], y=bank[1]))
+                elif full:
+                    result = action_deposit_bank_item(client=client, name=name, body=[
+                        SimpleItemSchema(code=s.code, quantity=s.quantity) for s in held])
+                elif pos != monster:
+                    result = action_move(client=client, name=name, body=DestinationSchema(x=monster[0], y=monster[1]))
+                else:
+                    result = action_fight(client=client, name=name, body=FightRequestSchema())
+                attempt = 0
+            except RateLimitedError as e:
+                stop.wait(retry_after_seconds(e.headers, attempt))
+                attempt += 1
+                continue
+            except httpx.HTTPError:
+                stop.wait(1.0)
+                continue
+            data = getattr(result, "data", None)
+            after = getattr(data, "character", None) or next(iter(getattr(data, "characters", None) or []), None)
+            if isinstance(after, CharacterSchema):
+                _wait_out(after, stop)
+            else:
+                stop.wait(0.5)
+
+
+def _run_scripted(server: StandinServer, names: Sequence[str], bundle: Mapping[str, Any],
+                  duration_seconds: float) -> None:
+    stop = threading.Event()
+    monster, bank = _tile_of(bundle, "monster", "chicken"), _tile_of(bundle, "bank")
+    threads = [threading.Thread(target=scripted_character, args=(server.url, name, stop),
+                                kwargs={"monster": monster, "bank": bank}, daemon=True) for name in names]
+    for thread in threads:
+        thread.start()
+    stop.wait(duration_seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+
+def _run_play(server: StandinServer, duration_seconds: float) -> None:
+    with tempfile.TemporaryDirectory(prefix="standin-home-") as home:
+        env = {**os.environ, "HOME": home, "ARTIFACTSMMO_API_URL": server.url, "ARTIFACTSMMO_TOKEN": TOKEN}
+        proc = subprocess.Popen(
+            [sys.executable, "-m", "artifactsmmo_cli.main", "play", "--all"],
+            cwd=home, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        try:
+            proc.wait(timeout=duration_seconds)
+        except subprocess.TimeoutExpired:
+            proc.send_signal(signal.SIGINT)
+            try:
+                proc.wait(timeout=PLAY_SHUTDOWN_SECONDS)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
+
+
+def run_throughput(
+    bundle: Mapping[str, Any],
+    *,
+    characters: int = 3,
+    duration_seconds: float = 60.0,
+    driver: str = "scripted",
+    latency_seconds: float = 0.0,
+    cooldown_scale: float = 1.0,
+    rates: Mapping[str, Mapping[str, int]] = DEFAULT_RATES,
+    seed: int = 0,
+) -> ThroughputReport:
+    """Run `characters` characters for `duration_seconds` and report."""
+    if driver not in DRIVERS:
+        raise ValueError(f"unknown driver {driver!r}; expected one of {DRIVERS}")
+    names = [f"standin{i}" for i in range(1, characters + 1)]
+    world = StandinWorld(bundle, names, cooldown_scale=cooldown_scale, seed=seed)
+    with StandinServer(world, rates=rates, latency_seconds=latency_seconds) as server:
+        started = time.monotonic()
+        if driver == "scripted":
+            _run_scripted(server, names, bundle, duration_seconds)
+        else:
+            _run_play(server, duration_seconds)
+        elapsed = time.monotonic() - started
+        return ThroughputReport(driver=driver, elapsed_seconds=elapsed, cooldown_scale=cooldown_scale,
+                                latency_seconds=latency_seconds, characters=world.load(), buckets=server.load())
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0] if __doc__ else None)
+    parser.add_argument("--bundle", type=Path, default=DEFAULT_BUNDLE, help="GameData cache bundle JSON")
+    parser.add_argument("--characters", type=int, default=3)
+    parser.add_argument("--duration", type=float, default=60.0, help="wall-clock seconds")
+    parser.add_argument("--driver", choices=DRIVERS, default="scripted")
+    parser.add_argument("--latency-ms", type=float, default=100.0, help="per-request server latency")
+    parser.add_argument("--cooldown-scale", type=float, default=1.0)
+    parser.add_argument("--rates", type=Path, default=None,
+                        help="JSON {bucket: {window: limit}}; defaults to standin_server.DEFAULT_RATES")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+    rates = json.loads(args.rates.read_text()) if args.rates is not None else DEFAULT_RATES
+    report = run_throughput(
+        json.loads(args.bundle.read_text()), characters=args.characters, duration_seconds=args.duration,
+        driver=args.driver, latency_seconds=args.latency_ms / 1000.0, cooldown_scale=args.cooldown_scale,
+        rates=rates, seed=args.seed)
+    print(report.to_json() if args.json else report.render())
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -43,7 +43,7 @@ def _diag(work: tuple[str, CraftCell]) -> dict:
     craft = stats.crafting_level
     state = census_state(recipe, cell, gd)
     t0 = time.monotonic()
-    plan = plan_craft(recipe, state, gd)
+    plan, _failed = plan_craft(recipe, state, gd)
     el = time.monotonic() - t0
     verdict = craft_cell_verdict(recipe, plan, gd)
     if verdict.passed:
@@ -7,8 +7,9 @@ tests/test_ai/scenarios/fixtures/gamedata_bundle.json — the same fixture the
 craft census and the scenario suite plan against.
 
 Parallel: like the craft census, every cell is an independent planner drive.
-We fan the (few, ~56) cells across a process pool (each worker loads GameData
-ONCE via the initializer). Run:
+`run_census` fans the (few, ~56) cells across a process pool and keeps each
+cell's result in the shared census cache (`audit/census_runner.py`; pass
+`--no-cache` to plan every cell afresh). Run:
 
     uv run python scripts/gen_inventory_completeness.py [max_workers]
 
@@ -37,18 +38,17 @@ import json
 import os
 import sys
 import time
-from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 from artifactsmmo_cli.ai.game_data import GameData
 from artifactsmmo_cli.ai.inventory_keep import KeepReason
+from artifactsmmo_cli.audit.census_runner import CensusCache, bundle_digest, code_digest
 from artifactsmmo_cli.audit.inventory_census import (
     CellResult,
     census_cells,
     reason_coverage,
-    run_cell,
+    run_census,
 )
-from artifactsmmo_cli.audit.inventory_completeness import InventoryCell
 from artifactsmmo_cli.audit.inventory_report import (
     band_summary,
     render_matrix,
@@ -58,20 +58,6 @@ from artifactsmmo_cli.audit.inventory_report import (
 BUNDLE = Path("tests/test_ai/scenarios/fixtures/gamedata_bundle.json")
 OUT_DIR = Path("docs/behavioral_completeness")
 
-# Per-worker GameData, built once by the pool initializer from the bundle dict.
-_GD: GameData | None = None
-
-
-def _init_worker(bundle_dict: dict) -> None:
-    global _GD
-    _GD = GameData.from_cache_bundle(bundle_dict)
-
-
-def _run_one(cell: InventoryCell) -> CellResult:
-    assert _GD is not None  # set by _init_worker in every pool worker
-    return run_cell(cell, _GD)
-
-
 def main() -> None:
     argv = sys.argv[1:]
     check = "--check" in argv
@@ -82,12 +68,9 @@ def main() -> None:
     cells = census_cells(gd)
     start = time.monotonic()
     print(f"census: {len(cells)} cells on {max_workers} workers", file=sys.stderr)
-    results: list[CellResult] = []
-    with ProcessPoolExecutor(
-        max_workers=max_workers, initializer=_init_worker, initargs=(bundle_dict,)
-    ) as ex:
-        for i, res in enumerate(ex.map(_run_one, cells, chunksize=1), start=1):
-            results.append(res)
+    cache = None if "--no-cache" in argv else CensusCache(
+        "inventory", CellResult, bundle_digest(bundle_dict), code_digest("artifactsmmo_cli.audit.inventory_census"))
+    results = run_census(gd, cells, max_workers=max_workers, cache=cache)
     coverage = reason_coverage(results)
     OUT_DIR.mkdir(parents=True, exist_ok=True)
     (OUT_DIR / "INVENTORY_MATRIX.md").write_text(render_matrix(results, coverage))
@@ -10,6 +10,9 @@ Serial, unlike its two siblings: this grid is FOUR cells (they are ~56 and
 ~1900), each a single `StrategyArbiter.select` drive, so a process pool would
 cost more to spin up than the census takes to run.
 
+Cell results are kept in the shared census cache (`audit/census_runner.py`);
+pass `--no-cache` to plan every cell afresh.
+
     uv run python scripts/gen_recycle_source_completeness.py
 
 CI gate: pass `--check` to exit non-zero when any cell classifies
@@ -31,8 +34,10 @@ import time
 from pathlib import Path
 
 from artifactsmmo_cli.ai.game_data import GameData
+from artifactsmmo_cli.audit.census_runner import CensusCache, bundle_digest, code_digest
 from artifactsmmo_cli.audit.recycle_source_completeness import (
     RecycleSourceGapClass,
+    RecycleSourceResult,
     render_matrix,
     run_census,
     summary_line,
@@ -44,9 +49,13 @@ OUT_DIR = Path("docs/behavioral_completeness")
 
 def main() -> None:
     check = "--check" in sys.argv[1:]
-    game_data = GameData.from_cache_bundle(json.loads(BUNDLE.read_text()))
+    bundle = json.loads(BUNDLE.read_text())
+    game_data = GameData.from_cache_bundle(bundle)
+    cache = None if "--no-cache" in sys.argv[1:] else CensusCache(
+        "recycle_source", RecycleSourceResult, bundle_digest(bundle),
+        code_digest("artifactsmmo_cli.audit.recycle_source_completeness"))
     start = time.monotonic()
-    results = run_census(game_data)
+    results = run_census(game_data, cache=cache)
     OUT_DIR.mkdir(parents=True, exist_ok=True)
     (OUT_DIR / "RECYCLE_SOURCE_MATRIX.md").write_text(render_matrix(results))
     print(f"census done in {time.monotonic() - start:.0f}s", file=sys.stderr)
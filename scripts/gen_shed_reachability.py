@@ -11,6 +11,9 @@ Serial, like its small siblings: this grid is FIVE cells (the craft grid is
 pure catalog sweep, so a process pool would cost more to spin up than the
 census takes to run.
 
+Cell results are kept in the shared census cache (`audit/census_runner.py`);
+pass `--no-cache` to plan every cell afresh.
+
     uv run python scripts/gen_shed_reachability.py
 
 CI gate: pass `--check` to exit non-zero when any cell classifies
@@ -33,8 +36,10 @@ import time
 from pathlib import Path
 
 from artifactsmmo_cli.ai.game_data import GameData
+from artifactsmmo_cli.audit.census_runner import CensusCache, bundle_digest, code_digest
 from artifactsmmo_cli.audit.shed_reachability_completeness import (
     ShedGapClass,
+    ShedResult,
     render_matrix,
     run_census,
     summary_line,
@@ -52,9 +57,13 @@ the gate — they say the bundle's map, not the ladder, is what stopped the shed
 
 def main() -> None:
     check = "--check" in sys.argv[1:]
-    game_data = GameData.from_cache_bundle(json.loads(BUNDLE.read_text()))
+    bundle = json.loads(BUNDLE.read_text())
+    game_data = GameData.from_cache_bundle(bundle)
+    cache = None if "--no-cache" in sys.argv[1:] else CensusCache(
+        "shed_reachability", ShedResult, bundle_digest(bundle),
+        code_digest("artifactsmmo_cli.audit.shed_reachability_completeness"))
     start = time.monotonic()
-    results = run_census(game_data)
+    results = run_census(game_data, cache=cache)
     OUT_DIR.mkdir(parents=True, exist_ok=True)
     (OUT_DIR / "SHED_REACHABILITY_MATRIX.md").write_text(render_matrix(results))
     print(f"census done in {time.monotonic() - start:.0f}s", file=sys.stderr)
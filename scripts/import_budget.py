@@ -0,0 +1,112 @@
+"""Import budget for the CLI entry point: what `artifactsmmo <anything>` loads
+before it dispatches.
+
+`main.py` used to import every command module up front, so `bank list`,
+`info items` and every `play --all` child spawn loaded the planner, Textual and
+SQLModel whether or not the command needed them: 1,491 modules and 2.2 s
+before the first line of the command ran, against 717 and 1.0 s loaded lazily.
+Commands are now imported on dispatch (`LAZY_COMMANDS`). This script holds the
+line.
+
+It runs `python -X importtime -c "import artifactsmmo_cli.main"` in a fresh
+interpreter and checks two things:
+
+  * MODULES: how many modules the import loads, against `MODULE_BUDGET`. A
+    count, not a time, so the gate means the same on a laptop and in CI; one
+    stray eager import of a command module blows it by hundreds.
+  * FORBIDDEN: no module under `FORBIDDEN_PREFIXES` is loaded at all.
+
+The cumulative time is printed alongside, with the heaviest self-time modules,
+and `--max-ms` turns it into a gate on a machine whose numbers you trust.
+
+    python scripts/import_budget.py [--max-ms 800] [--top 15]
+"""
+
+import argparse
+import subprocess
+import sys
+from dataclasses import dataclass
+
+ENTRY_POINT = "artifactsmmo_cli.main"
+
+MODULE_BUDGET = 800
+"""Modules `import artifactsmmo_cli.main` may load: 717 at the lazy split,
+against 1,491 when every command module was imported eagerly. Most of the 717
+is `artifactsmmo_api_client.models`, which the root callback's `ClientManager`
+needs for every command."""
+
+FORBIDDEN_PREFIXES = ("artifactsmmo_cli.ai.player", "artifactsmmo_cli.ai.planner", "artifactsmmo_cli.ai.learning",
+                      "artifactsmmo_cli.commands", "artifactsmmo_cli.multi", "artifactsmmo_cli.tui",
+                      "sqlmodel", "textual")
+"""What only a dispatched command may import: the player and planner, the
+learning DB, the command modules themselves, the fleet supervisor and the TUI.
+(`ai.constants` is a leaf the rate-limit detector shares; it may load.)"""
+
+
+@dataclass(frozen=True)
+class ImportLine:
+    module: str
+    self_us: int
+    cumulative_us: int
+
+
+def parse_importtime(stderr: str) -> list[ImportLine]:
+    """The `-X importtime` lines of `stderr`, in the order the interpreter
+    wrote them (a module after everything it imported)."""
+    lines: list[ImportLine] = []
+    for raw in stderr.splitlines():
+        if not raw.startswith("import time:"):
+            continue
+        self_us, cumulative_us, module = raw[len("import time:"):].split("|", 2)
+        if not self_us.strip().isdigit():  # the column header
+            continue
+        lines.append(ImportLine(module.strip(), int(self_us), int(cumulative_us)))
+    return lines
+
+
+def measure(entry_point: str = ENTRY_POINT) -> list[ImportLine]:
+    """Import `entry_point` in a fresh interpreter under `-X importtime`."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {entry_point}"],
+        capture_output=True, text=True, timeout=120, check=True,
+    )
+    return parse_importtime(result.stderr)
+
+
+def total_ms(lines: list[ImportLine], entry_point: str = ENTRY_POINT) -> float:
+    """Milliseconds `entry_point` took to import, everything it loaded included."""
+    return next(line.cumulative_us for line in lines if line.module == entry_point) / 1000
+
+
+def violations(lines: list[ImportLine], entry_point: str = ENTRY_POINT,
+               max_ms: float | None = None) -> list[str]:
+    """Every way `lines` breaks the budget; empty when it holds."""
+    found = [f"{len(lines)} modules imported, budget {MODULE_BUDGET}"] if len(lines) > MODULE_BUDGET else []
+    found += [f"{line.module} imported at startup" for line in lines
+              if line.module.startswith(FORBIDDEN_PREFIXES)]
+    if max_ms is not None:
+        elapsed = total_ms(lines, entry_point)
+        if elapsed > max_ms:
+            found.append(f"{elapsed:.0f} ms to import {entry_point}, budget {max_ms:g} ms")
+    return found
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Check the CLI entry point's import budget.")
+    parser.add_argument("--max-ms", type=float, default=None,
+                        help="Also fail when the entry point takes longer than this to import")
+    parser.add_argument("--top", type=int, default=10, help="Heaviest self-time modules to list")
+    args = parser.parse_args(argv)
+
+    lines = measure()
+    print(f"{ENTRY_POINT}: {len(lines)} modules (budget {MODULE_BUDGET}), {total_ms(lines):.0f} ms")
+    for line in sorted(lines, key=lambda line: line.self_us, reverse=True)[:args.top]:
+        print(f"  {line.self_us / 1000:8.1f} ms  {line.module}")
+    problems = violations(lines, max_ms=args.max_ms)
+    for problem in problems:
+        print(f"OVER BUDGET: {problem}")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
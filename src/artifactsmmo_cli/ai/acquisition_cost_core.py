@@ -309,3 +309,84 @@ def bundle_acquisition_cost(
     for item, qty in roots:
         _accumulate(item, qty, options, memo, holdings, paid, actions, fuel)
     return actions[0] + sum(paid.values()), paid
+
+
+@dataclass(frozen=True)
+class AcquisitionStep:
+    """One leg of the cheapest-route walk, as a plan would have to take it.
+
+    Attributes:
+        item: The item this leg obtains.
+        kind: The `RouteOption.kind` the walk chose for it.
+        quantity: Units to obtain beyond the holdings the walk credited.
+        holding: Units of `item` the plan is expected to HOLD when the leg is
+            done: the expected stock when it starts (holdings, plus earlier
+            legs' output, minus what earlier legs consumed) plus `quantity`.
+    """
+
+    item: str
+    kind: str
+    quantity: int
+    holding: int
+
+
+def _walk_steps(item: str, qty: int, options: Mapping[str, list[RouteOption]],
+                memo: dict[str, tuple[int, RouteOption | None]],
+                credit: dict[str, int], stock: dict[str, int],
+                steps: list[AcquisitionStep], fuel: int) -> bool:
+    """`_accumulate`'s walk, emitting a leg per obtained item instead of
+    summing its price. Inputs are emitted before the item that consumes them,
+    so the legs are in a valid plan order. False when some need has no route
+    or the walk runs out of fuel (a cycle)."""
+    if qty <= 0:
+        return True
+    if fuel <= 0:
+        return False
+    held = credit.get(item, 0)
+    used = min(held, qty)
+    credit[item] = held - used
+    remaining = qty - used
+    if remaining <= 0:
+        return True
+    _unit, route = _cheapest_route(item, options, memo, frozenset())
+    if route is None:
+        return False
+    applications = -(-remaining // max(1, route.yield_per))
+    for material, per_application in sorted(route.inputs.items()):
+        if not _walk_steps(material, per_application * applications, options, memo,
+                           credit, stock, steps, fuel - 1):
+            return False
+    steps.append(AcquisitionStep(item, route.kind, remaining, stock.get(item, 0) + remaining))
+    stock[item] = stock.get(item, 0) + applications * max(1, route.yield_per)
+    for material, per_application in route.inputs.items():
+        stock[material] = stock.get(material, 0) - per_application * applications
+    return True
+
+
+def acquisition_steps(
+    roots: Sequence[tuple[str, int]],
+    options: Mapping[str, list[RouteOption]],
+    owned: Mapping[str, int],
+) -> list[AcquisitionStep] | None:
+    """The legs of ONE plan obtaining every root, in an order it can take
+    them, or None when some need has no route.
+
+    The same walk `bundle_acquisition_cost` prices — same route choice
+    (`_cheapest_route`, capacity ignored), same holdings credit, same fuel
+    bound — read out as (item, quantity) subgoals instead of summed. That is
+    what lets a planner split one deep search into a short one per leg: the
+    legs are the abstract plan, and each is refined on its own.
+
+    A PLAN ORDER, NOT A BOUND. Capacity is still ignored, so a leg may ask a
+    stock-limited route for more than it holds; the leg's refinement is what
+    finds out, and a caller must treat a leg that does not refine as the
+    decomposition failing, not the goal."""
+    memo: dict[str, tuple[int, RouteOption | None]] = {}
+    credit = dict(owned)
+    stock = dict(owned)
+    steps: list[AcquisitionStep] = []
+    fuel = len(options) + 1
+    for item, qty in roots:
+        if not _walk_steps(item, qty, options, memo, credit, stock, steps, fuel):
+            return None
+    return steps
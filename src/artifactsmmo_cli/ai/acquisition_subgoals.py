@@ -0,0 +1,90 @@
+"""The abstract tier of the two-level planner: split an acquisition goal into
+(item, quantity) subgoals that `GOAPPlanner.plan(subgoals=...)` refines one
+short search at a time.
+
+`craft_plan_gen` already replaces the A* for a pure gather-craft chain with an
+O(closure) descent, but it declines as soon as the closure needs a route its
+descent cannot sequence, and the flat A* it falls back to has to discover the
+whole mixed chain (gather here, withdraw there, a fight for the drop, a buy for
+the vendor leaf) in one search over the product of every leg's branching. That
+search is exponential in the chain's depth; its legs are not. Fixing the route
+choice first — the cheapest route per item, exactly as `acquisition_cost` prices
+it — leaves each leg a search toward ONE item that is a handful of actions deep.
+
+The legs are `GatherMaterialsGoal(item, {item: holding})`: "hold `holding` of
+`item`", where `holding` is the stock the walk expects once that leg is done
+(`acquisition_cost_core.AcquisitionStep`). `GatherMaterialsGoal` is the goal the
+flat search was already running for these chains, so a leg reuses its
+`relevant_actions`, its heuristic and its depth bound unchanged.
+
+HOLDINGS ARE BAG PLUS BANK HERE, unlike `acquisition_actions`' bag-only rule,
+because they must agree with `GatherMaterialsGoal.is_satisfied`, which counts
+both: a banked input satisfies its leg, and the leg that consumes it withdraws
+it. Routes come from `acquisition_options` with NO store, so a skill-gated craft
+is never a leg: only routes the executor can serve now are, and a goal whose
+chain needs the grind has no decomposition and keeps the flat search (where
+`LevelSkill` is an edge).
+
+Nothing here is trusted: a leg that cannot be refined abandons the
+decomposition, and `plan` falls back to the flat search for the whole goal.
+"""
+
+from artifactsmmo_cli.ai.acquisition_cost import acquisition_options
+from artifactsmmo_cli.ai.acquisition_cost_core import RouteOption, acquisition_steps
+from artifactsmmo_cli.ai.game_data import GameData
+from artifactsmmo_cli.ai.goals.base import Goal
+from artifactsmmo_cli.ai.goals.gathering import GatherMaterialsGoal
+from artifactsmmo_cli.ai.goals.progression import UpgradeEquipmentGoal
+from artifactsmmo_cli.ai.selection_context import SelectionContext
+from artifactsmmo_cli.ai.source_kind import SourceKind
+from artifactsmmo_cli.ai.world_state import WorldState
+
+MIN_LEGS = 2
+"""A decomposition with fewer legs is the goal itself; the flat search is
+already that short, so it gets no subgoals."""
+
+
+def acquisition_targets(goal: Goal, state: WorldState, game_data: GameData) -> dict[str, int]:
+    """The `{item: quantity}` a goal must come to hold, for the goals whose
+    plans are acquisition chains: a `GatherMaterialsGoal`'s `needed` map and
+    the piece an `UpgradeEquipmentGoal` means to equip. Empty for everything
+    else, and for a perpetual skill-grind gather, which has no chain."""
+    if isinstance(goal, GatherMaterialsGoal):
+        if goal.skill_grind:
+            return {}
+        return {item: qty for item, qty in goal.needed.items() if qty > 0}
+    if isinstance(goal, UpgradeEquipmentGoal):
+        # `find_upgrade_target`, not `desired_state`: the latter names only an
+        # upgrade whose materials are already in hand, i.e. no chain at all.
+        target = goal.find_upgrade_target(state, game_data)
+        if target is None or target[0] in state.equipment.values():
+            return {}
+        return {target[0]: 1}
+    return {}
+
+
+def acquisition_subgoals(goal: Goal, state: WorldState, game_data: GameData,
+                         ctx: SelectionContext) -> list[GatherMaterialsGoal]:
+    """The legs of `goal`'s acquisition chain in plan order, or [] when it has
+    no chain, some need has no route, or the chain is shorter than
+    `MIN_LEGS`."""
+    targets = acquisition_targets(goal, state, game_data)
+    if not targets:
+        return []
+    options: dict[str, list[RouteOption]] = {}
+    for item in targets:
+        options.update(acquisition_options(item, state, game_data, ctx))
+    # The bank is already credited as held, so a withdraw route would count
+    # the same units twice; the leg that consumes a banked input withdraws it.
+    options = {item: [route for route in routes if route.kind != SourceKind.WITHDRAW.value]
+               for item, routes in options.items()}
+    holdings = dict(state.inventory)
+    for item, qty in (state.bank_items or {}).items():
+        holdings[item] = holdings.get(item, 0) + qty
+    holdings["gold"] = holdings.get("gold", 0) + state.gold
+    steps = acquisition_steps(list(targets.items()), options, holdings)
+    if steps is None or len(steps) < MIN_LEGS:
+        return []
+    exclude = goal.exclude_recycle if isinstance(goal, GatherMaterialsGoal) else frozenset()
+    return [GatherMaterialsGoal(step.item, {step.item: step.holding}, exclude_recycle=exclude)
+            for step in steps]
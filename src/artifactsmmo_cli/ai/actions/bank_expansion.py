@@ -57,7 +57,7 @@ class BuyBankExpansionAction(Action):
     def cost(self, state: WorldState, game_data: GameData,
              history: LearningStore | None = None) -> float:
         dest = self.bank_location or (state.x, state.y)
-        dist = abs(dest[0] - state.x) + abs(dest[1] - state.y)
+        dist = game_data.travel_steps(state.x, state.y, dest[0], dest[1], state.layer)
         # Seconds, like every other edge. The gold price is NOT added here: an
         # edge cost is time, and buying an expansion takes the same time whether
         # it costs 3,500 gold or 448,000. The old `+ cost / 100` put gold into a
@@ -70,7 +70,8 @@ class BuyBankExpansionAction(Action):
 
     def execute(self, state: WorldState, client: AuthenticatedClient) -> WorldState:
         if self.bank_location and (state.x, state.y) != self.bank_location:
-            state = MoveAction(x=self.bank_location[0], y=self.bank_location[1]).execute(state, client)
+            state = MoveAction(x=self.bank_location[0], y=self.bank_location[1],
+                               distances=self.distances).execute(state, client)
         result = action_buy_bank_expansion(client=client, name=state.character)
         result = Action._raise_for_error(result, "BuyBankExpansion")
         return WorldState.from_character_schema(
@@ -1,18 +1,28 @@
 """Action ABC for GOAP planning."""
 
+import sys
 from abc import ABC, abstractmethod
-from typing import ClassVar, TypeVar
+from collections.abc import Iterable
+from typing import ClassVar, NewType, TypeVar
 
 from artifactsmmo_api_client import AuthenticatedClient
 from artifactsmmo_api_client.models.error_response_schema import ErrorResponseSchema
 
 from artifactsmmo_cli.ai.actions.api_action_error import ApiActionError
+from artifactsmmo_cli.ai.actions.footprint import Footprint
 from artifactsmmo_cli.ai.game_data import GameData
 from artifactsmmo_cli.ai.learning.store import LearningStore
+from artifactsmmo_cli.ai.nearest_tile import Steps
+from artifactsmmo_cli.ai.tile_distance import TileDistanceTable
 from artifactsmmo_cli.ai.world_state import WorldState
 
 T = TypeVar("T")
 
+ActionKey = NewType("ActionKey", str)
+"""Interned `Action.learning_key()` — the identity learned stats, traces and
+plan-body logs are keyed on. A `str` subtype, so it drops into every
+`LearningStore` signature unchanged."""
+
 
 class Action(ABC):
     """Abstract base class for all GOAP actions."""
@@ -43,6 +53,28 @@ class Action(ABC):
     Class-level default keeps every legacy action overworld-bound; layered
     Fight/Gather instances and transitions override per instance."""
 
+    distances: TileDistanceTable | None = None
+    """Exact walking-distance table (`GameData.tile_distances`) for actions
+    that pick their destination among several tiles. `execute` has no
+    `GameData`, so an action that ranks tiles by walking distance must carry
+    the table itself — otherwise apply would plan toward the path-nearest tile
+    while execute walked to the Manhattan-nearest one. Class-level None keeps
+    every other action (and every hand-built test instance) on Manhattan;
+    `actions/factory.build_actions` sets it per instance.
+
+    Every action's folded move also hands it to `MoveAction`, which learns the
+    server's path length into it (`TileDistanceTable.observe`). For a
+    fixed-destination action (bank, workshop, GE, NPC, taskmaster) that is its
+    only use, and the player attaches the table at execute to any action that
+    arrives without one."""
+
+    def destination_steps(self, state: WorldState) -> Steps | None:
+        """Distance function ranking this action's candidate tiles, or None
+        for the Manhattan primitive."""
+        if self.distances is None:
+            return None
+        return self.distances.stepper(state.layer)
+
     tags: ClassVar[frozenset[str]] = frozenset()
     """Semantic labels for goal-level action filtering. Subclasses override.
 
@@ -66,6 +98,13 @@ class Action(ABC):
              history: LearningStore | None = None) -> float:
         """Estimated seconds. Optional `history` lets subclasses consult learned stats."""
 
+    def footprint(self, state: WorldState, game_data: GameData) -> Footprint | None:
+        """The facts this action reads and writes from `state`, for the
+        planner's partial-order reduction (`actions/footprint`). None — the
+        default — means "touches everything": the action commutes with
+        nothing, and every interleaving of it is searched as before."""
+        return None
+
     @abstractmethod
     def execute(self, state: WorldState, client: AuthenticatedClient) -> WorldState:
         """Call the API and return updated WorldState built from the response."""
@@ -82,5 +121,35 @@ class Action(ABC):
         fragment into a fresh, empty bucket per batch size. Any writer that
         wants the read side (`cost`'s `history.action_cost(...)`) to actually
         find its own writes MUST record `Cycle.action_repr` as
-        `action.learning_key()`, not `repr(action)`."""
+        `action.action_key()` (this key, interned), not `repr(action)`.
+
+        Formats a string on every call; hot paths read `action_key()`."""
         return repr(self)
+
+    _action_key: ActionKey | None = None
+    """Instance slot for the interned key; the class-level None means
+    'not computed yet'. Not a dataclass field (never annotated on a
+    subclass), so it takes no part in `__eq__`/`__hash__`/`repr`, and a
+    `dataclasses.replace` copy starts unkeyed and re-derives its own."""
+
+    def action_key(self) -> ActionKey:
+        """`learning_key()`, computed once per instance and interned.
+
+        `cost` runs on every planner edge and reads learned stats by this key,
+        so a repr-formatted key put an f-string and a fresh hash on the
+        innermost loop (~99k calls per search in the documented profile). The
+        factory stamps every emitted action up front (`intern_action_keys`);
+        an action built elsewhere — a goal re-sizing a gather, a test — derives
+        its key on first use. Actions are never mutated after construction
+        (re-sizing goes through `dataclasses.replace`), so the cached key
+        cannot go stale."""
+        key = self._action_key
+        if key is None:
+            key = self._action_key = ActionKey(sys.intern(self.learning_key()))
+        return key
+
+
+def intern_action_keys(actions: Iterable[Action]) -> None:
+    """Stamp every action's `action_key` now, off the planner's hot path."""
+    for action in actions:
+        action.action_key()
@@ -25,6 +25,7 @@ from artifactsmmo_cli.ai.learning.store import LearningStore
 from artifactsmmo_cli.ai.loadout_match import equipped_matches_loadout
 from artifactsmmo_cli.ai.nearest_tile import nearest_or_error
 from artifactsmmo_cli.ai.task_lifecycle import derive_task_lifecycle_phase
+from artifactsmmo_cli.ai.tile_distance import TileDistanceTable
 from artifactsmmo_cli.ai.world_state import WorldState
 
 _MIN_FIGHT_HP_FRACTION = 0.3
@@ -64,6 +65,9 @@ class FightAction(Action):
     # CycleSnapshot.action string are unchanged. Read by GamePlayer via an
     # isinstance gate, mirroring _last_grind_expansion / LevelSkill.
     last_fight: FightRecord | None = field(default=None, compare=False, repr=False)
+    # Walking-distance table for destination choice (see Action.distances).
+    # Excluded from compare/repr: it is a lookup aid, not action identity.
+    distances: TileDistanceTable | None = field(default=None, compare=False, repr=False)
 
     _MIN_FREE_SLOTS = 1  # combat can drop loot; need at least 1 free capacity
 
@@ -126,7 +130,7 @@ class FightAction(Action):
         return equipped_matches_loadout(state.equipment, optimal)
 
     def apply(self, state: WorldState, game_data: GameData) -> WorldState:
-        dest = nearest_or_error(state.x, state.y, self.locations, "combat")
+        dest = nearest_or_error(state.x, state.y, self.locations, "combat", self.destination_steps(state))
         estimated_hp_cost = max(1, state.max_hp // 5)
         new_hp = max(1, state.hp - estimated_hp_cost)
         # The _PENDING_TASK marker is the planning-only "some monsters task"
@@ -168,14 +172,14 @@ class FightAction(Action):
 
     def cost(self, state: WorldState, game_data: GameData,
              history: LearningStore | None = None) -> float:
-        dest = nearest_or_error(state.x, state.y, self.locations, "combat")
-        dist = abs(dest[0] - state.x) + abs(dest[1] - state.y)
+        dest = nearest_or_error(state.x, state.y, self.locations, "combat", self.destination_steps(state))
+        dist = game_data.travel_steps(state.x, state.y, dest[0], dest[1], state.layer)
         static = 10.0 + dist
         if history is None:
             base = learned_cost_pure(static, 0.0, 1.0, has_history=False)
         else:
-            learned = history.action_cost(repr(self), default=static, window=50)
-            rate = history.success_rate(repr(self), window=50)
+            learned = history.action_cost(self.action_key(), default=static, window=50)
+            rate = history.success_rate(self.action_key(), window=50)
             base = learned_cost_pure(static, learned, rate, has_history=True)
         # Per-slot comparison: pick_loadout returns every slot (including None
         # placeholders), state.equipment only carries filled slots. Direct
@@ -192,9 +196,9 @@ class FightAction(Action):
         return base
 
     def execute(self, state: WorldState, client: AuthenticatedClient) -> WorldState:
-        dest = nearest_or_error(state.x, state.y, self.locations, "combat")
+        dest = nearest_or_error(state.x, state.y, self.locations, "combat", self.destination_steps(state))
         if (state.x, state.y) != dest:
-            state = MoveAction(x=dest[0], y=dest[1]).execute(state, client)
+            state = MoveAction(x=dest[0], y=dest[1], distances=self.distances).execute(state, client)
         self.last_fight = None
         result = action_fight(client=client, name=state.character, body=FightRequestSchema())
         result = Action._raise_for_error(result, f"Fight {self.monster_code}")
@@ -62,6 +62,11 @@ class UseConsumableAction(Action):
             if stats.type_ == "consumable"
         }
 
+    @property
+    def foods(self) -> frozenset[str]:
+        """Every code this action may eat; it applies only holding one."""
+        return frozenset(self._item_stats)
+
     def is_applicable(self, state: WorldState, game_data: GameData) -> bool:
         if state.hp >= state.max_hp:
             return False
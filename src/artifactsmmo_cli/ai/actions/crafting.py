@@ -112,7 +112,7 @@ class CraftAction(Action):
     def cost(self, state: WorldState, game_data: GameData,
              history: LearningStore | None = None) -> float:
         dest = self.workshop_location or (state.x, state.y)
-        dist = abs(dest[0] - state.x) + abs(dest[1] - state.y)
+        dist = game_data.travel_steps(state.x, state.y, dest[0], dest[1], state.layer)
         # Cost stays keyed to the REQUESTED quantity (not the effective batch) to
         # match the proved planner-admissibility cost model
         # (formal/Formal/PlannerAdmissibility.lean, qtyCost). A partial craft is
@@ -121,7 +121,8 @@ class CraftAction(Action):
 
     def execute(self, state: WorldState, client: AuthenticatedClient) -> WorldState:
         if self.workshop_location and (state.x, state.y) != self.workshop_location:
-            state = MoveAction(x=self.workshop_location[0], y=self.workshop_location[1]).execute(state, client)
+            state = MoveAction(x=self.workshop_location[0], y=self.workshop_location[1],
+                               distances=self.distances).execute(state, client)
         body = CraftingSchema(code=self.code, quantity=self.quantity)
         result = action_crafting(client=client, name=state.character, body=body)
         result = Action._raise_for_error(result, f"Craft {self.code}×{self.quantity}")
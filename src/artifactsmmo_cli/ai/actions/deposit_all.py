@@ -16,9 +16,12 @@ from artifactsmmo_cli.ai.actions.movement import MoveAction
 from artifactsmmo_cli.ai.bank_selection import select_bank_deposits
 from artifactsmmo_cli.ai.game_data import GameData
 from artifactsmmo_cli.ai.learning.store import LearningStore
+from artifactsmmo_cli.ai.memo_stats import memo_counter
 from artifactsmmo_cli.ai.selection_context import NO_PROFILE_CONTEXT, SelectionContext
 from artifactsmmo_cli.ai.world_state import WorldState
 
+_STATS = memo_counter("deposit_all")  # one memo per action object: no size
+
 
 @dataclass
 class DepositAllAction(Action):
@@ -68,8 +71,11 @@ class DepositAllAction(Action):
             return []
         cached = self._last_deposits
         if cached is not None and cached[0] is state:
+            _STATS.hit()
             return cached[1]
+        started = _STATS.start()
         out = select_bank_deposits(state, self.game_data, self.ctx)
+        _STATS.miss(started)
         self._last_deposits = (state, out)
         return out
 
@@ -105,12 +111,13 @@ class DepositAllAction(Action):
     def cost(self, state: WorldState, game_data: GameData,
              history: LearningStore | None = None) -> float:
         dest = self.bank_location
-        dist = abs(dest[0] - state.x) + abs(dest[1] - state.y)
+        dist = game_data.travel_steps(state.x, state.y, dest[0], dest[1], state.layer)
         return qty_cost_pure(0.0, len(state.inventory), dist, 2.0)
 
     def execute(self, state: WorldState, client: AuthenticatedClient) -> WorldState:
         if (state.x, state.y) != self.bank_location:
-            state = MoveAction(x=self.bank_location[0], y=self.bank_location[1]).execute(state, client)
+            state = MoveAction(x=self.bank_location[0], y=self.bank_location[1],
+                               distances=self.distances).execute(state, client)
         last_state = state
         for code, qty in self._deposits(state):
             body = SimpleItemSchema(code=code, quantity=qty)
@@ -12,12 +12,17 @@ from artifactsmmo_api_client.models.simple_item_schema import SimpleItemSchema
 
 from artifactsmmo_cli.ai.actions.base import Action
 from artifactsmmo_cli.ai.actions.cost_core import distance_cost_pure
+from artifactsmmo_cli.ai.actions.footprint import BANK_SLOTS, INVENTORY_QUANTITY, INVENTORY_SLOTS, Footprint
 from artifactsmmo_cli.ai.actions.movement import MoveAction
 from artifactsmmo_cli.ai.bank_room import bank_has_room
 from artifactsmmo_cli.ai.game_data import GameData
 from artifactsmmo_cli.ai.learning.store import LearningStore
 from artifactsmmo_cli.ai.world_state import WorldState
 
+_BASE_SECONDS = 2.0
+"""The bank action's own cost before the walk. One constant for `cost` and
+`footprint`, so the commuting claim cannot drift from the price."""
+
 
 @dataclass
 class DepositItemAction(Action):
@@ -62,12 +67,29 @@ class DepositItemAction(Action):
     def cost(self, state: WorldState, game_data: GameData,
              history: LearningStore | None = None) -> float:
         dest = self.bank_location
-        dist = abs(dest[0] - state.x) + abs(dest[1] - state.y)
-        return distance_cost_pure(2.0, dist)
+        dist = game_data.travel_steps(state.x, state.y, dest[0], dest[1], state.layer)
+        return distance_cost_pure(_BASE_SECONDS, dist)
+
+    def footprint(self, state: WorldState, game_data: GameData) -> Footprint:
+        """Moves this code from bag to bank at the bank tile. Takes a bank
+        slot only for a code the bank does not hold yet — for one it holds,
+        `bank_has_room` still LOOKS at the slot count, so that is a read."""
+        releases = {INVENTORY_QUANTITY}
+        if state.inventory.get(self.code, 0) <= self.quantity:
+            releases.add(INVENTORY_SLOTS)
+        banked = self.code in (state.bank_items or {})
+        return Footprint(
+            writes=frozenset({("inventory", self.code), ("bank", self.code)}),
+            reads=frozenset({BANK_SLOTS}) if banked else frozenset(),
+            consumes=frozenset() if banked else frozenset({BANK_SLOTS}),
+            releases=frozenset(releases),
+            travel=(self.bank_location, _BASE_SECONDS),
+        )
 
     def execute(self, state: WorldState, client: AuthenticatedClient) -> WorldState:
         if (state.x, state.y) != self.bank_location:
-            state = MoveAction(x=self.bank_location[0], y=self.bank_location[1]).execute(state, client)
+            state = MoveAction(x=self.bank_location[0], y=self.bank_location[1],
+                               distances=self.distances).execute(state, client)
         body = SimpleItemSchema(code=self.code, quantity=self.quantity)
         result = deposit_item(client=client, name=state.character, body=[body])
         result = Action._raise_for_error(result, f"DepositItem {self.code}×{self.quantity}")
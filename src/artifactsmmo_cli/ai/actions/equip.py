@@ -10,6 +10,7 @@ from artifactsmmo_api_client.models.equip_schema import EquipSchema
 from artifactsmmo_api_client.models.item_slot import ItemSlot
 
 from artifactsmmo_cli.ai.actions.base import Action
+from artifactsmmo_cli.ai.actions.footprint import INVENTORY_QUANTITY, INVENTORY_SLOTS, Footprint
 from artifactsmmo_cli.ai.game_data import GameData
 from artifactsmmo_cli.ai.gear_taxonomy import ITEM_TYPE_TO_SLOT as ITEM_TYPE_TO_SLOT
 from artifactsmmo_cli.ai.gear_taxonomy import ITEM_TYPE_TO_SLOTS as ITEM_TYPE_TO_SLOTS
@@ -141,6 +142,30 @@ class EquipAction(Action):
              history: LearningStore | None = None) -> float:
         return 1.0
 
+    def footprint(self, state: WorldState, game_data: GameData) -> Footprint | None:
+        """Swaps this code with whatever the slot wears; walks nowhere. The
+        slot count moves by the same net `is_applicable` checks room for. A
+        utility slot, whose stack quantity the swap also rewrites, is not
+        modelled."""
+        if self.slot in ("utility1_slot", "utility2_slot"):
+            return None
+        facts = {("inventory", self.code), ("slot", self.slot), ("worn", self.code)}
+        displaced = state.equipment.get(self.slot)
+        if displaced is not None:
+            facts |= {("inventory", displaced), ("worn", displaced)}
+        net_stacks = ((displaced is not None and displaced not in state.inventory)
+                      - (state.inventory.get(self.code, 0) == self.quantity))
+        releases = set()
+        if net_stacks < 0:
+            releases.add(INVENTORY_SLOTS)
+        if displaced is None or self.quantity > 1:
+            releases.add(INVENTORY_QUANTITY)
+        return Footprint(
+            writes=frozenset(facts),
+            consumes=frozenset({INVENTORY_SLOTS}) if net_stacks > 0 else frozenset(),
+            releases=frozenset(releases),
+        )
+
     def execute(self, state: WorldState, client: AuthenticatedClient) -> WorldState:
         body = EquipSchema(code=self.code, slot=ItemSlot(self.slot.replace("_slot", "")),
                            quantity=self.quantity)
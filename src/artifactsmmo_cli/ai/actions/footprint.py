@@ -0,0 +1,77 @@
+"""`Footprint` — the facts of a `WorldState` one action reads and writes, so the
+planner can tell when two actions commute.
+
+THE WASTE. A re-gear equips two slots; a craft withdraws three codes from the
+bank; a cleanup sells two items to one merchant. Each batch can be run in any
+order and reaches the same state at the same total cost, and the A* built every
+interleaving of it — k! paths to one state for a batch of k — costing each
+successor before `_state_key` dedup threw all but one away. With footprints,
+`planner._reordered` generates one order of each commuting pair.
+
+COMMUTING, EXACTLY. Two actions commute from a state when running them in
+either order is applicable the same way, costs the same, and ends in the same
+state. A footprint proves it from disjointness:
+
+  * `writes` — facts the action overwrites (a held stack, a slot, a bank
+    stack). A write conflicts with every other use of the same fact.
+  * `reads` — facts it only looks at. Two reads never conflict.
+  * `consumes` — a shared counter drawn down against a check for EXACTLY the
+    amount drawn (`has_room(n, q, ...)` for the n slots and q items the action
+    itself adds). Two consumers commute: each order needs the sum to fit.
+  * `releases` — a counter raised with no check (gold from a sale, room from a
+    deposit). Two releasers commute. A release against a consume does NOT: the
+    consumer may only fit after it.
+  * `travel` — the one fixed tile the action walks to before it acts, and the
+    base its cost adds the walk to (`distance_cost_pure`). Two actions at the
+    same tile at the same base cost `base + walk + base + 0` either way — the
+    second one starts where it stands — even under the request floor's `max`.
+
+A footprint must be a function of the facts it names: whatever it reads of the
+state to decide its own sets (is the displaced piece already held? is this
+stack the last one?) is a fact in its sets, so an action that commutes with it
+cannot change the answer. `cooldown_expires`, which every apply clears to the
+same None, is not a fact.
+
+`Action.footprint` returning None — the default — says "touches everything":
+such an action commutes with nothing, so a class nobody reasoned about can
+never be reordered away.
+"""
+
+from dataclasses import dataclass
+
+Fact = tuple[str, str]
+"""(kind, name): `("inventory", code)`, `("bank", code)`, `("slot", slot)`,
+`("worn", code)`, or one of the counters below."""
+
+GOLD: Fact = ("gold", "")
+INVENTORY_QUANTITY: Fact = ("inventory_quantity", "")
+"""`WorldState.inventory_free` — item-count headroom."""
+INVENTORY_SLOTS: Fact = ("inventory_slots", "")
+"""`WorldState.inventory_slots_free` — distinct-stack headroom."""
+BANK_SLOTS: Fact = ("bank_slots", "")
+"""Distinct bank stacks against `GameData.bank_capacity`."""
+
+
+@dataclass(frozen=True)
+class Footprint:
+    """What one action does to the world state, split by how it can conflict."""
+
+    writes: frozenset[Fact] = frozenset()
+    reads: frozenset[Fact] = frozenset()
+    consumes: frozenset[Fact] = frozenset()
+    releases: frozenset[Fact] = frozenset()
+    travel: tuple[tuple[int, int], float] | None = None
+    """(destination tile, cost base), or None for an action that neither walks
+    nor prices the walk."""
+
+    def commutes_with(self, other: "Footprint") -> bool:
+        """True when the two actions reach the same state at the same total
+        cost in either order, and either order is applicable iff the other is."""
+        if self.travel is not None and other.travel is not None and self.travel != other.travel:
+            return False
+        touched = self.writes | self.reads | self.consumes | self.releases
+        other_touched = other.writes | other.reads | other.consumes | other.releases
+        return not (self.writes & other_touched or other.writes & touched
+                    or self.reads & (other.consumes | other.releases)
+                    or other.reads & (self.consumes | self.releases)
+                    or self.consumes & other.releases or self.releases & other.consumes)
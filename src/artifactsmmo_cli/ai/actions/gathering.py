@@ -23,6 +23,7 @@ from artifactsmmo_cli.ai.game_data import GameData
 from artifactsmmo_cli.ai.gear_value_core import Gather
 from artifactsmmo_cli.ai.learning.store import LearningStore
 from artifactsmmo_cli.ai.nearest_tile import nearest_or_error
+from artifactsmmo_cli.ai.tile_distance import TileDistanceTable
 from artifactsmmo_cli.ai.world_state import WorldState
 
 GATHER_LOADOUT_PENALTY = 6.0
@@ -95,6 +96,9 @@ class GatherAction(Action):
     drop_item_override: str | None = None
     # P5b: access region of the resource tiles (see FightAction.travel_region).
     travel_region: str = "overworld"
+    # Walking-distance table for destination choice (see Action.distances).
+    # Excluded from compare/repr: it is a lookup aid, not action identity.
+    distances: TileDistanceTable | None = field(default=None, compare=False, repr=False)
 
     _MIN_FREE_SLOTS = 3  # gathering can produce ore + random bonus drops simultaneously
 
@@ -173,7 +177,7 @@ class GatherAction(Action):
                 and self.effective_quantity(state, game_data) >= 1)
 
     def apply(self, state: WorldState, game_data: GameData) -> WorldState:
-        dest = nearest_or_error(state.x, state.y, self.locations, "gather")
+        dest = nearest_or_error(state.x, state.y, self.locations, "gather", self.destination_steps(state))
         drop_item = self.drop_item(game_data)
         post = gather_apply_batch_pure(self.inv(state), drop_item,
                                        self.effective_quantity(state, game_data))
@@ -199,8 +203,8 @@ class GatherAction(Action):
 
     def cost(self, state: WorldState, game_data: GameData,
              history: LearningStore | None = None) -> float:
-        dest = nearest_or_error(state.x, state.y, self.locations, "gather")
-        dist = abs(dest[0] - state.x) + abs(dest[1] - state.y)
+        dest = nearest_or_error(state.x, state.y, self.locations, "gather", self.destination_steps(state))
+        dist = game_data.travel_steps(state.x, state.y, dest[0], dest[1], state.layer)
         static = (6.0 + dist) * self.quantity
         # Penalize re-gathering a material the bank already holds, so the
         # planner withdraws banked stock before re-gathering it (see
@@ -240,15 +244,15 @@ class GatherAction(Action):
         # the same banked/loadout penalties `static` does, not just the bare
         # `6.0 + dist`, or a low-sample quantity=1 gather would diverge from
         # the pre-batching cost the moment it picked up any history at all.
-        learned = history.action_cost(self.learning_key(), default=(static / self.quantity),
+        learned = history.action_cost(self.action_key(), default=(static / self.quantity),
                                       window=50) * self.quantity
-        rate = history.success_rate(self.learning_key(), window=50)
+        rate = history.success_rate(self.action_key(), window=50)
         return learned_cost_pure(static, learned, rate, has_history=True)
 
     def execute(self, state: WorldState, client: AuthenticatedClient) -> WorldState:
-        dest = nearest_or_error(state.x, state.y, self.locations, "gather")
+        dest = nearest_or_error(state.x, state.y, self.locations, "gather", self.destination_steps(state))
         if (state.x, state.y) != dest:
-            state = MoveAction(x=dest[0], y=dest[1]).execute(state, client)
+            state = MoveAction(x=dest[0], y=dest[1], distances=self.distances).execute(state, client)
         result = action_gathering(client=client, name=state.character)
         result = Action._raise_for_error(result, f"Gather {self.resource_code}")
         return WorldState.from_character_schema(
@@ -72,12 +72,13 @@ class GeFillBuyOrderAction(Action):
     def cost(self, state: WorldState, game_data: GameData,
              history: LearningStore | None = None) -> float:
         dest = self.ge_location or (state.x, state.y)
-        dist = abs(dest[0] - state.x) + abs(dest[1] - state.y)
+        dist = game_data.travel_steps(state.x, state.y, dest[0], dest[1], state.layer)
         return distance_cost_pure(1.0, dist)
 
     def execute(self, state: WorldState, client: AuthenticatedClient) -> WorldState:
         if self.ge_location and (state.x, state.y) != self.ge_location:
-            state = MoveAction(x=self.ge_location[0], y=self.ge_location[1]).execute(state, client)
+            state = MoveAction(x=self.ge_location[0], y=self.ge_location[1],
+                               distances=self.distances).execute(state, client)
         body = GEFillBuyOrderSchema(id=self.order_id, quantity=self.quantity)
         result = action_ge_fill(client=client, name=state.character, body=body)
         result = Action._raise_for_error(result, f"GeFill {self.item_code}×{self.quantity} into {self.order_id}")
@@ -86,7 +86,7 @@ class GeFillSellOrderAction(Action):
     def cost(self, state: WorldState, game_data: GameData,
              history: LearningStore | None = None) -> float:
         dest = self.ge_location or (state.x, state.y)
-        dist = abs(dest[0] - state.x) + abs(dest[1] - state.y)
+        dist = game_data.travel_steps(state.x, state.y, dest[0], dest[1], state.layer)
         # Gold cost scaled to action cost (mirrors NpcBuyAction): 1 unit per 10 gold.
         # Seconds. The order's gold value is NOT added: `is_applicable`
         # already refuses to break the gold reserve, so no shortfall
@@ -95,7 +95,8 @@ class GeFillSellOrderAction(Action):
 
     def execute(self, state: WorldState, client: AuthenticatedClient) -> WorldState:
         if self.ge_location and (state.x, state.y) != self.ge_location:
-            state = MoveAction(x=self.ge_location[0], y=self.ge_location[1]).execute(state, client)
+            state = MoveAction(x=self.ge_location[0], y=self.ge_location[1],
+                               distances=self.distances).execute(state, client)
         body = GEBuyOrderSchema(id=self.order_id, quantity=self.quantity)
         result = action_ge_buy(client=client, name=state.character, body=body)
         result = Action._raise_for_error(result, f"GeBuy {self.item_code}×{self.quantity} from {self.order_id}")
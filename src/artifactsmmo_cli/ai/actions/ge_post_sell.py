@@ -73,12 +73,13 @@ class GePostSellOrderAction(Action):
     def cost(self, state: WorldState, game_data: GameData,
              history: LearningStore | None = None) -> float:
         dest = self.ge_location or (state.x, state.y)
-        dist = abs(dest[0] - state.x) + abs(dest[1] - state.y)
+        dist = game_data.travel_steps(state.x, state.y, dest[0], dest[1], state.layer)
         return distance_cost_pure(2.0, dist)
 
     def execute(self, state: WorldState, client: AuthenticatedClient) -> WorldState:
         if self.ge_location and (state.x, state.y) != self.ge_location:
-            state = MoveAction(x=self.ge_location[0], y=self.ge_location[1]).execute(state, client)
+            state = MoveAction(x=self.ge_location[0], y=self.ge_location[1],
+                               distances=self.distances).execute(state, client)
         body = GEOrderCreationSchema(code=self.item_code, quantity=self.quantity, price=self.price)
         result = action_ge_create_sell_order(client=client, name=state.character, body=body)
         result = Action._raise_for_error(
@@ -2,7 +2,7 @@
 
 import dataclasses
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import ClassVar
 
@@ -14,9 +14,18 @@ from artifactsmmo_cli.ai.actions.base import Action
 from artifactsmmo_cli.ai.actions.cost_core import learned_cost_pure
 from artifactsmmo_cli.ai.game_data import GameData
 from artifactsmmo_cli.ai.learning.store import LearningStore
+from artifactsmmo_cli.ai.tile_distance import TileDistanceTable
 from artifactsmmo_cli.ai.world_state import WorldState
 
 
+def path_steps(path: list[list[int]], start: tuple[int, int]) -> int:
+    """Steps walked along a move response's `path`. The server's coordinate
+    list may or may not repeat the start tile; only tiles entered count."""
+    if path and tuple(path[0]) == start:
+        return len(path) - 1
+    return len(path)
+
+
 @dataclass
 class MoveAction(Action):
     """Move the character to a specific tile."""
@@ -25,6 +34,10 @@ class MoveAction(Action):
 
     x: int
     y: int
+    # Table the server-reported path length is learned into (see
+    # `TileDistanceTable.observe`); set by the multi-tile actions that fold a
+    # move into their execute. Not identity: excluded from compare/repr.
+    distances: TileDistanceTable | None = field(default=None, compare=False, repr=False)
 
     def is_applicable(self, state: WorldState, game_data: GameData) -> bool:
         return state.x != self.x or state.y != self.y
@@ -34,18 +47,21 @@ class MoveAction(Action):
 
     def cost(self, state: WorldState, game_data: GameData,
              history: LearningStore | None = None) -> float:
-        distance = abs(self.x - state.x) + abs(self.y - state.y)
+        distance = game_data.travel_steps(state.x, state.y, self.x, self.y, state.layer)
         static = max(distance * 5.0, 1.0)
         if history is None:
             return learned_cost_pure(static, 0.0, 1.0, has_history=False)
-        learned = history.action_cost(repr(self), default=static, window=50)
-        rate = history.success_rate(repr(self), window=50)
+        learned = history.action_cost(self.action_key(), default=static, window=50)
+        rate = history.success_rate(self.action_key(), window=50)
         return learned_cost_pure(static, learned, rate, has_history=True)
 
     def execute(self, state: WorldState, client: AuthenticatedClient) -> WorldState:
         body = DestinationSchema(x=self.x, y=self.y)
         result = action_move(client=client, name=state.character, body=body)
         result = Action._raise_for_error(result, f"Move to ({self.x},{self.y})")
+        if self.distances is not None:
+            self.distances.observe(state.x, state.y, self.x, self.y, state.layer,
+                                   path_steps(result.data.path, (state.x, state.y)))
         new_state = WorldState.from_character_schema(
             result.data.character,
             bank_items=state.bank_items,
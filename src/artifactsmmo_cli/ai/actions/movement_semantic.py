@@ -1,7 +1,7 @@
 """Semantic move action: move to a named location type."""
 
 import dataclasses
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import ClassVar
 
 from artifactsmmo_api_client import AuthenticatedClient
@@ -10,7 +10,8 @@ from artifactsmmo_cli.ai.actions.base import Action
 from artifactsmmo_cli.ai.actions.movement import MoveAction
 from artifactsmmo_cli.ai.game_data import GameData
 from artifactsmmo_cli.ai.learning.store import LearningStore
-from artifactsmmo_cli.ai.nearest_tile import nearest_tile
+from artifactsmmo_cli.ai.nearest_tile import nearest_by_steps, nearest_tile
+from artifactsmmo_cli.ai.tile_distance import TileDistanceTable
 from artifactsmmo_cli.ai.world_state import WorldState
 
 
@@ -27,14 +28,23 @@ class MoveTo(Action):
 
     name: str
     destinations: frozenset[tuple[int, int]]
+    # Walking-distance table for destination choice (see Action.distances).
+    # Excluded from compare/repr: it is a lookup aid, not action identity.
+    distances: TileDistanceTable | None = field(default=None, compare=False, repr=False)
+
+    def _nearest(self, state: WorldState) -> tuple[int, int] | None:
+        steps = self.destination_steps(state)
+        if steps is None:
+            return nearest_tile(state.x, state.y, self.destinations)
+        return nearest_by_steps(state.x, state.y, self.destinations, steps)
 
     def is_applicable(self, state: WorldState, game_data: GameData) -> bool:
         return (state.x, state.y) not in self.destinations
 
     def apply(self, state: WorldState, game_data: GameData) -> WorldState:
-        # Manhattan-nearest (lex-tie-broken) — the SAME pick `execute` makes, so the
+        # Nearest (lex-tie-broken) — the SAME pick `execute` makes, so the
         # planned and executed destinations agree (closes the apply/execute divergence).
-        dest = nearest_tile(state.x, state.y, self.destinations)
+        dest = self._nearest(state)
         if dest is None:
             raise ValueError("no destinations to move to")
         return dataclasses.replace(state, x=dest[0], y=dest[1], cooldown_expires=None)
@@ -44,10 +54,10 @@ class MoveTo(Action):
         return 1.0
 
     def execute(self, state: WorldState, client: AuthenticatedClient) -> WorldState:
-        nearest = nearest_tile(state.x, state.y, self.destinations)
+        nearest = self._nearest(state)
         if nearest is None:
             raise ValueError("no destinations to move to")
-        return MoveAction(x=nearest[0], y=nearest[1]).execute(state, client)
+        return MoveAction(x=nearest[0], y=nearest[1], distances=self.distances).execute(state, client)
 
     def __repr__(self) -> str:
         return f"MoveTo({self.name})"
@@ -124,7 +124,7 @@ class NpcBuyAction(Action):
     def cost(self, state: WorldState, game_data: GameData,
              history: LearningStore | None = None) -> float:
         dest = self.npc_location or (state.x, state.y)
-        dist = abs(dest[0] - state.x) + abs(dest[1] - state.y)
+        dist = game_data.travel_steps(state.x, state.y, dest[0], dest[1], state.layer)
         # Seconds. The purchase price is NOT added: the buy takes the same time
         # at any price, and `is_applicable` already refuses a purchase that would
         # break the gold reserve, so there is no shortfall to price here.
@@ -132,7 +132,8 @@ class NpcBuyAction(Action):
 
     def execute(self, state: WorldState, client: AuthenticatedClient) -> WorldState:
         if self.npc_location and (state.x, state.y) != self.npc_location:
-            state = MoveAction(x=self.npc_location[0], y=self.npc_location[1]).execute(state, client)
+            state = MoveAction(x=self.npc_location[0], y=self.npc_location[1],
+                               distances=self.distances).execute(state, client)
         body = NpcMerchantBuySchema(code=self.item_code, quantity=self.quantity)
         result = action_npc_buy(client=client, name=state.character, body=body)
         result = Action._raise_for_error(result, f"NpcBuy {self.item_code}×{self.quantity} from {self.npc_code}")
@@ -13,12 +13,16 @@ from artifactsmmo_api_client.models.npc_merchant_buy_schema import NpcMerchantBu
 
 from artifactsmmo_cli.ai.actions.base import Action
 from artifactsmmo_cli.ai.actions.cost_core import distance_cost_pure
+from artifactsmmo_cli.ai.actions.footprint import GOLD, INVENTORY_QUANTITY, INVENTORY_SLOTS, Footprint
 from artifactsmmo_cli.ai.actions.movement import MoveAction
 from artifactsmmo_cli.ai.event_availability import event_npc_tradeable
 from artifactsmmo_cli.ai.game_data import GameData
 from artifactsmmo_cli.ai.learning.store import LearningStore
 from artifactsmmo_cli.ai.world_state import WorldState
 
+_BASE_SECONDS = 1.5
+"""The sale's own cost before the walk, shared by `cost` and `footprint`."""
+
 
 @dataclass
 class NpcSellAction(Action):
@@ -67,12 +71,25 @@ class NpcSellAction(Action):
     def cost(self, state: WorldState, game_data: GameData,
              history: LearningStore | None = None) -> float:
         dest = self.npc_location or (state.x, state.y)
-        dist = abs(dest[0] - state.x) + abs(dest[1] - state.y)
-        return distance_cost_pure(1.5, dist)
+        dist = game_data.travel_steps(state.x, state.y, dest[0], dest[1], state.layer)
+        return distance_cost_pure(_BASE_SECONDS, dist)
+
+    def footprint(self, state: WorldState, game_data: GameData) -> Footprint | None:
+        """Turns this code into gold at the merchant's tile. An event
+        merchant's `is_applicable` reads where the character stands, so it
+        is not modelled."""
+        if self.npc_location is None or game_data.npc_event_code(self.npc_code) is not None:
+            return None
+        releases = {GOLD, INVENTORY_QUANTITY}
+        if state.inventory.get(self.item_code, 0) <= self.quantity:
+            releases.add(INVENTORY_SLOTS)
+        return Footprint(writes=frozenset({("inventory", self.item_code)}), releases=frozenset(releases),
+                         travel=(self.npc_location, _BASE_SECONDS))
 
     def execute(self, state: WorldState, client: AuthenticatedClient) -> WorldState:
         if self.npc_location and (state.x, state.y) != self.npc_location:
-            state = MoveAction(x=self.npc_location[0], y=self.npc_location[1]).execute(state, client)
+            state = MoveAction(x=self.npc_location[0], y=self.npc_location[1],
+                               distances=self.distances).execute(state, client)
         body = NpcMerchantBuySchema(code=self.item_code, quantity=self.quantity)
         result = action_npc_sell(client=client, name=state.character, body=body)
         result = Action._raise_for_error(result, f"NpcSell {self.item_code}×{self.quantity} to {self.npc_code}")
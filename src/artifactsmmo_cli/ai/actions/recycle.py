@@ -130,12 +130,13 @@ class RecycleAction(Action):
     def cost(self, state: WorldState, game_data: GameData,
              history: LearningStore | None = None) -> float:
         dest = self.workshop_location or (state.x, state.y)
-        dist = abs(dest[0] - state.x) + abs(dest[1] - state.y)
+        dist = game_data.travel_steps(state.x, state.y, dest[0], dest[1], state.layer)
         return qty_cost_pure(0.0, self.quantity, dist, 3.0)
 
     def execute(self, state: WorldState, client: AuthenticatedClient) -> WorldState:
         if self.workshop_location and (state.x, state.y) != self.workshop_location:
-            state = MoveAction(x=self.workshop_location[0], y=self.workshop_location[1]).execute(state, client)
+            state = MoveAction(x=self.workshop_location[0], y=self.workshop_location[1],
+                               distances=self.distances).execute(state, client)
         body = RecyclingSchema(code=self.code, quantity=self.quantity)
         result = action_recycling(client=client, name=state.character, body=body)
         result = Action._raise_for_error(result, f"Recycle {self.code}×{self.quantity}")
@@ -62,13 +62,13 @@ class TaskCancelAction(Action):
     def cost(self, state: WorldState, game_data: GameData,
              history: LearningStore | None = None) -> float:
         dest = self.taskmaster_location
-        dist = abs(dest[0] - state.x) + abs(dest[1] - state.y)
+        dist = game_data.travel_steps(state.x, state.y, dest[0], dest[1], state.layer)
         return distance_cost_pure(1.0, dist)
 
     def execute(self, state: WorldState, client: AuthenticatedClient) -> WorldState:
         dest = self.taskmaster_location
         if (state.x, state.y) != dest:
-            state = MoveAction(x=dest[0], y=dest[1]).execute(state, client)
+            state = MoveAction(x=dest[0], y=dest[1], distances=self.distances).execute(state, client)
         result = action_task_cancel(client=client, name=state.character)
         result = Action._raise_for_error(result, "TaskCancel")
         return WorldState.from_character_schema(
@@ -69,12 +69,13 @@ class TaskTradeAction(Action):
     def cost(self, state: WorldState, game_data: GameData,
              history: LearningStore | None = None) -> float:
         dest = self.taskmaster_location or (state.x, state.y)
-        dist = abs(dest[0] - state.x) + abs(dest[1] - state.y)
+        dist = game_data.travel_steps(state.x, state.y, dest[0], dest[1], state.layer)
         return distance_cost_pure(2.0, dist)
 
     def execute(self, state: WorldState, client: AuthenticatedClient) -> WorldState:
         if self.taskmaster_location and (state.x, state.y) != self.taskmaster_location:
-            state = MoveAction(x=self.taskmaster_location[0], y=self.taskmaster_location[1]).execute(state, client)
+            state = MoveAction(x=self.taskmaster_location[0], y=self.taskmaster_location[1],
+                               distances=self.distances).execute(state, client)
         body = SimpleItemSchema(code=self.code, quantity=self.quantity)
         result = action_task_trade(client=client, name=state.character, body=body)
         result = Action._raise_for_error(result, f"TaskTrade {self.code}×{self.quantity}")
@@ -109,7 +109,7 @@ class MapTransitionAction(Action):
 
     def cost(self, state: WorldState, game_data: GameData,
              history: LearningStore | None = None) -> float:
-        walk = abs(state.x - self.portal_x) + abs(state.y - self.portal_y)
+        walk = game_data.travel_steps(state.x, state.y, self.portal_x, self.portal_y, state.layer)
         return float(walk) + 3.0
 
     def execute(self, state: WorldState, client: AuthenticatedClient) -> WorldState:
@@ -122,7 +122,7 @@ class MapTransitionAction(Action):
                 f"{self!r} needs layer {self.portal_layer!r}, "
                 f"character is on {state.layer!r}")
         if (state.x, state.y) != (self.portal_x, self.portal_y):
-            state = MoveAction(x=self.portal_x, y=self.portal_y).execute(state, client)
+            state = MoveAction(x=self.portal_x, y=self.portal_y, distances=self.distances).execute(state, client)
         result = action_transition(client=client, name=state.character)
         result = Action._raise_for_error(result, "MapTransition")
         return WorldState.from_character_schema(
@@ -12,6 +12,7 @@ from artifactsmmo_api_client.models.item_slot import ItemSlot
 from artifactsmmo_api_client.models.unequip_schema import UnequipSchema
 
 from artifactsmmo_cli.ai.actions.base import Action
+from artifactsmmo_cli.ai.actions.footprint import INVENTORY_QUANTITY, INVENTORY_SLOTS, Footprint
 from artifactsmmo_cli.ai.game_data import GameData
 from artifactsmmo_cli.ai.learning.store import LearningStore
 from artifactsmmo_cli.ai.world_state import WorldState
@@ -57,6 +58,18 @@ class UnequipAction(Action):
              history: LearningStore | None = None) -> float:
         return 1.0
 
+    def footprint(self, state: WorldState, game_data: GameData) -> Footprint:
+        """Returns the worn piece to the bag; walks nowhere. The one item it
+        adds is exactly the room `is_applicable` checks; the new stack it may
+        open is NOT checked, so that slot count is a write."""
+        displaced = state.equipment.get(self.slot)
+        facts = {("slot", self.slot)}
+        if displaced is not None:
+            facts |= {("inventory", displaced), ("worn", displaced)}
+            if displaced not in state.inventory:
+                facts.add(INVENTORY_SLOTS)
+        return Footprint(writes=frozenset(facts), consumes=frozenset({INVENTORY_QUANTITY}))
+
     def execute(self, state: WorldState, client: AuthenticatedClient) -> WorldState:
         body = UnequipSchema(slot=ItemSlot(self.slot.replace("_slot", "")))
         result = action_unequip(client=client, name=state.character, body=[body])
@@ -41,11 +41,12 @@ class WithdrawGoldAction(Action):
              history: LearningStore | None = None) -> float:
         dest = self.bank_location or (state.x, state.y)
         return distance_cost_pure(
-            2.0, abs(dest[0] - state.x) + abs(dest[1] - state.y))
+            2.0, game_data.travel_steps(state.x, state.y, dest[0], dest[1], state.layer))
 
     def execute(self, state: WorldState, client: AuthenticatedClient) -> WorldState:
         if self.bank_location and (state.x, state.y) != self.bank_location:
-            state = MoveAction(x=self.bank_location[0], y=self.bank_location[1]).execute(state, client)
+            state = MoveAction(x=self.bank_location[0], y=self.bank_location[1],
+                               distances=self.distances).execute(state, client)
         body = DepositWithdrawGoldSchema(quantity=self.quantity)
         result = action_withdraw_gold(client=client, name=state.character, body=body)
         result = Action._raise_for_error(result, f"WithdrawGold {self.quantity}")
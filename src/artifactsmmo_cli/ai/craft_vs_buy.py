@@ -10,6 +10,7 @@ from enum import Enum
 
 from artifactsmmo_cli.ai.game_data import GameData
 from artifactsmmo_cli.ai.gather_floor import ceil_gathers
+from artifactsmmo_cli.ai.ge_post_pricing import within_reference
 from artifactsmmo_cli.ai.min_gathers import min_gathers
 from artifactsmmo_cli.ai.world_state import WorldState
 
@@ -50,11 +51,16 @@ def acquisition_method(
     item: str, needed: int, state: WorldState, game_data: GameData, reserve: int
 ) -> Method:
     """Assemble inputs from GameData and delegate to the proved `cheaper_acquisition`.
-    Returns CRAFT when no NPC sells the item (fail-open)."""
+    Returns CRAFT when no NPC sells the item (fail-open), and when the NPC asks
+    more than `within_reference` allows over the item's recent GE best sell: the
+    reserve keeps the purchase affordable, not sane, and gold is never traded
+    for cooldowns at any price."""
     sellers = game_data.npcs_selling_item(item)
     if not sellers:
         return Method.CRAFT
     npc_code, unit_price = min(sellers, key=lambda np: np[1])
+    if not within_reference("buy", unit_price, game_data.ge_reference_price(item, "sell")):
+        return Method.CRAFT
     total_price = unit_price * needed
     buy_cd = _buy_cooldowns(game_data.npc_location(npc_code), state, needed)
     craft_cd = _craft_cooldowns(item, needed, state, game_data)
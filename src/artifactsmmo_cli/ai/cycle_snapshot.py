@@ -53,6 +53,17 @@ class ObjectiveUnplannable(BaseModel):
     timed_out: bool = False
 
 
+class MemoLayerStats(BaseModel):
+    """One memo layer's counts over the cycle (`ai/memo_stats.drain`). `size`
+    is -1 for a layer with no single cache to count."""
+
+    layer: str
+    hits: int = 0
+    misses: int = 0
+    size: int = -1
+    saved_ms: float = 0.0
+
+
 class PlanTreeNode(BaseModel):
     """One node in the chosen objective's prerequisite tree (TUI plan screen).
 
@@ -156,6 +167,7 @@ class CycleSnapshot(BaseModel):
     plan_len: int = 0
     goals_tried: list[GoalAttempt] = Field(default_factory=list)
     objective_unplannable: ObjectiveUnplannable | None = None
+    memo: list[MemoLayerStats] = Field(default_factory=list)
     suppressed_goals: list[str] = Field(default_factory=list)
     path_blocked: bool = False
 
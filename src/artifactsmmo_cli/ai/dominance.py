@@ -0,0 +1,151 @@
+"""HP dominance: a search node that only differs from an already-expanded one
+by holding LESS HP, reached no cheaper, need not be expanded.
+
+THE WASTE. A fight costs HP and a rest buys it back. Under the fleet's
+request floor (`GOAPPlanner.action_floor_seconds`) every rest costs the same
+one request whatever it heals, so fight, rest, fight and fight, fight, rest
+reach the same holdings at the same cost — the second at full HP — and
+`_state_key` dedup keeps both. With the 69s floor of the 2026-08-10 fleet run,
+the l12 fixture searches for `GatherMaterials(iron_sword)` and
+`(feather_coat)` expanded 3,949 and 3,501 nodes; dominance cuts them to 3,186
+and 3,232 with the same plans. Without a floor it finds nothing: a rest is
+priced by the deficit it closes, so the healthier node is the dearer one.
+
+THE RELATION. Node `n1` dominates node `n2` when every `_state_key` fact but
+HP is equal, `n1` holds at least `n2`'s HP, and `n1` was reached no dearer and
+in no more actions. Every plan from `n2` then replays from `n1` at no greater
+cost and length, provided that:
+
+  * the goal's satisfaction never turns False as HP rises
+    (`Goal.hp_monotone`), and
+  * every action of the search is HP-monotone: from more HP it is at least as
+    applicable, no dearer, and leaves at least as much HP with everything else
+    it does unchanged — or, like a Rest the healthier node does not need, it
+    is one the healthier node may skip at a saving.
+
+`hp_dominance_applies` checks both over the exact action set the planner
+searches; an action class not listed here switches it off.
+
+WHY ONLY HP. Gold and holdings look like the same kind of resource, and
+neither is monotone in this tree. The gold reserve stops binding once the
+account cannot fund it (`progression_reserve._binding`), so a poorer purse can
+make a purchase a richer one is refused. A fuller bag refuses a gather an
+emptier one takes, and a bank holding one more stack refuses a deposit. On the
+fixture bundle no state was dominated through its bag at all.
+
+`UseConsumableAction` picks its food by the HP deficit, so from more HP it may
+eat a different item, or none. It passes only when no food it could eat is
+reachable in the search (`relaxed_reachable_items`), so it never applies.
+"""
+
+from dataclasses import dataclass
+
+from artifactsmmo_cli.ai.actions.accept_task import AcceptTaskAction
+from artifactsmmo_cli.ai.actions.bank_expansion import BuyBankExpansionAction
+from artifactsmmo_cli.ai.actions.base import Action
+from artifactsmmo_cli.ai.actions.claim import ClaimPendingItemAction
+from artifactsmmo_cli.ai.actions.combat import FightAction
+from artifactsmmo_cli.ai.actions.complete_task import CompleteTaskAction
+from artifactsmmo_cli.ai.actions.consumable import UseConsumableAction
+from artifactsmmo_cli.ai.actions.crafting import CraftAction
+from artifactsmmo_cli.ai.actions.delete import DeleteItemAction
+from artifactsmmo_cli.ai.actions.deposit_all import DepositAllAction
+from artifactsmmo_cli.ai.actions.deposit_gold import DepositGoldAction
+from artifactsmmo_cli.ai.actions.deposit_item import DepositItemAction
+from artifactsmmo_cli.ai.actions.equip import EquipAction
+from artifactsmmo_cli.ai.actions.gathering import GatherAction
+from artifactsmmo_cli.ai.actions.ge_cancel_order import GeCancelOrderAction
+from artifactsmmo_cli.ai.actions.ge_fill import GeFillBuyOrderAction
+from artifactsmmo_cli.ai.actions.ge_fill_sell import GeFillSellOrderAction
+from artifactsmmo_cli.ai.actions.ge_post_buy import GePostBuyOrderAction
+from artifactsmmo_cli.ai.actions.ge_post_sell import GePostSellOrderAction
+from artifactsmmo_cli.ai.actions.level_skill import LevelSkill
+from artifactsmmo_cli.ai.actions.movement import MoveAction
+from artifactsmmo_cli.ai.actions.movement_semantic import MoveTo
+from artifactsmmo_cli.ai.actions.npc import NpcBuyAction
+from artifactsmmo_cli.ai.actions.npc_sell import NpcSellAction
+from artifactsmmo_cli.ai.actions.optimize_loadout import OptimizeLoadoutAction
+from artifactsmmo_cli.ai.actions.recycle import RecycleAction
+from artifactsmmo_cli.ai.actions.rest import RestAction
+from artifactsmmo_cli.ai.actions.task_cancel import TaskCancelAction
+from artifactsmmo_cli.ai.actions.task_exchange import TaskExchangeAction
+from artifactsmmo_cli.ai.actions.task_trade import TaskTradeAction
+from artifactsmmo_cli.ai.actions.teleport import TeleportAction
+from artifactsmmo_cli.ai.actions.transition import MapTransitionAction
+from artifactsmmo_cli.ai.actions.unequip import UnequipAction
+from artifactsmmo_cli.ai.actions.use_gold_bag import UseGoldBagAction
+from artifactsmmo_cli.ai.actions.wait import WaitAction
+from artifactsmmo_cli.ai.actions.withdraw_gold import WithdrawGoldAction
+from artifactsmmo_cli.ai.actions.withdraw_item import WithdrawItemAction
+from artifactsmmo_cli.ai.game_data import GameData
+from artifactsmmo_cli.ai.goals.base import Goal
+from artifactsmmo_cli.ai.relaxed_reachability import relaxed_reachable_items
+from artifactsmmo_cli.ai.world_state import WorldState
+
+_HP_MONOTONE: tuple[type[Action], ...] = (
+    # They never read HP, and carry it through `apply` unchanged.
+    AcceptTaskAction, BuyBankExpansionAction, ClaimPendingItemAction, CompleteTaskAction,
+    CraftAction, DeleteItemAction, DepositAllAction, DepositGoldAction, DepositItemAction,
+    EquipAction, GatherAction, GeCancelOrderAction, GeFillBuyOrderAction, GeFillSellOrderAction,
+    GePostBuyOrderAction, GePostSellOrderAction, LevelSkill, MapTransitionAction, MoveAction,
+    MoveTo, NpcBuyAction, NpcSellAction, OptimizeLoadoutAction, RecycleAction, TaskCancelAction,
+    TaskExchangeAction, TaskTradeAction, TeleportAction, UnequipAction, UseGoldBagAction,
+    WaitAction, WithdrawGoldAction, WithdrawItemAction,
+    # Gated on an HP floor, priced the same at any HP, and `max(1, hp - loss)`
+    # after: more HP in, at least as much out.
+    FightAction,
+    # Cheaper from more HP and ends at `max_hp` either way; a node already at
+    # `max_hp` cannot rest, and skips it.
+    RestAction,
+)
+
+
+def hp_dominance_applies(goal: Goal, actions: list[Action], state: WorldState, game_data: GameData) -> bool:
+    """True when every plan over `actions` from a node replays from any node
+    that dominates it, so the planner may discard dominated nodes."""
+    if not goal.hp_monotone:
+        return False
+    reachable: frozenset[str] | None = None
+    for action in actions:
+        if isinstance(action, _HP_MONOTONE):
+            continue
+        if not isinstance(action, UseConsumableAction):
+            return False
+        if reachable is None:
+            reachable = relaxed_reachable_items(state, game_data, actions)
+            if reachable is None:
+                return False
+        if action.foods & reachable:
+            return False
+    return True
+
+
+@dataclass(frozen=True)
+class Expanded:
+    """One node the search has fully expanded."""
+
+    hp: int
+    g_score: float
+    depth: int
+    key: tuple[object, ...]
+    """Its `_state_key`."""
+
+
+class HpFrontier:
+    """The expanded nodes of one search, bucketed on every state fact but HP."""
+
+    def __init__(self, tie: float) -> None:
+        self._tie = tie
+        """Two g-scores this close are the same cost."""
+        self._buckets: dict[tuple[object, ...], list[Expanded]] = {}
+
+    def add(self, bucket: tuple[object, ...], expanded: Expanded) -> None:
+        self._buckets.setdefault(bucket, []).append(expanded)
+
+    def dominator(self, bucket: tuple[object, ...], hp: int, g_score: float, depth: int) -> Expanded | None:
+        """An expanded node of `bucket` with at least `hp`, reached no dearer
+        and no deeper; None when there is none."""
+        for expanded in self._buckets.get(bucket, ()):
+            if expanded.hp >= hp and expanded.g_score <= g_score + self._tie and expanded.depth <= depth:
+                return expanded
+        return None
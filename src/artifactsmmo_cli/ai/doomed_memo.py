@@ -8,36 +8,96 @@ the same signature doubles the TTL (base 20 → 40 → 80, capped at 160 cycles)
 a goal that keeps timing out on every re-probe is retried geometrically less
 often instead of re-burning a full planning budget every fixed K cycles. The
 counter resets when the goal plans successfully (`clear`) or when its
-plannability signature changes (new levels = genuinely new plannability)."""
+plannability signature changes (new levels = genuinely new plannability).
 
-from artifactsmmo_cli.ai.plannability_signature import Signature, plannability_signature
+SHARED VERDICTS. With a coordination store attached (`share`), every mark is
+also published to the learning DB's `doomed_verdicts`, keyed by goal and the
+game data's `catalog_digest`, and a goal this process has no entry for is
+skipped while any character's unexpired verdict covers its signature
+(`signature_covers`: recorded at no lower level in anything). A restarted
+child inherits its own verdicts and a sibling reads the fleet's, so the wall
+is paid for once. A mark with no entry of its own at that signature
+continues the highest failure count among the covering verdicts, so the window
+keeps escalating across processes. The shared window is the cycle window at
+`CYCLE_SECONDS` per cycle; a goal this process has planned is judged by its
+own attempts alone until it fails again."""
+
+from collections.abc import Callable
+from datetime import datetime, timezone
+
+from artifactsmmo_cli.ai.learning.coordination_store import CoordinationStore, SharedVerdict
+from artifactsmmo_cli.ai.plannability_signature import Signature, plannability_signature, signature_covers
 from artifactsmmo_cli.ai.world_state import WorldState
 
+CYCLE_SECONDS = 15
+"""Seconds per cycle when converting a re-probe window to the wall clock the
+shared verdicts expire on. The low end of the observed 15-25s cooldown-bound
+cadence, so a shared window never outlasts the cycle window it stands for."""
+
+
+def _utc_now() -> datetime:
+    return datetime.now(tz=timezone.utc)
+
 
 class DoomedMemo:
     """Per-session record of goals that produced no plan. Keyed by `repr(goal)`."""
 
     def __init__(self, retry_after_cycles: int = 20,
-                 max_retry_after_cycles: int = 160) -> None:
+                 max_retry_after_cycles: int = 160,
+                 clock: Callable[[], datetime] = _utc_now) -> None:
         self._base_retry = retry_after_cycles
         self._max_retry = max_retry_after_cycles
+        self._clock = clock
         # goal_repr -> (signature at mark time, cycle marked, consecutive failures)
         self._entries: dict[str, tuple[Signature, int, int]] = {}
+        # Goals planned since their last mark; shared verdicts do not apply.
+        self._planned: set[str] = set()
+        self._board: CoordinationStore | None = None
+        self._catalog = ""
+        # The board's verdicts, read once per cycle: (cycle read at, verdicts).
+        self._verdicts: tuple[int, dict[str, list[SharedVerdict]]] | None = None
+
+    def share(self, board: CoordinationStore | None, catalog: str | None) -> None:
+        """Publish to and read from `board`'s verdicts on `catalog`. None for
+        either keeps the memo private to this process."""
+        self._board = board if catalog is not None else None
+        self._catalog = catalog or ""
+
+    def _shared(self, goal_repr: str, sig: Signature, cycle: int) -> list[SharedVerdict]:
+        """The board's verdicts on `goal_repr` that cover `sig`."""
+        if self._board is None or goal_repr in self._planned:
+            return []
+        if self._verdicts is None or self._verdicts[0] != cycle:
+            self._verdicts = (cycle, self._board.doomed_verdicts(self._catalog))
+        return [v for v in self._verdicts[1].get(goal_repr, ()) if signature_covers(v.signature, sig)]
 
     def mark(self, goal_repr: str, state: WorldState, cycle: int) -> None:
         """Record that `goal_repr` produced no plan at this state/cycle.
 
         A re-mark under the SAME signature is a consecutive failure (the
         re-probe also found no plan) and escalates the TTL; a mark under a
-        new signature starts the failure count over at 1."""
+        new signature starts the failure count over at 1, or past the
+        shared verdicts that cover it."""
         sig = plannability_signature(state)
         prev = self._entries.get(goal_repr)
-        failures = prev[2] + 1 if prev is not None and prev[0] == sig else 1
+        if prev is not None and prev[0] == sig:
+            failures = prev[2] + 1
+        else:
+            self._planned.discard(goal_repr)
+            failures = 1 + max((v.failures for v in self._shared(goal_repr, sig, cycle)), default=0)
         self._entries[goal_repr] = (sig, cycle, failures)
+        if self._board is not None:
+            self._board.publish_doomed(goal_repr, sig, self._catalog, failures,
+                                       self._ttl(failures) * CYCLE_SECONDS, self._clock())
 
     def clear(self, goal_repr: str) -> None:
         """Forget a goal (called when it plans successfully)."""
-        self._entries.pop(goal_repr, None)
+        marked = self._entries.pop(goal_repr, None)
+        if self._board is None:
+            return
+        self._planned.add(goal_repr)
+        if marked is not None or (self._verdicts is not None and goal_repr in self._verdicts[1]):
+            self._board.clear_doomed(goal_repr, self._catalog)
 
     def _ttl(self, failures: int) -> int:
         """Re-probe window for the Nth consecutive failure: doubles each time,
@@ -47,10 +107,13 @@ class DoomedMemo:
     def is_doomed(self, goal_repr: str, state: WorldState, cycle: int) -> bool:
         """True => skip planning this goal this cycle. False once the signature
         changes (new plannability) or the escalating re-probe window has
-        elapsed."""
+        elapsed. With no verdict of its own, a shared one that covers this
+        state decides until its wall-clock window ends."""
         entry = self._entries.get(goal_repr)
         if entry is None:
-            return False
+            now = self._clock()
+            shared = self._shared(goal_repr, plannability_signature(state), cycle)
+            return any(verdict.expires_at > now for verdict in shared)
         sig, set_at, failures = entry
         if sig != plannability_signature(state):
             return False
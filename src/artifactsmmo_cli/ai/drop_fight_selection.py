@@ -66,8 +66,8 @@ def select_drop_fight(item: str, actions: list[Action], state: WorldState,
         if fight is None:
             continue
         if fight.locations:
-            loc = nearest_or_error(state.x, state.y, fight.locations, "gather")
-            dist = abs(loc[0] - state.x) + abs(loc[1] - state.y)
+            loc = nearest_or_error(state.x, state.y, fight.locations, "gather", fight.destination_steps(state))
+            dist = game_data.travel_steps(state.x, state.y, loc[0], loc[1], state.layer)
         else:
             dist = 0
         drop_candidates.append(MonsterDropCandidate(
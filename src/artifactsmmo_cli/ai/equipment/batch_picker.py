@@ -0,0 +1,228 @@
+"""Batched gear scoring and loadout search over a columnar item table.
+
+`pick_loadout` is the REFERENCE: it is the algorithm `Formal/RealizableLoadout`
+models and the one the mutation harness (`formal/diff/mutate.py`) anchors on,
+so it stays exactly as written. It is also slot x candidate x slot: every slot
+rebuilds its candidate list from the whole owned pool, scores each candidate
+through `gear_value` (which copies the purpose's monster maps per call and
+re-reads ~15 `ItemStats` attributes), scores the argmax and the incumbent a
+second time, and `_forbidden` re-sums `result` for every candidate.
+
+`pick_loadout_batched` returns the same loadout, bit for bit, from:
+
+* ONE scoring pass (`benefits`) over the owned codes. The purpose's
+  monster-relative factors — ``max(0, 100 - res[e])``, the monster's attack,
+  the player's attack through the clamp — are hoisted out of the item loop, and
+  each item's stats come from its `_ItemColumns` row, where the scorers'
+  four-stat sums are already summed. The arithmetic is `equipment.scoring`'s
+  pure cores, re-associated only where integer arithmetic makes that exact.
+* Per-slot candidate vectors sorted once by the picker's own tie chain
+  ``(-benefit, -level, code)``, so a slot's argmax is its first feasible entry.
+* A running per-code occupancy count, so the cap check is O(1).
+
+`_ItemColumns` lays the catalog out one stat per `array` column, codes interned
+to dense rows, so the scoring pass is a loop over machine ints instead of
+attribute reads. It is derived from `GameData.all_item_stats`, which stays the
+source of truth, and is kept per `GameData` like `kit_selection`'s memos,
+rebuilt when the table is rebound or grows.
+
+`tests/test_ai/test_batch_picker.py` pins both halves against the reference:
+`benefits` against `_benefit` over the whole catalog, and the picks against
+`pick_loadout` over the real catalog's owned-gear mixes.
+"""
+
+import weakref
+from array import array
+from collections import Counter
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+
+from artifactsmmo_cli.ai.actions.equip import DUPLICATE_SLOT_TYPES, ITEM_TYPE_TO_SLOTS
+from artifactsmmo_cli.ai.elements import ELEMENTS
+from artifactsmmo_cli.ai.equipment.loadout_picker import UTILITY_FILL_TYPES, ordered_slots
+from artifactsmmo_cli.ai.equipment.realizable_loadout import ownership
+from artifactsmmo_cli.ai.equipment.scoring import RULER_SCALE
+from artifactsmmo_cli.ai.game_data import GameData
+from artifactsmmo_cli.ai.gear_value_core import Combat, Gather, Rank, rank_adversary
+from artifactsmmo_cli.ai.item_catalog import ItemStats
+from artifactsmmo_cli.ai.world_state import WorldState
+
+_TYPECODE = "q"
+"""Signed 64-bit columns: every scored product stays exact and well inside range."""
+
+
+def _column(values: Iterable[int]) -> "array[int]":
+    return array(_TYPECODE, values)
+
+
+def _matrix(rows: Iterable[Mapping[str, int]]) -> "array[int]":
+    return array(_TYPECODE, (row.get(elem, 0) for row in rows for elem in ELEMENTS))
+
+
+@dataclass(frozen=True)
+class _ItemColumns:
+    """Every item's scored stats, one column per stat, row `ids[code]`.
+
+    `flat_combat` and `efficiency` are pre-summed exactly as the scorers sum
+    them (`equipment.scoring.armor_score_combat_pure`'s ``hp_restore + hp_bonus
+    + lifesteal + combat_buff`` and `gear_score_efficiency_pure`'s ``wisdom +
+    prospecting + inventory_space + haste``), so a pass reads one int where a
+    scorer reads four attributes. Per-element stats are row-major ``[n, E]``
+    matrices in `ELEMENTS` order."""
+
+    ids: Mapping[str, int]
+    level: "array[int]"
+    type_: tuple[str, ...]
+    is_tool: "array[int]"
+    critical_strike: "array[int]"
+    dmg: "array[int]"
+    flat_combat: "array[int]"
+    efficiency: "array[int]"
+    attack: "array[int]"
+    resistance: "array[int]"
+    dmg_elements: "array[int]"
+    skill_effects: Mapping[str, "array[int]"]
+    """skill -> column of the signed `skill_effects` entry (0 where absent)."""
+
+    @classmethod
+    def build(cls, stats: Mapping[str, ItemStats]) -> "_ItemColumns":
+        codes = sorted(stats)
+        rows = [stats[code] for code in codes]
+        skills = sorted({skill for s in rows for skill in s.skill_effects})
+        return cls(
+            ids={code: i for i, code in enumerate(codes)},
+            level=_column(s.level for s in rows),
+            type_=tuple(s.type_ for s in rows),
+            is_tool=_column(int(s.subtype == "tool") for s in rows),
+            critical_strike=_column(s.critical_strike for s in rows),
+            dmg=_column(s.dmg for s in rows),
+            flat_combat=_column(s.hp_restore + s.hp_bonus + s.lifesteal + s.combat_buff for s in rows),
+            efficiency=_column(s.wisdom + s.prospecting + s.inventory_space + s.haste for s in rows),
+            attack=_matrix(s.attack for s in rows),
+            resistance=_matrix(s.resistance for s in rows),
+            dmg_elements=_matrix(s.dmg_elements for s in rows),
+            skill_effects={skill: _column(s.skill_effects.get(skill, 0) for s in rows) for skill in skills},
+        )
+
+
+#: `id(game_data)` -> (the table's fingerprint, its columns). Keyed per
+#: `GameData` as `kit_selection` keys its memos, with the same
+#: `weakref.finalize` purge; the fingerprint is `RequirementGraphMemo`'s (the
+#: table's identity and size), so an in-place edit that keeps the size is not
+#: seen.
+_columns: dict[int, tuple[tuple[int, int], _ItemColumns]] = {}
+
+
+def _columns_for(game_data: GameData) -> _ItemColumns:
+    stats = game_data.all_item_stats
+    fingerprint = (id(stats), len(stats))
+    key = id(game_data)
+    cached = _columns.get(key)
+    if cached is None:
+        weakref.finalize(game_data, _columns.pop, key, None)
+    elif cached[0] == fingerprint:
+        return cached[1]
+    built = _ItemColumns.build(stats)
+    _columns[key] = (fingerprint, built)
+    return built
+
+
+def benefits(purpose: object, codes: Iterable[str], game_data: GameData) -> dict[str, int]:
+    """`loadout_picker._benefit` for every code in `codes` the catalog knows.
+
+    Gather: a `UTILITY_FILL_TYPES` piece scores its flat utility (the armor
+    ruler against no monster and no attack, i.e. ``RULER_SCALE * 200 *
+    (flat_combat + efficiency)``), anything else the negated skill effect.
+    Combat (and Rank, which is Combat against `rank_adversary`): a weapon
+    scores ``RULER_SCALE * raw * (200 + crit) + nonToolBonus``, everything
+    else ``RULER_SCALE * (200 * defense + offense + 200 * flat_combat)`` —
+    each plus the shared ``RULER_SCALE * 200 * efficiency``.
+    """
+    cols = _columns_for(game_data)
+    rows = [(code, i) for code in codes if (i := cols.ids.get(code)) is not None]
+    width = len(ELEMENTS)
+    out: dict[str, int] = {}
+    if isinstance(purpose, Gather):
+        effect = cols.skill_effects.get(purpose.skill)
+        for code, i in rows:
+            if cols.type_[i] in UTILITY_FILL_TYPES:
+                out[code] = RULER_SCALE * 200 * (cols.flat_combat[i] + cols.efficiency[i])
+            else:
+                out[code] = -effect[i] if effect is not None else 0
+        return out
+    if purpose is Rank or isinstance(purpose, Rank):
+        purpose = rank_adversary()
+    if not isinstance(purpose, Combat):
+        raise ValueError(f"unsupported purpose: {purpose!r}")
+    clamp = [max(0, 100 - purpose.monster_resistance.get(e, 0)) for e in ELEMENTS]
+    monster_attack = [purpose.monster_attack.get(e, 0) for e in ELEMENTS]
+    reach = [purpose.player_attack.get(e, 0) * clamp[k] for k, e in enumerate(ELEMENTS)]
+    for code, i in rows:
+        base = i * width
+        efficiency = RULER_SCALE * 200 * cols.efficiency[i]
+        crit = cols.critical_strike[i]
+        if cols.type_[i] == "weapon":
+            raw = sum(cols.attack[base + k] * clamp[k] for k in range(width))
+            out[code] = RULER_SCALE * raw * (200 + crit) + (1 - cols.is_tool[i]) + efficiency
+            continue
+        dmg = cols.dmg[i]
+        defense = sum(monster_attack[k] * cols.resistance[base + k] for k in range(width))
+        offense = sum(reach[k] * (2 * (dmg + cols.dmg_elements[base + k]) + crit) for k in range(width))
+        out[code] = RULER_SCALE * (200 * defense + offense + 200 * cols.flat_combat[i]) + efficiency
+    return out
+
+
+def pick_loadout_batched(
+    purpose: object, state: WorldState, game_data: GameData,
+) -> dict[str, str | None]:
+    """`loadout_picker.pick_loadout`, computed from one batched scoring pass.
+
+    Same contract, same answer: see `pick_loadout` for the occupancy cap, the
+    strict-improvement rule and the empty-slot gate, which this reproduces
+    step for step over the same slot order.
+    """
+    cols = _columns_for(game_data)
+    pool = {code for code, qty in state.inventory.items() if qty > 0}
+    pool.update(code for code in state.equipment.values() if code)
+    benefit = benefits(purpose, pool, game_data)
+
+    by_slot: dict[str, list[tuple[int, int, str]]] = {}
+    for code in benefit:
+        i = cols.ids[code]
+        level = cols.level[i]
+        if state.level < level:
+            continue
+        for slot in ITEM_TYPE_TO_SLOTS.get(cols.type_[i], []):
+            by_slot.setdefault(slot, []).append((-benefit[code], -level, code))
+    for ranked in by_slot.values():
+        ranked.sort()
+
+    caps: dict[str, int] = {}
+
+    def cap(code: str) -> int:
+        if code not in caps:
+            dup = cols.type_[cols.ids[code]] in DUPLICATE_SLOT_TYPES
+            caps[code] = ownership(code, state.inventory, state.equipment) if dup else 1
+        return caps[code]
+
+    result: dict[str, str | None] = dict(state.equipment)
+    worn = Counter(code for code in result.values() if code)
+    for slot in ordered_slots():
+        here = result.get(slot)
+        best = next((code for _neg, _lvl, code in by_slot.get(slot, ())
+                     if worn[code] - (here == code) < cap(code)), None)
+        if best is None:
+            continue
+        current_code = state.equipment.get(slot)
+        if current_code == best:
+            continue
+        if current_code and current_code in benefit:
+            if benefit[best] <= benefit[current_code]:
+                continue
+        elif current_code is None and benefit[best] <= 0:
+            continue
+        if here:
+            worn[here] -= 1
+        result[slot] = best
+        worn[best] += 1
+    return result
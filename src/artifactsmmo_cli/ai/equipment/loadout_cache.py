@@ -9,19 +9,26 @@ inside `pick_loadout`. Within one search almost every node shares the same
 lookups.
 
 The key is exactly pick_loadout's determinants: purpose, `state.level`,
-`state.equipment`, and `state.inventory` WITH counts (the ring/artifact
-occupancy cap is physical ownership, so quantities change the answer).
-Entries are scoped per-GameData via weak references — a GameData's cache
-dies with it, and distinct instances (test fixtures) never collide.
+`state.equipment`, and the part of `state.inventory` the solve can read —
+see `_inventory_key`. Entries are scoped per-GameData via weak references — a
+GameData's cache dies with it, and distinct instances (test fixtures) never
+collide.
+
+Solved entries also outlive the process: `save_loadouts` writes the most
+recently used ones next to the game-data cache (`persisted_memo`), and a fresh
+cache seeds itself from that file, so a restarted or sibling child does not
+re-solve the loadouts its predecessor already did.
 """
 
 import weakref
 from collections import OrderedDict
 
-from artifactsmmo_cli.ai.actions.equip import ITEM_TYPE_TO_SLOTS
-from artifactsmmo_cli.ai.equipment.loadout_picker import pick_loadout
+from artifactsmmo_cli.ai.actions.equip import DUPLICATE_SLOT_TYPES, ITEM_TYPE_TO_SLOTS
+from artifactsmmo_cli.ai.equipment.batch_picker import pick_loadout_batched
 from artifactsmmo_cli.ai.game_data import GameData
 from artifactsmmo_cli.ai.gear_value_core import Combat, Gather, Rank
+from artifactsmmo_cli.ai.memo_stats import memo_counter
+from artifactsmmo_cli.ai.persisted_memo import read_entries, sync_memo
 from artifactsmmo_cli.ai.world_state import WorldState
 
 CACHE_MAX_ENTRIES = 4096
@@ -29,6 +36,15 @@ CACHE_MAX_ENTRIES = 4096
 search states while capping long-run growth (inventory churns every action, so
 unbounded keys would accumulate for the life of the process)."""
 
+LOADOUT_CACHE_VERSION = 1
+"""Format of the file `save_loadouts` writes. Bump when `_CacheKey` or the
+purpose key changes shape: an old file then reads as a miss."""
+
+PERSIST_MAX_ENTRIES = 1024
+"""How many of the most recently used entries `save_loadouts` writes. A
+cycle's search touches a few hundred distinct keys; the rest of the LRU is
+mostly states no later cycle revisits."""
+
 _CacheKey = tuple[tuple[object, ...], int, tuple[tuple[str, str | None], ...],
                   tuple[tuple[str, int], ...]]
 
@@ -38,9 +54,15 @@ WeakKeyDictionary can't hold it. A `weakref.finalize` purges the entry the
 moment its GameData is collected, which also makes id-reuse impossible: the
 old id is evicted before the allocator can hand it out again."""
 
-_equippable_memo: dict[int, dict[str, bool]] = {}
-"""Per-GameData `code -> can this code ever occupy a slot`. Catalog-static, so
-memoized once per code; purged together with the loadout cache."""
+_projections: dict[int, dict[str, tuple[int, int]]] = {}
+"""Per-GameData `code -> (item level, copies the solve can use)`; the copy count
+is 0 for a code that can never occupy a slot. Catalog-static, so memoized
+once per code; purged together with the loadout cache."""
+
+_dirty: set[int] = set()
+"""GameData ids whose cache gained entries since the last save."""
+
+_STATS = memo_counter("loadout_cache", size=lambda: sum(len(cache) for cache in _caches.values()))
 
 
 def _cache_for(game_data: GameData) -> "OrderedDict[_CacheKey, dict[str, str | None]]":
@@ -49,22 +71,57 @@ def _cache_for(game_data: GameData) -> "OrderedDict[_CacheKey, dict[str, str | N
     if cache is None:
         cache = OrderedDict()
         _caches[key] = cache
-        _equippable_memo[key] = {}
-        weakref.finalize(game_data, _caches.pop, key, None)
-        weakref.finalize(game_data, _equippable_memo.pop, key, None)
+        _projections[key] = {}
+        weakref.finalize(game_data, _forget, key)
+        _load_persisted(game_data, cache)
     return cache
 
 
-def _equippable(code: str, game_data: GameData) -> bool:
-    memo = _equippable_memo[id(game_data)]
+def _forget(key: int) -> None:
+    _caches.pop(key, None)
+    _projections.pop(key, None)
+    _dirty.discard(key)
+
+
+def _projection(code: str, game_data: GameData) -> tuple[int, int]:
+    memo = _projections[id(game_data)]
     known = memo.get(code)
     if known is None:
         stats = game_data.item_stats(code)
-        known = stats is not None and stats.type_ in ITEM_TYPE_TO_SLOTS
+        if stats is None or stats.type_ not in ITEM_TYPE_TO_SLOTS:
+            known = (0, 0)
+        elif stats.type_ in DUPLICATE_SLOT_TYPES:
+            known = (stats.level, len(ITEM_TYPE_TO_SLOTS[stats.type_]))
+        else:
+            known = (stats.level, 1)
         memo[code] = known
     return known
 
 
+def _inventory_key(state: WorldState, game_data: GameData) -> tuple[tuple[str, int], ...]:
+    """The inventory as `pick_loadout` sees it, canonicalised.
+
+    The solve reads the inventory in exactly two places: the candidate pool
+    (qty > 0, an equippable type, item level <= `state.level`) and, for those
+    candidates, the ring/artifact occupancy cap `ownership(code)`. So a code
+    enters the key only if it can be a candidate — gathered materials and
+    above-level gear cannot change the answer — and its count is clamped to
+    what the cap comparison can tell apart. A non-duplicate code's cap is 1
+    whatever the count, so only presence matters. A duplicate code's cap is
+    compared against the copies worn in the OTHER slots of its type, at most
+    `len(slots) - 1`, so every count from `len(slots)` up forbids nothing and
+    reads the same. A fourth ring in the bag is a cache hit."""
+    key: list[tuple[str, int]] = []
+    for code, qty in state.inventory.items():
+        if qty <= 0:
+            continue
+        level, usable = _projection(code, game_data)
+        if usable and level <= state.level:
+            key.append((code, min(qty, usable)))
+    key.sort()
+    return tuple(key)
+
+
 def _purpose_key(purpose: object) -> tuple[object, ...]:
     """Hashable canonical key for the closed purpose set (gear_value_core)."""
     if isinstance(purpose, Combat):
@@ -86,32 +143,76 @@ def pick_loadout_cached(
     purpose: object, state: WorldState, game_data: GameData,
 ) -> dict[str, str | None]:
     """`pick_loadout` with a per-GameData LRU memo — bit-identical results.
+    A miss is solved by `batch_picker.pick_loadout_batched`, which returns
+    exactly `pick_loadout`'s answer from one batched scoring pass.
 
     Both the stored entry and the returned dict are private copies, so a
     caller mutating its result can never poison later hits.
     """
     cache = _cache_for(game_data)
-    # Inventory enters the key PROJECTED onto equippable codes: pick_loadout
-    # reads the inventory only through the candidate pool (qty>0, item type in
-    # ITEM_TYPE_TO_SLOTS) and the dup-cap ownership of those same candidates,
-    # so gathered-material churn (the planner mutates it every search node)
-    # cannot change the answer and must not miss the cache — whole-inventory
-    # keys left 68% of planner CPU as misses (profile 2026-07-06).
+    # Inventory enters the key PROJECTED (`_inventory_key`): gathered-material
+    # churn (the planner mutates it every search node) cannot change the
+    # answer and must not miss the cache — whole-inventory keys left 68% of
+    # planner CPU as misses (profile 2026-07-06).
     key: _CacheKey = (
         _purpose_key(purpose),
         state.level,
         tuple(sorted(state.equipment.items())),
-        tuple(sorted(
-            (code, qty) for code, qty in state.inventory.items()
-            if qty > 0 and _equippable(code, game_data)
-        )),
+        _inventory_key(state, game_data),
     )
     hit = cache.get(key)
     if hit is not None:
         cache.move_to_end(key)
+        _STATS.hit()
         return dict(hit)
-    result = pick_loadout(purpose, state, game_data)
+    started = _STATS.start()
+    result = pick_loadout_batched(purpose, state, game_data)
+    _STATS.miss(started)
     cache[key] = dict(result)
+    _dirty.add(id(game_data))
     if len(cache) > CACHE_MAX_ENTRIES:
         cache.popitem(last=False)
     return result
+
+
+def _load_persisted(game_data: GameData,
+                    cache: "OrderedDict[_CacheKey, dict[str, str | None]]") -> None:
+    """Seed a fresh cache from the file `save_loadouts` writes (a file of
+    another catalog or format seeds nothing)."""
+    path = game_data._loadout_cache_path
+    if path is None or game_data._catalog_digest is None:
+        return
+    for key, loadout in read_entries(path, LOADOUT_CACHE_VERSION, game_data._catalog_digest,
+                                     _decode):
+        cache[key] = loadout  # type: ignore[index]
+
+
+def _decode(raw: dict[str, str | None]) -> dict[str, str | None]:
+    return dict(raw)
+
+
+def _encode(loadout: dict[str, str | None]) -> object:
+    return loadout
+
+
+def save_loadouts(game_data: GameData) -> None:
+    """Persist the most recently used loadouts next to the game-data cache and
+    merge in whatever sibling processes persisted (`persisted_memo.sync_memo`).
+
+    A no-op unless this GameData was loaded with a persistence path and its
+    cache gained entries since the last save; the player calls it once per
+    cycle, inside the cooldown. A failed write is reported and otherwise
+    ignored: the entries are still in memory and the next save retries.
+    `pick_loadout` reads nothing but the catalog and the keyed state, so the
+    catalog digest is the whole invalidation story."""
+    key = id(game_data)
+    path = game_data._loadout_cache_path
+    if key not in _dirty or path is None or game_data._catalog_digest is None:
+        return
+    try:
+        sync_memo(_caches[key], path, LOADOUT_CACHE_VERSION, game_data._catalog_digest,
+                  _decode, _encode, PERSIST_MAX_ENTRIES, CACHE_MAX_ENTRIES)
+    except OSError as e:
+        print(f"[loadout] cache write failed: {e}")
+        return
+    _dirty.discard(key)
@@ -14,7 +14,7 @@ from artifactsmmo_cli.ai.gear_value import gear_value
 from artifactsmmo_cli.ai.gear_value_core import Gather
 from artifactsmmo_cli.ai.world_state import WorldState
 
-_UTILITY_FILL_TYPES: frozenset[str] = frozenset({"artifact"})
+UTILITY_FILL_TYPES: frozenset[str] = frozenset({"artifact"})
 """Item types whose value is purpose-independent flat utility (wisdom/prospecting/
 hp). They carry no skill_effects, so the Gather scorer values them at 0 and the
 empty-slot gate discards them — this set routes them through the flat-utility
@@ -57,7 +57,7 @@ def _candidates_for_slot(
     return result
 
 
-def _ordered_slots() -> list[str]:
+def ordered_slots() -> list[str]:
     """Deterministic slot iteration order for the one-slot-per-code rule.
 
     Iteration order MATTERS: when two multi-slot peers (e.g. ring1_slot,
@@ -91,12 +91,12 @@ def _benefit(stats: ItemStats, purpose: object) -> int:
     is also 0 — the empty-slot gate (best_score <= 0 → skip) and the
     strict-improvement rule (> current_score) together guarantee that armor
     slots keep their current item unchanged for Gather purposes. Exception:
-    types in `_UTILITY_FILL_TYPES` (artifacts) route through the flat-utility
+    types in `UTILITY_FILL_TYPES` (artifacts) route through the flat-utility
     term `armor_score(stats, {})` instead, since they carry no skill_effects
     but do grant purpose-independent utility that pick_loadout should equip.
     """
     if isinstance(purpose, Gather):
-        if stats.type_ in _UTILITY_FILL_TYPES:
+        if stats.type_ in UTILITY_FILL_TYPES:
             # Artifacts grant purpose-independent utility (wisdom/prospecting/hp)
             # and carry no skill_effects, so gear_value(Gather) = 0 and the
             # empty-slot gate discards them. Score by the flat-utility term:
@@ -182,7 +182,7 @@ def pick_loadout(
                if _dup_allowed(code) else 1)
         return worn_elsewhere >= cap
 
-    for slot in _ordered_slots():
+    for slot in ordered_slots():
         candidates = _candidates_for_slot(slot, state, game_data)
         current_code = state.equipment.get(slot)
 
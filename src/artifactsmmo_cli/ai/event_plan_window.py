@@ -73,7 +73,7 @@ def plan_fits_event_window(plan: list[Action], state: WorldState,
             game_data.resource_locations(content_code)
         if not tiles:
             return False
-        distance = min(abs(tx - state.x) + abs(ty - state.y) for tx, ty in tiles)
+        distance = min(game_data.travel_steps(state.x, state.y, tx, ty, state.layer) for tx, ty in tiles)
         if not event_window_sufficient_pure(
                 remaining_seconds=(expiration - now).total_seconds(),
                 distance=distance, plan_cost=plan_cost):
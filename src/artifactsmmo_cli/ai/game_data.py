@@ -7,12 +7,15 @@ the catalogs own the state and domain queries, the facade owns the API-load
 logic and delegates everything else.
 """
 
+import sqlite3
 import sys
 import time
 from collections.abc import Mapping
 from collections.abc import Set as AbstractSet
 from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
 from functools import cached_property
+from pathlib import Path
 from typing import Any
 
 from artifactsmmo_api_client import AuthenticatedClient
@@ -36,6 +39,7 @@ from artifactsmmo_api_client.models.craft_skill import CraftSkill
 from artifactsmmo_api_client.models.effect_schema import EffectSchema
 from artifactsmmo_api_client.models.event_schema import EventSchema
 from artifactsmmo_api_client.models.gathering_skill import GatheringSkill
+from artifactsmmo_api_client.models.ge_order_schema import GEOrderSchema
 from artifactsmmo_api_client.models.ge_order_type import GEOrderType
 from artifactsmmo_api_client.models.item_schema import ItemSchema
 from artifactsmmo_api_client.models.map_content_type import MapContentType
@@ -48,8 +52,14 @@ from artifactsmmo_api_client.models.task_full_schema import TaskFullSchema
 from artifactsmmo_api_client.types import Unset
 
 from artifactsmmo_cli.ai.elements import ELEMENTS
-from artifactsmmo_cli.ai.game_data_cache import GameDataCache
+from artifactsmmo_cli.ai.game_data_cache import GameDataCache, catalog_digest
 from artifactsmmo_cli.ai.game_data_error import GameDataCoverageError
+from artifactsmmo_cli.ai.ge_market_store import (
+    GE_REFERENCE_WINDOW_SECONDS,
+    GeMarketStore,
+    best_order,
+    book_order,
+)
 from artifactsmmo_cli.ai.gear_taxonomy import ITEM_TYPE_TO_SLOTS, stats_is_combat_bearing
 from artifactsmmo_cli.ai.gear_taxonomy_core import (
     combat_gear_types as _core_combat_gear_types,
@@ -63,6 +73,7 @@ from artifactsmmo_cli.ai.monster_catalog import MonsterCatalog
 from artifactsmmo_cli.ai.recipe_catalog import RecipeCatalog
 from artifactsmmo_cli.ai.recipe_cost_memo import RecipeCostMemo
 from artifactsmmo_cli.ai.requirement_graph_memo import RequirementGraphMemo
+from artifactsmmo_cli.ai.tile_distance import TileDistanceTable
 from artifactsmmo_cli.ai.world_state import TASKS_COIN_CODE, WorldState
 from artifactsmmo_cli.rate_limited_error import RateLimitedError
 from artifactsmmo_cli.utils.retry_after import retry_after_seconds
@@ -170,6 +181,24 @@ class GameData:
     _task_gold_rewards: dict[str, int] = field(default_factory=dict)
     _recipe_cost_memo: RecipeCostMemo | None = field(default=None, init=False, repr=False)
     _requirement_graph_memo: RequirementGraphMemo | None = field(default=None, init=False, repr=False)
+    _tile_distances: TileDistanceTable | None = field(default=None, init=False, repr=False)
+    _tile_distances_key: tuple[int, int] = field(default=(0, 0), init=False, repr=False)
+    _tile_distance_path: Path | None = field(default=None, init=False, repr=False)
+    """Where `load` persists the compiled distance tables (next to the
+    game-data bundle). None for offline/test builds: compile in memory only."""
+    _grind_candidate_path: Path | None = field(default=None, init=False, repr=False)
+    """Where `tiers/skill_grind_target.save_grind_candidates` persists grind
+    candidate lists. None for offline/test builds: memoise in memory only."""
+    _loadout_cache_path: Path | None = field(default=None, init=False, repr=False)
+    """Where `equipment/loadout_cache.save_loadouts` persists solved loadouts.
+    None for offline/test builds: memoise in memory only."""
+    _ge_market_path: Path | None = field(default=None, init=False, repr=False)
+    """The shared `GeMarketStore` file `_load_ge_orders` reads and syncs. None
+    for offline/test builds: page the live book directly."""
+    _catalog_digest: str | None = field(default=None, init=False, repr=False)
+    """`catalog_digest` of the static pages this GameData was built from, set
+    by `load`. Tags persisted derived caches so a different catalog reads as a
+    miss."""
     _consumable_effect_codes: dict[str, list[str]] = field(default_factory=dict, init=False, repr=False)
     _effect_registry: dict[str, str] = field(default_factory=dict, init=False, repr=False)
     _seen_effect_codes: set[str] = field(default_factory=set, init=False, repr=False)
@@ -589,6 +618,14 @@ class GameData:
     def _ge_sell_orders(self, value: dict[str, tuple[str, int, int]]) -> None:
         self.world.ge_sell_orders = value
 
+    @property
+    def _ge_reference_prices(self) -> dict[str, dict[str, int]]:
+        return self.world.ge_reference_prices
+
+    @_ge_reference_prices.setter
+    def _ge_reference_prices(self, value: dict[str, dict[str, int]]) -> None:
+        self.world.ge_reference_prices = value
+
     @property
     def _event_npc_spawns(self) -> dict[str, tuple[int, int]]:
         return self.world.event_npc_spawns
@@ -1134,6 +1171,14 @@ class GameData:
         anti-surrogate guard for buy_source_venue)."""
         return self.world.ge_best_sell_order(item_code)
 
+    def ge_reference_price(self, item_code: str, side: str) -> int | None:
+        """The median best `side` ("buy"/"sell") price of item_code over the
+        last `GE_REFERENCE_WINDOW_SECONDS` of the local market history, or None
+        when there is no history for it. Not an order: nothing can be filled at
+        it. The pricing adapters bound a post or an NPC buy against it, so a
+        price far off the recent market is refused rather than acted on."""
+        return self.world.ge_reference_price(item_code, side)
+
     def grand_exchange_location(self) -> tuple[int, int] | None:
         """Tile of the Grand Exchange, or None if the map has no GE."""
         return self.world.grand_exchange_location()
@@ -1142,6 +1187,38 @@ class GameData:
         """Find the nearest location to (x, y) by Manhattan distance."""
         return self.world.nearest_location(x, y, locations)
 
+    @property
+    def tile_distances(self) -> TileDistanceTable:
+        """Exact walking-distance tables over the walkable grid (see
+        `ai/tile_distance`). Built on first use and kept for this GameData's
+        lifetime; rebuilt if the tile sets have grown since (a test or a load
+        seeding them in place — the `RequirementGraphMemo` fingerprint rule);
+        a rebuild keeps the distances the old table learned from real moves.
+        When `load` recorded a persistence path, the compiled tables are read
+        from / written to disk so a warm boot runs no BFS."""
+        key = (len(self.world.walkable_tiles), len(self.world.restricted_tiles))
+        if self._tile_distances is None or self._tile_distances_key != key:
+            table = TileDistanceTable(self.world.walkable_tiles, self.world.restricted_tiles)
+            if self._tile_distances is not None:
+                table.observed.update(self._tile_distances.observed)
+            path = self._tile_distance_path
+            if path is not None and not table.load(path):
+                table.compile_all()
+                try:
+                    table.save(path)
+                except OSError as e:
+                    # Same stance as the bundle write in `_load_once`: the
+                    # tables are in memory already; the next boot recompiles.
+                    print(f"[game_data] tile distance cache write failed: {e}")
+            self._tile_distances = table
+            self._tile_distances_key = key
+        return self._tile_distances
+
+    def travel_steps(self, x0: int, y0: int, x1: int, y1: int, layer: str) -> int:
+        """Walking steps between two tiles on `layer`: exact over the walkable
+        grid (or as last observed from the server), Manhattan when unknown."""
+        return self.tile_distances.steps(x0, y0, x1, y1, layer)
+
     # === Whole-mapping read-only views ===
     # External code that iterates, membership-tests, or passes a whole index
     # to a pure helper reads it through these properties instead of touching
@@ -1519,6 +1596,11 @@ class GameData:
         else:
             objs = cls._hydrate_bundle(raw)
         data._build_from_objs(objs)
+        data._tile_distance_path = cache.tile_distance_path
+        data._grind_candidate_path = cache.grind_candidate_path
+        data._loadout_cache_path = cache.loadout_path
+        data._ge_market_path = cache.ge_market_path
+        data._catalog_digest = catalog_digest(raw)
         data._load_ge_orders(client)
         return data
 
@@ -2098,48 +2180,66 @@ class GameData:
 
     def _load_ge_orders(self, client: AuthenticatedClient) -> None:
         """Index, per item, the highest-price OPEN BUY order and the lowest-price
-        OPEN SELL order from the live GE order book. Filling a BUY order sells the
+        OPEN SELL order from the GE order book. Filling a BUY order sells the
         item for immediate gold (realizable proceeds); filling a SELL order buys the
-        item for immediate, guaranteed acquisition (realizable cost). We page each
-        side of the order book and keep, per item, the single best order (BUY: max
-        price; SELL: min price; ties broken by larger quantity, then order id for
-        determinism). The API is the source of truth; no order is fabricated."""
-        page = 1
-        while True:
-            result = get_ge_orders(client=client, type_=GEOrderType.BUY, page=page, size=100)
-            if result is None or not result.data:
-                break
-            for order in result.data:
-                candidate = (order.id, order.price, order.quantity)
-                current = self._ge_buy_orders.get(order.code)
-                if current is None or (order.price, order.quantity, order.id) > (
-                    current[1], current[2], current[0]
-                ):
-                    self._ge_buy_orders[order.code] = candidate
-            if len(result.data) < 100:
-                break
-            page += 1
-        # SELL side (the DUAL): index the LOWEST-price open sell order per item.
-        # Filling such an order BUYS the item for immediate, guaranteed acquisition,
-        # so its price is a realizable cost (the cheapest fillable buy source). We
-        # keep, per item, the single lowest-price order (ties broken by larger
-        # quantity, then order id for determinism — same tie-break shape as the BUY
-        # pass). The API is the source of truth; no order is fabricated.
+        item for immediate, guaranteed acquisition (realizable cost). Per item we
+        keep the single best order (`ge_market_store.best_order`: BUY max price,
+        SELL min price, ties broken by larger quantity, then order id for
+        determinism). The API is the source of truth; no order is fabricated.
+
+        With a `_ge_market_path` (a real `load`) the book comes from the shared
+        `GeMarketStore`: this process pages a side only when it wins that side's
+        `claim_sync`, and otherwise reads the snapshot a sibling recorded less
+        than `GE_SYNC_TTL_SECONDS` ago, waiting for it (`await_sync`) while the
+        claimer is still paging. A side that has never been recorded, or whose
+        claimer's snapshot does not land in time, is paged regardless — an empty
+        index would leave the whole session blind to the market, and a stale
+        one would price on orders that are gone. The same store supplies the
+        recent reference prices (`ge_reference_price`). Any store failure falls
+        back to paging live."""
+        path = self._ge_market_path
+        if path is None:
+            self._ge_buy_orders = best_order("buy", self._fetch_ge_book(client, GEOrderType.BUY))
+            self._ge_sell_orders = best_order("sell", self._fetch_ge_book(client, GEOrderType.SELL))
+            return
+        now = datetime.now(tz=timezone.utc)
+        books: dict[str, dict[str, tuple[str, int, int]]] = {}
+        store: GeMarketStore | None
+        try:
+            store = GeMarketStore(path)
+        except (OSError, sqlite3.Error) as e:  # an unwritable or full cache dir
+            print(f"[game_data] GE market store unavailable ({e}); paging live")
+            store = None
+        for order_type in (GEOrderType.BUY, GEOrderType.SELL):
+            side = order_type.value
+            if store is not None:
+                try:
+                    if (store.claim_sync(side, now) or store.synced_at(side) is None
+                            or not store.await_sync(side, now)):
+                        store.record_book(side, [book_order(o) for o in self._fetch_ge_book(client, order_type)], now)
+                    books[side] = store.best_orders(side)
+                    self._ge_reference_prices[side] = store.reference_prices(
+                        side, now - timedelta(seconds=GE_REFERENCE_WINDOW_SECONDS))
+                    continue
+                except (OSError, sqlite3.Error) as e:
+                    print(f"[game_data] GE market store unavailable ({e}); paging live")
+            books[side] = best_order(side, self._fetch_ge_book(client, order_type))
+        self._ge_buy_orders = books["buy"]
+        self._ge_sell_orders = books["sell"]
+
+    def _fetch_ge_book(self, client: AuthenticatedClient, order_type: GEOrderType) -> list[GEOrderSchema]:
+        """Page one whole side of the live order book."""
+        out: list[GEOrderSchema] = []
         page = 1
         while True:
-            result = get_ge_orders(client=client, type_=GEOrderType.SELL, page=page, size=100)
+            result = get_ge_orders(client=client, type_=order_type, page=page, size=100)
             if result is None or not result.data:
                 break
-            for order in result.data:
-                candidate = (order.id, order.price, order.quantity)
-                current = self._ge_sell_orders.get(order.code)
-                if current is None or (-order.price, order.quantity, order.id) > (
-                    -current[1], current[2], current[0]
-                ):
-                    self._ge_sell_orders[order.code] = candidate
+            out.extend(result.data)
             if len(result.data) < 100:
                 break
             page += 1
+        return out
 
     def _fetch_effects(self, client: AuthenticatedClient) -> list[EffectSchema]:
         """Page all effect definitions; return the schema list."""
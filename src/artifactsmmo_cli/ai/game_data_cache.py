@@ -1,6 +1,7 @@
 """Disk cache for GameData's static API pages: configurable-TTL, versioned,
 atomic. Holds NO game logic — only persistence + freshness."""
 
+import hashlib
 import json
 import os
 from datetime import datetime, timedelta, timezone
@@ -26,6 +27,19 @@ class GameDataCache:
         host = urlparse(api_base_url).netloc or "default"
         base = cache_dir if cache_dir is not None else Path.home() / ".cache" / "artifactsmmo"
         self.path = base / f"gamedata-{host}.json"
+        self.tile_distance_path = base / f"tiledist-{host}.json"
+        """Sibling file for `TileDistanceTable.save`. Not TTL-governed: the
+        tables carry a fingerprint of the tile sets they were compiled from."""
+        self.grind_candidate_path = base / f"grind-{host}.json"
+        """Sibling file for `skill_grind_target.save_grind_candidates`. Not
+        TTL-governed: entries carry the `catalog_digest` they were computed
+        against."""
+        self.loadout_path = base / f"loadout-{host}.json"
+        """Sibling file for `loadout_cache.save_loadouts`, governed the same
+        way as `grind_candidate_path`."""
+        self.ge_market_path = base / f"ge-{host}.db"
+        """`GeMarketStore` SQLite file: the shared GE order book and its price
+        history. Freshness is the store's own (`claim_sync`), not this TTL."""
 
     def read(self, ttl_minutes: int, now: datetime | None = None) -> RawPages | None:
         now = now or datetime.now(tz=timezone.utc)
@@ -47,3 +61,12 @@ class GameDataCache:
         tmp = self.path.with_suffix(self.path.suffix + ".tmp")
         tmp.write_text(json.dumps(payload))
         os.replace(tmp, self.path)
+
+
+def catalog_digest(raw_pages: RawPages) -> str:
+    """Stable digest of the static pages, for tagging caches DERIVED from them.
+
+    The bank page is left out: it is character state that happens to ride in
+    the bundle, and it changes on every deposit without changing the catalog."""
+    static = {k: v for k, v in raw_pages.items() if k != "bank"}
+    return hashlib.sha256(json.dumps(static, sort_keys=True).encode()).hexdigest()[:16]
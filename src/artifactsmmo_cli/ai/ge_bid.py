@@ -13,13 +13,14 @@ alternative to ceiling-bound the post price, that we are not already acquiring
 another way (no open order for it), and for which the three-way buy-venue choice
 lands on posting our own order (`BuyVenue.GE_POST`) rather than filling a standing
 sell order or buying from the NPC. The posted price is `buy_post_price`: one tick
-over the anchor, ceiling-bounded by the NPC alternative minus margin.
+over the anchor, ceiling-bounded by the NPC alternative minus margin, and it must
+sit within the recent best-buy history (`within_reference`).
 """
 
 from artifactsmmo_cli.ai.bid_vs_craft import should_bid
 from artifactsmmo_cli.ai.buy_source_venue import BuyVenue, choose_buy_venue3
 from artifactsmmo_cli.ai.game_data import GameData
-from artifactsmmo_cli.ai.ge_post_pricing import buy_post_price
+from artifactsmmo_cli.ai.ge_post_pricing import buy_post_price, within_reference
 from artifactsmmo_cli.ai.selection_context import SelectionContext
 from artifactsmmo_cli.ai.world_state import WorldState
 
@@ -62,6 +63,8 @@ def ge_bid_candidates(
         post_price = buy_post_price(best_buy, alt_cost=npc_price, margin=_BID_MARGIN)
         if post_price is None:
             continue  # no live buy-anchor — fail closed, never post speculatively
+        if not within_reference("buy", post_price, game_data.ge_reference_price(item, "buy")):
+            continue  # overbidding a spike the recent market does not pay
         sell_order = game_data.ge_best_sell_order(item)
         fill_cost = sell_order[1] if sell_order is not None else None
         if choose_buy_venue3(npc_price, fill_cost, post_price) is BuyVenue.GE_POST:
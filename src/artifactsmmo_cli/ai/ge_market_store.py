@@ -0,0 +1,297 @@
+"""Local, shared copy of the Grand Exchange order book plus its price history.
+
+Every `play --all` child used to page BOTH sides of the whole order book at
+boot (`GameData._load_ge_orders`) — the account-bucket burst `SupervisorPool`
+staggers children to survive — and every `trade` market command re-fetched a
+page with no memory of the last run. This store is one SQLite file per API
+host next to the game-data cache (`GameDataCache.ge_market_path`), so every
+child and the trade CLI on the machine see the same book:
+
+* `claim_sync` hands the paging job to ONE process per side per
+  `GE_SYNC_TTL_SECONDS`; the others wait for the snapshot it writes
+  (`await_sync`) and page live only if it does not land.
+* `record_book` stores a fetched book as a DIFF against the previous one —
+  vanished orders deleted, new or changed orders upserted — and appends one
+  `PriceSample` per (code, side) whose best price, depth or order count moved.
+  The history therefore grows with market change, not with the number of
+  syncs, and is what `price_history` and `reference_prices` read.
+* The orders endpoint takes no since/cursor filter, so a full-side sync still
+  pages the whole side. What is incremental is the write, and the per-item
+  record (`record_book(code=...)`) that `trade analyze` feeds from the one
+  item page it already fetched, which updates that item between full syncs.
+* `best_orders` is the per-item index `GameData` serves to `ge_post_pricing`,
+  `liquidation_venue`, `buy_source_venue` and `craft_vs_buy`, with the same
+  tie-breaks the live load used (`best_order`); `reference_prices` is the
+  recent price those consumers bound a post or an NPC buy against.
+
+Its own file and stdlib `sqlite3`, not a table in `learning.db`: the market is
+per API host while `learning.db` is not, and `SQLModel.metadata` is global, so
+a model declared here would be created in every learning DB as well.
+
+Best-effort like `LearningStore`: callers catch `sqlite3.Error` and fall back to
+paging the live book, which is the pre-store behaviour.
+"""
+
+import sqlite3
+import time
+from collections.abc import Iterable, Iterator
+from contextlib import closing, contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from statistics import median_low
+from typing import Protocol
+
+from artifactsmmo_api_client.models.ge_order_schema import GEOrderSchema
+
+GE_SYNC_TTL_SECONDS = 120
+"""How long one side's snapshot serves before a process pages it again. Staggered
+children boot within a couple of minutes of each other, so one sync covers the
+fleet start; the book itself is only read at boot, so a fresher snapshot would
+buy nothing between boots."""
+
+GE_SYNC_WAIT_SECONDS = 30.0
+"""How long a process that lost `claim_sync` waits for the winner's snapshot
+before paging the side itself. Paging one side is a handful of requests, so a
+live claimer lands well inside this; a claimer that died or failed does not,
+and its stale snapshot is then never served."""
+
+GE_REFERENCE_WINDOW_SECONDS = 24 * 3600
+"""How far back `reference_prices` looks: a day of market moves."""
+
+_SYNC_POLL_SECONDS = 1.0
+
+SIDES = ("buy", "sell")
+"""`GEOrderType` values, stored as text."""
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS ge_orders (id TEXT PRIMARY KEY, side TEXT NOT NULL, "
+    "code TEXT NOT NULL, price INTEGER NOT NULL, quantity INTEGER NOT NULL, "
+    "created_at TEXT NOT NULL, seen_at TEXT NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS ix_ge_orders_side_code ON ge_orders (side, code)",
+    "CREATE TABLE IF NOT EXISTS ge_price_samples (code TEXT NOT NULL, side TEXT NOT NULL, "
+    "at TEXT NOT NULL, best_price INTEGER, depth INTEGER NOT NULL, orders INTEGER NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS ix_ge_price_samples_code ON ge_price_samples (code, side, at)",
+    "CREATE TABLE IF NOT EXISTS ge_sync (side TEXT PRIMARY KEY, claimed_at TEXT, synced_at TEXT)",
+)
+
+
+@dataclass(frozen=True)
+class BookOrder:
+    """One open order as the store holds it. `created_at` is the API's ISO
+    timestamp, kept as text."""
+
+    id: str
+    side: str
+    code: str
+    price: int
+    quantity: int
+    created_at: str
+
+
+@dataclass(frozen=True)
+class PriceSample:
+    """The top of one side of one item's book at a sync that changed it.
+    `best_price` is None once the side emptied; `depth` is the total quantity
+    on offer and `orders` the number of open orders."""
+
+    code: str
+    side: str
+    at: str
+    best_price: int | None
+    depth: int
+    orders: int
+
+
+def book_order(order: GEOrderSchema) -> BookOrder:
+    """An API order as the row `record_book` stores."""
+    return BookOrder(id=order.id, side=order.type_.value, code=order.code, price=order.price,
+                     quantity=order.quantity, created_at=order.created_at.isoformat())
+
+
+class OpenOrder(Protocol):
+    """What `best_order` reads: a `BookOrder` or the API's `GEOrderSchema`."""
+
+    @property
+    def id(self) -> str: ...
+    @property
+    def code(self) -> str: ...
+    @property
+    def price(self) -> int: ...
+    @property
+    def quantity(self) -> int: ...
+
+
+def best_order(side: str, orders: Iterable[OpenOrder]) -> dict[str, tuple[str, int, int]]:
+    """Per item, the single order a fill would take: the highest-price BUY or
+    the lowest-price SELL, ties broken by larger quantity, then larger id, so
+    the pick is deterministic. As `(order_id, price, quantity)`."""
+    sign = 1 if side == "buy" else -1
+    best: dict[str, tuple[str, int, int]] = {}
+    for order in orders:
+        current = best.get(order.code)
+        if current is None or (sign * order.price, order.quantity, order.id) > (
+            sign * current[1], current[2], current[0]
+        ):
+            best[order.code] = (order.id, order.price, order.quantity)
+    return best
+
+
+def _summary(side: str, orders: list[BookOrder]) -> tuple[int | None, int, int]:
+    prices = [o.price for o in orders]
+    top = (max(prices) if side == "buy" else min(prices)) if prices else None
+    return top, sum(o.quantity for o in orders), len(orders)
+
+
+class GeMarketStore:
+    """The order-book file. Opens a short-lived connection per call, so an
+    instance is cheap to hold and safe to share across threads."""
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            for statement in _SCHEMA:
+                conn.execute(statement)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # `closing` AND a transaction: sqlite3's own context manager commits
+        # but leaves the connection open (a ResourceWarning under `-W error`).
+        with closing(sqlite3.connect(self._path, timeout=30, isolation_level=None)) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def claim_sync(self, side: str, now: datetime, ttl_seconds: int = GE_SYNC_TTL_SECONDS) -> bool:
+        """Whether THIS process should page `side` now. True at most once per
+        `ttl_seconds` across every process sharing the file: the check and the
+        stamp happen in one write transaction, so two children booting together
+        cannot both win. A claim whose sync never landed (the claimer died or
+        its fetch failed) simply ages out with the TTL."""
+        stamp = now.isoformat()
+        floor = (now - timedelta(seconds=ttl_seconds)).isoformat()
+        with self._connect() as conn:
+            row = conn.execute("SELECT claimed_at FROM ge_sync WHERE side = ?", (side,)).fetchone()
+            if row is not None and row[0] is not None and row[0] > floor:
+                return False
+            conn.execute(
+                "INSERT INTO ge_sync (side, claimed_at) VALUES (?, ?) "
+                "ON CONFLICT(side) DO UPDATE SET claimed_at = excluded.claimed_at",
+                (side, stamp))
+        return True
+
+    def synced_at(self, side: str) -> datetime | None:
+        """When `side` was last recorded in full, or None if it never was."""
+        with self._connect() as conn:
+            row = conn.execute("SELECT synced_at FROM ge_sync WHERE side = ?", (side,)).fetchone()
+        return datetime.fromisoformat(row[0]) if row is not None and row[0] is not None else None
+
+    def is_fresh(self, now: datetime, ttl_seconds: int = GE_SYNC_TTL_SECONDS,
+                 sides: Iterable[str] = SIDES) -> bool:
+        """`sides` (both by default) recorded in full within `ttl_seconds` of `now`."""
+        floor = now - timedelta(seconds=ttl_seconds)
+        return all((at := self.synced_at(side)) is not None and at > floor for side in sides)
+
+    def await_sync(self, side: str, now: datetime, wait_seconds: float = GE_SYNC_WAIT_SECONDS,
+                   ttl_seconds: int = GE_SYNC_TTL_SECONDS) -> bool:
+        """Whether `side` is, or within `wait_seconds` becomes, fresh as of
+        `now`. For a process that lost `claim_sync`: the claim says a sibling is
+        paging the side, not that its snapshot has landed, so the snapshot on
+        file may still be the stale one the claim is replacing."""
+        deadline = time.monotonic() + wait_seconds
+        while not self.is_fresh(now, ttl_seconds, (side,)):
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(_SYNC_POLL_SECONDS)
+        return True
+
+    def record_book(self, side: str, orders: Iterable[BookOrder], now: datetime,
+                    code: str | None = None) -> int:
+        """Replace the stored `side` book — or only `code`'s part of it — with
+        `orders`, as a diff, and sample every item whose top of book moved.
+        A full-side record also stamps `synced_at`; a per-code one does not,
+        since the rest of the side is as old as it was. Returns the number of
+        order rows inserted, updated or deleted."""
+        stamp = now.isoformat()
+        fresh = {o.id: o for o in orders if o.side == side and (code is None or o.code == code)}
+        with self._connect() as conn:
+            old = {o.id: o for o in self._select(conn, side, code)}
+            gone = [oid for oid in old if oid not in fresh]
+            changed = [o for oid, o in fresh.items() if old.get(oid) != o]
+            conn.executemany("DELETE FROM ge_orders WHERE id = ?", [(oid,) for oid in gone])
+            conn.executemany(
+                "INSERT INTO ge_orders (id, side, code, price, quantity, created_at, seen_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?) ON CONFLICT(id) DO UPDATE SET side = excluded.side, "
+                "code = excluded.code, price = excluded.price, quantity = excluded.quantity, "
+                "created_at = excluded.created_at, seen_at = excluded.seen_at",
+                [(o.id, o.side, o.code, o.price, o.quantity, o.created_at, stamp) for o in changed])
+            moved = {old[oid].code for oid in gone} | {o.code for o in changed}
+            for item in sorted(moved):
+                before = _summary(side, [o for o in old.values() if o.code == item])
+                after = _summary(side, [o for o in fresh.values() if o.code == item])
+                if before != after:
+                    conn.execute(
+                        "INSERT INTO ge_price_samples (code, side, at, best_price, depth, orders) "
+                        "VALUES (?, ?, ?, ?, ?, ?)", (item, side, stamp, *after))
+            if code is None:
+                conn.execute(
+                    "INSERT INTO ge_sync (side, synced_at) VALUES (?, ?) "
+                    "ON CONFLICT(side) DO UPDATE SET synced_at = excluded.synced_at",
+                    (side, stamp))
+        return len(gone) + len(changed)
+
+    def book(self, side: str | None = None, code: str | None = None) -> list[BookOrder]:
+        """Stored open orders, optionally narrowed to one side and/or item."""
+        with self._connect() as conn:
+            if side is not None:
+                return self._select(conn, side, code)
+            return [o for s in SIDES for o in self._select(conn, s, code)]
+
+    def best_orders(self, side: str) -> dict[str, tuple[str, int, int]]:
+        """`best_order` over the stored `side` book."""
+        return best_order(side, self.book(side))
+
+    def price_history(self, code: str, side: str, since: datetime | None = None) -> list[PriceSample]:
+        """`code`'s samples on `side`, oldest first, optionally from `since`."""
+        floor = since.isoformat() if since is not None else ""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT code, side, at, best_price, depth, orders FROM ge_price_samples "
+                "WHERE code = ? AND side = ? AND at >= ? ORDER BY at, rowid",
+                (code, side, floor)).fetchall()
+        return [PriceSample(*row) for row in rows]
+
+    def reference_prices(self, side: str, since: datetime) -> dict[str, int]:
+        """Per item, the median best `side` price in force over the window from
+        `since`: the samples taken in it plus the last one before it (the price
+        the window opened on, since a sample is written only when the top of
+        book moves). Items whose side was empty throughout have no entry."""
+        floor = since.isoformat()
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT code, best_price FROM ge_price_samples s WHERE side = ? AND (at >= ? OR at = "
+                "(SELECT MAX(at) FROM ge_price_samples WHERE code = s.code AND side = s.side AND at < ?)) "
+                "ORDER BY code, at, rowid", (side, floor, floor)).fetchall()
+        prices: dict[str, list[int]] = {}
+        for code, price in rows:
+            if price is not None:
+                prices.setdefault(code, []).append(price)
+        return {code: median_low(seen) for code, seen in prices.items()}
+
+    @staticmethod
+    def _select(conn: sqlite3.Connection, side: str, code: str | None) -> list[BookOrder]:
+        if code is None:
+            rows = conn.execute(
+                "SELECT id, side, code, price, quantity, created_at FROM ge_orders "
+                "WHERE side = ? ORDER BY code, id", (side,)).fetchall()
+        else:
+            rows = conn.execute(
+                "SELECT id, side, code, price, quantity, created_at FROM ge_orders "
+                "WHERE side = ? AND code = ? ORDER BY id", (side, code)).fetchall()
+        return [BookOrder(*row) for row in rows]
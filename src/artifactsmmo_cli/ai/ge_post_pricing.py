@@ -6,6 +6,8 @@ the realizable alternative, so a posted price can never be worse than dumping to
 buying from the NPC. Undercut/overbid by ONE tick to sit in front of the queue.
 
 These are the differential target proved in formal/Formal/GePostPricing.lean.
+`within_reference` is a third, unproved guard the adapters add on top: a post
+far off the item's recent market history is refused.
 """
 
 
@@ -25,3 +27,23 @@ def buy_post_price(best_buy: int | None, alt_cost: int, margin: int) -> int | No
     if best_buy is None:
         return None
     return min(best_buy + 1, alt_cost - margin)
+
+
+REFERENCE_BAND = 2
+"""How far off the recent market a price may sit before it is refused: a factor
+of two either way of the item's reference price."""
+
+
+def within_reference(side: str, price: int, reference: int | None) -> bool:
+    """Whether trading at `price` is in line with the item's recent market.
+    `side` is OUR side of the trade: "buy" pays `price` and is refused above
+    `REFERENCE_BAND` x `reference`; "sell" receives it and is refused below
+    `reference / REFERENCE_BAND`. A live anchor that far off is an outlier — a
+    dumped order, a spike bid — that the history (`GameData.ge_reference_price`)
+    says the market does not trade at. No reference (no history) admits any
+    price, which is the pre-history behaviour."""
+    if reference is None:
+        return True
+    if side == "buy":
+        return price <= REFERENCE_BAND * reference
+    return REFERENCE_BAND * price >= reference
@@ -26,6 +26,12 @@ class Goal(ABC):
     only char-XP source for the 20-160-cycle re-probe window, stranding the bot in
     a skill-grind detour under a ReachCharLevel root (2026-06-30)."""
 
+    hp_monotone: bool = False
+    """When True, `is_satisfied` never turns False as HP rises with every other
+    fact held equal. It lets the planner discard a node that only differs from
+    an already-expanded, no dearer one by having less HP (`ai/dominance`).
+    Default False: a goal nobody reasoned about is searched in full."""
+
     @abstractmethod
     def value(self, state: WorldState, game_data: GameData,
               history: LearningStore | None = None) -> float:
@@ -70,6 +76,13 @@ class Goal(ABC):
         Default True; override only with a SOUND condition — i.e. one that fails
         ONLY when no plan of length ≤ max_depth can exist (see
         formal/Formal/PlannerDepthBound.lean). Default True is always safe.
+
+        The planner runs a generic gate of its own before every search: the
+        delete relaxation over `relevant_actions` (`ai/relaxed_reachability`),
+        which refuses the goal when even with every delete ignored no plan
+        reaches it within `max_depth`. An override need not repeat what that
+        proves; it earns its place by what the relaxation cannot see
+        (quantities, gold, affordability).
         """
         return True
 
@@ -8,10 +8,9 @@ from artifactsmmo_cli.ai.actions.npc_sell import NpcSellAction
 from artifactsmmo_cli.ai.discard_surplus import discardable_surplus
 from artifactsmmo_cli.ai.disposal_route import overstock_disposal
 from artifactsmmo_cli.ai.game_data import GameData
-from artifactsmmo_cli.ai.ge_post_pricing import sell_post_price
 from artifactsmmo_cli.ai.goals.base import Goal
 from artifactsmmo_cli.ai.learning.store import LearningStore
-from artifactsmmo_cli.ai.liquidation_venue import Venue, choose_venue3, liquidation_venue
+from artifactsmmo_cli.ai.liquidation_venue import Venue, choose_venue3, liquidation_venue, post_sell_price
 from artifactsmmo_cli.ai.selection_context import SelectionContext
 from artifactsmmo_cli.ai.thresholds import (
     PRESSURE_CRITICAL_FRACTION,
@@ -143,9 +142,8 @@ class DiscardOverstockGoal(Goal):
             # the book gives an anchor and the post price beats the NPC floor.
             # choose_venue3 -> GE_POST (proved fail-closed in GePostPricing.lean).
             sell_anchor = game_data.ge_best_sell_order(code)
-            best_sell = sell_anchor[1] if sell_anchor is not None else None
             fill_proceeds = order[1] if (order is not None and order[2] >= excess_qty) else None
-            post_price = sell_post_price(best_sell, npc_sellback=npc_pay, margin=1)
+            post_price = post_sell_price(code, npc_pay, game_data)
             if ge_loc is not None and post_price is not None and \
                     choose_venue3(npc_pay, fill_proceeds, post_price) is Venue.GE_POST:
                 # Batch to the standing sell order's size, capped at the excess.
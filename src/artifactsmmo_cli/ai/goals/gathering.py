@@ -55,6 +55,8 @@ ramp (which capped at 40.0) plus an above-baseline scalar bonus head-room."""
 class GatherMaterialsGoal(Goal):
     """Gather resources needed to craft a specific upgrade item."""
 
+    hp_monotone = True  # is_satisfied reads held quantities only
+
     def __init__(self, target_item: str, needed: dict[str, int],
                  skill_grind: bool = False,
                  exclude_recycle: frozenset[str] = frozenset()) -> None:
@@ -429,8 +431,8 @@ class GatherMaterialsGoal(Goal):
                     break
                 _code, rate, mn, mx = row
                 if a.locations:
-                    loc = nearest_or_error(state.x, state.y, a.locations, "gather")
-                    dist = abs(loc[0] - state.x) + abs(loc[1] - state.y)
+                    loc = nearest_or_error(state.x, state.y, a.locations, "gather", a.destination_steps(state))
+                    dist = game_data.travel_steps(state.x, state.y, loc[0], loc[1], state.layer)
                 else:
                     dist = 0
                 candidates.append(GatherCandidate(
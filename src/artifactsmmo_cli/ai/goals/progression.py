@@ -46,6 +46,8 @@ _UPGRADE_EQUIPMENT_BASE = 35.0
 class UpgradeEquipmentGoal(Goal):
     """Craft and equip better gear when an upgrade is available or craftable."""
 
+    hp_monotone = True  # is_satisfied reads the equipment only
+
     def __init__(self, initial_equipment: dict[str, str | None] | None = None,
                  committed_target: tuple[str, str] | None = None) -> None:
         self._initial_equipment: dict[str, str | None] = dict(initial_equipment) if initial_equipment else {}
@@ -10,9 +10,13 @@ from artifactsmmo_api_client.models.gathering_skill import GatheringSkill
 _GATHERING_SKILLS = frozenset(s.value for s in GatheringSkill)
 
 
-@dataclass
+@dataclass(slots=True)
 class ItemStats:
-    """Relevant stats for an item."""
+    """Relevant stats for an item.
+
+    Slotted: the catalog holds one per item (several hundred) and the scorers
+    read its attributes in every gear pass, so it carries no per-instance
+    `__dict__`."""
 
     code: str
     level: int
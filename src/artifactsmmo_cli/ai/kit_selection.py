@@ -39,6 +39,7 @@ from collections import OrderedDict
 from artifactsmmo_cli.ai.equipment.scoring import gather_score
 from artifactsmmo_cli.ai.game_data import GameData
 from artifactsmmo_cli.ai.item_catalog import _GATHERING_SKILLS
+from artifactsmmo_cli.ai.memo_stats import memo_counter
 from artifactsmmo_cli.ai.per_state_memo import per_state
 from artifactsmmo_cli.ai.world_state import WorldState
 
@@ -63,7 +64,9 @@ def _pick_weapon(candidates: set[str], game_data: GameData) -> str | None:
     key = frozenset(candidates)
     if key in cache:
         cache.move_to_end(key)
+        _WEAPON_STATS.hit()
         return cache[key]
+    started = _WEAPON_STATS.start()
     best: tuple[int, str] | None = None
     for code in candidates:
         stats = game_data.item_stats(code)
@@ -74,6 +77,7 @@ def _pick_weapon(candidates: set[str], game_data: GameData) -> str | None:
         if best is None or attack > best[0] or (attack == best[0] and code < best[1]):
             best = (attack, code)
     answer = best[1] if best else None
+    _WEAPON_STATS.miss(started)
     cache[key] = answer
     if len(cache) > _KIT_MEMO_MAX:
         cache.popitem(last=False)
@@ -104,6 +108,9 @@ def _pick_weapon(candidates: set[str], game_data: GameData) -> str | None:
 _tool_caches: "dict[int, OrderedDict[frozenset[str], frozenset[str]]]" = {}
 _weapon_caches: "dict[int, OrderedDict[frozenset[str], str | None]]" = {}
 _KIT_MEMO_MAX = 4096
+_TOOL_STATS = memo_counter("kit_selection.tools", size=lambda: sum(len(cache) for cache in _tool_caches.values()))
+_WEAPON_STATS = memo_counter("kit_selection.weapon",
+                             size=lambda: sum(len(cache) for cache in _weapon_caches.values()))
 
 
 def _cache_for(game_data: GameData) -> tuple[
@@ -137,7 +144,9 @@ def _pick_tools(candidates: set[str], game_data: GameData) -> frozenset[str]:
     hit = cache.get(key)
     if hit is not None:
         cache.move_to_end(key)
+        _TOOL_STATS.hit()
         return hit
+    started = _TOOL_STATS.start()
     tools: set[str] = set()
     for skill in _GATHERING_SKILLS:
         best: tuple[int, str] | None = None
@@ -151,6 +160,7 @@ def _pick_tools(candidates: set[str], game_data: GameData) -> frozenset[str]:
         if best is not None:
             tools.add(best[1])
     answer = frozenset(tools)
+    _TOOL_STATS.miss(started)
     cache[key] = answer
     if len(cache) > _KIT_MEMO_MAX:
         cache.popitem(last=False)
@@ -18,8 +18,10 @@ to the empty view (no siblings), which is present-day single-character
 behaviour. Handled here and NOT re-handled upstream.
 """
 
+import json
 import weakref
 from collections.abc import Mapping
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -30,6 +32,7 @@ from sqlmodel import SQLModel, col, create_engine, select
 
 from artifactsmmo_cli.ai.learning.models import (
     BankStockClaim,
+    DoomedVerdict,
     GeOrderClaim,
     HoldingLedger,
     MaterialDemand,
@@ -110,6 +113,20 @@ window twice over while costing at most one extra minute of locked capital
 against sessions that run for hours."""
 
 
+PlannabilitySignature = tuple[int, tuple[tuple[str, int], ...]]
+"""`plannability_signature`'s shape, restated so this package keeps importing
+nothing from the planner's side of `ai`."""
+
+
+@dataclass(frozen=True)
+class SharedVerdict:
+    """One character's `DoomedVerdict` for a goal, as `doomed_verdicts` reads it."""
+
+    signature: PlannabilitySignature
+    failures: int
+    expires_at: datetime
+
+
 def _migrate_role_lease_unique_index(conn: Connection) -> None:
     """One-shot fix-up for `role_leases` on a pre-existing learning DB (2026-08-03).
 
@@ -1099,5 +1116,71 @@ class CoordinationStore:
         except SQLAlchemyError as e:
             print(f"[coordination] release_supply failed: {e}")
 
+    def publish_doomed(self, goal_repr: str, signature: PlannabilitySignature, catalog: str,
+                       failures: int, window_seconds: float, now: datetime) -> None:
+        """Record that `goal_repr` produced no plan for THIS character at
+        `signature`, for `window_seconds` from `now`. Upserts this character's
+        own row, leaving every sibling's verdict on the same goal alone."""
+        _require_utc(now)
+        expiry = (now + timedelta(seconds=window_seconds)).isoformat()
+        encoded = json.dumps(signature)
+        try:
+            with SqlSession(self._engine) as s:
+                row = s.exec(
+                    select(DoomedVerdict).where(
+                        DoomedVerdict.character == self._character,
+                        DoomedVerdict.goal_repr == goal_repr,
+                        DoomedVerdict.catalog == catalog,
+                    )
+                ).first()
+                if row is None:
+                    row = DoomedVerdict(character=self._character, goal_repr=goal_repr, catalog=catalog,
+                                        signature=encoded, failures=failures, expires_at=expiry)
+                else:
+                    row.signature, row.failures, row.expires_at = encoded, failures, expiry
+                s.add(row)
+                s.commit()
+        except SQLAlchemyError as e:
+            print(f"[coordination] publish_doomed failed: {e}")
+
+    def clear_doomed(self, goal_repr: str, catalog: str) -> None:
+        """Drop THIS character's verdict on `goal_repr`, when the goal planned.
+        Own row only, like `release`: a sibling's verdict was reached at its
+        own levels and is its to clear."""
+        try:
+            with SqlSession(self._engine) as s:
+                row = s.exec(
+                    select(DoomedVerdict).where(
+                        DoomedVerdict.character == self._character,
+                        DoomedVerdict.goal_repr == goal_repr,
+                        DoomedVerdict.catalog == catalog,
+                    )
+                ).first()
+                if row is None:
+                    return
+                s.delete(row)
+                s.commit()
+        except SQLAlchemyError as e:
+            print(f"[coordination] clear_doomed failed: {e}")
+
+    def doomed_verdicts(self, catalog: str) -> dict[str, list[SharedVerdict]]:
+        """Every character's verdicts against `catalog`, THIS character's own
+        included — its rows are what a restarted process inherits — and
+        expired ones included, for their failure counts (see
+        `DoomedVerdict`). Whether a verdict applies is the reader's call."""
+        verdicts: dict[str, list[SharedVerdict]] = {}
+        try:
+            with SqlSession(self._engine) as s:
+                rows = s.exec(select(DoomedVerdict).where(DoomedVerdict.catalog == catalog)).all()
+        except SQLAlchemyError as e:
+            print(f"[coordination] doomed_verdicts failed: {e}")
+            return {}
+        for row in rows:
+            level, skills = json.loads(row.signature)
+            signature = (level, tuple((skill, value) for skill, value in skills))
+            verdicts.setdefault(row.goal_repr, []).append(
+                SharedVerdict(signature, row.failures, datetime.fromisoformat(row.expires_at)))
+        return verdicts
+
     def close(self) -> None:
         self._engine.dispose()
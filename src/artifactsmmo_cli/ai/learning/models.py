@@ -79,6 +79,21 @@ class CycleBase(SQLModel):
     without levels and cannot acquire them; inventing one would hand a
     measurement a fabricated observation."""
 
+    state_json: str | None = Field(default=None)
+    """The full `WorldState` this cycle's decision ran against, encoded by
+    `ai.world_state_codec.state_to_json`, or None for a row written before this
+    column existed (2026-10-18) and for every cycle the run did not sample:
+    it is written only under `play --record-states N`, on every Nth cycle.
+
+    PRE-ACTION, like `skill_levels_json`: it is the state `StrategyArbiter.select`
+    saw, so `formal/diff/decision_replay.py` can re-drive the decision stack
+    against it and compare with `selected_goal` / `action_repr` on the same row.
+    The scalars above are POST-action and cannot stand in for it.
+
+    NULLABLE, NOT BACK-FILLED, for the same reason as `skill_levels_json`: the
+    inventory, equipment and bank of an old row were never recorded, and a
+    replay over a reconstructed guess would time a decision nobody made."""
+
     # Items consumed this cycle as JSON {item_code: qty}. Sparse — non-empty
     # only on fights that consumed equipped utility consumables. Generalizes
     # to any utility effect (Phase 2 resolves each code's effect).
@@ -494,6 +509,38 @@ class SupplyClaim(SQLModel, table=True):
     expires_at: str
 
 
+class DoomedVerdict(SQLModel, table=True):
+    """One character's standing "this goal does not plan" verdict — the fleet's
+    WALL board, read by `DoomedMemo` through `CoordinationStore`.
+
+    `DoomedMemo` lived in process memory, so a restarted child and every
+    sibling at the same levels each re-paid a full planning budget to learn
+    what one of them already knew. A verdict here is the memo's own entry
+    made durable: the goal, the plannability signature it failed at (JSON
+    `[level, [[skill, level], ...]]`), the `catalog_digest` of the game data
+    it was searched against, and the consecutive-failure count that sets its
+    escalating window.
+
+    Upsert key is (character, goal_repr, catalog). `expires_at` is the end of
+    the re-probe window, converted from cycles at mark time. Unlike the claim
+    tables an EXPIRED row is still read: a verdict past its window no longer
+    skips anything, but its failure count is what lets the next mark escalate
+    instead of starting over at the base window."""
+
+    __tablename__ = "doomed_verdicts"
+    __table_args__ = (
+        UniqueConstraint("character", "goal_repr", "catalog", name="uq_doomed_verdict_holder"),
+    )
+
+    id: int | None = Field(default=None, primary_key=True)
+    character: str = Field(index=True)
+    goal_repr: str = Field(index=True)
+    catalog: str = Field(index=True)
+    signature: str
+    failures: int
+    expires_at: str
+
+
 class PlanBodyLogBase(SQLModel):
     """One computed plan body, logged at re-plan time. Counted by the Phase-2
     macro detector."""
@@ -43,8 +43,10 @@ from artifactsmmo_cli.ai.learning.store_warmup_core import (
     warmup_gated_success_rate,
 )
 from artifactsmmo_cli.ai.learning.types import ActionStats, GoalStats
+from artifactsmmo_cli.ai.memo_stats import memo_counter
 
 _T = TypeVar("_T")
+_STATS = memo_counter("search_cache")  # one cache per open decision episode: no size
 
 
 @dataclass(frozen=True)
@@ -175,6 +177,11 @@ class LearningStore:
             # observation. A consumer excludes NULL rather than defaulting it.
             if cols and "skill_levels_json" not in cols:
                 conn.exec_driver_sql("ALTER TABLE cycles ADD COLUMN skill_levels_json TEXT")
+            # Decision-replay column (2026-10-18): the pre-decision WorldState.
+            # NULLABLE with no DEFAULT, like skill_levels_json above: an old row
+            # never recorded its inventory or bank, and the replay excludes it.
+            if cols and "state_json" not in cols:
+                conn.exec_driver_sql("ALTER TABLE cycles ADD COLUMN state_json TEXT")
             # Craft-xp numerator migration (2026-08-15): craft_yield gains the
             # skill level its xp was measured at. NULLABLE with no DEFAULT --
             # the rows already in the wild were measured at a level nobody
@@ -313,7 +320,11 @@ class LearningStore:
         if self._search_cache is None:
             return compute()
         if key not in self._search_cache:
+            started = _STATS.start()
             self._search_cache[key] = compute()
+            _STATS.miss(started)
+        else:
+            _STATS.hit()
         return self._search_cache[key]  # type: ignore[return-value]
 
     def action_cost(self, action_repr: str, default: float, window: int = WINDOW_ACTION) -> float:
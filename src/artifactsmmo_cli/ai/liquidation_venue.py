@@ -15,6 +15,7 @@ differential target proved in formal/Formal/LiquidationVenue.lean over `Int` wit
 from enum import Enum
 
 from artifactsmmo_cli.ai.game_data import GameData
+from artifactsmmo_cli.ai.ge_post_pricing import sell_post_price, within_reference
 from artifactsmmo_cli.ai.world_state import WorldState
 
 
@@ -83,3 +84,17 @@ def liquidation_venue(item: str, qty: int, state: WorldState, game_data: GameDat
         if order_qty >= qty:
             ge_proceeds = price
     return choose_venue(npc_pay, ge_proceeds)
+
+
+def post_sell_price(item: str, npc_pay: int, game_data: GameData) -> int | None:
+    """Impure adapter for `choose_venue3`'s post price: `sell_post_price` one
+    tick under the standing best sell order, floored at the NPC sell-back plus
+    a one-gold margin. None (no post) without a standing sell order to anchor
+    on, or when that price is under the item's recent market
+    (`within_reference` against the recent best sell): undercutting a dumped
+    order would sell for far less than the item has been going for."""
+    anchor = game_data.ge_best_sell_order(item)
+    post_price = sell_post_price(anchor[1] if anchor is not None else None, npc_sellback=npc_pay, margin=1)
+    if post_price is None or not within_reference("sell", post_price, game_data.ge_reference_price(item, "sell")):
+        return None
+    return post_price
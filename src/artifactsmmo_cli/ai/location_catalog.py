@@ -91,6 +91,10 @@ class LocationCatalog:
     Populated from the live GE-orders API read (the source of truth); never
     fabricated. A sell order is a real standing offer, so its price is a realizable
     acquisition cost (unlike a speculative new buy order)."""
+    ge_reference_prices: dict[str, dict[str, int]] = field(default_factory=dict)
+    """side ("buy"/"sell") -> item_code -> the recent median best price on that
+    side of the book (`GeMarketStore.reference_prices`). Empty without a local
+    market store; an item with no history has no entry."""
     event_npc_spawns: dict[str, tuple[int, int]] = field(default_factory=dict)  # npc_code -> fixed event spawn tile
     npc_event_codes: dict[str, str] = field(default_factory=dict)  # npc_code -> event code (membership = is_event_npc)
     # Event-spawned combat/gather content (PLAN #4 visibility slice). Loaded for ALL
@@ -453,6 +457,11 @@ class LocationCatalog:
         anti-surrogate guard for buy_source_venue)."""
         return self.ge_sell_orders.get(item_code)
 
+    def ge_reference_price(self, item_code: str, side: str) -> int | None:
+        """The recent median best `side` price of item_code, or None when the
+        local history has none."""
+        return self.ge_reference_prices.get(side, {}).get(item_code)
+
     def grand_exchange_location(self) -> tuple[int, int] | None:
         """Tile of the Grand Exchange, or None if the map has no GE."""
         return self.grand_exchange_tile
@@ -0,0 +1,97 @@
+"""Hit/miss counters for the memo layers of the planner's hot path, drained once
+per cycle into the trace record and the `CycleSnapshot`.
+
+THE BLIND SPOT. `loadout_cache`, `per_state`, the `kit_selection` and
+`skill_grind_target` caches, `reserved_targets_memo`, `LearningStore
+.search_cache` and `DepositAllAction._last_deposits` were each added after a
+cProfile of one slow search, and none of them could say afterwards whether it
+still hit. A cache keyed on a fact that started churning goes cold silently;
+the planner just gets slower.
+
+COST. A hit is one attribute increment. A miss also reads `perf_counter` twice.
+Measured on this tree, the timed pair costs about 0.46 us more than the
+disabled flag test (0.60 us against 0.14 us), and a miss of
+`kit_selection.best_fighting_weapon` runs about 5 us, so the counter is close
+to a tenth of the cheapest `per_state` miss. `set_enabled(False)` (`play
+--no-memo-stats`) turns both into a flag test and `drain` into an empty dict.
+
+TIME SAVED is an estimate: each hit is credited the layer's mean miss time over
+the same cycle, what the hit would have cost had it missed. A cycle with hits
+but no miss credits nothing rather than guess.
+
+SIZE is read at drain time only, through the callable the layer registers; the
+hot path never pays for it.
+"""
+
+from collections.abc import Callable
+from time import perf_counter
+
+_enabled = True
+
+
+class MemoCounter:
+    """One memo layer's hits, misses and miss time since the last `drain`."""
+
+    __slots__ = ("hits", "miss_seconds", "misses", "name", "size")
+
+    def __init__(self, name: str, size: Callable[[], int] | None) -> None:
+        self.name = name
+        self.size = size
+        self.hits = 0
+        self.misses = 0
+        self.miss_seconds = 0.0
+
+    def hit(self) -> None:
+        if _enabled:
+            self.hits += 1
+
+    def start(self) -> float:
+        """The clock a miss is timed from; pass it to `miss`."""
+        return perf_counter() if _enabled else 0.0
+
+    def miss(self, started: float) -> None:
+        if _enabled:
+            self.misses += 1
+            self.miss_seconds += perf_counter() - started
+
+
+_COUNTERS: dict[str, MemoCounter] = {}
+
+
+def memo_counter(name: str, size: Callable[[], int] | None = None) -> MemoCounter:
+    """The counter `name` reports into, registered on first use. `size` returns
+    the layer's current entry count; None for a layer with no single cache to
+    count (one memo per action object, or per game-data snapshot)."""
+    counter = _COUNTERS.get(name)
+    if counter is None:
+        counter = MemoCounter(name, size)
+        _COUNTERS[name] = counter
+    return counter
+
+
+def set_enabled(enabled: bool) -> None:
+    """Count (the default) or not. While off, `drain` reports nothing."""
+    global _enabled
+    _enabled = enabled
+
+
+def drain() -> dict[str, dict[str, float]]:
+    """Every layer used since the last drain, by name: `hits`, `misses`,
+    `size` (-1 when the layer registered none) and `saved_ms`. Resets the
+    counts."""
+    out: dict[str, dict[str, float]] = {}
+    if not _enabled:
+        return out
+    for name, counter in sorted(_COUNTERS.items()):
+        if not counter.hits and not counter.misses:
+            continue
+        per_miss = counter.miss_seconds / counter.misses if counter.misses else 0.0
+        out[name] = {
+            "hits": counter.hits,
+            "misses": counter.misses,
+            "size": counter.size() if counter.size is not None else -1,
+            "saved_ms": round(counter.hits * per_miss * 1000.0, 3),
+        }
+        counter.hits = counter.misses = 0
+        counter.miss_seconds = 0.0
+    return out
@@ -7,8 +7,18 @@ are broken lexicographically by `(x, y)` for a deterministic, unique winner —
 total order whether a step is being PLANNED (apply) or EXECUTED, closing the
 apply/execute divergence (apply previously used `min(tiles)`, execute Manhattan-min).
 Pure: no I/O. This is the differential target proved in formal/Formal/NearestTile.lean.
+
+Off that model — walls inside a layer, where the server's A* walks around —
+callers pass a `steps` function (`TileDistanceTable.stepper`) and the SAME
+`(steps, x, y)` total order ranks by exact walking distance instead. With no
+`steps` the proven Manhattan primitive is used unchanged.
 """
 
+from collections.abc import Callable
+
+Steps = Callable[[int, int, int, int], int]
+"""(x0, y0, x1, y1) -> walking steps; `TileDistanceTable.stepper(layer)`."""
+
 
 def nearest_tile(
     origin_x: int, origin_y: int, tiles: frozenset[tuple[int, int]] | list[tuple[int, int]]
@@ -24,12 +34,27 @@ def nearest_tile(
     )
 
 
+def nearest_by_steps(
+    origin_x: int, origin_y: int, tiles: frozenset[tuple[int, int]] | list[tuple[int, int]], steps: Steps
+) -> tuple[int, int] | None:
+    """`nearest_tile` under an arbitrary walking-distance function: the tile
+    minimizing `(steps(origin, tile), x, y)`, or `None` if `tiles` is empty."""
+    if len(tiles) == 0:
+        return None
+    return min(tiles, key=lambda t: (steps(origin_x, origin_y, t[0], t[1]), t[0], t[1]))
+
+
 def nearest_or_error(
-    origin_x: int, origin_y: int, tiles: frozenset[tuple[int, int]] | list[tuple[int, int]], what: str
+    origin_x: int, origin_y: int, tiles: frozenset[tuple[int, int]] | list[tuple[int, int]], what: str,
+    steps: Steps | None = None,
 ) -> tuple[int, int]:
     """`nearest_tile` for callers that require a destination: raises `ValueError`
-    (naming `what` kind of locations were empty) instead of returning `None`."""
-    dest = nearest_tile(origin_x, origin_y, tiles)
+    (naming `what` kind of locations were empty) instead of returning `None`.
+    A `steps` function ranks by it (`nearest_by_steps`) instead of Manhattan."""
+    if steps is None:
+        dest = nearest_tile(origin_x, origin_y, tiles)
+    else:
+        dest = nearest_by_steps(origin_x, origin_y, tiles, steps)
     if dest is None:
         raise ValueError(f"no {what} locations to choose from")
     return dest
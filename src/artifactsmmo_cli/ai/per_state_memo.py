@@ -25,6 +25,7 @@ from functools import wraps
 from typing import TypeVar
 
 from artifactsmmo_cli.ai.game_data import GameData
+from artifactsmmo_cli.ai.memo_stats import memo_counter
 from artifactsmmo_cli.ai.world_state import WorldState
 
 _T = TypeVar("_T")
@@ -43,15 +44,22 @@ def per_state(fn: "Callable[[WorldState, GameData], _T]"
 
     The entry is read ONCE into a local before it is inspected, so a concurrent
     replacement cannot be observed half-applied.
+
+    Each decorated helper reports to its own `memo_stats` counter,
+    `per_state.<name>`.
     """
     slot: list[tuple[WorldState, GameData, _T]] = []
+    stats = memo_counter(f"per_state.{fn.__name__}", size=lambda: len(slot))
 
     @wraps(fn)
     def wrapper(state: WorldState, game_data: GameData) -> _T:
         entry = slot[0] if slot else None
         if entry is not None and entry[0] is state and entry[1] is game_data:
+            stats.hit()
             return entry[2]
+        started = stats.start()
         out = fn(state, game_data)
+        stats.miss(started)
         slot[:] = [(state, game_data, out)]
         return out
 
@@ -0,0 +1,79 @@
+"""On-disk form of a per-GameData memo: versioned, catalog-tagged, atomic.
+
+`tiers/skill_grind_target` and `equipment/loadout_cache` memoise pure functions
+of (game data, a projected state key). Within one process their LRUs already
+survive across cycles; these helpers let the entries survive a restart, and —
+because every fleet child reads and merges the same file — reach the siblings.
+
+A file is `{"version", "catalog", "entries": [[key, value], ...]}`. `catalog`
+is `GameData._catalog_digest`, so entries computed against a different catalog
+read as a miss; `version` is the caller's own format number. Keys are nested
+tuples of scalars, which JSON turns into lists; `thaw_key` turns them back so a
+loaded key compares equal to a freshly built one.
+
+Holds NO game logic — only persistence, in the spirit of `game_data_cache`.
+"""
+
+import json
+import os
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Sequence
+from pathlib import Path
+from typing import Any
+
+
+def thaw_key(raw: object) -> object:
+    """JSON lists back into the nested tuples the memo keys are built from."""
+    if isinstance(raw, list):
+        return tuple(thaw_key(part) for part in raw)
+    return raw
+
+
+def read_entries[V](path: Path, version: int, catalog: str,
+                 decode: Callable[[Any], V]) -> list[tuple[object, V]]:
+    """Every `(key, value)` in the file, oldest first, or [] when the file is
+    missing, corrupt, of another version or another catalog. All-or-nothing:
+    one undecodable entry discards the file, exactly as `GameDataCache.read`
+    and `TileDistanceTable.load` treat theirs."""
+    try:
+        raw = json.loads(path.read_text())
+        if raw["version"] != version or raw["catalog"] != catalog:
+            return []
+        return [(thaw_key(key), decode(value)) for key, value in raw["entries"]]
+    except (OSError, json.JSONDecodeError, KeyError, ValueError, TypeError):
+        return []
+
+
+def write_entries(path: Path, version: int, catalog: str,
+                  entries: Sequence[tuple[object, object]]) -> None:
+    """Replace the file with `entries` (already JSON-shaped values) atomically.
+    Raises OSError; callers report it and carry on, since the memo is still in
+    memory."""
+    payload = {"version": version, "catalog": catalog,
+               "entries": [[key, value] for key, value in entries]}
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + f".{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(payload))
+    os.replace(tmp, path)
+
+
+def sync_memo[K: Hashable, V](cache: "OrderedDict[K, V]", path: Path, version: int, catalog: str,
+              decode: Callable[[Any], V], encode: Callable[[V], object],
+              persist: int, bound: int) -> None:
+    """Merge the file into `cache`, then write back the `persist` most recent.
+
+    Entries only the file holds — a sibling's, or this process's own from
+    before it was evicted — join `cache` at the COLD end, so they are served if
+    asked for but never displace what this process used recently, and `cache`
+    is trimmed back to `bound`. The write is then this process's hottest
+    entries, which is what the next reader most likely needs. Raises OSError
+    from the write."""
+    for key, value in read_entries(path, version, catalog, decode):
+        frozen: K = key  # type: ignore[assignment]
+        if frozen not in cache:
+            cache[frozen] = value
+            cache.move_to_end(frozen, last=False)
+    while len(cache) > bound:
+        cache.popitem(last=False)
+    recent = list(cache.items())[-persist:]
+    write_entries(path, version, catalog, [(key, encode(value)) for key, value in recent])
@@ -14,3 +14,12 @@ Signature = tuple[int, tuple[tuple[str, int], ...]]
 def plannability_signature(state: WorldState) -> Signature:
     """`(character level, sorted skill levels)` — the memo invalidation key."""
     return (state.level, tuple(sorted(state.skills.items())))
+
+
+def signature_covers(recorded: Signature, current: Signature) -> bool:
+    """True when `recorded` is at least `current` in the character level and in
+    every skill `current` has: a goal that found no plan at `recorded` had every
+    unlock `current` has, so the verdict carries over."""
+    level, skills = recorded
+    have = dict(skills)
+    return level >= current[0] and all(have.get(skill, 0) >= value for skill, value in current[1])
@@ -2,13 +2,16 @@
 
 import heapq
 import time
+from collections.abc import Callable, Sequence
 from contextlib import nullcontext
 from dataclasses import dataclass, field
 
 from artifactsmmo_cli.ai.actions.base import Action
+from artifactsmmo_cli.ai.dominance import Expanded, HpFrontier, hp_dominance_applies
 from artifactsmmo_cli.ai.game_data import GameData
 from artifactsmmo_cli.ai.goals.base import Goal
 from artifactsmmo_cli.ai.learning.store import LearningStore
+from artifactsmmo_cli.ai.relaxed_reachability import relaxed_plan_length
 from artifactsmmo_cli.ai.world_state import WorldState
 
 _SEARCH_BUDGET_SECONDS = 15.0
@@ -98,6 +101,22 @@ succeeded uncapped at ~900K created (RestoreHP live probe 2026-07-06).
 1M created ≈ 4GB transient worst case; goals with sane relevant_actions
 never approach it."""
 
+_FLAT_PROBE_SECONDS = 1.0
+"""Wall clock the flat search gets, on a goal with subgoals, before `plan`
+decomposes it. The flat search returns the least-cost plan and a refined one
+does not (the legs fix the route order: 12 actions for the feather_coat chain
+against the flat 10, two extra minutes at the fleet's request floor), so a
+chain the flat search solves inside this probe keeps its least-cost plan and
+its subgoals are never even derived. The chains decomposition is for take the
+flat search seconds to tens of seconds (feather_coat: 13.3 s)."""
+
+_REFINE_BUDGET_SECONDS = 2.0
+"""Wall-clock cap on refining a decomposition (`plan(subgoals=...)`), across
+all of its legs. Each leg is a short search toward an (item, quantity) subgoal
+— a few gathers, one craft, a withdraw — so a healthy decomposition refines in
+well under a second; one that has not finished by this cap is not going to,
+and the flat search it falls back to gets what is left of the budget."""
+
 
 def _state_key(state: WorldState) -> tuple[object, ...]:
     """Hashable key over the full WorldState for the visited set.
@@ -128,6 +147,16 @@ def _state_key(state: WorldState) -> tuple[object, ...]:
     )
 
 
+_HP_INDEX = 2
+"""Where `_state_key` puts `state.hp`; `ai/dominance` buckets nodes on the rest."""
+
+
+_TIE_SECONDS = 1e-6
+"""Two g-scores this close are the same cost. The two orders of a commuting
+pair add the same edge costs in a different order, which floating point may
+round a last bit apart."""
+
+
 @dataclass(order=True)
 class _Node:
     """Priority queue node for A* search."""
@@ -137,6 +166,19 @@ class _Node:
     state: WorldState = field(compare=False)
     plan: list[Action] = field(compare=False)
     g_score: float = field(compare=False)
+    parent: WorldState | None = field(compare=False, default=None)
+    """The state `plan[-1]` was applied in; None at the root."""
+
+
+@dataclass(frozen=True)
+class SubgoalStats:
+    """One leg of a decomposition: the subgoal searched for, and what it cost."""
+    goal: str
+    nodes_explored: int
+    plan_len: int
+    refined: bool
+    """False for the leg that found no plan, where the decomposition was
+    abandoned for a flat search."""
 
 
 @dataclass
@@ -150,6 +192,64 @@ class PlanStats:
     """True when the search stopped at _MAX_SEARCH_NODES (memory bound).
     Always sets timed_out too: a capped search is inconclusive, not proof of
     unreachability, so it must ride the same doomed-memo-exempt semantics."""
+    subgoals: list[SubgoalStats] = field(default_factory=list)
+    """The legs of the decomposition `plan` was handed, in refinement order;
+    empty for a plain search. When a leg failed, this ends at that leg and the
+    rest of the stats are the flat search's."""
+    hierarchical: bool = False
+    """True when the returned plan is the refined decomposition (the counters
+    then sum over its legs), False when it came from one flat search."""
+    relaxed_unreachable: bool = False
+    """True when the delete relaxation (`ai/relaxed_reachability`) proved no
+    plan within `max_depth` exists and the search was never run. Conclusive,
+    unlike `timed_out`."""
+    interleavings_pruned: int = 0
+    """Successors never generated because they only reorder a commuting pair
+    (`_reordered`): the canonical order reaches the same state at the same
+    cost from the parent."""
+    nodes_dominated: int = 0
+    """First visits never expanded because an expanded node with the same
+    facts but more HP was reached no dearer (`ai/dominance`)."""
+
+
+def _reordered(node: _Node, relevant: list[Action], rank: dict[int, int], commuting: list[int],
+               game_data: GameData) -> set[int]:
+    """Indices into `relevant` of the successors `node` need not generate.
+
+    PARTIAL-ORDER REDUCTION. When two actions commute (`actions/footprint`),
+    `a` then `b` and `b` then `a` reach one state at one total cost, and the
+    search only needs one of them. The canonical one is the order of
+    `relevant`: after `node`'s own last action, every commuting action listed
+    BEFORE it is skipped — the parent generates that action first and this
+    one after it.
+
+    Why nothing optimal is lost: take, among the cheapest plans, the shortest,
+    and among those the first in `relevant`-lexicographic order. It has no
+    skipped pair — swapping one would give an equally cheap, equally long,
+    lexicographically earlier plan — and each of its prefixes is the same kind
+    of plan to its own state. Duplicate detection keeps an arbitrary path per
+    state, so `_search` re-expands, from every equally cheap revisit, what the
+    first visit skipped and this one would not have: the prefix's node always
+    gets its next action generated, from one visit or the other."""
+    if node.parent is None:
+        return set()
+    last = node.plan[-1]
+    made = last.footprint(node.parent, game_data)
+    if made is None:
+        return set()
+    last_rank = rank[id(last)]
+    skipped: set[int] = set()
+    for index in commuting:
+        if index >= last_rank:
+            break
+        action = relevant[index]
+        # Read at `node.state`, not the parent: it names only facts `last`
+        # does not touch when the two commute, so the two readings agree.
+        footprint = action.footprint(node.state, game_data)
+        if (footprint is not None and action.travel_region == last.travel_region
+                and made.commutes_with(footprint)):
+            skipped.add(index)
+    return skipped
 
 
 class GOAPPlanner:
@@ -185,6 +285,7 @@ class GOAPPlanner:
         *,
         budget_seconds: float | None = None,
         max_nodes: int | None = None,
+        subgoals: Sequence[Goal] | Callable[[], Sequence[Goal]] = (),
     ) -> list[Action]:
         """Return the lowest-cost action plan to satisfy `goal` from `state`, or [] if none found.
 
@@ -193,52 +294,195 @@ class GOAPPlanner:
         constant for every candidate, guards included; ``None`` (the default) falls
         back to the constant outright.
         ``max_nodes`` likewise overrides ``_MAX_SEARCH_NODES`` (the memory bound).
+
+        ``subgoals`` is an abstract plan for `goal` (`ai/acquisition_subgoals`),
+        or a function that derives one: legs to reach in order before `goal`
+        itself. Pass it only for a goal that has an acquisition chain: any
+        other goal would pay a probe for nothing. It is used only when the flat
+        search runs out of ``_FLAT_PROBE_SECONDS`` without a plan. Then each
+        leg is refined by its own short search from the state the previous
+        leg's plan reaches, and the legs' plans are concatenated. A probe that
+        stopped on ``max_nodes`` is not decomposed: it is returned as it is,
+        because the flat fallback would stop on the same node. A refined plan
+        is valid but NOT necessarily the least-cost one — the decomposition
+        fixed the route choice — which is the price of not searching the whole
+        product space. A leg that finds no plan within
+        ``_REFINE_BUDGET_SECONDS`` abandons the decomposition for the flat
+        search, on what is left of the budget: the whole call, probe and legs
+        included, stays inside ``budget_seconds``.
         """
-        max_depth = goal.max_depth
         budget = _SEARCH_BUDGET_SECONDS if budget_seconds is None else budget_seconds
         node_cap = _MAX_SEARCH_NODES if max_nodes is None else max_nodes
         deadline = time.monotonic() + budget
+        legs: list[SubgoalStats] = []
+
+        cache_ctx = history.search_cache() if history is not None else nullcontext()
+        with cache_ctx:
+            if subgoals:
+                probe_deadline = min(deadline, time.monotonic() + _FLAT_PROBE_SECONDS)
+                plan, _end, stats = self._search(state, goal, actions, game_data, history,
+                                                 probe_deadline, node_cap)
+                if (plan is not None or not stats.timed_out or stats.node_capped
+                        or time.monotonic() >= deadline):
+                    # Solved least-cost, conclusively unsolvable, capped (a
+                    # rerun would stop on the same node), or out of budget.
+                    self.last_stats = stats
+                    return plan if plan is not None else []
+                abstract = subgoals() if callable(subgoals) else subgoals
+                if abstract:
+                    refine_deadline = min(deadline, time.monotonic() + _REFINE_BUDGET_SECONDS)
+                    refined = self._refine(state, goal, abstract, actions, game_data, history,
+                                           refine_deadline, node_cap, legs)
+                    if refined is not None:
+                        return refined
+            plan, _end, stats = self._search(state, goal, actions, game_data, history,
+                                             deadline, node_cap)
+        stats.subgoals = legs
+        self.last_stats = stats
+        return plan if plan is not None else []
+
+    def _refine(
+        self,
+        state: WorldState,
+        goal: Goal,
+        subgoals: Sequence[Goal],
+        actions: list[Action],
+        game_data: GameData,
+        history: LearningStore | None,
+        deadline: float,
+        node_cap: int,
+        legs: list[SubgoalStats],
+    ) -> list[Action] | None:
+        """Search each of `subgoals`, then `goal`, from where the last leg left
+        off; the concatenated plan, or None at the first leg with no plan (or
+        when the concatenation exceeds `goal.max_depth`). Every leg tried is
+        appended to `legs`."""
+        plan: list[Action] = []
+        stats = PlanStats(subgoals=legs, hierarchical=True)
+        for leg in [*subgoals, goal]:
+            found, state, leg_stats = self._search(state, leg, actions, game_data, history,
+                                                   deadline, node_cap)
+            legs.append(SubgoalStats(repr(leg), leg_stats.nodes_explored,
+                                     len(found or []), found is not None))
+            stats.nodes_explored += leg_stats.nodes_explored
+            stats.nodes_created += leg_stats.nodes_created
+            stats.max_depth_reached += leg_stats.max_depth_reached
+            if found is None:
+                return None
+            plan.extend(found)
+        if len(plan) > goal.max_depth:
+            # The flat search never returns a plan longer than `max_depth`
+            # (formal/Formal/PlannerDepthBound), and `is_plannable` gates on
+            # that bound; a refined plan must not be the exception.
+            return None
+        self.last_stats = stats
+        return plan
+
+    def _search(
+        self,
+        state: WorldState,
+        goal: Goal,
+        actions: list[Action],
+        game_data: GameData,
+        history: LearningStore | None,
+        deadline: float,
+        node_cap: int,
+    ) -> tuple[list[Action] | None, WorldState, PlanStats]:
+        """One A* search: `(plan, the state it reaches, stats)`, or
+        `(None, state, stats)` when no plan was found before the deadline or
+        node cap."""
+        max_depth = goal.max_depth
         stats = PlanStats(nodes_created=1)  # the root node below
 
         visited: set[tuple[object, ...]] = set()
         relevant = goal.relevant_actions(actions, state, game_data)
-
-        cache_ctx = history.search_cache() if history is not None else nullcontext()
-        with cache_ctx:
-            # h = goal.heuristic(state, game_data): an admissible & CONSISTENT
-            # estimate of remaining plan cost (seconds), by contract (see
-            # Goal.heuristic's docstring). Every `action.cost(...)` in this
-            # codebase returns a non-negative float (see e.g. rest.py's
-            # rest_cost_pure ≥ 0.3 — dynamic since 3a4994f4, not the old flat
-            # 10.0 —
-            # movement.py:58 = max(d*5, 1.0) ≥ 1.0, consumable.py:93 = 2.0,
-            # gathering.py:86, combat.py:97, crafting.py:103 — all ≥ 0). With
-            # non-negative edge costs and an admissible+consistent h, A*'s
-            # "first satisfied node popped is least cost" holds. The default
-            # h ≡ 0.0 (trivially admissible & consistent) reduces this to
-            # Dijkstra optimality, which holds absolutely for every goal that
-            # does not override `heuristic`. A previous version used
-            # `goal.value(...)` as h (urgency, not seconds), which was
-            # non-admissible and made the planner return strictly suboptimal
-            # plans — see formal/Formal/PlannerAdmissibility.lean.
-            h0 = goal.heuristic(state, game_data)
-            heap: list[_Node] = [_Node(f_score=h0, depth=0, state=state, plan=[], g_score=0.0)]
-            while heap:
-                if time.monotonic() >= deadline:
-                    stats.timed_out = True
-                    break
-                if stats.nodes_created >= node_cap:
-                    # Memory bound hit (checked per pop; overshoot is at most
-                    # one expansion's fan-out). Inconclusive like a timeout.
-                    stats.node_capped = True
-                    stats.timed_out = True
-                    break
-
-                node = heapq.heappop(heap)
-
-                key = _state_key(node.state)
-                if key in visited:
+        if relaxed_plan_length(goal, state, game_data, relevant) > max_depth:
+            # Even with every delete ignored, no plan over `relevant` reaches
+            # the goal within `max_depth`: conclusive, in milliseconds, where
+            # the A* below would spend its whole budget finding nothing.
+            stats.relaxed_unreachable = True
+            return None, state, stats
+
+        # h = goal.heuristic(state, game_data): an admissible & CONSISTENT
+        # estimate of remaining plan cost (seconds), by contract (see
+        # Goal.heuristic's docstring). Every `action.cost(...)` in this
+        # codebase returns a non-negative float (see e.g. rest.py's
+        # rest_cost_pure ≥ 0.3 — dynamic since 3a4994f4, not the old flat
+        # 10.0 —
+        # movement.py:58 = max(d*5, 1.0) ≥ 1.0, consumable.py:93 = 2.0,
+        # gathering.py:86, combat.py:97, crafting.py:103 — all ≥ 0). With
+        # non-negative edge costs and an admissible+consistent h, A*'s
+        # "first satisfied node popped is least cost" holds. The default
+        # h ≡ 0.0 (trivially admissible & consistent) reduces this to
+        # Dijkstra optimality, which holds absolutely for every goal that
+        # does not override `heuristic`. A previous version used
+        # `goal.value(...)` as h (urgency, not seconds), which was
+        # non-admissible and made the planner return strictly suboptimal
+        # plans — see formal/Formal/PlannerAdmissibility.lean.
+        # Partial-order reduction: see `_reordered`. `asleep` holds, per state
+        # whose first expansion skipped any successor, that expansion's g and
+        # the skipped indices, so an equally cheap revisit can wake them.
+        rank = {id(action): index for index, action in enumerate(relevant)}
+        commuting = [index for index, action in enumerate(relevant)
+                     if type(action).footprint is not Action.footprint]
+        asleep: dict[tuple[object, ...], tuple[float, set[int]]] = {}
+        # HP dominance: see `ai/dominance`. A first visit another expanded
+        # node dominates is not expanded itself, so it is never `visited`.
+        frontier = HpFrontier(_TIE_SECONDS) if hp_dominance_applies(goal, relevant, state, game_data) else None
+        bucket: tuple[object, ...] = ()
+
+        h0 = goal.heuristic(state, game_data)
+        heap: list[_Node] = [_Node(f_score=h0, depth=0, state=state, plan=[], g_score=0.0)]
+        while heap:
+            if time.monotonic() >= deadline:
+                stats.timed_out = True
+                break
+            if stats.nodes_created >= node_cap:
+                # Memory bound hit (checked per pop; overshoot is at most
+                # one expansion's fan-out). Inconclusive like a timeout.
+                stats.node_capped = True
+                stats.timed_out = True
+                break
+
+            node = heapq.heappop(heap)
+
+            key = _state_key(node.state)
+            dominator = None
+            if frontier is not None and key not in visited:
+                bucket = key[:_HP_INDEX] + key[_HP_INDEX + 1:]
+                dominator = frontier.dominator(bucket, node.state.hp, node.g_score, node.depth)
+            if key in visited:
+                # Duplicate detection alone would drop what the first visit
+                # skipped as a reordering: a successor of this state that
+                # commuted with the FIRST path's last action need not commute
+                # with this one's, and its canonical route may run through
+                # here. An equally cheap revisit expands exactly those.
+                slept = asleep.get(key)
+                if slept is None or node.depth >= max_depth or node.g_score > slept[0] + _TIE_SECONDS:
+                    continue
+                skipped = _reordered(node, relevant, rank, commuting, game_data)
+                woken = slept[1] - skipped
+                if not woken:
+                    continue
+                slept[1].intersection_update(skipped)
+                stats.interleavings_pruned -= len(woken)
+                expand = [relevant[index] for index in sorted(woken)]
+            elif dominator is not None:
+                # Whatever this node reaches, the dominator reaches no dearer
+                # — except what the dominator's own first expansion skipped as
+                # a reordering of ITS last action. When the two are equally
+                # cheap, the canonical route to the optimum may run through
+                # here, so this node generates exactly those; the same
+                # argument as a revisit, from a state with more HP.
+                stats.nodes_dominated += 1
+                slept = asleep.get(dominator.key)
+                if slept is None or node.depth >= max_depth or node.g_score > dominator.g_score + _TIE_SECONDS:
+                    continue
+                woken = slept[1] - _reordered(node, relevant, rank, commuting, game_data)
+                if not woken:
                     continue
+                expand = [relevant[index] for index in sorted(woken)]
+            else:
                 visited.add(key)
                 stats.nodes_explored += 1
                 if node.depth > stats.max_depth_reached:
@@ -251,85 +495,92 @@ class GOAPPlanner:
                     # is provably least-cost.  Proven in
                     # formal/Formal/PlannerAdmissibility.lean
                     # (`firstSatisfied_least_cost_of_admissible` applied with h=0).
-                    self.last_stats = stats
-                    return node.plan
+                    return node.plan, node.state, stats
 
                 if node.depth >= max_depth:
                     continue
+                if frontier is not None:
+                    frontier.add(bucket, Expanded(node.state.hp, node.g_score, node.depth, key))
+                skipped = _reordered(node, relevant, rank, commuting, game_data)
+                expand = relevant
+                if skipped:
+                    asleep[key] = (node.g_score, skipped)
+                    stats.interleavings_pruned += len(skipped)
+                    expand = [action for index, action in enumerate(relevant) if index not in skipped]
+
+            for action in expand:
+                if getattr(action, "travel_region", "overworld") != \
+                        game_data.state_region(node.state):
+                    continue
+                if not action.is_applicable(node.state, game_data):
+                    continue
 
-                for action in relevant:
-                    if getattr(action, "travel_region", "overworld") != \
-                            game_data.state_region(node.state):
-                        continue
-                    if not action.is_applicable(node.state, game_data):
-                        continue
-
-                    next_state = action.apply(node.state, game_data)
-                    # THE EDGE COST IS max(cooldown, one request slot).
-                    #
-                    # `action.cost(...)` prices an action at the SECONDS its
-                    # cooldown takes. That is the true price only while the
-                    # cooldown is what the bot waits on. On a `play --all` fleet
-                    # it is not: rate limits are per-IP, every child holds a
-                    # fifth of one budget, and the 2026-08-10 five-character run
-                    # measured every child pinned at ~52 actions/hour — a mean
-                    # 69s between actions against a mean 11.5s cooldown, with
-                    # 29-49% of the wall clock spent blocked in
-                    # `RateGovernor.acquire`. An action whose cooldown is
-                    # cheaper than that pace does not happen any sooner for
-                    # being cheap; it still costs one request out of a fixed
-                    # hourly supply. Pricing it at its cooldown made a plan of
-                    # many cheap actions look better than a plan of few dear
-                    # ones, which is backwards whenever requests are what bind.
-                    #
-                    # A LOWER BOUND, NOT A FLAT RATE. `max` keeps every action
-                    # dearer than the floor at its own price, so a long move
-                    # still costs more than a short one and distance does not
-                    # become free. When the floor binds for both alternatives
-                    # the comparison degenerates to "fewer actions wins", which
-                    # is the correct objective in exactly that regime.
-                    #
-                    # APPLIED HERE, NOT INSIDE `Action.cost`, for two reasons
-                    # that are both load-bearing:
-                    #   * `Goal.heuristic` is NOT `h ≡ 0` — `goals/progression`
-                    #     and `goals/gathering` return `LevelSkill(...).cost(...)`
-                    #     — and `PlannerAdmissibility.Consistent` is a TIGHT
-                    #     equality there (`skillGrind_h_consistent`). Raising
-                    #     only the EDGE keeps `h s ≤ cost s s' + h s'` slacker
-                    #     on the safe side; raising only the HEURISTIC would
-                    #     break consistency and make closed-set pruning discard
-                    #     cheaper routes. Admissibility moves the same safe way:
-                    #     `trueRemaining` rises while `h` does not.
-                    #   * `formal/diff/test_action_cost_nonneg_diff.py` pins
-                    #     ~20 EXACT equalities on live `Action.cost(...)` against
-                    #     the Lean model, and `ActionCostNonneg` carries two
-                    #     UPPER bounds on Rest (`restCost_le_restCostMax`,
-                    #     `restCost_lt_consumableCostOverheal`) that keep the
-                    #     overheal sentinel dominant. A floor inside the pure
-                    #     cost cores would falsify all of them; a floor here
-                    #     leaves every published cost formula untouched.
-                    # Non-negativity — the seal on the optimality proof — is
-                    # preserved trivially: `max(x, y) ≥ x ≥ 0` for `y ≥ 0`.
-                    g = node.g_score + max(
-                        action.cost(node.state, game_data, history),
-                        self.action_floor_seconds,
-                    )
-                    # h = goal.heuristic(next_state, game_data): see h0 above.
-                    # `goal.value` remains used by goal *selection* (StrategyArbiter,
-                    # learning) — the planner's heuristic role is a distinct,
-                    # admissible+consistent estimate (default 0.0 = Dijkstra).
-                    h = goal.heuristic(next_state, game_data)
-                    heapq.heappush(
-                        heap,
-                        _Node(
-                            f_score=g + h,
-                            depth=node.depth + 1,
-                            state=next_state,
-                            plan=[*node.plan, action],
-                            g_score=g,
-                        ),
-                    )
-                    stats.nodes_created += 1
-
-        self.last_stats = stats
-        return []
+                next_state = action.apply(node.state, game_data)
+                # THE EDGE COST IS max(cooldown, one request slot).
+                #
+                # `action.cost(...)` prices an action at the SECONDS its
+                # cooldown takes. That is the true price only while the
+                # cooldown is what the bot waits on. On a `play --all` fleet
+                # it is not: rate limits are per-IP, every child holds a
+                # fifth of one budget, and the 2026-08-10 five-character run
+                # measured every child pinned at ~52 actions/hour — a mean
+                # 69s between actions against a mean 11.5s cooldown, with
+                # 29-49% of the wall clock spent blocked in
+                # `RateGovernor.acquire`. An action whose cooldown is
+                # cheaper than that pace does not happen any sooner for
+                # being cheap; it still costs one request out of a fixed
+                # hourly supply. Pricing it at its cooldown made a plan of
+                # many cheap actions look better than a plan of few dear
+                # ones, which is backwards whenever requests are what bind.
+                #
+                # A LOWER BOUND, NOT A FLAT RATE. `max` keeps every action
+                # dearer than the floor at its own price, so a long move
+                # still costs more than a short one and distance does not
+                # become free. When the floor binds for both alternatives
+                # the comparison degenerates to "fewer actions wins", which
+                # is the correct objective in exactly that regime.
+                #
+                # APPLIED HERE, NOT INSIDE `Action.cost`, for two reasons
+                # that are both load-bearing:
+                #   * `Goal.heuristic` is NOT `h ≡ 0` — `goals/progression`
+                #     and `goals/gathering` return `LevelSkill(...).cost(...)`
+                #     — and `PlannerAdmissibility.Consistent` is a TIGHT
+                #     equality there (`skillGrind_h_consistent`). Raising
+                #     only the EDGE keeps `h s ≤ cost s s' + h s'` slacker
+                #     on the safe side; raising only the HEURISTIC would
+                #     break consistency and make closed-set pruning discard
+                #     cheaper routes. Admissibility moves the same safe way:
+                #     `trueRemaining` rises while `h` does not.
+                #   * `formal/diff/test_action_cost_nonneg_diff.py` pins
+                #     ~20 EXACT equalities on live `Action.cost(...)` against
+                #     the Lean model, and `ActionCostNonneg` carries two
+                #     UPPER bounds on Rest (`restCost_le_restCostMax`,
+                #     `restCost_lt_consumableCostOverheal`) that keep the
+                #     overheal sentinel dominant. A floor inside the pure
+                #     cost cores would falsify all of them; a floor here
+                #     leaves every published cost formula untouched.
+                # Non-negativity — the seal on the optimality proof — is
+                # preserved trivially: `max(x, y) ≥ x ≥ 0` for `y ≥ 0`.
+                g = node.g_score + max(
+                    action.cost(node.state, game_data, history),
+                    self.action_floor_seconds,
+                )
+                # h = goal.heuristic(next_state, game_data): see h0 above.
+                # `goal.value` remains used by goal *selection* (StrategyArbiter,
+                # learning) — the planner's heuristic role is a distinct,
+                # admissible+consistent estimate (default 0.0 = Dijkstra).
+                h = goal.heuristic(next_state, game_data)
+                heapq.heappush(
+                    heap,
+                    _Node(
+                        f_score=g + h,
+                        depth=node.depth + 1,
+                        state=next_state,
+                        plan=[*node.plan, action],
+                        g_score=g,
+                        parent=node.state,
+                    ),
+                )
+                stats.nodes_created += 1
+
+        return None, state, stats
@@ -25,6 +25,7 @@ from artifactsmmo_api_client.models.achievement_type import AchievementType
 from artifactsmmo_api_client.models.error_response_schema import ErrorResponseSchema
 from artifactsmmo_api_client.types import Unset
 
+from artifactsmmo_cli.ai import memo_stats
 from artifactsmmo_cli.ai.action_kind import action_kind_of
 from artifactsmmo_cli.ai.actions.api_action_error import ApiActionError
 from artifactsmmo_cli.ai.actions.base import Action
@@ -33,7 +34,7 @@ from artifactsmmo_cli.ai.actions.combat import FightAction
 from artifactsmmo_cli.ai.actions.crafting import CraftAction
 from artifactsmmo_cli.ai.actions.deposit_all import DepositAllAction
 from artifactsmmo_cli.ai.actions.deposit_item import DepositItemAction
-from artifactsmmo_cli.ai.actions.factory import build_actions
+from artifactsmmo_cli.ai.actions.factory import ActionMenu
 from artifactsmmo_cli.ai.actions.gathering import GatherAction
 from artifactsmmo_cli.ai.actions.ge_cancel_order import GeCancelOrderAction
 from artifactsmmo_cli.ai.actions.level_skill import LevelSkill
@@ -58,13 +59,14 @@ from artifactsmmo_cli.ai.cycle_snapshot import (
     CycleSnapshot,
     GoalAttempt,
     GoalRankEntry,
+    MemoLayerStats,
     ObjectiveUnplannable,
     PlanTreeNode,
     RoleChange,
     RootScoreView,
 )
 from artifactsmmo_cli.ai.dual_role_currency import dual_role_holdings
-from artifactsmmo_cli.ai.equipment.loadout_cache import pick_loadout_cached
+from artifactsmmo_cli.ai.equipment.loadout_cache import pick_loadout_cached, save_loadouts
 from artifactsmmo_cli.ai.fight_record import FightRecord
 from artifactsmmo_cli.ai.game_data import GameData
 from artifactsmmo_cli.ai.gear_latch import GearLatch
@@ -117,6 +119,7 @@ from artifactsmmo_cli.ai.role_catalog import (
 from artifactsmmo_cli.ai.role_selection import decide_role, demand_by_role, serves_item
 from artifactsmmo_cli.ai.selection_context import NO_PROFILE_CONTEXT
 from artifactsmmo_cli.ai.should_replan import should_replan
+from artifactsmmo_cli.ai.slow_cycle_profiler import SlowCycleProfiler
 from artifactsmmo_cli.ai.strategy_driver import (
     StrategyArbiter,
     monster_drop_inputs,
@@ -133,9 +136,11 @@ from artifactsmmo_cli.ai.tiers import (
 from artifactsmmo_cli.ai.tiers.guards import SelectionContext
 from artifactsmmo_cli.ai.tiers.meta_goal import MetaGoal
 from artifactsmmo_cli.ai.tiers.progression_tree import has_structural_upgrade
+from artifactsmmo_cli.ai.tiers.skill_grind_target import save_grind_candidates
 from artifactsmmo_cli.ai.tracer import Tracer
 from artifactsmmo_cli.ai.winnable_cascade import CascadeInputs, winnable_farm_target_pure
 from artifactsmmo_cli.ai.world_state import TASKS_COIN_CODE, WorldState
+from artifactsmmo_cli.ai.world_state_codec import state_to_json
 from artifactsmmo_cli.client_manager import ClientManager
 from artifactsmmo_cli.rate_limited_error import RateLimitedError
 from artifactsmmo_cli.utils.rate_governor import RateGovernor
@@ -242,6 +247,9 @@ class GamePlayer:
         # (live 476 deadlock: the RestoreHP guard looped UseConsumable). Decays
         # per cycle alongside _suppressed_goals.
         self._failed_action_backoff: dict[str, int] = {}
+        # The factory's emission blocks, kept across cycles and rebuilt only
+        # where their inputs moved (see ActionMenu).
+        self._action_menu = ActionMenu()
         self._actions_since_full_refresh: int = 0
         # Consecutive no-cooldown action failures, driving the exponential
         # backoff that keeps a persistent error (e.g. a stuck Withdraw→478) from
@@ -312,6 +320,12 @@ class GamePlayer:
         self._last_path_plan: PathPlan | None = None
         self._cycle_observer = cycle_observer
         self._planning_observer: Callable[[bool], None] | None = None
+        # `play --profile-slow-cycles`; None (the default) profiles nothing.
+        self._slow_profiler: SlowCycleProfiler | None = None
+        # Every how many cycles `_record_learning_cycle` stores the pre-decision
+        # `WorldState` for the offline decision replay; 0 stores none. See
+        # `set_state_recording`.
+        self._record_states_every = 0
         # Event-driven gear prioritization: the latch (set on level-up or a
         # predicted-winnable fight loss, cleared when gear is level-appropriate)
         # is updated once per cycle BEFORE selection and read into the
@@ -456,6 +470,18 @@ class GamePlayer:
     def set_planning_observer(self, observer: "Callable[[bool], None] | None") -> None:
         self._planning_observer = observer
 
+    def set_slow_cycle_profiler(self, profiler: "SlowCycleProfiler | None") -> None:
+        """Sample the decide band of cycles slower than the profiler's
+        threshold; its summary rides the trace record as `profile`."""
+        self._slow_profiler = profiler
+
+    def set_state_recording(self, every: int) -> None:
+        """Store the pre-decision state in `Cycle.state_json` on every
+        `every`-th cycle (0: never, the default). A state with its bank is
+        kilobytes, written on every cycle of every character, and only the
+        offline decision replay reads it, so a run opts in and picks the rate."""
+        self._record_states_every = every
+
     def set_rate_governors(
         self, data: RateGovernor, action: RateGovernor, account: RateGovernor
     ) -> None:
@@ -789,8 +815,10 @@ class GamePlayer:
             cache, self._last_outcome, self._gear_latch.active,
             goal_satisfied, step_applicable, BANK_REFRESH_INTERVAL,
         ):
-            selected_goal, plan, goals_tried = self._decide_band(
-                state, game_data, actions, ctx_combat_monster)
+            with (self._slow_profiler.watch(self._cycle_counter) if self._slow_profiler is not None
+                  else nullcontext()):
+                selected_goal, plan, goals_tried = self._decide_band(
+                    state, game_data, actions, ctx_combat_monster)
             if plan and selected_goal is not None:
                 self._plan_cache = PlanCache(
                     selected_goal=selected_goal,
@@ -803,8 +831,12 @@ class GamePlayer:
                 if self.history is not None:
                     plan_reprs = [repr(a) for a in plan]
                     goal_json = json.dumps(goal_to_dict(selected_goal) or {})
+                    # Plan bodies are learning data, keyed like every other
+                    # learned stat; the commitment below restores a plan by
+                    # matching rebuilt actions, so it keeps the display repr.
+                    plan_keys: list[str] = [a.action_key() for a in plan]
                     self.history.record_plan_body(
-                        repr(selected_goal), plan_reprs[0], plan_reprs)
+                        repr(selected_goal), plan_keys[0], plan_keys)
                     self.history.save_plan_commitment(
                         repr(selected_goal), goal_json, plan_reprs, 0,
                         self._last_decide_crafting_target, self._gear_latch.active)
@@ -1177,10 +1209,14 @@ class GamePlayer:
                         "objective_unplannable": (
                             self._arbiter.objective_unplannable if replanned else None),
                         "goal_rank": goal_rank_trace,
+                        # The memo layers' counts since the last drain: this
+                        # cycle's, plus any cycle that ended before emitting.
+                        "memo": memo_stats.drain(),
                         **self._path_trace_snapshot(),
                     }
                     self._emit_trace(
                         action_name="<no_plan>",
+                        action_key="<no_plan>",
                         goal_name="<none>",
                         outcome="no_plan",
                         planner_stats=no_plan_stats,
@@ -1220,6 +1256,11 @@ class GamePlayer:
                 action = plan[0]
                 self._log_action(action, selected_goal, plan)
 
+                # Persist the grind candidates and loadouts this cycle's search
+                # solved, so a restart starts warm. No-ops when nothing is new.
+                save_grind_candidates(game_data)
+                save_loadouts(game_data)
+
                 # Sleep out whatever the search did not already spend of the
                 # cooldown. This used to run before planning, which made every
                 # replan cycle cost `cooldown + search` and left the cooldown
@@ -1280,7 +1321,7 @@ class GamePlayer:
                 self._record_learning_cycle(
                     prev_state=prev_state_for_learning,
                     new_state=new_state,
-                    action_repr=action.learning_key(),
+                    action_repr=action.action_key(),
                     action_class=type(action).__name__,
                     outcome=outcome,
                     selected_goal=repr(selected_goal),
@@ -1354,10 +1395,12 @@ class GamePlayer:
                     "objective_unplannable": (
                         self._arbiter.objective_unplannable if replanned else None),
                     "goal_rank": goal_rank_trace,
+                    "memo": memo_stats.drain(),
                     **self._path_trace_snapshot(),
                 }
                 self._emit_trace(
                     action_name=repr(action),
+                    action_key=action.action_key(),
                     goal_name=repr(selected_goal),
                     outcome=outcome,
                     planner_stats=cycle_stats,
@@ -1596,6 +1639,12 @@ class GamePlayer:
             # racing us to it (`cancel_selection.cancel_targets`).
             if isinstance(action, GeCancelOrderAction):
                 self._claim_ge_order(action)
+            # Same seam for the walking-distance table: every folded move
+            # learns the server's path length (`Action.distances`), whoever
+            # emitted the action. Only a destination-ranking action changes
+            # behaviour with it, and the factory already built those with it.
+            if action.distances is None and self.game_data is not None:
+                action.distances = self.game_data.tile_distances
             self._acquire_action()
             new_state = action.execute(self.state, client)
             # Re-sync bank state after visiting bank
@@ -2147,7 +2196,7 @@ class GamePlayer:
         Takes the action itself, not a pre-formatted pair of strings, so the two
         identities can never drift apart at a call site: `action_name` is always
         the repr (display/trace) and `action_key` always
-        `Action.learning_key()` (the stable, quantity-free identity the stuck
+        `Action.action_key()` (the stable, quantity-free identity the stuck
         rules count on — see `CycleRecord.action_key`). `action is None` means
         the cycle produced no plan, and both fields carry the `<no_plan>`
         sentinel the stuck rules exclude.
@@ -2156,7 +2205,7 @@ class GamePlayer:
             state_key=_state_key(self.state) if self.state else (),
             goal_name=goal_name,
             action_name=repr(action) if action is not None else "<no_plan>",
-            action_key=action.learning_key() if action is not None else "<no_plan>",
+            action_key=action.action_key() if action is not None else "<no_plan>",
             planned_depth=planned_depth,
             planner_timed_out=planner_timed_out,
             succeeded=succeeded,
@@ -2216,8 +2265,11 @@ class GamePlayer:
     def _emit_trace(self, action_name: str, goal_name: str, outcome: str,
                     planner_stats: dict[str, object],
                     recovery: dict[str, object] | None = None,
-                    fight: FightRecord | None = None) -> None:
-        """Emit one per-cycle record to the tracer."""
+                    fight: FightRecord | None = None,
+                    action_key: str | None = None) -> None:
+        """Emit one per-cycle record to the tracer. `action_name` is the
+        display repr; `action_key` the interned `Action.action_key()` the
+        cycle's learned stats are recorded under."""
         if self.state is None:
             return
         cooldown_remaining = 0.0
@@ -2254,6 +2306,7 @@ class GamePlayer:
             "selected_goal": goal_name,
             "planner": planner_stats,
             "action": action_name,
+            "action_key": action_key,
             "outcome": outcome,
             "recovery": recovery,
             "suppressed_goals": list(self._suppressed_goals.keys()),
@@ -2341,6 +2394,10 @@ class GamePlayer:
                 band_adequate=self._tree_band_adequate(),
                 ctx=self._last_ctx)
             record["strategy"] = decision.to_trace()
+        profile = self._slow_profiler.take() if self._slow_profiler is not None else None
+        if profile is not None:
+            # Only on a cycle whose decide ran past `--profile-slow-cycles`.
+            record["profile"] = profile
         self.tracer.write_cycle(record)
         self._cycle_counter += 1
 
@@ -2461,7 +2518,7 @@ class GamePlayer:
             # goal_name(s) whose records emitted them. Drop "<none>" (the no-plan
             # placeholder, not a suppressible goal).
             #
-            # Keyed on `action_key` (the quantity-free `Action.learning_key()`),
+            # Keyed on `action_key` (the quantity-free `Action.action_key()`),
             # matching the detector rule that fired this signal. Keyed on the
             # repr, a closure gather re-sized each cycle tallies under a fresh
             # bucket per batch size and never reaches the threshold — the tally
@@ -2522,7 +2579,7 @@ class GamePlayer:
         decision exists, so it cannot ask the authority a complete question.
         """
         assert self.game_data is not None
-        built = build_actions(
+        built = self._action_menu.build(
             game_data=self.game_data,
             state=self.state,
             objective=self._objective,
@@ -2533,13 +2590,13 @@ class GamePlayer:
         # so a repeatedly-failing action (even guard-driven) is dropped from the
         # plan while its short backoff lasts.
         #
-        # Matched on `learning_key()` — the SAME identity the block was recorded
+        # Matched on `action_key()` — the SAME identity the block was recorded
         # under. On the repr the two halves can never meet for a gather: the
         # block is recorded from a goal-SIZED gather (`Gather(x×47)`) while the
         # factory here always builds the unsized one (`Gather(x×1)`), so the
         # filter would silently match nothing. See `CycleRecord.action_key`.
         if self._failed_action_backoff:
-            return [a for a in built if a.learning_key() not in self._failed_action_backoff]
+            return [a for a in built if a.action_key() not in self._failed_action_backoff]
         return built
 
     def _notify_observer(
@@ -2577,6 +2634,12 @@ class GamePlayer:
             )
             if isinstance(raw_abandoned, dict) else None
         )
+        raw_memo = stats.get("memo")
+        memo_layers = [
+            MemoLayerStats(layer=name, hits=int(m["hits"]), misses=int(m["misses"]),
+                           size=int(m["size"]), saved_ms=float(m["saved_ms"]))
+            for name, m in (raw_memo.items() if isinstance(raw_memo, dict) else ())
+        ]
         plan = self._last_path_plan
         # Cooldown remaining at snapshot time (post-action; the server-set
         # cooldown the bot will wait through before the next cycle).
@@ -2634,6 +2697,7 @@ class GamePlayer:
             plan_len=int(stats.get("plan_len", 0)),
             goals_tried=goals_tried,
             objective_unplannable=objective_unplannable,
+            memo=memo_layers,
             suppressed_goals=list(self._suppressed_goals.keys()),
             path_blocked=bool(stats.get("path_blocked", False)),
             chosen_root=(repr(self._last_decision.chosen_root)
@@ -3281,6 +3345,10 @@ class GamePlayer:
             self._asymmetric_demand = frozenset()
             self._sibling_skills = {}
             return
+        # Doomed verdicts go on the same board, keyed by the catalog they were
+        # searched against (`DoomedMemo.share`). Idempotent; re-attached each
+        # cycle because the game data can be rebuilt under a new catalog.
+        self._arbiter._memo.share(self._coordination, game_data._catalog_digest)
         role_before = self._role
         now = datetime.now(tz=timezone.utc)
         # Snapshot of what this character wears + carries in dual-role codes
@@ -3918,10 +3986,12 @@ class GamePlayer:
             if gained is not None and gained != 0:
                 skill_deltas[skill_name] = gained
         consumables = self._compute_consumables_expended(prev_state, new_state)
+        cycle_index = getattr(self, "_cycle_counter", 0)
+        every = self._record_states_every
         cycle = Cycle(
             ts=datetime.now(tz=timezone.utc).isoformat(),
             session_id="placeholder",
-            cycle_index=getattr(self, "_cycle_counter", 0),
+            cycle_index=cycle_index,
             character=self.character,
             x=new_state.x, y=new_state.y,
             hp=new_state.hp, max_hp=new_state.max_hp,
@@ -3959,6 +4029,10 @@ class GamePlayer:
             skill_levels_json=json.dumps(prev_state.skills, ensure_ascii=False,
                                          sort_keys=True),
             consumables_expended_json=json.dumps(consumables, ensure_ascii=False, sort_keys=True),
+            # PRE-action again: the state the arbiter selected against, which is
+            # what the offline decision replay re-drives. Sampled, and off
+            # unless the run asked for it (`set_state_recording`).
+            state_json=state_to_json(prev_state) if every and cycle_index % every == 0 else None,
             cycles_to_satisfy=cycles_to_satisfy,
         )
         self.history.record_cycle(cycle)
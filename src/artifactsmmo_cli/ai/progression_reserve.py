@@ -7,6 +7,7 @@ Craftable-now / unsellable items contribute nothing (no gold needed).
 """
 from artifactsmmo_cli.ai.actions.equip import ITEM_TYPE_TO_SLOTS
 from artifactsmmo_cli.ai.game_data import GameData
+from artifactsmmo_cli.ai.memo_stats import memo_counter
 from artifactsmmo_cli.ai.progression_reserve_core import (
     effective_floor,
     effective_floor_multi,
@@ -17,6 +18,7 @@ from artifactsmmo_cli.ai.world_state import WorldState
 
 _HORIZON = 2  # reserve for upgrades usable within the next 2 character levels
 _MIN_SAFETY_FLOOR = 100  # never spend to zero even when nothing is reserved
+_STATS = memo_counter("reserved_targets_memo")  # one memo per GameData snapshot: no size
 
 
 def buy_price(code: str, game_data: GameData) -> int | None:
@@ -166,7 +168,9 @@ def reserved_targets(state: WorldState, game_data: GameData) -> dict[str, int]:
     key = _reserve_key(state)
     hit = memo.get(key)
     if hit is not None:
+        _STATS.hit()
         return hit
+    started = _STATS.start()
     # ENDS first: `gear_targets` is already code -> buy price, and a boss target
     # is the same kind of thing. MEANS are consulted only when there is no end
     # left to save for.
@@ -177,6 +181,7 @@ def reserved_targets(state: WorldState, game_data: GameData) -> dict[str, int]:
         targets = {code: wanted[code]}
     else:
         targets = {}
+    _STATS.miss(started)
     memo[key] = targets
     return targets
 
@@ -73,7 +73,7 @@ class CycleRecord:
     goal_name: str
     action_name: str          # "<no_plan>" when planning failed
     action_key: str
-    """Stable, quantity-FREE identity of the action — `Action.learning_key()`
+    """Stable, quantity-FREE identity of the action — `Action.action_key()`
     (`"<no_plan>"` when planning failed). Every rule that COUNTS repeats must
     key on this, never on `action_name`: a closure gather is re-sized to the
     outstanding deficit each cycle, so its `repr` is `Gather(x×60)`, then
@@ -0,0 +1,151 @@
+"""The regression tier: a backward search from an acquisition goal's needs to
+the holdings the character already has, read out as the (item, quantity) legs
+`GOAPPlanner.plan(subgoals=...)` refines forward.
+
+THE GAP. `acquisition_subgoals` prices routes with `acquisition_options`, which
+serves only routes the executor can run now, so a chain whose craft is
+skill-gated has no decomposition and falls to the flat A*. That search finds
+the whole chain forward, one action at a time, over every applicable action:
+on the fixture bundle, `GatherMaterials(iron_sword)` at l12 (weaponcrafting 5,
+the sword needs 10) timed out at 10s after 4,134 expansions, as did
+`iron_helm`, `iron_boots` and `iron_ring`. Backward, the branching at each step
+is the handful of actions that PRODUCE the item still missing.
+
+THE SEARCH. A node is a requirement: how much of each item the world must hold
+(bag plus bank, as `GatherMaterialsGoal.is_satisfied` counts). The root is the
+goal's targets, and a node whose every requirement the character's holdings
+already cover closes the search. The first missing item in code order is
+regressed through each action of the search that adds it:
+
+  * a craft: ceil(shortfall / yield) runs; the item's requirement drops by
+    what they make and each recipe input's rises by what they consume. A
+    craft above the character's skill is usable only when the search also
+    holds a `LevelSkill` reaching it, whose cost the route pays once.
+  * a leaf — any other producer that needs no item for it (a gather, a drop
+    fight, a gold purchase): the whole shortfall. How many applications that
+    takes is for the leg's own search to find out.
+
+Producers are read through `relaxed_reachability.relax`, the same reading the
+planner's pre-search gate trusts. A recycle or a currency purchase is not a
+route here; a leg's search may still use one. The search is uniform-cost over
+each route's `cost` at the root — an estimate, not a plan cost: it only picks
+the routes, and is never offered as a bound.
+
+THE MEETING POINT is the root. The backward search ends at a requirement the
+current holdings cover; each leg is then refined forward from the state the
+previous leg reached, and the glue a backward step cannot see — the walk,
+the rest, the deposit, the withdraw from the bank, the skill grind itself — is
+what those short forward searches find. Nothing here is trusted: a leg that
+does not refine abandons the decomposition for the flat search, as with
+`acquisition_subgoals`.
+"""
+
+import heapq
+from collections.abc import Mapping
+
+from artifactsmmo_cli.ai.acquisition_subgoals import MIN_LEGS, acquisition_targets
+from artifactsmmo_cli.ai.actions.base import Action
+from artifactsmmo_cli.ai.actions.crafting import CraftAction
+from artifactsmmo_cli.ai.actions.level_skill import LevelSkill
+from artifactsmmo_cli.ai.game_data import GameData
+from artifactsmmo_cli.ai.goals.base import Goal
+from artifactsmmo_cli.ai.goals.gathering import GatherMaterialsGoal
+from artifactsmmo_cli.ai.learning.store import LearningStore
+from artifactsmmo_cli.ai.relaxed_reachability import INERT, relax
+from artifactsmmo_cli.ai.world_state import WorldState
+
+_NODE_CAP = 2_000
+"""Requirements popped before the search gives up. The chains the fixture
+bundle decomposes close in tens."""
+
+_Requirement = tuple[tuple[str, int], ...]
+"""(item, quantity) pairs in code order, zero quantities dropped."""
+
+
+def regression_subgoals(goal: Goal, state: WorldState, game_data: GameData, actions: list[Action],
+                        history: LearningStore | None = None) -> list[GatherMaterialsGoal]:
+    """The legs of `goal`'s acquisition chain in plan order, regressed over the
+    actions the planner would search for it; [] when it has no chain, no route
+    covers it within `_NODE_CAP` requirements, or the chain is shorter than
+    `MIN_LEGS`."""
+    targets = acquisition_targets(goal, state, game_data)
+    if not targets:
+        return []
+    relevant = goal.relevant_actions(actions, state, game_data)
+    producers: dict[str, list[tuple[Action, tuple[str, int] | None]]] = {}
+    grinds: list[LevelSkill] = []
+    for action in relevant:
+        relaxed = relax(action, state, game_data)
+        if relaxed is None or relaxed is INERT:
+            continue
+        if isinstance(action, LevelSkill):
+            grinds.append(action)
+        if relaxed.needs_items and not isinstance(action, CraftAction):
+            continue
+        for item in relaxed.adds_items:
+            producers.setdefault(item, []).append((action, relaxed.needs_skill))
+
+    costs: dict[int, float] = {}
+
+    def price(action: Action) -> float:
+        if id(action) not in costs:
+            costs[id(action)] = action.cost(state, game_data, history)
+        return costs[id(action)]
+
+    def grind(skill: str, level: int) -> float | None:
+        """The cheapest grind to `level`; 0 when already there, None when no
+        `LevelSkill` of the search reaches it."""
+        if state.skills.get(skill, 1) >= level:
+            return 0.0
+        reaching = [price(action) for action in grinds if action.skill == skill and action.target_level >= level]
+        return min(reaching, default=None)
+
+    held = dict(state.inventory)
+    for item, qty in (state.bank_items or {}).items():
+        held[item] = held.get(item, 0) + qty
+    counter = 0
+    heap: list[tuple[float, int, _Requirement, frozenset[str], tuple[tuple[str, int], ...]]] = [
+        (0.0, counter, tuple(sorted(targets.items())), frozenset(), ())]
+    closed: set[tuple[_Requirement, frozenset[str]]] = set()
+    while heap and len(closed) < _NODE_CAP:
+        g, _, need, ground, legs = heapq.heappop(heap)
+        if (need, ground) in closed:
+            continue
+        closed.add((need, ground))
+        missing = [(item, qty) for item, qty in need if qty > held.get(item, 0)]
+        if not missing:
+            if len(legs) < MIN_LEGS:
+                return []
+            exclude = goal.exclude_recycle if isinstance(goal, GatherMaterialsGoal) else frozenset()
+            return [GatherMaterialsGoal(item, {item: qty}, exclude_recycle=exclude) for item, qty in reversed(legs)]
+        if len(legs) >= goal.max_depth:
+            continue
+        item, qty = missing[0]
+        for action, gate in producers.get(item, ()):
+            cost, skills = price(action), ground
+            if gate is not None:
+                skill, level = gate
+                grind_cost = grind(skill, level)
+                if grind_cost is None:
+                    continue
+                if grind_cost and skill not in ground:
+                    cost, skills = cost + grind_cost, ground | {skill}
+            after = dict(need)
+            if isinstance(action, CraftAction):
+                _regress_craft(after, item, qty - held.get(item, 0), game_data)
+            else:
+                del after[item]
+            counter += 1
+            heapq.heappush(heap, (g + cost, counter, tuple(sorted((code, n) for code, n in after.items() if n > 0)),
+                                  skills, (*legs, (item, qty))))
+    return []
+
+
+def _regress_craft(need: dict[str, int], item: str, shortfall: int, game_data: GameData) -> None:
+    """`need` as it stands before the crafts that make `shortfall` of `item`."""
+    made = game_data.craft_yield(item)
+    runs = -(-shortfall // made)
+    need[item] -= runs * made
+    recipe: Mapping[str, int] = game_data.crafting_recipe(item) or {}
+    for material, per_run in recipe.items():
+        need[material] = need.get(material, 0) + per_run * runs
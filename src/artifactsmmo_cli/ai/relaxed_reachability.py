@@ -0,0 +1,246 @@
+"""Delete-relaxation reachability: a lower bound on the length of any plan for
+a goal, computed over the exact action set the planner would search.
+
+THE WASTE. `Goal.is_plannable` defaults to True and only a few goals override
+it, so a goal no plan can satisfy is discovered by letting the A* exhaust its
+whole budget, and `DoomedMemo` re-probes it every 20-160 cycles at that price.
+A typical shape: `GatherMaterials(feather)` for a character who cannot beat a
+chicken — `relevant_actions` holds no fight that drops a feather, so no plan
+exists at any depth, and the search proves it the slow way.
+
+THE RELAXATION. Facts are monotone: an item HELD (bag, bank or worn), an item
+WORN in a slot, a skill at a level. Every action is read as (preconditions,
+added facts) and its deletes are ignored, so once a fact is reachable it stays
+reachable. Layer 0 is the root's facts; layer k+1 adds everything an action
+whose preconditions hold at layer k can add. The first layer holding one of
+the goal's fact sets is `h_max` in actions: every action of a real plan can
+lift a fact at most one layer, so a real plan is at least that long, and a goal
+no layer reaches has no plan at all.
+
+SOUND BY CONSTRUCTION, NOT BY AGREEMENT. The bound is only as good as the
+per-class reading in `relax`: each one must ADD at least every item, slot or
+skill its `apply` can add, and REQUIRE at most what its `is_applicable` checks.
+Quantities, gold, position, HP and free slots are all ignored (over-
+approximating). An action class `relax` does not know, or a goal this module
+does not model, makes the answer 0 — "no bound" — so a new action can never
+be pruned away by a reading nobody wrote.
+
+The layers count actions, not seconds, so they are not offered as an A*
+heuristic: the edge costs they would have to under-run are learned and
+floored per environment (`GOAPPlanner.action_floor_seconds`).
+"""
+
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+
+from artifactsmmo_cli.ai.actions.accept_task import AcceptTaskAction
+from artifactsmmo_cli.ai.actions.bank_expansion import BuyBankExpansionAction
+from artifactsmmo_cli.ai.actions.base import Action
+from artifactsmmo_cli.ai.actions.claim import ClaimPendingItemAction
+from artifactsmmo_cli.ai.actions.combat import FightAction
+from artifactsmmo_cli.ai.actions.complete_task import CompleteTaskAction
+from artifactsmmo_cli.ai.actions.consumable import UseConsumableAction
+from artifactsmmo_cli.ai.actions.crafting import CraftAction
+from artifactsmmo_cli.ai.actions.delete import DeleteItemAction
+from artifactsmmo_cli.ai.actions.deposit_all import DepositAllAction
+from artifactsmmo_cli.ai.actions.deposit_gold import DepositGoldAction
+from artifactsmmo_cli.ai.actions.deposit_item import DepositItemAction
+from artifactsmmo_cli.ai.actions.equip import EquipAction
+from artifactsmmo_cli.ai.actions.gathering import GatherAction
+from artifactsmmo_cli.ai.actions.ge_cancel_order import GeCancelOrderAction
+from artifactsmmo_cli.ai.actions.ge_fill import GeFillBuyOrderAction
+from artifactsmmo_cli.ai.actions.ge_fill_sell import GeFillSellOrderAction
+from artifactsmmo_cli.ai.actions.ge_post_buy import GePostBuyOrderAction
+from artifactsmmo_cli.ai.actions.ge_post_sell import GePostSellOrderAction
+from artifactsmmo_cli.ai.actions.level_skill import LevelSkill
+from artifactsmmo_cli.ai.actions.movement import MoveAction
+from artifactsmmo_cli.ai.actions.movement_semantic import MoveTo
+from artifactsmmo_cli.ai.actions.npc import NpcBuyAction
+from artifactsmmo_cli.ai.actions.npc_sell import NpcSellAction
+from artifactsmmo_cli.ai.actions.optimize_loadout import OptimizeLoadoutAction
+from artifactsmmo_cli.ai.actions.recycle import RecycleAction
+from artifactsmmo_cli.ai.actions.rest import RestAction
+from artifactsmmo_cli.ai.actions.task_cancel import TaskCancelAction
+from artifactsmmo_cli.ai.actions.task_exchange import TaskExchangeAction
+from artifactsmmo_cli.ai.actions.task_trade import TaskTradeAction
+from artifactsmmo_cli.ai.actions.teleport import TeleportAction
+from artifactsmmo_cli.ai.actions.transition import MapTransitionAction
+from artifactsmmo_cli.ai.actions.unequip import UnequipAction
+from artifactsmmo_cli.ai.actions.use_gold_bag import UseGoldBagAction
+from artifactsmmo_cli.ai.actions.wait import WaitAction
+from artifactsmmo_cli.ai.actions.withdraw_gold import WithdrawGoldAction
+from artifactsmmo_cli.ai.actions.withdraw_item import WithdrawItemAction
+from artifactsmmo_cli.ai.game_data import GameData
+from artifactsmmo_cli.ai.goals.base import Goal
+from artifactsmmo_cli.ai.goals.gathering import GatherMaterialsGoal
+from artifactsmmo_cli.ai.goals.progression import UpgradeEquipmentGoal
+from artifactsmmo_cli.ai.world_state import TASKS_COIN_CODE, WorldState
+
+NO_BOUND = 0.0
+"""What an unmodelled goal or action set gets: every plan is at least 0 long."""
+
+UNREACHABLE = float("inf")
+"""The bound for a goal no layer reaches: no plan exists at any depth."""
+
+_NO_EFFECT: tuple[type[Action], ...] = (
+    # Every item these move is one already held: the bank counts as held, so
+    # a withdraw, a deposit or an unequip adds no fact. The rest add nothing
+    # but gold, position, HP or task state.
+    AcceptTaskAction, BuyBankExpansionAction, DeleteItemAction, DepositAllAction,
+    DepositGoldAction, DepositItemAction, GeFillBuyOrderAction, GePostBuyOrderAction,
+    GePostSellOrderAction, MapTransitionAction, MoveAction, MoveTo, NpcSellAction,
+    RestAction, TaskCancelAction, TaskExchangeAction, TaskTradeAction, TeleportAction,
+    UnequipAction, UseConsumableAction, UseGoldBagAction, WaitAction, WithdrawGoldAction,
+    WithdrawItemAction,
+)
+
+
+@dataclass(frozen=True)
+class Relaxed:
+    """One action with its deletes dropped."""
+
+    needs_items: frozenset[str] = frozenset()
+    needs_skill: tuple[str, int] | None = None
+    adds_items: frozenset[str] = frozenset()
+    adds_worn: frozenset[tuple[str, str]] = frozenset()
+    adds_skill: tuple[str, int] | None = None
+    wears_anything: bool = False
+    """`OptimizeLoadout`: may put any held piece in any slot."""
+
+
+INERT = Relaxed()
+"""The reading of an action that can never apply (`relax`): skipped, not unknown."""
+
+
+def relax(action: Action, state: WorldState, game_data: GameData) -> Relaxed | None:
+    """`action` read as (preconditions, additions); `INERT` for an action that
+    can never apply, None for a class this module has no reading of."""
+    if isinstance(action, GatherAction):
+        if not action.locations:
+            return INERT
+        return Relaxed(needs_skill=game_data.resource_skill_level(action.resource_code),
+                        adds_items=frozenset({action.drop_item(game_data)}))
+    if isinstance(action, CraftAction):
+        stats = game_data.item_stats(action.code)
+        recipe = game_data.crafting_recipe(action.code)
+        if action.workshop_location is None or stats is None or stats.crafting_skill is None or recipe is None:
+            return INERT
+        return Relaxed(needs_items=frozenset(recipe), needs_skill=(stats.crafting_skill, stats.crafting_level),
+                        adds_items=frozenset({action.code}))
+    if isinstance(action, RecycleAction):
+        return Relaxed(needs_items=frozenset({action.code}),
+                        adds_items=frozenset(game_data.crafting_recipe(action.code) or {}))
+    if isinstance(action, FightAction):
+        return Relaxed(adds_items=frozenset(drop for drop, _rate, _mn, _mx
+                                             in game_data.monster_drops(action.monster_code)))
+    if isinstance(action, NpcBuyAction):
+        currency = game_data.npc_purchase_currency(action.npc_code, action.item_code) or "gold"
+        return Relaxed(needs_items=frozenset() if currency == "gold" else frozenset({currency}),
+                        adds_items=frozenset({action.item_code}))
+    if isinstance(action, GeFillSellOrderAction):
+        return Relaxed(adds_items=frozenset({action.item_code}))
+    if isinstance(action, EquipAction):
+        return Relaxed(needs_items=frozenset({action.code}), adds_worn=frozenset({(action.slot, action.code)}))
+    if isinstance(action, OptimizeLoadoutAction):
+        return Relaxed(wears_anything=True)
+    if isinstance(action, LevelSkill):
+        return Relaxed(adds_skill=(action.skill, action.target_level))
+    if isinstance(action, ClaimPendingItemAction):
+        # Nothing in the search mints a pending item; the root's are all.
+        return Relaxed(adds_items=frozenset(code for _id, code in state.pending_items or ()))
+    if isinstance(action, GeCancelOrderAction):
+        return Relaxed(adds_items=frozenset(order.code for order in state.open_orders))
+    if isinstance(action, CompleteTaskAction):
+        return Relaxed(adds_items=frozenset({TASKS_COIN_CODE}))
+    if isinstance(action, _NO_EFFECT):
+        return INERT
+    return None
+
+
+def relaxed_targets(goal: Goal, state: WorldState) -> list[tuple[frozenset[str], frozenset[tuple[str, str]]]] | None:
+    """The goal's satisfaction as alternative (held items, worn pieces) fact
+    sets — any one of them reached satisfies it — or None for a goal this
+    module does not model. Each set must be implied by `goal.is_satisfied`."""
+    if isinstance(goal, GatherMaterialsGoal):
+        needed = frozenset(item for item, qty in goal.needed.items() if qty > 0)
+        alternatives = [(needed, frozenset[tuple[str, str]]())]
+        if goal._target_item not in goal.needed:
+            # A finished target already held satisfies the goal on its own.
+            alternatives.append((frozenset({goal._target_item}), frozenset()))
+        return alternatives
+    if isinstance(goal, UpgradeEquipmentGoal) and goal._committed_target is not None:
+        # Uncommitted, ANY changed slot satisfies it: no fact set says which.
+        item, slot = goal._committed_target
+        return [(frozenset(), frozenset({(slot, item)}))]
+    return None
+
+
+def _held(state: WorldState) -> Iterable[str]:
+    yield from state.inventory
+    yield from state.bank_items or {}
+    yield from (code for code in state.equipment.values() if code is not None)
+
+
+def _read(actions: list[Action], state: WorldState, game_data: GameData) -> list[Relaxed] | None:
+    """Every action's reading, the inert ones dropped; None when any action is
+    outside the model."""
+    pending: list[Relaxed] = []
+    for action in actions:
+        relaxed = relax(action, state, game_data)
+        if relaxed is None:
+            return None
+        if relaxed is not INERT:
+            pending.append(relaxed)
+    return pending
+
+
+def _layers(pending: list[Relaxed], state: WorldState) -> Iterator[tuple[set[str], set[tuple[str, str]], bool]]:
+    """(held, worn, wears_anything) at layer 0, 1, ... up to the fixed point."""
+    held = set(_held(state))
+    worn = {(slot, code) for slot, code in state.equipment.items() if code is not None}
+    skills = dict(state.skills)
+    wears_anything = False
+    while True:
+        yield held, worn, wears_anything
+        fired = [relaxed for relaxed in pending
+                 if relaxed.needs_items <= held
+                 and (relaxed.needs_skill is None
+                      or skills.get(relaxed.needs_skill[0], 1) >= relaxed.needs_skill[1])]
+        if not fired:
+            return
+        fired_ids = {id(relaxed) for relaxed in fired}
+        pending = [relaxed for relaxed in pending if id(relaxed) not in fired_ids]
+        for relaxed in fired:
+            held |= relaxed.adds_items
+            worn |= relaxed.adds_worn
+            wears_anything = wears_anything or relaxed.wears_anything
+            if relaxed.adds_skill is not None:
+                skill, level = relaxed.adds_skill
+                skills[skill] = max(skills.get(skill, 1), level)
+
+
+def relaxed_plan_length(goal: Goal, state: WorldState, game_data: GameData, actions: list[Action]) -> float:
+    """A lower bound on the length of any plan over `actions` that satisfies
+    `goal` from `state`: `UNREACHABLE` when none exists, `NO_BOUND` when the
+    goal or an action is outside the model."""
+    targets = relaxed_targets(goal, state)
+    if targets is None:
+        return NO_BOUND
+    pending = _read(actions, state, game_data)
+    if pending is None:
+        return NO_BOUND
+    for layer, (held, worn, wears_anything) in enumerate(_layers(pending, state)):
+        for items, pieces in targets:
+            if items <= held and all(piece in worn or (wears_anything and piece[1] in held) for piece in pieces):
+                return float(layer)
+    return UNREACHABLE
+
+
+def relaxed_reachable_items(state: WorldState, game_data: GameData, actions: list[Action]) -> frozenset[str] | None:
+    """Every item some plan over `actions` from `state` could ever hold — a
+    superset, deletes ignored — or None when an action is outside the model."""
+    pending = _read(actions, state, game_data)
+    if pending is None:
+        return None
+    *_, (held, _worn, _wears_anything) = _layers(pending, state)
+    return frozenset(held)
@@ -0,0 +1,156 @@
+"""The requirement graph compiled to integer indices and closure bitsets.
+
+`requirement_closure` used to answer every query with a fresh stack walk over
+`frozenset`/`set` membership, and the progression tree, the objective-needs
+projection and the synergy multiset each ask it for dozens of roots per
+decide; the audits sweep every recipe. The graph is static per GameData, so
+its transitive closure can be computed ONCE and every later query becomes a
+few big-int ORs and ANDs.
+
+Layout. Every item the graph knows gets an index in topological order —
+ingredients before the items that consume them — and `closure_bits[i]` is the
+bitset of everything item `i` transitively requires, itself included. Recipe
+cycles (the bundle has none today, but `requirement_closure` has always been
+cycle-safe) are handled by compiling strongly connected components: every
+member of a cycle shares one closure, exactly the set the old walk reached.
+
+Holds no game logic and no quantities: demand arithmetic stays on the
+extracted `_closure_demand`, whose Lean proof a re-implementation here would
+leave behind.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+
+DECODE_MEMO_MAX = 4096
+"""Decoded closures kept per compiled graph. Single-root closures number at
+most one per item; the cap only bites on a stream of distinct multi-root
+unions, which are cheap to decode again."""
+
+@dataclass(frozen=True)
+class CompiledRequirementGraph:
+    """Integer-indexed closure of a `RequirementGraph`. Read-only."""
+
+    #: index -> item code, ingredients before consumers.
+    codes: tuple[str, ...]
+    #: item code -> index.
+    index: Mapping[str, int]
+    #: index -> bitset of the item's transitive requirements, itself included.
+    closure_bits: tuple[int, ...]
+    #: items with a recipe.
+    craftable_mask: int
+    _decoded: dict[int, frozenset[str]] = field(default_factory=dict, compare=False, repr=False)
+
+    def bits(self, roots: Iterable[str]) -> tuple[int, frozenset[str]]:
+        """The union closure of `roots` as a bitset, plus the roots the graph
+        does not know (which require nothing but themselves)."""
+        acc = 0
+        unknown: set[str] = set()
+        for root in roots:
+            i = self.index.get(root)
+            if i is None:
+                unknown.add(root)
+            else:
+                acc |= self.closure_bits[i]
+        return acc, frozenset(unknown)
+
+    def decode(self, bits: int) -> frozenset[str]:
+        """The item codes in `bits`. Memoized per bitset: the same closures are
+        decoded over and over by the per-root callers."""
+        hit = self._decoded.get(bits)
+        if hit is None:
+            out: list[str] = []
+            rest = bits
+            while rest:
+                low = rest & -rest
+                out.append(self.codes[low.bit_length() - 1])
+                rest ^= low
+            hit = frozenset(out)
+            if len(self._decoded) >= DECODE_MEMO_MAX:
+                self._decoded.clear()
+            self._decoded[bits] = hit
+        return hit
+
+    def closure(self, roots: Iterable[str]) -> frozenset[str]:
+        """Every item transitively required by `roots`, roots included."""
+        bits, unknown = self.bits(roots)
+        known = self.decode(bits)
+        return known | unknown if unknown else known
+
+    def craftables(self, roots: Iterable[str]) -> frozenset[str]:
+        """Closure items that have a recipe."""
+        bits, _unknown = self.bits(roots)
+        return self.decode(bits & self.craftable_mask)
+
+
+def compile_requirement_graph(edges: Mapping[str, Mapping[str, int]],
+                              known: Iterable[str] = ()) -> CompiledRequirementGraph:
+    """Compile recipe `edges` (item -> ingredient -> qty) over every item in
+    `edges`, in their ingredients, and in `known`.
+
+    Tarjan's algorithm, iterative (a deep recipe chain must not hit the
+    recursion limit), emits components sinks-first, which is exactly the order
+    in which each component's closure can be finished from already-finished
+    successors. Indices are handed out in that order, so the index order is
+    topological."""
+    nodes: list[str] = sorted(set(edges) | {i for ings in edges.values() for i in ings} | set(known))
+    successors = {node: sorted(edges.get(node, {})) for node in nodes}
+
+    order: dict[str, int] = {}
+    low: dict[str, int] = {}
+    on_stack: set[str] = set()
+    stack: list[str] = []
+    components: list[list[str]] = []
+    for start in nodes:
+        if start in order:
+            continue
+        work: list[tuple[str, int]] = [(start, 0)]
+        while work:
+            node, child = work.pop()
+            if child == 0:
+                order[node] = low[node] = len(order)
+                stack.append(node)
+                on_stack.add(node)
+            succ = successors[node]
+            if child < len(succ):
+                work.append((node, child + 1))
+                nxt = succ[child]
+                if nxt not in order:
+                    work.append((nxt, 0))
+                elif nxt in on_stack:
+                    low[node] = min(low[node], order[nxt])
+                continue
+            if work:
+                parent = work[-1][0]
+                low[parent] = min(low[parent], low[node])
+            if low[node] == order[node]:
+                component: list[str] = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+                    if member == node:
+                        break
+                components.append(sorted(component))
+
+    codes: list[str] = [code for component in components for code in component]
+    index = {code: i for i, code in enumerate(codes)}
+    closure_bits = [0] * len(codes)
+    for component in components:
+        bits = 0
+        for member in component:
+            bits |= 1 << index[member]
+        for member in component:
+            for ingredient in successors[member]:
+                bits |= closure_bits[index[ingredient]]
+        for member in component:
+            closure_bits[index[member]] = bits
+    craftable_mask = 0
+    for item in edges:
+        craftable_mask |= 1 << index[item]
+    return CompiledRequirementGraph(
+        codes=tuple(codes), index=index, closure_bits=tuple(closure_bits),
+        craftable_mask=craftable_mask,
+    )
@@ -48,9 +48,11 @@ from __future__ import annotations
 
 from collections.abc import Mapping
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Protocol
 
 from artifactsmmo_cli.ai.item_catalog import ItemStats
+from artifactsmmo_cli.ai.requirement_bitset import CompiledRequirementGraph, compile_requirement_graph
 from artifactsmmo_cli.ai.source_kind import SourceKind
 
 
@@ -130,6 +132,13 @@ class RequirementGraph:
         not distinguish from "raw resource" (D2)."""
         return bool(self.leaves.get(item))
 
+    @cached_property
+    def compiled(self) -> CompiledRequirementGraph:
+        """The closure bitsets every closure projection answers from. Built on
+        first use and kept for the graph's lifetime — the graph is immutable,
+        and the memo rebuilds the graph (and so this) on a catalog change."""
+        return compile_requirement_graph(self.edges, self.leaves)
+
 
 def _gather_skill_by_item(game_data: _HasRequirementData) -> dict[str, tuple[str, int]]:
     """Resolve resource-keyed gather gates into ITEM-keyed ones.
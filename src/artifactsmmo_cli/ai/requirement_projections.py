@@ -76,7 +76,13 @@ def requirement_closure(
     replaces could not represent them, so callers grew three separate patches.
 
     Cycle-safe: an item already on the walk is not reopened.
+
+    Untruncated, it is a lookup in the graph's compiled closure bitsets; a
+    `truncate_at` predicate is state, which the compiled form cannot hold, so
+    that case still walks.
     """
+    if truncate_at is None:
+        return graph.compiled.closure(roots)
     seen: set[str] = set()
     stack = list(roots)
     while stack:
@@ -101,7 +107,7 @@ def requirement_craftables(
     all 321 bundle recipes before this replaced its five callers, so the swap is
     a pure indirection onto the shared model, not a behaviour change.
     """
-    return frozenset(i for i in requirement_closure(graph, roots) if i in graph.edges)
+    return graph.compiled.craftables(roots)
 
 
 def requirement_gather_skills(
@@ -0,0 +1,115 @@
+"""`play --profile-slow-cycles`: stack samples of the decide band, taken only
+on the cycles whose decide runs past a threshold.
+
+THE GAP. Per-node cost was measured by stopping the bot and running cProfile
+or py-spy against a harness, and the harness does not hold what the live bot
+holds: `planner.py` records 1.99 ms/node live against 0.495 in the harness,
+and the cause is still open. The searches worth profiling are the slow ones,
+and they only happen live.
+
+HOW. `watch` runs the decide on the calling thread and arms a sampler thread
+that sleeps on an event for `threshold_seconds`. A decide that finishes first
+sets the event and costs nothing more. One still running is sampled every
+`interval_seconds` through `sys._current_frames` until it ends — so a profile
+covers the part of a slow decide past the threshold, where a pathological
+search spends its time.
+
+OUTPUT. Each slow cycle writes `<base>.cycle-<N>.folded`, one
+`root;...;leaf count` line per distinct stack: the collapsed-stack format
+`flamegraph.pl` and speedscope read. `take` hands the trace record the
+summary: the decide's seconds, the sample count, the file (absent when it
+could not be written) and the frames most often on top of the stack.
+"""
+
+import sys
+import threading
+import time
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from types import FrameType
+
+TOP_FRAMES = 10
+"""Leaf frames the trace record's summary lists."""
+
+
+def _label(frame: FrameType) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})"
+
+
+def _stack(frame: FrameType | None) -> tuple[str, ...]:
+    """The frames from the thread's root down to `frame`."""
+    labels: list[str] = []
+    while frame is not None:
+        labels.append(_label(frame))
+        frame = frame.f_back
+    return tuple(reversed(labels))
+
+
+class SlowCycleProfiler:
+    """Samples the decide band of cycles slower than `threshold_seconds`."""
+
+    def __init__(self, threshold_seconds: float, base_path: str, interval_seconds: float = 0.01) -> None:
+        self.threshold_seconds = threshold_seconds
+        self.base_path = base_path
+        self.interval_seconds = interval_seconds
+        self._summary: dict[str, object] | None = None
+
+    @contextmanager
+    def watch(self, cycle: int) -> Iterator[None]:
+        """Profile the body if it runs past the threshold."""
+        target = threading.get_ident()
+        done = threading.Event()
+        samples: Counter[tuple[str, ...]] = Counter()
+        sampler = threading.Thread(target=self._sample, args=(target, done, samples),
+                                   name=f"slow-cycle-profiler-{cycle}", daemon=True)
+        started = time.monotonic()
+        sampler.start()
+        try:
+            yield
+        finally:
+            done.set()
+            sampler.join()
+            if samples:
+                self._summary = self._write(cycle, time.monotonic() - started, samples)
+
+    def _sample(self, target: int, done: threading.Event, samples: Counter[tuple[str, ...]]) -> None:
+        if done.wait(self.threshold_seconds):
+            return
+        while not done.is_set():
+            frame = sys._current_frames().get(target)
+            if frame is not None:
+                samples[_stack(frame)] += 1
+            done.wait(self.interval_seconds)
+
+    def _write(self, cycle: int, seconds: float, samples: Counter[tuple[str, ...]]) -> dict[str, object]:
+        """Write the folded file and summarise. Runs in `watch`'s `finally`, on
+        the play loop: a file that cannot be written (unwritable directory,
+        full disk) costs the summary its `file` and nothing else — a
+        diagnostics option must not take the bot down."""
+        leaves: Counter[str] = Counter()
+        for stack, count in samples.items():
+            leaves[stack[-1]] += count
+        summary: dict[str, object] = {
+            "decide_seconds": round(seconds, 3),
+            "samples": sum(samples.values()),
+            "top": [[frame, count] for frame, count in leaves.most_common(TOP_FRAMES)],
+        }
+        path = f"{self.base_path}.cycle-{cycle}.folded"
+        try:
+            with open(path, "w", encoding="utf-8") as fh:
+                for stack, count in samples.most_common():
+                    fh.write(f"{';'.join(stack)} {count}\n")
+        except OSError as e:
+            print(f"[slow_cycle_profiler] profile write failed: {e}")
+            return summary
+        summary["file"] = path
+        return summary
+
+    def take(self) -> dict[str, object] | None:
+        """The last profiled cycle's summary, once; None when no cycle since
+        the last call ran past the threshold."""
+        summary, self._summary = self._summary, None
+        return summary
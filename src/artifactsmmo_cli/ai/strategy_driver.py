@@ -10,6 +10,7 @@ from datetime import datetime, timezone
 
 from artifactsmmo_cli.ai.accumulation_sell import bank_sellable_surplus, sell_targets
 from artifactsmmo_cli.ai.acquisition_cost import acquisition_actions
+from artifactsmmo_cli.ai.acquisition_subgoals import acquisition_subgoals, acquisition_targets
 from artifactsmmo_cli.ai.actions.base import Action
 from artifactsmmo_cli.ai.actions.equip import ITEM_TYPE_TO_SLOTS
 from artifactsmmo_cli.ai.actions.wait import WaitAction
@@ -79,6 +80,7 @@ from artifactsmmo_cli.ai.planner import _SEARCH_BUDGET_SECONDS, GOAPPlanner
 from artifactsmmo_cli.ai.potion_provision_qty import potion_provision_qty_pure
 from artifactsmmo_cli.ai.raid_participation import raid_survivable_pure
 from artifactsmmo_cli.ai.recycle_surplus import recyclable_surplus
+from artifactsmmo_cli.ai.regression import regression_subgoals
 from artifactsmmo_cli.ai.requirement_projections import demand_set
 from artifactsmmo_cli.ai.selection_context import NO_PROFILE_CONTEXT
 from artifactsmmo_cli.ai.shed_urgency import bank_shed_hoist, shed_urgency
@@ -1233,8 +1235,24 @@ class StrategyArbiter:
                 "elapsed_ms": _elapsed_ms(),
             })
             return gen
+        # Abstract tier: a chain the descent above declined (a mixed-source
+        # closure) is split into per-item acquisition legs at the routes
+        # `acquisition_cost` prices cheapest, and the planner refines each leg
+        # with a short search before falling back to the flat one. See
+        # `acquisition_subgoals`'s module docstring. A chain it has no route for
+        # (a skill-gated craft) takes its legs from the backward search over the
+        # planner's own actions instead (`ai/regression`). Handed over as a
+        # function: the planner derives the legs (10-15 ms per tier) only for a
+        # goal its flat search does not solve inside `_FLAT_PROBE_SECONDS`.
+        # A goal with no acquisition targets has no legs to derive, so it gets
+        # none, and its flat search runs on the whole budget without a probe.
+        def subgoals() -> list[GatherMaterialsGoal]:
+            return (acquisition_subgoals(goal, state, game_data, ctx)
+                    or regression_subgoals(goal, state, game_data, actions, self._history))
+
+        chained = bool(acquisition_targets(goal, state, game_data))
         plan = self._planner.plan(state, goal, actions, game_data, self._history,
-                                  budget_seconds=budget_seconds)
+                                  budget_seconds=budget_seconds, subgoals=subgoals if chained else ())
         stats = self._planner.last_stats
         self._last_timed_out = stats.timed_out
         # P2: a plan that depends on event-ONLY content is worthless if the window
@@ -1255,6 +1273,7 @@ class StrategyArbiter:
             "plan_len": len(plan),
             "priority": priority,
             "elapsed_ms": _elapsed_ms(),
+            "subgoals": [leg.goal for leg in stats.subgoals],
         })
         return plan
 
@@ -32,20 +32,25 @@ such items so the reachable `copper_dagger` wins.
 """
 
 import dataclasses
+import hashlib
+import json
 import weakref
 from collections import OrderedDict
 
 from artifactsmmo_cli.ai.acquisition_cost import acquisition_actions
 from artifactsmmo_cli.ai.drop_obtainability import drop_obtainable
 from artifactsmmo_cli.ai.game_data import GameData
+from artifactsmmo_cli.ai.gear_taxonomy import ITEM_TYPE_TO_SLOTS
 from artifactsmmo_cli.ai.grind_probe_state import grind_probe_state
+from artifactsmmo_cli.ai.memo_stats import memo_counter
+from artifactsmmo_cli.ai.persisted_memo import read_entries, sync_memo
 from artifactsmmo_cli.ai.selection_context import NO_PROFILE_CONTEXT, SelectionContext
 from artifactsmmo_cli.ai.skill_xp_positive import skill_xp_positive
 from artifactsmmo_cli.ai.tiers.skill_grind_selection import (
     GrindCandidate,
     skill_grind_selection_pure,
 )
-from artifactsmmo_cli.ai.world_state import WorldState
+from artifactsmmo_cli.ai.world_state import GOLD_CODE, WorldState
 
 GRIND_ALLOWS_GREY = True
 """The grind's standing exemption from the 2026-07-06 grey directive, named so
@@ -125,20 +130,46 @@ def _obtainable(code: str, state: WorldState, game_data: GameData,
     return all(_obtainable(mat, state, game_data, nxt, gatherable) for mat in recipe)
 
 
-_CacheKey = tuple[str, int, tuple[tuple[str, str | None], ...],
-                  tuple[tuple[str, int], ...], tuple[tuple[str, int], ...],
-                  tuple[tuple[str, int], ...]]
+_Pairs = tuple[tuple[str, int], ...]
+_CacheKey = tuple[str, int, tuple[tuple[str, str | None], ...], _Pairs, _Pairs, _Pairs,
+                  tuple[int, str, int, str], tuple[str, ...], str]
 
 CACHE_MAX_ENTRIES = 4096
 """Per-GameData LRU bound, mirroring `equipment/loadout_cache`: comfortably holds
 one arbitration cycle's distinct search states while capping long-run growth."""
 
+GRIND_CACHE_VERSION = 2
+"""Bump when the persisted key or `GrindCandidate` shape changes; an old file
+then reads as a miss."""
+
+PERSIST_MAX_ENTRIES = 512
+"""How many of the most recently used entries `save_grind_candidates` writes.
+A restart needs the states the character is actually in, not the long tail of
+search nodes, and this keeps the file small enough to rewrite every cycle."""
+
 _caches: dict[int, "OrderedDict[_CacheKey, list[GrindCandidate]]"] = {}
 """Keyed by `id(game_data)` with a `weakref.finalize` purge, exactly as
 `loadout_cache` does — GameData is an eq-dataclass and so unhashable, and the
 finalizer makes id-reuse impossible because the old id is evicted before the
 allocator can hand it out again."""
 
+_closures: dict[int, dict[tuple[str, int], frozenset[str]]] = {}
+"""Per-GameData `(skill, skill level) -> _route_closure`, same scoping."""
+
+_holding_sets: dict[int, tuple[frozenset[str], frozenset[str]]] = {}
+"""Per-GameData `(_gear, _sale_reads)` code sets, same scoping."""
+
+_closure_books: dict[int, tuple[object, dict[tuple[str, int], str]]] = {}
+"""Per-GameData `_closure_book` digests, same scoping, tagged with the sell book
+they were read from. `GameData._load_ge_orders` installs a new book dict on
+every load and never edits one in place, so the book's identity is its version:
+a new book drops every digest at once."""
+
+_dirty: set[int] = set()
+"""GameData ids whose cache gained entries since the last save."""
+
+_STATS = memo_counter("skill_grind_target", size=lambda: sum(len(cache) for cache in _caches.values()))
+
 
 def _cache_for(game_data: GameData) -> "OrderedDict[_CacheKey, list[GrindCandidate]]":
     key = id(game_data)
@@ -146,11 +177,100 @@ def _cache_for(game_data: GameData) -> "OrderedDict[_CacheKey, list[GrindCandida
     if cache is None:
         cache = OrderedDict()
         _caches[key] = cache
-        weakref.finalize(game_data, _caches.pop, key, None)
+        weakref.finalize(game_data, _forget, key)
+        _load_persisted(game_data, cache)
     return cache
 
 
-def _cache_key(skill: str, state: WorldState) -> "_CacheKey":
+def _forget(key: int) -> None:
+    _caches.pop(key, None)
+    _closures.pop(key, None)
+    _holding_sets.pop(key, None)
+    _closure_books.pop(key, None)
+    _dirty.discard(key)
+
+
+def _route_closure(skill: str, current_level: int, game_data: GameData) -> frozenset[str]:
+    """Every item code the candidate walk can price at this skill level.
+
+    The roots are the in-level rungs `build_selectable_grind_candidates`
+    prices. From each code the walk follows the same edges
+    `acquisition_options` does — recipe inputs and purchase currencies — and
+    ADMITS the recipe consumers (the RECYCLE route's source items) without
+    expanding them: a consumer is only ever priced as something to recycle
+    INTO the code that led here, and its own craft route consumes that very
+    code, so the consumer's other inputs can never lower a price. A pure
+    function of game data and the level, so it is memoised per GameData."""
+    memo = _closures.setdefault(id(game_data), {})
+    hit = memo.get((skill, current_level))
+    if hit is not None:
+        return hit
+    seen: set[str] = set()
+    frontier = [code for code, stats in game_data.all_item_stats.items()
+                if stats.crafting_skill == skill and stats.crafting_level <= current_level]
+    consumers: set[str] = set()
+    while frontier:
+        code = frontier.pop()
+        if code in seen:
+            continue
+        seen.add(code)
+        frontier.extend(game_data.crafting_recipe(code) or {})
+        frontier.extend(currency for _npc, _price, currency in game_data.npc_purchases(code))
+        consumers.update(game_data.recipe_consumers.get(code, ()))
+    closure = frozenset(seen | consumers)
+    memo[(skill, current_level)] = closure
+    return closure
+
+
+def _holding_reads(game_data: GameData) -> tuple[frozenset[str], frozenset[str]]:
+    """`(gear, sale)`: the held codes the walk reads whatever the skill.
+
+    GEAR is every equippable. The DROP route prices a kill with the loadout
+    `pick_loadout_cached` builds from ALL owned gear, and the RECYCLE licence
+    compares held gear pairwise, so gear holdings are determinants wherever
+    they sit in the catalog.
+
+    SALE is what the SELL route can read once gold is in the closure: every
+    code some NPC buys (a superset of `accumulation_sell._is_sellable`, whose
+    reachability half moves with events) plus every heal, because the keep
+    authority licensing a sale ranks the whole held heal stock
+    (`inventory_keep._held_heals`)."""
+    sets = _holding_sets.get(id(game_data))
+    if sets is None:
+        stats = game_data.all_item_stats
+        gear = frozenset(code for code, s in stats.items() if ITEM_TYPE_TO_SLOTS.get(s.type_))
+        bought = {code for prices in game_data.npc_sell_prices.values() for code in prices}
+        heals = {code for code, s in stats.items() if s.hp_restore > 0}
+        sets = (gear, frozenset(bought | heals))
+        _holding_sets[id(game_data)] = sets
+    return sets
+
+
+def _closure_book(skill: str, current_level: int, closure: frozenset[str], game_data: GameData) -> str:
+    """Digest of the best GE sell order on every `closure` code, or "" when the
+    book has none: the GE_FILL routes the walk can see. Computed once per book
+    and skill level, so the sorted closure is walked once per GE load rather
+    than once per search node; a digest, not the orders, so the key stays a
+    pure function of the book across processes."""
+    book = game_data.world.ge_sell_orders
+    held = _closure_books.get(id(game_data))
+    if held is None or held[0] is not book:
+        held = (book, {})
+        _closure_books[id(game_data)] = held
+    digest = held[1].get((skill, current_level))
+    if digest is None:
+        orders = [(code, order[1], order[2]) for code in sorted(closure)
+                  if (order := game_data.ge_best_sell_order(code)) is not None]
+        digest = hashlib.sha256(json.dumps(orders).encode()).hexdigest()[:16] if orders else ""
+        held[1][(skill, current_level)] = digest
+    return digest
+
+
+def _project(holdings: dict[str, int], keep: frozenset[str]) -> _Pairs:
+    return tuple(sorted((code, qty) for code, qty in holdings.items() if code in keep))
+
+
+def _cache_key(skill: str, state: WorldState, game_data: GameData) -> "_CacheKey":
     """The determinants of a candidate list, and nothing else.
 
     `level` and `equipment` drive `is_winnable` (hence obtainability and the DROP
@@ -159,6 +279,24 @@ def _cache_key(skill: str, state: WorldState) -> "_CacheKey":
     craft gates inside `obtain_sources`. Quantities matter, so these are counted
     pairs rather than key sets.
 
+    HOLDINGS ARE PROJECTED onto the codes the walk can read: the
+    `_route_closure` of this skill level plus every equippable, and — once the
+    closure can pay gold (a gold-priced vendor, or a standing GE sell order on
+    a closure code) — every code the SELL route could license for sale, with
+    the pocket gold itself. The bag churns on every gather and fight, and much
+    of that churn is in codes no rung of this skill touches — monster drops
+    nobody buys, another skill's intermediates — so keying on the raw bag
+    missed on nearly every cycle. A code outside the projection reaches no
+    route the walk enumerates; `test_skill_grind_target`'s catalog
+    differential holds the projection to the unprojected answer.
+
+    The keep authority behind the RECYCLE and SELL licences also reads the
+    items task and the in-flight craft, and the live overlays decide which
+    routes exist at all: active event and raid codes gate spawn tiles (GATHER,
+    DROP), and the best GE sell order on each closure code IS the GE_FILL
+    route (keyed as `_closure_book`'s digest). The raw-state key ignored all of
+    these; a key that outlives the process cannot.
+
     Same shape as `loadout_cache._CacheKey`, for the same reason: within one
     search almost every node shares these, so the memo turns a route walk into a
     lookup.
@@ -173,22 +311,84 @@ def _cache_key(skill: str, state: WorldState) -> "_CacheKey":
     `fightable_droppers` now evaluates winnability at RESTORABLE hp (2026-08-18),
     so the chain no longer reads `state.hp` at all and the key is complete as
     written."""
+    level = state.skills.get(skill, 0)
+    closure = _route_closure(skill, level, game_data)
+    orders = _closure_book(skill, level, closure, game_data)
+    gear, sale = _holding_reads(game_data)
+    keep = closure | gear
+    gold = -1
+    if GOLD_CODE in closure or orders:
+        keep |= sale
+        gold = state.gold
+    task = (state.task_code, state.task_total - state.task_progress) if state.task_code else ("", 0)
     return (
         skill,
         state.level,
         tuple(sorted(state.equipment.items())),
-        tuple(sorted(state.inventory.items())),
-        tuple(sorted((state.bank_items or {}).items())),
+        _project(state.inventory, keep),
+        _project(state.bank_items or {}, keep),
         tuple(sorted(state.skills.items())),
+        (gold, *task, state.crafting_target or ""),
+        tuple(sorted(game_data.active_event_codes | game_data.active_raid_codes)),
+        orders,
     )
 
 
+def _load_persisted(game_data: GameData,
+                    cache: "OrderedDict[_CacheKey, list[GrindCandidate]]") -> None:
+    """Seed a fresh cache from the file `save_grind_candidates` writes
+    (`persisted_memo.read_entries`: a file of another catalog seeds nothing)."""
+    path = game_data._grind_candidate_path
+    if path is None or game_data._catalog_digest is None:
+        return
+    for key, candidates in read_entries(path, GRIND_CACHE_VERSION, game_data._catalog_digest,
+                                        _decode):
+        cache[key] = candidates  # type: ignore[index]
+
+
+def _decode(raw: list[dict[str, object]]) -> list[GrindCandidate]:
+    return [GrindCandidate(**c) for c in raw]  # type: ignore[arg-type]
+
+
+def _encode(candidates: list[GrindCandidate]) -> object:
+    return [dataclasses.asdict(c) for c in candidates]
+
+
+def save_grind_candidates(game_data: GameData) -> None:
+    """Persist the most recently used candidate lists next to the game-data
+    cache, so a restart against the same catalog starts warm, and merge in
+    whatever sibling processes persisted (`persisted_memo.sync_memo`).
+
+    A no-op unless this GameData was loaded with a persistence path (offline
+    and test builds have none) and its cache gained entries since the last
+    save. The player calls it once per cycle, inside the cooldown it would
+    otherwise sleep through. A failed write is reported and otherwise
+    ignored: the entries are still in memory and the next save retries.
+
+    Nothing here reads the learning store. The walk prices drops from the
+    static tables (`acquisition_actions` is called without a store), so
+    there are no learned rates for a persisted entry to drift from; what
+    invalidates it is a different catalog, which the digest catches."""
+    key = id(game_data)
+    path = game_data._grind_candidate_path
+    if key not in _dirty or path is None or game_data._catalog_digest is None:
+        return
+    try:
+        sync_memo(_caches[key], path, GRIND_CACHE_VERSION, game_data._catalog_digest,
+                  _decode, _encode, PERSIST_MAX_ENTRIES, CACHE_MAX_ENTRIES)
+    except OSError as e:
+        print(f"[skill_grind] candidate cache write failed: {e}")
+        return
+    _dirty.discard(key)
+
+
 def _with_wanted(candidates: list[GrindCandidate],
                  ctx: SelectionContext) -> list[GrindCandidate]:
     """`candidates` with `wanted` set from `ctx`, as a NEW list.
 
     APPLIED AFTER THE CACHE, deliberately. `_cache_key` is a function of the
-    STATE — skill, level, equipment, inventory, bank, skills — and nothing else.
+    STATE — skill, level, equipment, inventory, bank, skills — and the live
+    game-data overlays, and nothing else.
     Folding the context in would multiply the cache by objective state and undo
     the hoist that took this producer from 47.0s of a 67.3s search. `wanted` is
     a projection of the context onto an already-computed list, so it costs one
@@ -271,11 +471,13 @@ def build_selectable_grind_candidates(skill: str, state: WorldState,
     `recipe_closure` is built ONCE per call and shared across candidates, so the
     added cost is one closure walk per rung rather than one per material."""
     cache = _cache_for(game_data)
-    key = _cache_key(skill, state)
+    key = _cache_key(skill, state, game_data)
     hit = cache.get(key)
     if hit is not None:
         cache.move_to_end(key)
+        _STATS.hit()
         return _with_wanted(hit, ctx)
+    started = _STATS.start()
     candidates: list[GrindCandidate] = []
     # One rebuild for the whole sweep instead of one per candidate's walk. Not a
     # micro-optimisation: routing this loop through the public `is_obtainable`
@@ -323,7 +525,9 @@ def build_selectable_grind_candidates(skill: str, state: WorldState,
             xp_positive=skill_xp_positive(stats.crafting_level,
                                           state.skills.get(skill, 0)),
         ))
+    _STATS.miss(started)
     cache[key] = candidates
+    _dirty.add(id(game_data))
     if len(cache) > CACHE_MAX_ENTRIES:
         cache.popitem(last=False)
     return _with_wanted(candidates, ctx)
@@ -0,0 +1,312 @@
+"""Exact walking distances over the server's walkable grid.
+
+The move action paths with A* THROUGH walkable tiles (docs: "uses A*
+pathfinding ... bypassing blocked maps"), so the step count between two tiles
+is the BFS distance over 4-adjacent walkable tiles of the same access region —
+NOT the Manhattan distance the planner used to assume. Walls inside a layer
+(the Lich Tomb interior, the sea edges around the desert island) make the two
+differ, and every differing pair mispriced a route.
+
+`TileDistanceTable` answers that exactly. A region (a connected component of
+same-kind tiles, the same partition `LocationCatalog.region_of` labels) is
+compiled on first use into a compact all-pairs table: a sorted tile tuple, a
+tile -> index map, and one flat `array('H')` of n*n step counts. After that a
+query is two dict lookups and an array index — O(1) in the planner's hot loop.
+The overworld is ~360 walkable tiles, so its table is ~250 KiB.
+
+Pairs the table cannot answer (either end not walkable, or the ends in
+different regions) fall back to Manhattan, the historical model, so sparse test
+fixtures without walkability facts price exactly as before. Server path lengths
+observed on real moves (`observe`) override both: the server is the authority,
+and a disagreement means the static map facts are missing something (an
+achievement-gated tile the account just unlocked, a tile the API reports
+walkable that is not).
+
+The compiled tables are a pure function of the walkable/restricted tile sets,
+so they persist on disk keyed by a fingerprint of those sets
+(`TileDistanceTable.save` / `load`): a warm boot with unchanged map data never
+re-runs a BFS. The learned overrides persist in the same file but are NOT
+keyed by the fingerprint — they are exactly the pairs the map facts got wrong,
+so a map refresh is when they matter most. Only disagreements are recorded,
+and each new one is written through to the file the table was loaded from.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import os
+from array import array
+from collections import deque
+from collections.abc import Callable, Iterable
+from collections.abc import Set as AbstractSet
+from pathlib import Path
+
+Tile = tuple[int, int, str]
+
+TILE_DISTANCE_VERSION = 2
+"""Bump when the on-disk table format changes; an old version reads as a miss."""
+
+_UNREACHED = 0xFFFF
+"""Sentinel for a pair the BFS never reached. Cannot occur inside one connected
+component; kept so a corrupt table reads as 'unknown', never as a distance."""
+
+
+def _manhattan(x0: int, y0: int, x1: int, y1: int) -> int:
+    return abs(x1 - x0) + abs(y1 - y0)
+
+
+class RegionDistances:
+    """All-pairs BFS step counts for ONE connected region, in compact arrays.
+
+    `tiles` is the region's (x, y) members in sorted order; `dist[i * n + j]` is
+    the step count from `tiles[i]` to `tiles[j]`."""
+
+    __slots__ = ("dist", "index", "layer", "n", "tiles")
+
+    def __init__(self, layer: str, tiles: tuple[tuple[int, int], ...], dist: array[int]) -> None:
+        self.layer = layer
+        self.tiles = tiles
+        self.n = len(tiles)
+        self.index = {t: i for i, t in enumerate(tiles)}
+        self.dist = dist
+
+    @classmethod
+    def compile(cls, layer: str, members: Iterable[tuple[int, int]]) -> RegionDistances:
+        """BFS from every member over 4-adjacency inside `members`."""
+        tiles = tuple(sorted(members))
+        index = {t: i for i, t in enumerate(tiles)}
+        n = len(tiles)
+        neighbours: list[tuple[int, ...]] = [
+            tuple(index[nb] for nb in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)) if nb in index)
+            for (x, y) in tiles
+        ]
+        dist = array("H", [_UNREACHED]) * (n * n)
+        for src in range(n):
+            base = src * n
+            dist[base + src] = 0
+            queue = deque((src,))
+            while queue:
+                cur = queue.popleft()
+                step = dist[base + cur] + 1
+                for nb in neighbours[cur]:
+                    if dist[base + nb] == _UNREACHED:
+                        dist[base + nb] = step
+                        queue.append(nb)
+        return cls(layer, tiles, dist)
+
+    def steps(self, a: tuple[int, int], b: tuple[int, int]) -> int | None:
+        """Step count a -> b, or None when either tile is not in the region."""
+        i = self.index.get(a)
+        j = self.index.get(b)
+        if i is None or j is None:
+            return None
+        d = self.dist[i * self.n + j]
+        return None if d == _UNREACHED else d
+
+    def path(self, a: tuple[int, int], b: tuple[int, int]) -> list[tuple[int, int]]:
+        """One shortest walk a -> b (a excluded, b included), or [] when the
+        pair is unknown. Descends the b-row of the table: each step moves to a
+        neighbour one step closer to b, lex-first among ties so the walk is
+        deterministic."""
+        total = self.steps(a, b)
+        if not total:
+            return []
+        j = self.index[b]
+        walk: list[tuple[int, int]] = []
+        x, y = a
+        remaining = total
+        while remaining:
+            for nb in sorted(((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1))):
+                k = self.index.get(nb)
+                if k is not None and self.dist[k * self.n + j] == remaining - 1:
+                    x, y = nb
+                    break
+            walk.append((x, y))
+            remaining -= 1
+        return walk
+
+
+def _components(pool: AbstractSet[Tile]) -> list[tuple[str, frozenset[tuple[int, int]]]]:
+    """Split a tile pool into 4-connected same-layer components."""
+    seen: set[Tile] = set()
+    out: list[tuple[str, frozenset[tuple[int, int]]]] = []
+    for start in sorted(pool):
+        if start in seen:
+            continue
+        seen.add(start)
+        members = {start}
+        frontier = [start]
+        while frontier:
+            cx, cy, cl = frontier.pop()
+            for nx, ny in ((cx + 1, cy), (cx - 1, cy), (cx, cy + 1), (cx, cy - 1)):
+                nt = (nx, ny, cl)
+                if nt in pool and nt not in seen:
+                    seen.add(nt)
+                    members.add(nt)
+                    frontier.append(nt)
+        out.append((start[2], frozenset((x, y) for x, y, _l in members)))
+    return out
+
+
+class TileDistanceTable:
+    """Per-region exact step counts, compiled lazily, with learned overrides.
+
+    Restricted tiles flood among themselves and walkable tiles among
+    themselves, mirroring `LocationCatalog.region_of`: a walk never crosses
+    between the two kinds, so a pair straddling them falls back."""
+
+    def __init__(self, walkable: AbstractSet[Tile], restricted: AbstractSet[Tile]) -> None:
+        self._walkable = walkable
+        self._restricted = restricted
+        self._region_of: dict[Tile, int] | None = None
+        self._members: list[tuple[str, frozenset[tuple[int, int]]]] = []
+        self._compiled: dict[int, RegionDistances] = {}
+        self._observed: dict[tuple[int, int, int, int, str], int] = {}
+        self._path: Path | None = None
+
+    def _regions(self) -> dict[Tile, int]:
+        if self._region_of is None:
+            self._members = _components(self._walkable - self._restricted) + _components(self._restricted)
+            self._region_of = {
+                (x, y, layer): rid
+                for rid, (layer, tiles) in enumerate(self._members)
+                for (x, y) in tiles
+            }
+        return self._region_of
+
+    def region(self, x: int, y: int, layer: str) -> RegionDistances | None:
+        """The compiled table of the region holding (x, y, layer), or None
+        when the tile is not walkable."""
+        rid = self._regions().get((x, y, layer))
+        if rid is None:
+            return None
+        table = self._compiled.get(rid)
+        if table is None:
+            rlayer, members = self._members[rid]
+            table = RegionDistances.compile(rlayer, members)
+            self._compiled[rid] = table
+        return table
+
+    def exact_steps(self, x0: int, y0: int, x1: int, y1: int, layer: str) -> int | None:
+        """Learned or BFS step count, or None when neither model knows the pair."""
+        learned = self._observed.get((x0, y0, x1, y1, layer))
+        if learned is not None:
+            return learned
+        table = self.region(x0, y0, layer)
+        if table is None:
+            return None
+        return table.steps((x0, y0), (x1, y1))
+
+    def steps(self, x0: int, y0: int, x1: int, y1: int, layer: str) -> int:
+        """Walking steps from (x0, y0) to (x1, y1) on `layer`; Manhattan when
+        the pair is unknown to both the table and the learned overrides."""
+        exact = self.exact_steps(x0, y0, x1, y1, layer)
+        return _manhattan(x0, y0, x1, y1) if exact is None else exact
+
+    def stepper(self, layer: str) -> Callable[[int, int, int, int], int]:
+        """`steps` bound to one layer — the shape `nearest_tile` ranks with."""
+        return lambda x0, y0, x1, y1: self.steps(x0, y0, x1, y1, layer)
+
+    def path(self, x0: int, y0: int, x1: int, y1: int, layer: str) -> list[tuple[int, int]]:
+        """One shortest walk (start excluded), or [] when the pair is unknown."""
+        table = self.region(x0, y0, layer)
+        if table is None:
+            return []
+        return table.path((x0, y0), (x1, y1))
+
+    def observe(self, x0: int, y0: int, x1: int, y1: int, layer: str, steps: int) -> None:
+        """Record the server-reported step count of a real move when it
+        disagrees with what the table answers now. Later queries for that pair
+        return it instead of the static model, and the change is written
+        through to the file `save` / `load` last used."""
+        if (x0, y0) == (x1, y1) or self.steps(x0, y0, x1, y1, layer) == steps:
+            return
+        self._observed[(x0, y0, x1, y1, layer)] = steps
+        if self._path is not None:
+            try:
+                self.save(self._path)
+            except OSError as e:
+                # The override is in memory already; only the next boot loses it.
+                print(f"[tile_distance] observed distance write failed: {e}")
+
+    @property
+    def observed(self) -> dict[tuple[int, int, int, int, str], int]:
+        """Learned step counts keyed by (x0, y0, x1, y1, layer)."""
+        return self._observed
+
+    def fingerprint(self) -> str:
+        """Stable digest of the tile sets the tables are derived from."""
+        h = hashlib.sha256()
+        for label, pool in (("w", self._walkable), ("r", self._restricted)):
+            h.update(label.encode())
+            for x, y, layer in sorted(pool):
+                h.update(f"{x},{y},{layer};".encode())
+        return h.hexdigest()[:16]
+
+    def compile_all(self) -> None:
+        """Compile every region now (before `save`, so the file is complete)."""
+        for tile in list(self._regions()):
+            self.region(*tile)
+
+    def save(self, path: Path) -> None:
+        """Persist the compiled tables atomically, tagged with the fingerprint,
+        together with the learned overrides. Later overrides write through to
+        `path`."""
+        self._path = path
+        self._regions()
+        payload = {
+            "version": TILE_DISTANCE_VERSION,
+            "fingerprint": self.fingerprint(),
+            "regions": {
+                str(rid): {
+                    "layer": table.layer,
+                    "tiles": [list(t) for t in table.tiles],
+                    "dist": base64.b64encode(table.dist.tobytes()).decode("ascii"),
+                }
+                for rid, table in self._compiled.items()
+            },
+            "observed": [[x0, y0, x1, y1, layer, n] for (x0, y0, x1, y1, layer), n in self._observed.items()],
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        tmp.write_text(json.dumps(payload))
+        os.replace(tmp, path)
+
+    def load(self, path: Path) -> bool:
+        """Adopt tables persisted by `save` when their fingerprint matches this
+        table's tile sets; True when they were adopted. All-or-nothing for the
+        tables: a missing, corrupt, stale or version-mismatched file leaves
+        them untouched and returns False. Learned overrides are adopted from
+        any readable file of this version, stale or not; one this table has
+        already learned keeps its in-memory value."""
+        self._path = path
+        try:
+            raw = json.loads(path.read_text())
+            if raw["version"] != TILE_DISTANCE_VERSION:
+                return False
+            observed = {
+                (int(x0), int(y0), int(x1), int(y1), str(layer)): int(n)
+                for x0, y0, x1, y1, layer, n in raw["observed"]
+            }
+            for key, n in observed.items():
+                self._observed.setdefault(key, n)
+            if raw["fingerprint"] != self.fingerprint():
+                return False
+            self._regions()
+            loaded: dict[int, RegionDistances] = {}
+            for rid_s, entry in raw["regions"].items():
+                rid = int(rid_s)
+                tiles = tuple((int(t[0]), int(t[1])) for t in entry["tiles"])
+                if self._members[rid] != (entry["layer"], frozenset(tiles)):
+                    return False
+                dist = array("H")
+                dist.frombytes(base64.b64decode(entry["dist"]))
+                if len(dist) != len(tiles) * len(tiles):
+                    return False
+                loaded[rid] = RegionDistances(entry["layer"], tiles, dist)
+        except (OSError, json.JSONDecodeError, KeyError, ValueError, TypeError, IndexError):
+            return False
+        self._compiled.update(loaded)
+        return True
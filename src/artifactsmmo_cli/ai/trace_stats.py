@@ -17,6 +17,7 @@ shadow decision (`record["tree"]`) is traced-only and never persisted to
 the learning store, so `analyze_tree_divergence` reads raw trace JSONL
 records instead (via `load_trace_records`) and populates the `tree_*`
 fields on `TraceStats` in its own single pass, independent of `analyze()`.
+The memo hit rates (`analyze_memo`) are traced-only for the same reason.
 """
 
 import json
@@ -50,6 +51,21 @@ class GoalLoad:
     timeouts: int
 
 
+@dataclass
+class MemoLoad:
+    """One memo layer's counts summed over the traced cycles
+    (`record["planner"]["memo"]`, drained by `ai/memo_stats`)."""
+    layer: str
+    hits: int = 0
+    misses: int = 0
+    max_size: int = -1
+    saved_ms: float = 0.0
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / (self.hits + self.misses) if self.hits + self.misses else 0.0
+
+
 @dataclass
 class FightLoss:
     cycle: int
@@ -96,6 +112,8 @@ class TraceStats:
     actions: Counter[str] = field(default_factory=Counter)
 
     planner: list[GoalLoad] = field(default_factory=list)
+    # Populated ONLY by `analyze_memo`, from raw trace JSONL records.
+    memo: list[MemoLoad] = field(default_factory=list)
 
     fight_attempts: int = 0
     fight_losses: list[FightLoss] = field(default_factory=list)
@@ -327,9 +345,28 @@ def analyze_tree_divergence(records: Iterable[Mapping[str, object]]) -> TraceSta
     return stats
 
 
+def analyze_memo(records: Iterable[Mapping[str, object]]) -> list[MemoLoad]:
+    """Per-layer memo counts over the trace records, coldest (lowest hit
+    rate) first. Records from before the counters existed carry no `memo`
+    block and are skipped."""
+    loads: dict[str, MemoLoad] = {}
+    for record in records:
+        planner = record.get("planner")
+        memo = planner.get("memo") if isinstance(planner, dict) else None
+        if not isinstance(memo, dict):
+            continue
+        for layer, counts in memo.items():
+            load = loads.setdefault(layer, MemoLoad(layer=layer))
+            load.hits += int(counts["hits"])
+            load.misses += int(counts["misses"])
+            load.max_size = max(load.max_size, int(counts["size"]))
+            load.saved_ms += float(counts["saved_ms"])
+    return sorted(loads.values(), key=lambda load: (load.hit_rate, load.layer))
+
+
 def load_trace_records(path: str) -> list[dict[str, object]]:
     """Read a trace JSONL log (one `GamePlayer._emit_trace` record per
-    line) for `analyze_tree_divergence`. Blank lines and lines that fail
+    line) for `analyze_tree_divergence` and `analyze_memo`. Blank lines and lines that fail
     to parse as JSON (e.g. a truncated final line from a live-tailed log)
     are skipped rather than aborting the read."""
     records: list[dict[str, object]] = []
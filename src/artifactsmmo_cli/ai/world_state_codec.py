@@ -0,0 +1,84 @@
+"""JSON round-trip for `WorldState`, so a recorded cycle can be re-decided offline.
+
+`cycles` carries the decision's OUTCOME (goal, action, planner stats) and a
+handful of post-action scalars, but never the state the decision ran against —
+no inventory, equipment, bank or task detail — so no replay could re-drive
+`StrategyArbiter.select` from a row. `Cycle.state_json` stores that state in
+this encoding, and `formal/diff/decision_replay.py` decodes it.
+
+Every field is written, including those still at their defaults, so a decode
+never has to guess what the writer meant. `task_lifecycle_phase` is the one
+exception: `WorldState.__post_init__` re-derives it from the raw task fields,
+so storing it would only add a second copy that could disagree.
+
+A field added to `WorldState` after a row was written decodes to the field's
+default when it has one; a REQUIRED field the row lacks raises
+`StateDecodeError`, because inventing a value for it would hand the replay a
+state no character was ever in.
+"""
+
+import dataclasses
+import json
+from datetime import datetime
+from typing import Any
+
+from artifactsmmo_cli.ai.open_order import OpenOrder, OrderSide
+from artifactsmmo_cli.ai.raid_info import RaidInfo
+from artifactsmmo_cli.ai.world_state import WorldState
+
+_DERIVED = frozenset({"task_lifecycle_phase"})
+
+
+class StateDecodeError(ValueError):
+    """The stored text is not a decodable `WorldState`."""
+
+
+def _dt(value: datetime | None) -> str | None:
+    return value.isoformat() if value is not None else None
+
+
+def _undt(value: str | None) -> datetime | None:
+    return datetime.fromisoformat(value) if value is not None else None
+
+
+def state_to_json(state: WorldState) -> str:
+    """Compact, key-sorted JSON for `state`."""
+    out: dict[str, Any] = {}
+    for f in dataclasses.fields(WorldState):
+        if f.name in _DERIVED:
+            continue
+        out[f.name] = getattr(state, f.name)
+    out["cooldown_expires"] = _dt(state.cooldown_expires)
+    out["active_events"] = {code: _dt(at) for code, at in state.active_events.items()}
+    out["raids"] = [{**dataclasses.asdict(r), "next_start_at": _dt(r.next_start_at),
+                     "window_ends_at": _dt(r.window_ends_at)} for r in state.raids]
+    out["open_orders"] = [{**o._asdict(), "side": o.side.value} for o in state.open_orders]
+    return json.dumps(out, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
+def state_from_json(text: str) -> WorldState:
+    """Inverse of `state_to_json`; raises `StateDecodeError` on anything else."""
+    try:
+        raw = json.loads(text)
+        if not isinstance(raw, dict):
+            raise StateDecodeError("stored state is not a JSON object")
+        known = {f.name for f in dataclasses.fields(WorldState)} - _DERIVED
+        kwargs = {k: v for k, v in raw.items() if k in known}
+        if "cooldown_expires" in kwargs:
+            kwargs["cooldown_expires"] = _undt(kwargs["cooldown_expires"])
+        if "active_events" in kwargs:
+            kwargs["active_events"] = {code: _undt(at) for code, at in kwargs["active_events"].items()}
+        if "raids" in kwargs:
+            kwargs["raids"] = [RaidInfo(**{**r, "next_start_at": _undt(r["next_start_at"]),
+                                           "window_ends_at": _undt(r["window_ends_at"])})
+                               for r in kwargs["raids"]]
+        if "open_orders" in kwargs:
+            kwargs["open_orders"] = tuple(OpenOrder(**{**o, "side": OrderSide(o["side"])})
+                                          for o in kwargs["open_orders"])
+        if kwargs.get("pending_items") is not None:
+            kwargs["pending_items"] = tuple((pid, code) for pid, code in kwargs["pending_items"])
+        return WorldState(**kwargs)
+    except StateDecodeError:
+        raise
+    except (json.JSONDecodeError, TypeError, ValueError, KeyError, AttributeError) as e:
+        raise StateDecodeError(f"stored state does not decode: {e}") from e
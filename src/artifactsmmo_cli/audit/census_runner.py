@@ -0,0 +1,200 @@
+"""Shared census runner: fans census cells over a process pool and serves
+unchanged cells from an on-disk result cache.
+
+Every planner-driving census (craft, inventory, obtain-parity, recycle-source,
+shed-reachability) is the same shape — a grid of independent, deterministic
+cells, each one `run_cell(cell, game_data)` -> frozen result dataclass — so
+they share one runner instead of each owning a serial loop or a private pool.
+
+The cache key of a cell is (census, `repr(cell)`, data digest, code digest):
+the data digest covers the whole bundle the census ran on, and the code digest
+covers every package module the census module can reach through its imports,
+so an edit that cannot change a verdict (a TUI widget, a CLI command) leaves
+the cache valid, and one that can (the planner, an action, the census itself)
+re-plans the whole grid.
+
+Only CONCLUSIVE cells are cached. A result whose `planner_failed` is set (a
+search that hit its wall-clock budget or node cap) has learned nothing, and on
+a faster machine or a quieter pool it may not fail at all, so it re-runs on the
+next pass instead of pinning a timeout into every later grid. A cell that
+raises is not cached either: the cells that finished before it are saved, and
+it re-runs, with everything after it, on the next pass.
+
+The cache is OPT-IN (`cache=None` runs everything): the test suite never reads
+results a previous run left behind, and the generator scripts pass one unless
+`--no-cache` is given."""
+
+import ast
+import dataclasses
+import hashlib
+import json
+import os
+from collections.abc import Callable, Generator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import closing
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from artifactsmmo_cli.ai.game_data import GameData
+from artifactsmmo_cli.ai.persisted_memo import read_entries, write_entries
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "artifactsmmo" / "census"
+CENSUS_CACHE_VERSION = 1
+
+_PACKAGE = "artifactsmmo_cli"
+_PACKAGE_ROOT = Path(__file__).resolve().parents[1]
+
+
+def bundle_digest(bundle: dict[str, Any]) -> str:
+    """Stable digest of a whole cache bundle. Unlike `catalog_digest` the bank
+    page is included: GameData builds from it, so a census cell may read it."""
+    return hashlib.sha256(json.dumps(bundle, sort_keys=True).encode()).hexdigest()[:16]
+
+
+def _module_file(name: str) -> Path | None:
+    parts = name.split(".")[1:]
+    for candidate in (_PACKAGE_ROOT.joinpath(*parts).with_suffix(".py"),
+                      _PACKAGE_ROOT.joinpath(*parts, "__init__.py")):
+        if parts and candidate.is_file():
+            return candidate
+    return None
+
+
+def _package_imports(path: Path) -> set[str]:
+    """Package module names `path` imports, at any depth of the file. Names
+    that turn out not to be modules (`from pkg.mod import Class`) are dropped
+    by the caller's file lookup."""
+    found: set[str] = set()
+    for node in ast.walk(ast.parse(path.read_text(), str(path))):
+        if isinstance(node, ast.Import):
+            found.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            found.add(node.module)
+            found.update(f"{node.module}.{alias.name}" for alias in node.names)
+    return {name for name in found if name.split(".")[0] == _PACKAGE}
+
+
+def code_digest(*modules: str) -> str:
+    """Digest of every package source file reachable from `modules` through
+    imports (package `__init__` files on the way included)."""
+    seen: dict[str, Path] = {}
+    frontier = list(modules)
+    while frontier:
+        name = frontier.pop()
+        if name in seen:
+            continue
+        path = _module_file(name)
+        if path is None:
+            continue
+        seen[name] = path
+        parents = [".".join(name.split(".")[:i]) for i in range(2, name.count(".") + 1)]
+        frontier.extend([*_package_imports(path), *parents])
+    digest = hashlib.sha256()
+    for name in sorted(seen):
+        digest.update(name.encode())
+        digest.update(seen[name].read_bytes())
+    return digest.hexdigest()[:16]
+
+
+@dataclass(frozen=True)
+class CensusCache[R]:
+    """One census's cached results, tagged with the (data, code) generation
+    they were computed at. A file of another generation reads as empty and is
+    replaced on the next save (`persisted_memo`'s all-or-nothing rule)."""
+
+    census: str
+    result_type: type[R]
+    data_digest: str
+    code_digest: str
+    directory: Path = DEFAULT_CACHE_DIR
+
+    @property
+    def path(self) -> Path:
+        return self.directory / f"{self.census}.json"
+
+    @property
+    def generation(self) -> str:
+        return f"{self.data_digest}-{self.code_digest}"
+
+    def load(self) -> dict[str, R]:
+        """Cached results by cell key."""
+        def decode(row: dict[str, Any]) -> R:
+            return self.result_type(**{k: tuple(v) if isinstance(v, list) else v for k, v in row.items()})
+        return {str(key): result
+                for key, result in read_entries(self.path, CENSUS_CACHE_VERSION, self.generation, decode)}
+
+    def save(self, results: dict[str, R]) -> None:
+        """Replace the file with `results`."""
+        write_entries(self.path, CENSUS_CACHE_VERSION, self.generation,
+                      [(key, dataclasses.asdict(result)) for key, result in results.items()])  # type: ignore[call-overload]
+
+
+# Process-local handles set once per worker by `_init_census_worker`, so the
+# (large) GameData is pickled once at pool startup rather than once per cell.
+_WORKER_GAME_DATA: GameData | None = None
+_WORKER_RUN_CELL: Callable[[Any, GameData], Any] | None = None
+
+
+def _init_census_worker(game_data: GameData, run_cell: Callable[[Any, GameData], Any]) -> None:
+    global _WORKER_GAME_DATA, _WORKER_RUN_CELL
+    _WORKER_GAME_DATA = game_data
+    _WORKER_RUN_CELL = run_cell
+
+
+def _run_cell_in_worker(cell: Any) -> Any:
+    assert _WORKER_GAME_DATA is not None and _WORKER_RUN_CELL is not None
+    return _WORKER_RUN_CELL(cell, _WORKER_GAME_DATA)
+
+
+def run_cells[C, R](
+    run_cell: Callable[[C, GameData], R],
+    cells: Sequence[C],
+    game_data: GameData,
+    *,
+    max_workers: int | None = None,
+    cache: CensusCache[R] | None = None,
+    progress: Callable[[int, int], None] | None = None,
+) -> list[R]:
+    """`[run_cell(cell, game_data) for cell in cells]`, in `cells` order.
+
+    Cells found in `cache` are not re-run; the rest fan out across a process
+    pool (a GOAP search is GIL-bound, so processes, not threads) and, when a
+    cache is given, the full result set is written back. `run_cell` must be a
+    module-level function so the pool can pickle it. `max_workers=1` runs
+    in-process. `progress(done, total)` fires once per cell, in `cells` order,
+    cached cells included. Inconclusive results (`planner_failed`) are
+    returned but never written back, and a cell that raises still saves the
+    cells finished before it (see the module docstring)."""
+    keys = [repr(cell) for cell in cells]
+    cached = cache.load() if cache is not None else {}
+    todo = [cell for cell, key in zip(cells, keys, strict=True) if key not in cached]
+    results: list[R] = []
+    try:
+        # closing(): the pool shuts down here, not whenever the generator is collected.
+        with closing(_run_uncached(run_cell, todo, game_data, max_workers)) as ran:
+            for done, key in enumerate(keys, start=1):
+                results.append(cached[key] if key in cached else next(ran))
+                if progress is not None:
+                    progress(done, len(keys))
+    finally:
+        if cache is not None and todo:
+            cache.save({key: result for key, result in zip(keys, results, strict=False)
+                        if not getattr(result, "planner_failed", False)})
+    return results
+
+
+def _run_uncached[C, R](run_cell: Callable[[C, GameData], R], todo: list[C], game_data: GameData,
+                  max_workers: int | None) -> Generator[R]:
+    """Results for `todo`, in order, yielded as they arrive."""
+    if max_workers == 1:
+        yield from (run_cell(cell, game_data) for cell in todo)
+    elif todo:
+        with ProcessPoolExecutor(
+            max_workers=min(max_workers or os.cpu_count() or 1, len(todo)),
+            initializer=_init_census_worker,
+            initargs=(game_data, run_cell),
+        ) as executor:
+            # chunksize=1: cells are wildly uneven (instant vs a 10 s budget
+            # wall), so per-cell dispatch keeps every worker busy.
+            yield from executor.map(_run_cell_in_worker, todo, chunksize=1)
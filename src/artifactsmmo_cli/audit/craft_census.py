@@ -6,8 +6,10 @@ orchestration layer between the proven cores and the doc renderers."""
 
 from collections.abc import Callable
 from dataclasses import dataclass
+from itertools import accumulate
 
 from artifactsmmo_cli.ai.game_data import GameData
+from artifactsmmo_cli.audit.census_runner import CensusCache, run_cells
 from artifactsmmo_cli.audit.craft_completeness import (
     CraftCell,
     census_state,
@@ -22,7 +24,8 @@ from artifactsmmo_cli.audit.craft_completeness import (
 class CellResult:
     """One census outcome: a recipe attempted at one (char_level, skill_level)
     cell. `passed`/`reason` mirror the CraftVerdict; `gap` is the GapClass
-    value string on failure (None on pass)."""
+    value string on failure (None on pass). `planner_failed` marks an
+    inconclusive search, which `census_runner` never caches."""
 
     recipe: str
     skill: str
@@ -32,6 +35,7 @@ class CellResult:
     passed: bool
     reason: str
     gap: str | None
+    planner_failed: bool = False
 
 
 def run_cell(recipe: str, cell: CraftCell, game_data: GameData) -> CellResult:
@@ -42,7 +46,7 @@ def run_cell(recipe: str, cell: CraftCell, game_data: GameData) -> CellResult:
     if stats is None or not stats.crafting_skill:
         raise ValueError(f"{recipe} is not a craftable recipe")
     state = census_state(recipe, cell, game_data)
-    plan = plan_craft(recipe, state, game_data)
+    plan, planner_failed = plan_craft(recipe, state, game_data)
     verdict = craft_cell_verdict(recipe, plan, game_data)
     gap = None if verdict.passed else classify_gap(recipe, cell, game_data).value
     return CellResult(
@@ -54,6 +58,7 @@ def run_cell(recipe: str, cell: CraftCell, game_data: GameData) -> CellResult:
         passed=verdict.passed,
         reason=verdict.reason,
         gap=gap,
+        planner_failed=planner_failed,
     )
 
 
@@ -74,19 +79,40 @@ def craftable_recipes(game_data: GameData) -> list[str]:
     )
 
 
+def _run_work(work: tuple[str, CraftCell], game_data: GameData) -> CellResult:
+    """`run_cell` over one (recipe, cell) work item — the shape `run_cells`
+    fans out, so every cell of every recipe is its own unit of pool work."""
+    recipe, cell = work
+    return run_cell(recipe, cell, game_data)
+
+
 def run_census(
     game_data: GameData,
     recipes: list[str],
     progress: Callable[[int, int, str], None] | None = None,
+    *,
+    max_workers: int | None = None,
+    cache: CensusCache[CellResult] | None = None,
 ) -> list[CellResult]:
     """Run the census over `recipes`: for each, every grid cell. The caller
     supplies the recipe list (the generator passes `craftable_recipes(gd)`;
     tests pass a tiny explicit list). `progress(done, total, recipe)` is called
-    after each recipe if supplied."""
-    results: list[CellResult] = []
-    for i, recipe in enumerate(recipes):
-        for cell in craft_grid(recipe, game_data):
-            results.append(run_cell(recipe, cell, game_data))
-        if progress is not None:
-            progress(i + 1, len(recipes), recipe)
+    after each recipe if supplied, once its last cell is in.
+
+    The (recipe, cell) grid is flattened and handed to
+    `census_runner.run_cells`, which fans it across a process pool and serves
+    unchanged cells from `cache`; results keep recipe-then-grid order."""
+    grids = [craft_grid(recipe, game_data) for recipe in recipes]
+    work = [(recipe, cell) for recipe, grid in zip(recipes, grids, strict=True) for cell in grid]
+    ends = list(accumulate(len(grid) for grid in grids))
+    reported = 0
+
+    def on_cell(done: int, _total: int) -> None:
+        nonlocal reported
+        while progress is not None and reported < len(recipes) and ends[reported] <= done:
+            reported += 1
+            progress(reported, len(recipes), recipes[reported - 1])
+
+    results = run_cells(_run_work, work, game_data, max_workers=max_workers, cache=cache, progress=on_cell)
+    on_cell(len(work), len(work))  # recipes with an empty grid after the last cell
     return results
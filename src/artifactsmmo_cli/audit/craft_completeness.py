@@ -92,9 +92,10 @@ def craft_grid(recipe: str, game_data: GameData) -> list[CraftCell]:
 
 
 def plan_craft(recipe: str, state: WorldState,
-               game_data: GameData) -> list[Action]:
+               game_data: GameData) -> tuple[list[Action], bool]:
     """The plan the REAL production planner produces for obtaining `recipe`
-    from `state`.
+    from `state`, and whether its search was INCONCLUSIVE (budget timeout or
+    node cap — `goals_tried`'s `timed_out`, as `plan_inventory` reads it).
 
     Drives `StrategyArbiter._plans` — the EXACT per-goal planning seam the live
     bot runs: the `is_plannable` reachability gate, the directed craft generator
@@ -117,8 +118,9 @@ def plan_craft(recipe: str, state: WorldState,
         bank_accessible=True, bank_required_level=0, bank_unlock_monster=None,
         initial_xp=0, task_exchange_min_coins=0, combat_monster=None,
     )
-    return arbiter._plans(goal, state, game_data, actions, ctx,
+    plan = arbiter._plans(goal, state, game_data, actions, ctx,
                           budget_seconds=CRAFT_AUDIT_BUDGET_SECONDS)
+    return plan, any(bool(attempt.get("timed_out")) for attempt in arbiter.goals_tried)
 
 
 @dataclass(frozen=True)
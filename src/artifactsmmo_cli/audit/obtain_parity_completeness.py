@@ -100,6 +100,7 @@ from artifactsmmo_cli.ai.tiers.meta_goal import ObtainItem
 from artifactsmmo_cli.ai.tiers.objective import CharacterObjective
 from artifactsmmo_cli.ai.tiers.strategy import StrategyDecision
 from artifactsmmo_cli.ai.world_state import SKILL_NAMES, WorldState
+from artifactsmmo_cli.audit.census_runner import CensusCache, run_cells
 
 PARITY_AUDIT_BUDGET_SECONDS = 10.0
 """Per-cell A* budget — the arbiter's cheap first-pass value, so a cell plans
@@ -682,9 +683,13 @@ def run_cell(cell: ParityCell, game_data: GameData) -> ParityResult:
     )
 
 
-def run_census(game_data: GameData) -> list[ParityResult]:
-    """The whole grid, in enum order."""
-    return [run_cell(cell, game_data) for cell in parity_grid(game_data)]
+def run_census(game_data: GameData, *, max_workers: int | None = 1,
+               cache: CensusCache[ParityResult] | None = None) -> list[ParityResult]:
+    """The whole grid, in enum order, through `census_runner.run_cells`
+    (unchanged cells served from `cache` when one is given). In-process by
+    default: the grid is a handful of cells, so a pool costs more to spin up
+    than it saves."""
+    return run_cells(run_cell, parity_grid(game_data), game_data, max_workers=max_workers, cache=cache)
 
 
 def summary_line(results: list[ParityResult]) -> str:
@@ -75,6 +75,7 @@ from artifactsmmo_cli.ai.tiers.meta_goal import ObtainItem
 from artifactsmmo_cli.ai.tiers.objective import CharacterObjective
 from artifactsmmo_cli.ai.tiers.strategy import StrategyDecision
 from artifactsmmo_cli.ai.world_state import SKILL_NAMES, WorldState
+from artifactsmmo_cli.audit.census_runner import CensusCache, run_cells
 
 CENSUS_LEVEL = 10
 """Character level for every cell. Above `water_bow`'s level (5) so the source is
@@ -647,9 +648,13 @@ def run_cell(cell: RecycleSourceCell, game_data: GameData) -> RecycleSourceResul
     )
 
 
-def run_census(game_data: GameData) -> list[RecycleSourceResult]:
-    """The whole grid, in enum order."""
-    return [run_cell(cell, game_data) for cell in recycle_source_grid(game_data)]
+def run_census(game_data: GameData, *, max_workers: int | None = 1,
+               cache: CensusCache[RecycleSourceResult] | None = None) -> list[RecycleSourceResult]:
+    """The whole grid, in enum order, through `census_runner.run_cells`
+    (unchanged cells served from `cache` when one is given). In-process by
+    default: the grid is a handful of cells, so a pool costs more to spin up
+    than it saves."""
+    return run_cells(run_cell, recycle_source_grid(game_data), game_data, max_workers=max_workers, cache=cache)
 
 
 def summary_line(results: list[RecycleSourceResult]) -> str:
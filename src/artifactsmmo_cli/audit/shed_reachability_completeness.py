@@ -73,6 +73,7 @@ from artifactsmmo_cli.ai.tiers.meta_goal import ReachCharLevel
 from artifactsmmo_cli.ai.tiers.objective import CharacterObjective
 from artifactsmmo_cli.ai.tiers.strategy import StrategyDecision
 from artifactsmmo_cli.ai.world_state import SKILL_NAMES, WorldState
+from artifactsmmo_cli.audit.census_runner import CensusCache, run_cells
 
 CENSUS_LEVEL = 11
 """Character level for every cell — the live diagnosis character's level (R2D2,
@@ -591,9 +592,13 @@ def run_cell(cell: ShedCell, game_data: GameData) -> ShedResult:
     )
 
 
-def run_census(game_data: GameData) -> list[ShedResult]:
-    """The whole grid, in enum order."""
-    return [run_cell(cell, game_data) for cell in shed_grid(game_data)]
+def run_census(game_data: GameData, *, max_workers: int | None = 1,
+               cache: CensusCache[ShedResult] | None = None) -> list[ShedResult]:
+    """The whole grid, in enum order, through `census_runner.run_cells`
+    (unchanged cells served from `cache` when one is given). In-process by
+    default: the grid is a handful of cells, so a pool costs more to spin up
+    than it saves."""
+    return run_cells(run_cell, shed_grid(game_data), game_data, max_workers=max_workers, cache=cache)
 
 
 def summary_line(results: list[ShedResult]) -> str:
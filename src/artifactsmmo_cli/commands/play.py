@@ -5,10 +5,12 @@ import sys
 import threading
 import traceback
 from datetime import datetime
+from pathlib import Path
 
 import httpx
 import typer
 
+from artifactsmmo_cli.ai import memo_stats
 from artifactsmmo_cli.ai.file_tracer import FileTracer
 from artifactsmmo_cli.ai.game_data import GameData
 from artifactsmmo_cli.ai.learning.coordination_store import CoordinationStore
@@ -16,6 +18,7 @@ from artifactsmmo_cli.ai.learning.store import LearningStore
 from artifactsmmo_cli.ai.null_tracer import NullTracer
 from artifactsmmo_cli.ai.player import GamePlayer
 from artifactsmmo_cli.ai.recovery import StuckExit
+from artifactsmmo_cli.ai.slow_cycle_profiler import SlowCycleProfiler
 from artifactsmmo_cli.ai.tracer import Tracer
 from artifactsmmo_cli.api_wrapper import APIWrapper
 from artifactsmmo_cli.client_manager import ClientManager
@@ -76,6 +79,19 @@ def play(
     refresh_game_data: bool = typer.Option(
         False, "--refresh-game-data",
         help="Ignore the cached static game data and re-fetch from the API"),
+    profile_slow_cycles: float | None = typer.Option(
+        None, "--profile-slow-cycles", min=0.0,
+        help="Sample the planner's stacks on cycles whose decide runs longer "
+             "than this many seconds; writes one collapsed-stack file per slow "
+             "cycle next to the trace and summarises it in the trace record"),
+    record_states: int | None = typer.Option(
+        None, "--record-states", min=1,
+        help="Store the pre-decision state of every Nth cycle in the learning "
+             "DB, for the offline decision replay (formal/diff/decision_replay.py)"),
+    no_memo_stats: bool = typer.Option(
+        False, "--no-memo-stats",
+        help="Do not count memo hits and misses; the trace's per-cycle memo "
+             "report is then empty"),
 ) -> None:
     """Run the autonomous GOAP AI player for one character."""
     if all_characters and character is not None:
@@ -90,7 +106,10 @@ def play(
     if all_characters:
         MultiRun(verbose=verbose, dry_run=dry_run, trace=trace, learn=learn,
                  learn_db=learn_db, tui=tui,
-                 refresh_game_data=refresh_game_data).run()
+                 refresh_game_data=refresh_game_data,
+                 profile_slow_cycles=profile_slow_cycles,
+                 record_states=record_states,
+                 memo_stats=not no_memo_stats).run()
         return
     # The three checks above raise for every case where `character` could
     # still be None; mypy's flow analysis does not connect the two
@@ -113,9 +132,10 @@ def play(
 
     config = Config.from_token_file()
 
+    stamp = datetime.now().strftime('%Y%m%d-%H%M%S')
     tracer: Tracer = NullTracer()
     if trace:
-        path = trace_file or f"play-trace-{character}-{datetime.now().strftime('%Y%m%d-%H%M%S')}.jsonl"
+        path = trace_file or f"play-trace-{character}-{stamp}.jsonl"
         tracer = FileTracer(path)
         print(f"Tracing to {path}")
 
@@ -141,6 +161,16 @@ def play(
         game_data_ttl_minutes=config.game_data_ttl_minutes,
         refresh_game_data=refresh_game_data,
     )
+    if profile_slow_cycles is not None:
+        # Next to the trace, named after it; without one, where it would be.
+        base = str(Path(path).with_suffix("")) if trace else f"play-profile-{character}-{stamp}"
+        player.set_slow_cycle_profiler(SlowCycleProfiler(profile_slow_cycles, base))
+        print(f"Profiling decides slower than {profile_slow_cycles:g}s to {base}.cycle-<N>.folded")
+    if record_states is not None:
+        player.set_state_recording(record_states)
+    if no_memo_stats:
+        # Process-wide, like the counters themselves (`ai/memo_stats`).
+        memo_stats.set_enabled(False)
     if rate_budget is not None:
         budgets = BucketBudgets.from_json(rate_budget)
         player.set_rate_governors(
@@ -243,7 +273,7 @@ def _run_with_tui(
         client, ttl_minutes=game_data_ttl_minutes, force_refresh=refresh_game_data)
     app = WatchApp(characters=[character], game_data=player.game_data,
                    api=APIWrapper(client))
-    bridge = ThreadSafeBridge(app, app.update_snapshot, planning_handler=app.set_planning)
+    bridge = ThreadSafeBridge(app, app.queue_snapshot, planning_handler=app.set_planning)
     player.set_cycle_observer(bridge.notify)
     player.set_planning_observer(bridge.notify_planning)
 
@@ -20,6 +20,7 @@ from rich.table import Table
 from artifactsmmo_cli.ai.trace_stats import (
     TraceStats,
     analyze,
+    analyze_memo,
     analyze_tree_divergence,
     list_sessions,
     load_cycles_from_db,
@@ -108,6 +109,24 @@ def _section_planner(s: TraceStats, top: int) -> Table:
     return t
 
 
+def _section_memo(s: TraceStats) -> Table | None:
+    """Memo hit rates, coldest first — populated only from `--trace-file`
+    (the counters are traced-only); omitted otherwise."""
+    if not s.memo:
+        return None
+    t = Table(title="Memo hit rates (coldest first)")
+    t.add_column("layer")
+    t.add_column("hit rate", justify="right")
+    t.add_column("hits", justify="right")
+    t.add_column("misses", justify="right")
+    t.add_column("max size", justify="right")
+    t.add_column("saved (s)", justify="right")
+    for m in s.memo:
+        t.add_row(m.layer, f"{100.0 * m.hit_rate:.1f}%", str(m.hits), str(m.misses),
+                  str(m.max_size) if m.max_size >= 0 else "-", f"{m.saved_ms / 1000.0:.1f}")
+    return t
+
+
 def _section_fights(s: TraceStats) -> Table | None:
     if not s.fight_attempts and not s.fight_losses:
         return None
@@ -221,15 +240,15 @@ def summary(
     top: int = typer.Option(10, "--top", "-n",
                             help="Top-N row count for ranked tables"),
     planner_only: bool = typer.Option(False, "--planner-only",
-                                      help="Show only the planner load table"),
+                                      help="Show only the planner load and memo hit-rate tables"),
     goals_only: bool = typer.Option(False, "--goals-only",
                                     help="Show only the selected-goal distribution"),
     trace_file: str | None = typer.Option(
         None, "--trace-file",
         help="Path to a trace JSONL log (e.g. play-trace-<char>.jsonl) — "
-             "enables the progression-tree shadow divergence section, "
-             "which the DB alone cannot populate (the shadow decision is "
-             "traced-only, never persisted to the learning store)"),
+             "enables the progression-tree shadow divergence and memo "
+             "hit-rate sections, which the DB alone cannot populate (both "
+             "are traced-only, never persisted to the learning store)"),
 ) -> None:
     """Summarise GOAP session data from the SQLite learning store.
 
@@ -251,18 +270,23 @@ def summary(
     s = analyze(cycles)
 
     if trace_file is not None:
-        tree_stats = analyze_tree_divergence(load_trace_records(trace_file))
+        records = load_trace_records(trace_file)
+        s.memo = analyze_memo(records)
+        tree_stats = analyze_tree_divergence(records)
         s.tree_dual_cycles = tree_stats.tree_dual_cycles
         s.tree_agree = tree_stats.tree_agree
         s.tree_branch_counts = tree_stats.tree_branch_counts
         s.tree_divergent_pairs = tree_stats.tree_divergent_pairs
 
-    if s.cycles == 0 and not s.tree_dual_cycles:
+    if s.cycles == 0 and not s.tree_dual_cycles and not s.memo:
         console.print("[yellow]no cycles matched the filter[/yellow]")
         return
 
     if planner_only:
         console.print(_section_planner(s, top))
+        memo = _section_memo(s)
+        if memo is not None:
+            console.print(memo)
         return
     if goals_only:
         console.print(_section_goals(s, top))
@@ -275,6 +299,7 @@ def summary(
         _section_goals(s, top),
         _section_actions(s, top),
         _section_planner(s, top),
+        _section_memo(s),
         _section_fights(s),
         _section_fight_losses(s),
         _section_inventory_events(s),
@@ -1,8 +1,9 @@
 """Grand Exchange trading commands."""
 
+import sqlite3
 import statistics
 from collections import defaultdict
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any
 
 import httpx
@@ -26,11 +27,14 @@ from artifactsmmo_api_client.models.error_response_schema import ErrorResponseSc
 from artifactsmmo_api_client.models.ge_buy_order_schema import GEBuyOrderSchema
 from artifactsmmo_api_client.models.ge_cancel_order_schema import GECancelOrderSchema
 from artifactsmmo_api_client.models.ge_order_creation_schema import GEOrderCreationSchema
+from artifactsmmo_api_client.models.ge_order_type import GEOrderType
 from artifactsmmo_api_client.types import UNSET
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
+from artifactsmmo_cli.ai.game_data_cache import GameDataCache
+from artifactsmmo_cli.ai.ge_market_store import SIDES, BookOrder, GeMarketStore, PriceSample, book_order
 from artifactsmmo_cli.client_manager import ClientManager
 from artifactsmmo_cli.utils.api_display import display_field
 from artifactsmmo_cli.utils.formatters import (
@@ -54,6 +58,96 @@ console = Console()
 GE_ORDERS_PAGE_SIZE = 100
 
 
+# Local order book (ai/ge_market_store): the file every `play` child syncs at
+# boot. When it holds a fresh full book the market commands read it instead of
+# spending a request on one page of it.
+def _market_store(create: bool = False) -> GeMarketStore | None:
+    """The shared GE store for the configured API host, or None when there is
+    no usable one: the client is not configured, or the file cannot be opened.
+
+    Only `ge-sync` (`create`) may make the file. The other market commands
+    only read, and a missing file means there is no book to read."""
+    try:
+        base_url = ClientManager().config.api_base_url
+    except RuntimeError:  # not initialised: no host to name the file after
+        return None
+    path = GameDataCache(api_base_url=base_url).ge_market_path
+    if not create and not path.exists():
+        return None
+    try:
+        return GeMarketStore(path)
+    except (OSError, sqlite3.Error):
+        return None
+
+
+def _market_orders(client: Any) -> tuple[list[Any], str | None]:
+    """Open orders for a market-wide analysis, and an error message or None.
+
+    The whole local book when both sides were synced within
+    `GE_SYNC_TTL_SECONDS`; otherwise, or when the store cannot be read (locked,
+    corrupt), one live page, as before the store."""
+    store = _market_store()
+    if store is not None:
+        try:
+            if store.is_fresh(datetime.now(tz=timezone.utc)):
+                return list(store.book()), None
+        except sqlite3.Error:
+            pass
+    response = get_ge_orders_grandexchange_orders_get.sync(client=client, size=GE_ORDERS_PAGE_SIZE)
+    cli_response = handle_api_response(response)
+    if not (cli_response.success and cli_response.data):
+        return [], cli_response.error or "Could not retrieve market data"
+    return (cli_response.data.data if hasattr(cli_response.data, "data") else []), None
+
+
+def _price_trend(item_code: str) -> list[PriceSample]:
+    """The local best-sell samples of `item_code`; none when there is no store
+    or it cannot be read."""
+    store = _market_store()
+    if store is None:
+        return []
+    try:
+        return store.price_history(item_code, "sell")
+    except sqlite3.Error:
+        return []
+
+
+def _record_item_book(item_code: str, orders: list[Any]) -> None:
+    """Feed one item's fetched orders into the local book, if there is one:
+    `record_book`'s per-code diff updates that item's rows and samples its
+    price history between full `ge-sync`s, for no extra request. A full page
+    may be only part of the item's book, so it is not recorded."""
+    if len(orders) >= GE_ORDERS_PAGE_SIZE:
+        return
+    store = _market_store()
+    if store is None:
+        return
+    now = datetime.now(tz=timezone.utc)
+    book = [book_order(order) for order in orders]
+    try:
+        for side in SIDES:
+            store.record_book(side, book, now, code=item_code)
+    except sqlite3.Error:
+        pass
+
+
+def _fetch_book(client: Any, order_type: GEOrderType) -> list[BookOrder]:
+    """Page one whole side of the live order book."""
+    out: list[BookOrder] = []
+    page = 1
+    while True:
+        result = get_ge_orders_grandexchange_orders_get.sync(
+            client=client, type_=order_type, page=page, size=GE_ORDERS_PAGE_SIZE
+        )
+        if result is None or not result.data:
+            break
+        out.extend(book_order(order) for order in result.data)
+        if len(result.data) < GE_ORDERS_PAGE_SIZE:
+            break
+        page += 1
+    return out
+
+
 # Market Analysis Helper Functions
 def calculate_price_stats(orders: list[Any]) -> dict[str, float]:
     """Calculate price statistics from orders."""
@@ -160,7 +254,11 @@ def format_price_table(item_code: str, orders: list[Any]) -> Table:
         created_date = ""
         if hasattr(order, "created_at"):
             try:
-                created_date = datetime.fromisoformat(order.created_at.replace("Z", "+00:00")).strftime("%m/%d %H:%M")
+                # The API model parses `created_at`; older payloads carry the ISO text.
+                created = order.created_at
+                if not isinstance(created, datetime):
+                    created = datetime.fromisoformat(created.replace("Z", "+00:00"))
+                created_date = created.strftime("%m/%d %H:%M")
             except ValueError:
                 created_date = "Unknown"
 
@@ -573,6 +671,7 @@ def analyze_item_market(
 
         if orders_cli_response.success and orders_cli_response.data:
             orders = orders_cli_response.data.data if hasattr(orders_cli_response.data, "data") else []
+            _record_item_book(item_code, orders)
 
         if history_cli_response.success and history_cli_response.data:
             history = history_cli_response.data.data if hasattr(history_cli_response.data, "data") else []
@@ -613,6 +712,12 @@ def analyze_item_market(
             elif recent_volume < 5:
                 insights.append("😴 Low trading activity")
 
+        trend = _price_trend(item_code)
+        if len(trend) >= 2 and trend[0].best_price is not None and trend[-1].best_price is not None:
+            insights.append(
+                f"📊 Best sell {trend[0].best_price}g → {trend[-1].best_price}g over {len(trend)} local samples"
+            )
+
         if insights:
             console.print("\n[bold cyan]Market Insights:[/bold cyan]")
             for insight in insights:
@@ -624,6 +729,29 @@ def analyze_item_market(
         raise typer.Exit(1)
 
 
+@app.command("ge-sync")
+def sync_market() -> None:
+    """Page the whole GE order book into the local store `play` children share."""
+    try:
+        client = ClientManager().client
+        store = _market_store(create=True)
+        if store is None:
+            console.print(format_error_message("No local market store for this API host"))
+            raise typer.Exit(1)
+        now = datetime.now(tz=timezone.utc)
+        rows = []
+        for order_type in (GEOrderType.BUY, GEOrderType.SELL):
+            book = _fetch_book(client, order_type)
+            changed = store.record_book(order_type.value, book, now)
+            rows.append([order_type.value, str(len(book)), str(changed)])
+        console.print(format_table(["Side", "Open Orders", "Changed"], rows, title="GE Market Sync"))
+
+    except (ValueError, UnexpectedStatus, httpx.HTTPError, sqlite3.Error) as e:
+        cli_response = handle_api_error(e)
+        console.print(format_error_message(cli_response.error or str(e)))
+        raise typer.Exit(1)
+
+
 @app.command("trending")
 def show_trending_items(
     limit: int = typer.Option(10, "--limit", help="Number of items to show"),
@@ -632,47 +760,42 @@ def show_trending_items(
     try:
         client = ClientManager().client
 
-        response = get_ge_orders_grandexchange_orders_get.sync(client=client, size=GE_ORDERS_PAGE_SIZE)
-
-        cli_response = handle_api_response(response)
-        if cli_response.success and cli_response.data:
-            orders = cli_response.data.data if hasattr(cli_response.data, "data") else []
+        orders, error = _market_orders(client)
+        if error is not None:
+            console.print(format_error_message(error))
+            return
 
-            if orders:
-                # Count orders by item
-                item_activity: defaultdict[str, dict[str, float]] = defaultdict(
-                    lambda: {"orders": 0, "total_quantity": 0, "avg_price": 0}
-                )
+        if orders:
+            # Count orders by item
+            item_activity: defaultdict[str, dict[str, float]] = defaultdict(
+                lambda: {"orders": 0, "total_quantity": 0, "avg_price": 0}
+            )
 
-                for order in orders:
-                    code = getattr(order, "code", "unknown")
-                    quantity = getattr(order, "quantity", 0)
-                    price = getattr(order, "price", 0)
+            for order in orders:
+                code = getattr(order, "code", "unknown")
+                quantity = getattr(order, "quantity", 0)
+                price = getattr(order, "price", 0)
 
-                    item_activity[code]["orders"] += 1
-                    item_activity[code]["total_quantity"] += quantity
-                    item_activity[code]["avg_price"] = (
-                        item_activity[code]["avg_price"] * (item_activity[code]["orders"] - 1) + price
-                    ) / item_activity[code]["orders"]
+                item_activity[code]["orders"] += 1
+                item_activity[code]["total_quantity"] += quantity
+                item_activity[code]["avg_price"] = (
+                    item_activity[code]["avg_price"] * (item_activity[code]["orders"] - 1) + price
+                ) / item_activity[code]["orders"]
 
-                # Sort by number of orders (activity)
-                trending = sorted(item_activity.items(), key=lambda x: x[1]["orders"], reverse=True)[:limit]
+            # Sort by number of orders (activity)
+            trending = sorted(item_activity.items(), key=lambda x: x[1]["orders"], reverse=True)[:limit]
 
-                # Create table
-                headers = ["Item", "Active Orders", "Total Quantity", "Avg Price"]
-                rows = []
+            # Create table
+            headers = ["Item", "Active Orders", "Total Quantity", "Avg Price"]
+            rows = []
 
-                for item, stats in trending:
-                    rows.append(
-                        [item, str(stats["orders"]), str(stats["total_quantity"]), f"{stats['avg_price']:.0f}g"]
-                    )
+            for item, stats in trending:
+                rows.append([item, str(stats["orders"]), str(stats["total_quantity"]), f"{stats['avg_price']:.0f}g"])
 
-                output = format_table(headers, rows, title="Trending Items (Most Active)")
-                console.print(output)
-            else:
-                console.print(format_error_message("No orders found"))
+            output = format_table(headers, rows, title="Trending Items (Most Active)")
+            console.print(output)
         else:
-            console.print(format_error_message(cli_response.error or "Could not retrieve market data"))
+            console.print(format_error_message("No orders found"))
 
     except (ValueError, UnexpectedStatus, httpx.HTTPError) as e:
         cli_response = handle_api_error(e)
@@ -689,29 +812,24 @@ def show_trade_opportunities(
     try:
         client = ClientManager().client
 
-        response = get_ge_orders_grandexchange_orders_get.sync(client=client, size=GE_ORDERS_PAGE_SIZE)
-
-        cli_response = handle_api_response(response)
-        if cli_response.success and cli_response.data:
-            orders = cli_response.data.data if hasattr(cli_response.data, "data") else []
+        orders, error = _market_orders(client)
+        if error is not None:
+            console.print(format_error_message(error))
+            return
 
-            if orders:
-                opportunities = find_arbitrage_opportunities(orders, min_margin)
+        if orders:
+            opportunities = find_arbitrage_opportunities(orders, min_margin)
 
-                if opportunities:
-                    table = format_opportunities_table(opportunities[:limit])
-                    console.print(table)
+            if opportunities:
+                table = format_opportunities_table(opportunities[:limit])
+                console.print(table)
 
-                    count = min(len(opportunities), limit)
-                    console.print(
-                        f"\n[dim]Showing top {count} opportunities with ≥{min_margin:.0%} margin[/dim]"
-                    )
-                else:
-                    console.print(format_error_message(f"No opportunities found with ≥{min_margin:.0%} profit margin"))
+                count = min(len(opportunities), limit)
+                console.print(f"\n[dim]Showing top {count} opportunities with ≥{min_margin:.0%} margin[/dim]")
             else:
-                console.print(format_error_message("No orders found"))
+                console.print(format_error_message(f"No opportunities found with ≥{min_margin:.0%} profit margin"))
         else:
-            console.print(format_error_message(cli_response.error or "Could not retrieve market data"))
+            console.print(format_error_message("No orders found"))
 
     except (ValueError, UnexpectedStatus, httpx.HTTPError) as e:
         cli_response = handle_api_error(e)
@@ -727,63 +845,60 @@ def show_price_spreads(
     try:
         client = ClientManager().client
 
-        response = get_ge_orders_grandexchange_orders_get.sync(client=client, size=GE_ORDERS_PAGE_SIZE)
+        orders, error = _market_orders(client)
+        if error is not None:
+            console.print(format_error_message(error))
+            return
 
-        cli_response = handle_api_response(response)
-        if cli_response.success and cli_response.data:
-            orders = cli_response.data.data if hasattr(cli_response.data, "data") else []
+        if orders:
+            # Group by item and calculate spreads
+            item_spreads = {}
+            items = defaultdict(list)
+
+            for order in orders:
+                code = getattr(order, "code", "unknown")
+                price = getattr(order, "price", 0)
+                items[code].append(price)
+
+            for item, prices in items.items():
+                if len(prices) >= 2:
+                    min_price = min(prices)
+                    max_price = max(prices)
+                    spread = max_price - min_price
+                    spread_pct = (spread / min_price * 100) if min_price > 0 else 0
+
+                    item_spreads[item] = {
+                        "min_price": min_price,
+                        "max_price": max_price,
+                        "spread": spread,
+                        "spread_pct": spread_pct,
+                    }
+
+            # Sort by spread percentage
+            sorted_spreads = sorted(item_spreads.items(), key=lambda x: x[1]["spread_pct"], reverse=True)[:limit]
+
+            if sorted_spreads:
+                # Create table
+                headers = ["Item", "Min Price", "Max Price", "Spread", "Spread %"]
+                rows = []
 
-            if orders:
-                # Group by item and calculate spreads
-                item_spreads = {}
-                items = defaultdict(list)
+                for item, data in sorted_spreads:
+                    rows.append(
+                        [
+                            item,
+                            f"{data['min_price']:.0f}g",
+                            f"{data['max_price']:.0f}g",
+                            f"{data['spread']:.0f}g",
+                            f"{data['spread_pct']:.1f}%",
+                        ]
+                    )
 
-                for order in orders:
-                    code = getattr(order, "code", "unknown")
-                    price = getattr(order, "price", 0)
-                    items[code].append(price)
-
-                for item, prices in items.items():
-                    if len(prices) >= 2:
-                        min_price = min(prices)
-                        max_price = max(prices)
-                        spread = max_price - min_price
-                        spread_pct = (spread / min_price * 100) if min_price > 0 else 0
-
-                        item_spreads[item] = {
-                            "min_price": min_price,
-                            "max_price": max_price,
-                            "spread": spread,
-                            "spread_pct": spread_pct,
-                        }
-
-                # Sort by spread percentage
-                sorted_spreads = sorted(item_spreads.items(), key=lambda x: x[1]["spread_pct"], reverse=True)[:limit]
-
-                if sorted_spreads:
-                    # Create table
-                    headers = ["Item", "Min Price", "Max Price", "Spread", "Spread %"]
-                    rows = []
-
-                    for item, data in sorted_spreads:
-                        rows.append(
-                            [
-                                item,
-                                f"{data['min_price']:.0f}g",
-                                f"{data['max_price']:.0f}g",
-                                f"{data['spread']:.0f}g",
-                                f"{data['spread_pct']:.1f}%",
-                            ]
-                        )
-
-                    output = format_table(headers, rows, title="Best Price Spreads")
-                    console.print(output)
-                else:
-                    console.print(format_error_message("No items with multiple price points found"))
+                output = format_table(headers, rows, title="Best Price Spreads")
+                console.print(output)
             else:
-                console.print(format_error_message("No orders found"))
+                console.print(format_error_message("No items with multiple price points found"))
         else:
-            console.print(format_error_message(cli_response.error or "Could not retrieve market data"))
+            console.print(format_error_message("No orders found"))
 
     except (ValueError, UnexpectedStatus, httpx.HTTPError) as e:
         cli_response = handle_api_error(e)
@@ -39,6 +39,11 @@ class Config(BaseModel):
                 f"Create a {token_path} file or set ARTIFACTSMMO_TOKEN environment variable."
             )
 
+        # ARTIFACTSMMO_API_URL points every client at another server, e.g. the
+        # offline stand-in (formal/sim/standin_server.py) for load testing.
+        api_base_url = os.getenv("ARTIFACTSMMO_API_URL")
+        if api_base_url:
+            return cls(token=token, api_base_url=api_base_url)
         return cls(token=token)
 
     def get_auth_headers(self) -> dict[str, str]:
@@ -1,29 +1,81 @@
 """Main CLI entry point for ArtifactsMMO CLI."""
 
+import importlib
 import sys
 from pathlib import Path
+from typing import Any
 
 import httpx
 import typer
+import typer.main
 from artifactsmmo_api_client.errors import UnexpectedStatus
 from rich.console import Console
+from typer.core import TyperGroup
 
 from artifactsmmo_cli import __version__
 from artifactsmmo_cli.client_manager import ClientManager
-from artifactsmmo_cli.commands import account, action, bank, character, craft, info, stats, task, trade
-from artifactsmmo_cli.commands.combat_deficit_report import combat_deficit_command
-from artifactsmmo_cli.commands.combat_loadout_report import combat_loadout_report_command
-from artifactsmmo_cli.commands.macro_research import macro_research as macro_research_command
-from artifactsmmo_cli.commands.objective import objective as objective_command
-from artifactsmmo_cli.commands.plan import plan as plan_command
-from artifactsmmo_cli.commands.play import play as play_command
 from artifactsmmo_cli.config import Config
 from artifactsmmo_cli.server_unavailable_error import ServerUnavailableError
 from artifactsmmo_cli.utils.formatters import format_error_message
 
+# Every command module, by the name it is invoked as: (module, attribute, help).
+# An attribute naming a `typer.Typer` is a command group; anything else is a
+# single command. Nothing here is imported until the command is dispatched, so
+# `bank list` does not load the planner, Textual and SQLModel `play` needs, and
+# neither does a `play --all` child paying for the other commands' imports.
+# `scripts/import_budget.py` holds the entry point's import time to a budget.
+LAZY_COMMANDS: dict[str, tuple[str, str, str]] = {
+    "play": ("artifactsmmo_cli.commands.play", "play", "Run the autonomous AI player"),
+    "plan": ("artifactsmmo_cli.commands.plan", "plan",
+             "Print the plan the AI would execute this cycle (no actions)"),
+    "objective": ("artifactsmmo_cli.commands.objective", "objective",
+                  "Print the unified objective's candidate ranking and which key decided it (read-only)"),
+    "macro-research": ("artifactsmmo_cli.commands.macro_research", "macro_research",
+                       "Analyze learning.db for recurring progression macros (read-only)"),
+    "combat-deficit": ("artifactsmmo_cli.commands.combat_deficit_report", "combat_deficit_command",
+                       "Why a character loses a fight and which acquisitions close the gap (read-only)"),
+    "combat-loadout-report": ("artifactsmmo_cli.commands.combat_loadout_report", "combat_loadout_report_command",
+                              "Per-task predict_win calibration + which loadouts won (read-only)"),
+    "character": ("artifactsmmo_cli.commands.character", "app", "Character management commands"),
+    "action": ("artifactsmmo_cli.commands.action", "app", "Character action commands"),
+    "bank": ("artifactsmmo_cli.commands.bank", "app", "Bank operation commands"),
+    "trade": ("artifactsmmo_cli.commands.trade", "app", "Grand Exchange trading commands"),
+    "craft": ("artifactsmmo_cli.commands.craft", "app", "Crafting and recycling commands"),
+    "task": ("artifactsmmo_cli.commands.task", "app", "Task management commands"),
+    "info": ("artifactsmmo_cli.commands.info", "app", "Information and lookup commands"),
+    "account": ("artifactsmmo_cli.commands.account", "app", "Account management commands"),
+    "stats": ("artifactsmmo_cli.commands.stats", "app", "Inspect AI session traces (traces.jsonl)"),
+}
+
+
+class LazyGroup(TyperGroup):
+    """The root group: `LAZY_COMMANDS` are imported and built on first
+    lookup. Listing them all (`--help`) imports them all.
+
+    `ctx` and the returned command are click types, which typer re-exports
+    from `click` or vendors depending on its release; `Any` spans both."""
+
+    def list_commands(self, ctx: Any) -> list[str]:
+        return [*LAZY_COMMANDS, *super().list_commands(ctx)]
+
+    def get_command(self, ctx: Any, cmd_name: str) -> Any:
+        if cmd_name not in LAZY_COMMANDS:
+            return super().get_command(ctx, cmd_name)
+        module, attribute, help_text = LAZY_COMMANDS[cmd_name]
+        target = getattr(importlib.import_module(module), attribute)
+        if isinstance(target, typer.Typer):
+            group = typer.main.get_group(target)
+            group.name, group.help = cmd_name, help_text
+            return group
+        single = typer.Typer(add_completion=False, rich_markup_mode="rich")
+        single.command(cmd_name, help=help_text)(target)
+        return typer.main.get_command(single)
+
+
 # Create the main Typer app
 app = typer.Typer(
-    name="artifactsmmo", help="CLI interface for ArtifactsMMO game", add_completion=True, rich_markup_mode="rich"
+    name="artifactsmmo", help="CLI interface for ArtifactsMMO game", add_completion=True, rich_markup_mode="rich",
+    cls=LazyGroup,
 )
 
 console = Console()
@@ -49,37 +101,6 @@ def run() -> None:
         sys.exit(SERVER_UNAVAILABLE_EXIT_CODE)
 
 
-# Register command groups
-app.add_typer(character.app, name="character", help="Character management commands")
-app.add_typer(action.app, name="action", help="Character action commands")
-app.add_typer(bank.app, name="bank", help="Bank operation commands")
-app.add_typer(trade.app, name="trade", help="Grand Exchange trading commands")
-app.add_typer(craft.app, name="craft", help="Crafting and recycling commands")
-app.add_typer(task.app, name="task", help="Task management commands")
-app.add_typer(info.app, name="info", help="Information and lookup commands")
-app.add_typer(account.app, name="account", help="Account management commands")
-app.command("play", help="Run the autonomous AI player")(play_command)
-app.command("plan", help="Print the plan the AI would execute this cycle (no actions)")(plan_command)
-app.command("objective",
-            help="Print the unified objective's candidate ranking and which key "
-                 "decided it (read-only)")(
-    objective_command
-)
-app.command("macro-research", help="Analyze learning.db for recurring progression macros (read-only)")(
-    macro_research_command
-)
-app.command("combat-deficit",
-            help="Why a character loses a fight and which acquisitions close the "
-                 "gap (read-only)")(
-    combat_deficit_command
-)
-app.command("combat-loadout-report",
-            help="Per-task predict_win calibration + which loadouts won (read-only)")(
-    combat_loadout_report_command
-)
-app.add_typer(stats.app, name="stats", help="Inspect AI session traces (traces.jsonl)")
-
-
 @app.callback()
 def main(
     ctx: typer.Context,
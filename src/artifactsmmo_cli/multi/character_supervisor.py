@@ -6,8 +6,16 @@ from collections.abc import Awaitable, Callable
 
 from pydantic import ValidationError
 
-from artifactsmmo_cli.multi.child_event import ChildEvent, ExitEvent, parse_child_event
+from artifactsmmo_cli.multi.child_event import (
+    DELTA_VERSION,
+    ChildEvent,
+    DeltaEvent,
+    ExitEvent,
+    SnapshotEvent,
+    parse_child_event,
+)
 from artifactsmmo_cli.multi.restart_policy import RestartPolicy
+from artifactsmmo_cli.multi.snapshot_delta import apply_delta
 
 STDERR_TAIL_LINES = 20
 
@@ -17,7 +25,8 @@ DEFAULT_STREAM_LIMIT = 8 * 1024 * 1024
 for a 300-node plan_tree + grind_expansion with 200 bank_items measured
 51,725 bytes -- 79% of the default -- at plausible late-game values. Past the
 configured limit, `StreamReader.readline()` raises `ValueError` rather than
-returning the line; 8 MiB leaves generous headroom for growth."""
+returning the line; 8 MiB leaves generous headroom for growth. Only keyframes
+are that size since the stream went delta-encoded (`snapshot_delta`)."""
 
 TERMINATE_TIMEOUT_SECONDS = 5.0
 """How long to wait for a graceful SIGTERM before escalating to SIGKILL."""
@@ -149,6 +158,9 @@ class CharacterSupervisor:
     async def _read_events(
         self, stream: asyncio.StreamReader, reason_box: list[str]
     ) -> None:
+        # The last snapshot this child sent, what its next delta applies to.
+        # Local, so a restarted child starts from its own first keyframe.
+        last: SnapshotEvent | None = None
         while True:
             try:
                 raw = await stream.readline()
@@ -171,10 +183,37 @@ class CharacterSupervisor:
             except ValidationError as exc:
                 self._stderr.append(f"protocol error: {line[:120]} ({exc.error_count()} errors)")
                 continue
+            if isinstance(event, DeltaEvent):
+                rebuilt = self._rebuild(last, event)
+                if rebuilt is None:
+                    # Every delta until the next keyframe is against a
+                    # snapshot this side never had.
+                    last = None
+                    continue
+                event = rebuilt
+            if isinstance(event, SnapshotEvent):
+                last = event
             if isinstance(event, ExitEvent):
                 reason_box.append(event.reason)
             self._on_event(event)
 
+    def _rebuild(self, last: SnapshotEvent | None, delta: DeltaEvent) -> SnapshotEvent | None:
+        """`delta` applied to `last` as the snapshot consumers see; None, with
+        the protocol error recorded, when it does not apply."""
+        if delta.version != DELTA_VERSION:
+            problem = f"delta {delta.seq} is version {delta.version}, expected {DELTA_VERSION}"
+        elif last is None or delta.seq != last.seq + 1:
+            problem = f"delta {delta.seq} without its base snapshot"
+        else:
+            try:
+                payload = apply_delta(last.payload, delta)
+            except ValueError as exc:
+                problem = f"delta {delta.seq} does not apply ({exc})"
+            else:
+                return SnapshotEvent(character=delta.character, payload=payload, seq=delta.seq)
+        self._stderr.append(f"protocol error: {problem}")
+        return None
+
     async def _read_stderr(self, stream: asyncio.StreamReader) -> None:
         while True:
             raw = await stream.readline()
@@ -4,19 +4,48 @@ writes to stdout and the `play --all` supervisor reads.
 Schema module: a discriminated union plus its variants, no behavior.
 `CycleSnapshot` is already a pydantic model, so the wire format is generated
 from it rather than hand-written, and cannot drift from it.
+
+Snapshots travel as a keyframe (`SnapshotEvent`, the whole snapshot) followed
+by deltas (`DeltaEvent`, the fields that changed) numbered by `seq`; see
+`snapshot_delta` for the encoding and the supervisor for reassembly.
 """
 
-from typing import Annotated, Literal
+from typing import Annotated, Any, Literal
 
 from pydantic import BaseModel, Field, TypeAdapter
 
 from artifactsmmo_cli.ai.cycle_snapshot import CycleSnapshot
 
+DELTA_VERSION = 1
+"""Bumped whenever `DeltaEvent`'s encoding changes meaning; a supervisor
+drops a delta of any other version rather than misapply it."""
+
 
 class SnapshotEvent(BaseModel):
     kind: Literal["snapshot"] = "snapshot"
     character: str
     payload: CycleSnapshot
+    seq: int = 0
+    """This snapshot's number in the child's stream; the next delta is `seq + 1`."""
+
+
+class EntryDelta(BaseModel):
+    """The entries of one mapping field that changed: `changed` set, `removed` dropped."""
+
+    changed: dict[str, Any] = Field(default_factory=dict)
+    removed: list[str] = Field(default_factory=list)
+
+
+class DeltaEvent(BaseModel):
+    """The snapshot numbered `seq`, as its changes from the one numbered
+    `seq - 1`: `fields` replace whole fields, `entries` patch mapping fields."""
+
+    kind: Literal["delta"] = "delta"
+    character: str
+    seq: int
+    version: int = DELTA_VERSION
+    fields: dict[str, Any] = Field(default_factory=dict)
+    entries: dict[str, EntryDelta] = Field(default_factory=dict)
 
 
 class PlanningEvent(BaseModel):
@@ -35,7 +64,7 @@ class ExitEvent(BaseModel):
 
 
 ChildEvent = Annotated[
-    SnapshotEvent | PlanningEvent | ExitEvent, Field(discriminator="kind")
+    SnapshotEvent | DeltaEvent | PlanningEvent | ExitEvent, Field(discriminator="kind")
 ]
 
 _ADAPTER: TypeAdapter[ChildEvent] = TypeAdapter(ChildEvent)
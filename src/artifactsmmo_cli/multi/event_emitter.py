@@ -1,13 +1,15 @@
 """JsonlEventEmitter: writes ChildEvent lines to a stream, one per line."""
 
-from typing import TextIO
+from typing import Any, TextIO
 
 from artifactsmmo_cli.ai.cycle_snapshot import CycleSnapshot
 from artifactsmmo_cli.multi.child_event import (
+    DeltaEvent,
     ExitEvent,
     PlanningEvent,
     SnapshotEvent,
 )
+from artifactsmmo_cli.multi.snapshot_delta import KEYFRAME_INTERVAL, diff
 
 
 class JsonlEventEmitter:
@@ -15,20 +17,33 @@ class JsonlEventEmitter:
 
     Every line is flushed: the supervisor reads this stream live, so a buffered
     write would stall the TUI until the buffer filled or the child exited.
+
+    Snapshots go out as a keyframe every `KEYFRAME_INTERVAL` and deltas
+    against the previous snapshot in between (`snapshot_delta`).
     """
 
     def __init__(self, character: str, stream: TextIO) -> None:
         self._character = character
         self._stream = stream
+        self._seq = 0
+        # The last snapshot sent, as JSON-mode data: what the next delta is against.
+        self._previous: dict[str, Any] | None = None
 
     def _write(self, payload: str) -> None:
         self._stream.write(payload + "\n")
         self._stream.flush()
 
     def snapshot(self, snap: CycleSnapshot) -> None:
-        self._write(
-            SnapshotEvent(character=self._character, payload=snap).model_dump_json()
-        )
+        self._seq += 1
+        current = snap.model_dump(mode="json")
+        if self._previous is None or (self._seq - 1) % KEYFRAME_INTERVAL == 0:
+            event: SnapshotEvent | DeltaEvent = SnapshotEvent(
+                character=self._character, payload=snap, seq=self._seq)
+        else:
+            fields, entries = diff(self._previous, current)
+            event = DeltaEvent(character=self._character, seq=self._seq, fields=fields, entries=entries)
+        self._previous = current
+        self._write(event.model_dump_json())
 
     def planning(self, active: bool) -> None:
         self._write(
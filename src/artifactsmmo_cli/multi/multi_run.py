@@ -34,7 +34,9 @@ class MultiRun:
     """
 
     def __init__(self, verbose: bool, dry_run: bool, trace: bool, learn: bool,
-                 learn_db: str | None, tui: bool, refresh_game_data: bool) -> None:
+                 learn_db: str | None, tui: bool, refresh_game_data: bool,
+                 profile_slow_cycles: float | None = None, record_states: int | None = None,
+                 memo_stats: bool = True) -> None:
         self._verbose = verbose
         self._dry_run = dry_run
         self._trace = trace
@@ -42,6 +44,9 @@ class MultiRun:
         self._learn_db = learn_db
         self._tui = tui
         self._refresh_game_data = refresh_game_data
+        self._profile_slow_cycles = profile_slow_cycles
+        self._record_states = record_states
+        self._memo_stats = memo_stats
         self._app: WatchApp | None = None
         # The ONE on-disk path every child's CoordinationStore opens, computed
         # lazily and memoized for the life of this MultiRun — see
@@ -110,6 +115,12 @@ class MultiRun:
                 argv += ["--learn-db", self._learn_db]
         if self._refresh_game_data:
             argv.append("--refresh-game-data")
+        if self._profile_slow_cycles is not None:
+            argv += ["--profile-slow-cycles", str(self._profile_slow_cycles)]
+        if self._record_states is not None:
+            argv += ["--record-states", str(self._record_states)]
+        if not self._memo_stats:
+            argv.append("--no-memo-stats")
         return argv
 
     def build_pool(self, characters: list[str], rates: dict[str, Any]) -> SupervisorPool:
@@ -148,7 +159,7 @@ class MultiRun:
         if self._app is None:
             return
         if isinstance(event, SnapshotEvent):
-            self._app.update_snapshot(event.payload)
+            self._app.queue_snapshot(event.payload)
         elif isinstance(event, PlanningEvent) and event.character == self._app.focused_character:
             # `set_planning` drives ONE overlay, not a per-character one, so
             # only the focused child's planning state should reach it -- a
@@ -0,0 +1,86 @@
+"""Delta encoding of the `CycleSnapshot` stream a `--emit-events` child writes.
+
+THE COST. Every cycle used to cross the pipe as the whole snapshot — 51,725
+bytes measured for a late-game one (`DEFAULT_STREAM_LIMIT`) — and the
+supervisor re-validated the whole model per line, five children at a time.
+Cycle to cycle most of it does not change: the bank, the skills, the plan tree
+between replans, all but a slot or two of the inventory.
+
+THE ENCODING. A child sends a keyframe (`SnapshotEvent`) first and every
+`KEYFRAME_INTERVAL` snapshots after it; in between, a `DeltaEvent` carries the
+top-level fields whose JSON differs from the previous snapshot's, and for the
+`MAP_FIELDS` only the entries that changed or went away. The supervisor holds
+the last snapshot per child and rebuilds the next one with `apply_delta`,
+validating only the fields the delta names.
+
+A delta applies to the snapshot numbered one below it and to nothing else. A
+line lost to a protocol error breaks that chain; the supervisor drops deltas
+until the next keyframe, which is what bounds the gap.
+
+The encoding stays JSON lines: the stream is the child's stdout and a protocol
+error quotes the offending line, and the payload is now a few hundred bytes,
+so the encoder is no longer where the time goes.
+"""
+
+from functools import cache
+from typing import Any
+
+from pydantic import TypeAdapter
+
+from artifactsmmo_cli.ai.cycle_snapshot import CycleSnapshot
+from artifactsmmo_cli.multi.child_event import DeltaEvent, EntryDelta
+
+KEYFRAME_INTERVAL = 50
+"""Snapshots per keyframe, the first included: the longest a supervisor that
+lost a line waits before it can show that child again (50 cycles, a few minutes
+of play)."""
+
+MAP_FIELDS = frozenset({
+    "inventory", "equipment", "skills", "skill_xp", "bank_items", "gear_focus", "interleave_seats",
+})
+"""`CycleSnapshot` fields keyed by item, slot or skill, sent entry by entry.
+Every other field is sent whole when any part of it changed."""
+
+_ABSENT = object()
+
+
+def diff(previous: dict[str, Any], current: dict[str, Any]) -> tuple[dict[str, Any], dict[str, EntryDelta]]:
+    """`(fields, entries)` turning `previous` into `current`, both
+    `CycleSnapshot.model_dump(mode="json")`. A mapping field that is None on
+    either side is sent whole."""
+    fields: dict[str, Any] = {}
+    entries: dict[str, EntryDelta] = {}
+    for name, value in current.items():
+        before = previous[name]
+        if value == before:
+            continue
+        if name in MAP_FIELDS and value is not None and before is not None:
+            entries[name] = EntryDelta(
+                changed={key: item for key, item in value.items() if before.get(key, _ABSENT) != item},
+                removed=[key for key in before if key not in value],
+            )
+        else:
+            fields[name] = value
+    return fields, entries
+
+
+@cache
+def _adapter(name: str) -> TypeAdapter[Any]:
+    field = CycleSnapshot.model_fields.get(name)
+    if field is None or field.annotation is None:
+        raise ValueError(f"no CycleSnapshot field {name!r}")
+    return TypeAdapter(field.annotation)
+
+
+def apply_delta(base: CycleSnapshot, delta: DeltaEvent) -> CycleSnapshot:
+    """The snapshot `delta` encodes against `base`. Raises `ValueError` (a
+    `ValidationError` included) for a field `CycleSnapshot` does not have or
+    a value that does not validate."""
+    update = dict(delta.fields)
+    for name, entry in delta.entries.items():
+        merged = dict(getattr(base, name, None) or {})
+        merged.update(entry.changed)
+        for key in entry.removed:
+            merged.pop(key, None)
+        update[name] = merged
+    return base.model_copy(update={name: _adapter(name).validate_python(value) for name, value in update.items()})
@@ -1,12 +1,23 @@
-"""WatchApp: Textual app with four panes for live character observation."""
-
-from collections.abc import Callable
+"""WatchApp: Textual app with four panes for live character observation.
+
+FRAMES. Snapshots from the bot thread (`ThreadSafeBridge`) or the children of
+`play --all` are queued (`queue_snapshot`) and applied together once per
+`FRAME_SECONDS`, so a burst from five children costs one repaint, not five. A
+frame records every snapshot into the store. The append-only views (the log
+pane, the log and fight modals) are given every snapshot of the focused
+character. The state panes are given only its latest. The inventory, the other
+characters' sprites and the roster line are repainted only when what they draw
+changed.
+"""
+
+from collections.abc import Callable, Sequence
 from functools import partial
 
 from artifactsmmo_api_client.models.log_type import LogType
 from textual.app import App, ComposeResult
 from textual.containers import Container
 from textual.screen import Screen
+from textual.timer import Timer
 from textual.widgets import Footer, Header
 from textual.worker import Worker, WorkerState
 
@@ -25,11 +36,23 @@ from artifactsmmo_cli.tui.screens.fight_screen import FightScreen
 from artifactsmmo_cli.tui.screens.log_screen import LogScreen
 from artifactsmmo_cli.tui.screens.plan_screen import PlanScreen
 from artifactsmmo_cli.tui.sprite_coverage_audit import SpriteCoverageAudit
+from artifactsmmo_cli.tui.sprites import Sprite
 from artifactsmmo_cli.tui.widgets.inventory_pane import InventoryPane
 from artifactsmmo_cli.tui.widgets.log_pane import LogPane
 from artifactsmmo_cli.tui.widgets.map_pane import MapPane
 from artifactsmmo_cli.tui.widgets.status_pane import StatusPane
 
+FRAME_SECONDS = 0.1
+"""Longest a queued snapshot waits to be drawn, and so the fastest the panes
+repaint however fast snapshots arrive."""
+
+
+def _inventory_view(snap: CycleSnapshot | None) -> object:
+    """What `InventoryPane` draws from `snap`."""
+    if snap is None:
+        return None
+    return snap.inventory, snap.inventory_max, snap.equipment
+
 
 class WatchApp(App[None]):
     """Live watch-mode TUI. Subscribes to GamePlayer's cycle_observer."""
@@ -108,6 +131,11 @@ class WatchApp(App[None]):
         self._store = MultiSnapshotStore(self._roster.names)
         self._child_states: dict[str, ChildState] = {}
         self._pool: SupervisorPool | None = None
+        self._pending: list[CycleSnapshot] = []
+        self._frame_timer: Timer | None = None
+        # What the map last drew, so an unchanged frame does not clear its line cache.
+        self._others_shown: dict[tuple[int, int, str], Sprite] | None = None
+        self._roster_shown: tuple[RosterEntry, ...] | None = None
         self._bind_character_keys()
         SpriteCoverageAudit().run(game_data)
 
@@ -172,29 +200,64 @@ class WatchApp(App[None]):
         yield Footer()
 
     def update_snapshot(self, snap: CycleSnapshot) -> None:
-        """Called from the bot's worker thread via ThreadSafeBridge.
-        Textual queues this onto the main thread."""
+        """Record `snap` and repaint now, without waiting for a frame."""
         if not self.is_running:
             # A snapshot can arrive before mount or after teardown (a child's
             # event still in flight when the app exits): querying the DOM
             # then raises ScreenStackError rather than the NoMatches that
             # `_repaint_others`/`_repaint_roster` already guard against.
             return
-        self._store.record(snap)
-        if snap.character == self.focused_character:
-            self._repaint_focused(snap)
+        self._apply_frame([snap])
+
+    def queue_snapshot(self, snap: CycleSnapshot) -> None:
+        """Hold `snap` for the next frame. Called from the bot's worker thread
+        via ThreadSafeBridge (Textual queues this onto the main thread) and by
+        the supervisors for each child's cycle. Dropped before mount and after
+        teardown, like `update_snapshot`."""
+        if not self.is_running:
+            return
+        self._pending.append(snap)
+        if self._frame_timer is None:
+            self._frame_timer = self.set_timer(FRAME_SECONDS, self._flush_frame)
+
+    def _flush_frame(self) -> None:
+        self._frame_timer = None
+        pending, self._pending = self._pending, []
+        if pending and self.is_running:
+            self._apply_frame(pending)
+
+    def _apply_frame(self, snaps: Sequence[CycleSnapshot]) -> None:
+        for snap in snaps:
+            self._store.record(snap)
+        focused = [snap for snap in snaps if snap.character == self.focused_character]
+        if focused:
+            self._append_focused(focused)
+            self._repaint_focused(focused[-1])
         self._repaint_others()
         self._repaint_roster()
 
+    def _append_focused(self, snaps: Sequence[CycleSnapshot]) -> None:
+        """Write every cycle of the frame to the append-only views: skipping
+        one would drop its line from the log for good."""
+        log = self.query_one("#log", LogPane)
+        top = self.screen
+        for snap in snaps:
+            log.update_snapshot(snap)
+            if isinstance(top, (LogScreen, FightScreen)):
+                top.update_snapshot(snap)
+
     def _repaint_focused(self, snap: CycleSnapshot) -> None:
+        """Point the state panes at the focused character's latest snapshot.
+        The inventory pane is left alone when nothing it draws changed."""
         if not self.is_running:
             return
         self.query_one("#status", StatusPane).update_snapshot(snap)
         self.query_one("#map", MapPane).update_snapshot(snap)
-        self.query_one("#inv", InventoryPane).update_snapshot(snap)
-        self.query_one("#log", LogPane).update_snapshot(snap)
+        inv = self.query_one("#inv", InventoryPane)
+        if _inventory_view(inv.snapshot) != _inventory_view(snap):
+            inv.update_snapshot(snap)
         top = self.screen
-        if isinstance(top, (CharacterScreen, LogScreen, PlanScreen, FightScreen)):
+        if isinstance(top, (CharacterScreen, PlanScreen)):
             top.update_snapshot(snap)
 
     def _repaint_others(self) -> None:
@@ -207,7 +270,10 @@ class WatchApp(App[None]):
             for name, snap in self._store.latest_all().items()
             if name != self.focused_character
         }
+        if others == self._others_shown:
+            return
         self.query_one("#map", MapPane).set_others(others)
+        self._others_shown = others
 
     def action_focus_character(self, slot: int) -> None:
         name = self._roster.at(slot)
@@ -310,7 +376,11 @@ class WatchApp(App[None]):
         child's reason mid-sentence; the HUD line spans both wide columns."""
         if not self.is_running:
             return
-        self.query_one("#map", MapPane).set_roster(self.roster_entries())
+        entries = self.roster_entries()
+        if entries == self._roster_shown:
+            return
+        self.query_one("#map", MapPane).set_roster(entries)
+        self._roster_shown = entries
 
     # The five modal screens. Each mounts with a FIXED widget id
     # (character-modal / log-modal / plan-modal / encyclopedia-modal / fight-modal),
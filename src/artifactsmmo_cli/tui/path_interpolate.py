@@ -4,6 +4,10 @@
 player-centered map slides from `start` to `end`: a Bresenham line, sampled
 down to at most `max_steps` frames, always ending exactly at `end`, with the
 `start` tile excluded. No Textual/IO dependency — fully unit-testable.
+
+When the caller knows the walked route (`TileDistanceTable.path`: a shortest
+walk over walkable tiles, which bends around walls the straight line would
+cut through), it is passed as `route` and sampled instead of the line.
 """
 
 
@@ -41,17 +45,23 @@ def _sample(frames: list[tuple[int, int]], max_steps: int) -> list[tuple[int, in
 
 
 def glide_path(
-    start: tuple[int, int], end: tuple[int, int], max_steps: int
+    start: tuple[int, int], end: tuple[int, int], max_steps: int,
+    route: list[tuple[int, int]] | None = None,
 ) -> list[tuple[int, int]]:
     """Center tiles to render gliding start -> end (start excluded, ends at end).
 
     Empty when start == end. Capped to `max_steps` frames. Raises if max_steps < 1.
+    A non-empty `route` (start excluded) ending at `end` replaces the Bresenham
+    line; any other route is ignored rather than animating a wrong walk.
     """
     if max_steps < 1:
         raise ValueError(f"max_steps must be >= 1, got {max_steps}")
     if start == end:
         return []
-    frames = _bresenham(start, end)[1:]   # drop the start tile
+    if route and route[-1] == end:
+        frames = list(route)
+    else:
+        frames = _bresenham(start, end)[1:]   # drop the start tile
     if len(frames) <= max_steps:
         return frames
     return _sample(frames, max_steps)
@@ -225,7 +225,8 @@ class MapPane(Static):
         # would animate a walk across tiles the character never crossed.
         if (prior is not None and prior.layer == snap.layer
                 and (prior.x, prior.y) != (snap.x, snap.y)):
-            self._anim_frames = glide_path((prior.x, prior.y), (snap.x, snap.y), MAX_ANIM_STEPS)
+            route = self._game_data.tile_distances.path(prior.x, prior.y, snap.x, snap.y, snap.layer)
+            self._anim_frames = glide_path((prior.x, prior.y), (snap.x, snap.y), MAX_ANIM_STEPS, route)
         else:
             self._anim_frames = []
         self.refresh()
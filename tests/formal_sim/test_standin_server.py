@@ -0,0 +1,140 @@
+"""Behavior tests for formal/sim/standin_server.py and formal/sim/throughput.py.
+
+The live-server tests bind port 0 and talk to the stand-in through the
+generated client, the same transport `play` uses.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+from artifactsmmo_api_client import AuthenticatedClient
+from artifactsmmo_api_client.api.monsters.get_all_monsters_monsters_get import sync as get_all_monsters
+from artifactsmmo_api_client.api.my_account.get_rate_limits_my_rates_get import sync as get_rate_limits
+from artifactsmmo_api_client.api.my_characters.action_rest_my_name_action_rest_post import (
+    sync as action_rest,
+)
+from artifactsmmo_api_client.api.my_characters.get_my_characters_my_characters_get import sync as get_my_characters
+from artifactsmmo_api_client.models.character_rest_response_schema import CharacterRestResponseSchema
+from artifactsmmo_api_client.models.error_response_schema import ErrorResponseSchema
+
+from artifactsmmo_cli.rate_limit_detector import detect_rate_limited_response
+from artifactsmmo_cli.rate_limited_error import RateLimitedError
+from formal.sim.standin_server import DEFAULT_RATES, BucketLoad, RateWindows, StandinServer, bucket_of
+from formal.sim.standin_world import StandinWorld
+from formal.sim.throughput import ThroughputReport, main, run_throughput
+
+_BUNDLE_PATH = Path(__file__).resolve().parents[1] / "test_ai" / "scenarios" / "fixtures" / "gamedata_bundle.json"
+_BUNDLE = json.loads(_BUNDLE_PATH.read_text())
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _client(server: StandinServer) -> AuthenticatedClient:
+    return AuthenticatedClient(
+        base_url=server.url, token="anything", raise_on_unexpected_status=False,
+        httpx_args={"event_hooks": {"response": [detect_rate_limited_response]}})
+
+
+@pytest.mark.parametrize(("path", "bucket"), [
+    ("/my/alice/action/fight", "action"),
+    ("/my/bank/items", "account"),
+    ("/my/characters", "account"),
+    ("/accounts/standin/achievements", "account"),
+    ("/items", "data"),
+    ("/characters/alice", "data"),
+])
+def test_bucket_of_mirrors_the_players_charging(path, bucket):
+    assert bucket_of(path) == bucket
+
+
+def test_rate_windows_slide_and_refuse_without_recording():
+    windows = RateWindows({"second": 2, "minute": 3})
+    assert windows.admit(0.0) is None
+    assert windows.admit(0.1) is None
+    assert windows.admit(0.2) == pytest.approx(0.8)
+    assert windows.admit(1.5) is None
+    assert windows.admit(2.0) == pytest.approx(58.0)
+    described = windows.describe(2.0)
+    assert described["second"]["remaining"] == 1
+    assert described["minute"]["remaining"] == 0
+    assert windows.admit(60.5) is None
+
+
+def test_throttled_request_is_429_with_retry_after_and_counted():
+    clock = _Clock()
+    world = StandinWorld(_BUNDLE, ["a"], clock=clock)
+    server = StandinServer(world, rates={"data": {"second": 1}}, clock=clock)
+    server.stop()
+    assert server.handle("GET", "/items", {}, b"")[0] == 200
+    status, body, headers = server.handle("GET", "/items", {}, b"")
+    assert (status, body["error"]["code"], headers) == (429, 429, {"Retry-After": "1"})
+    load = server.load()
+    assert load["data"] == BucketLoad(requests=1, throttled=1, retry_after_seconds=1)
+    assert load["action"] == BucketLoad()
+    clock.now += 1
+    assert server.handle("GET", "/items", {}, b"")[0] == 200
+
+
+def test_world_and_request_errors_map_to_status_codes():
+    server = StandinServer(StandinWorld(_BUNDLE, ["a"]))
+    server.stop()
+    assert server.handle("POST", "/my/nobody/action/rest", {}, b"")[0] == 498
+    assert server.handle("POST", "/my/a/rest", {}, b"")[0] == 404
+    assert server.handle("POST", "/my/a/action/move", {}, b"{not json")[0] == 422
+    assert server.handle("POST", "/my/a/action/crafting", {}, b"[1]")[0] == 422
+    assert server.handle("GET", "/nope", {}, b"")[0] == 404
+
+
+def test_live_server_serves_the_generated_client():
+    world = StandinWorld(_BUNDLE, ["a", "b"], cooldown_scale=0.0)
+    with StandinServer(world) as server, _client(server) as client:
+        chars = get_my_characters(client=client)
+        assert [c.name for c in chars.data] == ["a", "b"]
+        monsters = get_all_monsters(client=client, size=100)
+        assert monsters.total == len(_BUNDLE["monsters"])
+        rested = action_rest(client=client, name="a")
+        assert isinstance(rested, CharacterRestResponseSchema)
+        missing = action_rest(client=client, name="nobody")
+        assert isinstance(missing, ErrorResponseSchema) and missing.error.code == 498
+        rates = get_rate_limits(client=client)
+        assert rates.data.action.second.limit == DEFAULT_RATES["action"]["second"]
+        assert rates.data.account.second.remaining < rates.data.account.second.limit
+    assert world.load()["a"].actions == 1
+
+
+def test_live_429_reaches_the_client_as_rate_limited_error():
+    with StandinServer(StandinWorld(_BUNDLE, ["a"]), rates={"account": {"minute": 1}}) as server, \
+            _client(server) as client:
+        get_my_characters(client=client)
+        with pytest.raises(RateLimitedError) as exc:
+            get_my_characters(client=client)
+        assert exc.value.headers["retry-after"] == "60"
+
+
+def test_scripted_throughput_run_reports_actions(capsys):
+    report = run_throughput(_BUNDLE, characters=2, duration_seconds=1.5, cooldown_scale=0.01)
+    assert set(report.characters) == {"standin1", "standin2"}
+    assert report.actions > 0
+    assert report.actions_per_hour == pytest.approx(report.per_hour(report.actions))
+    assert report.buckets["action"].requests >= report.actions
+    assert json.loads(report.to_json())["actions"] == report.actions
+    assert "standin1" in report.render()
+    with pytest.raises(ValueError, match="unknown driver"):
+        run_throughput(_BUNDLE, driver="nope")
+    assert main(["--bundle", str(_BUNDLE_PATH), "--characters", "1", "--duration", "0.5",
+                 "--cooldown-scale", "0.01", "--latency-ms", "0", "--json"]) == 0
+    assert json.loads(capsys.readouterr().out)["driver"] == "scripted"
+
+
+def test_empty_report_renders_without_dividing_by_zero():
+    report = ThroughputReport(driver="scripted", elapsed_seconds=0.0, cooldown_scale=1.0, latency_seconds=0.0,
+                              characters={}, buckets={})
+    assert report.actions_per_hour == 0.0
+    assert "total: 0 actions" in report.render()
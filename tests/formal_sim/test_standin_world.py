@@ -0,0 +1,168 @@
+"""Behavior tests for formal/sim/standin_world.py.
+
+Every action payload is parsed through the generated client's response
+schema, so a shape drift against the live API fails here rather than as a
+parse error inside `play`.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+from artifactsmmo_api_client.models.bank_item_transaction_response_schema import BankItemTransactionResponseSchema
+from artifactsmmo_api_client.models.character_fight_response_schema import CharacterFightResponseSchema
+from artifactsmmo_api_client.models.character_movement_response_schema import CharacterMovementResponseSchema
+from artifactsmmo_api_client.models.character_rest_response_schema import CharacterRestResponseSchema
+from artifactsmmo_api_client.models.character_schema import CharacterSchema
+from artifactsmmo_api_client.models.equipment_response_schema import EquipmentResponseSchema
+from artifactsmmo_api_client.models.skill_response_schema import SkillResponseSchema
+
+from formal.sim.standin_world import CharacterLoad, StandinError, StandinWorld, max_hp_at
+from formal.sim.throughput import _tile_of
+
+_REPO = Path(__file__).resolve().parents[2]
+_BUNDLE = json.loads((_REPO / "tests" / "test_ai" / "scenarios" / "fixtures" / "gamedata_bundle.json").read_text())
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> _Clock:
+    return _Clock()
+
+
+@pytest.fixture
+def world(clock: _Clock) -> StandinWorld:
+    return StandinWorld(_BUNDLE, ["a", "b"], clock=clock)
+
+
+def _give(world: StandinWorld, name: str, code: str, quantity: int) -> None:
+    world._characters[name]["inventory"][0].update(code=code, quantity=quantity)
+
+
+def _act(world: StandinWorld, clock: _Clock, name: str, action: str, body: object = None) -> dict:
+    """Run an action, then step the clock past its cooldown."""
+    data = world.act(name, action, body)
+    clock.now += data["cooldown"]["total_seconds"] + 1
+    return data
+
+
+def test_max_hp_matches_every_captured_base_stats_row():
+    rows = json.loads((_REPO / "formal" / "sim" / "character_base_stats.json").read_text())["base_stats"]
+    assert rows
+    for level, row in rows.items():
+        assert max_hp_at(int(level)) == row["max_hp"]
+
+
+def test_new_characters_parse_and_start_armed(world):
+    body = world.read("/my/characters", {})
+    chars = [CharacterSchema.from_dict(c) for c in body["data"]]
+    assert [c.name for c in chars] == ["a", "b"]
+    assert chars[0].weapon_slot == "wooden_stick"
+    assert chars[0].hp == chars[0].max_hp == max_hp_at(1)
+
+
+def test_move_fight_rest_round_trip_through_the_client_schemas(world, clock):
+    x, y = _tile_of(_BUNDLE, "monster", "chicken")
+    moved = CharacterMovementResponseSchema.from_dict({"data": _act(world, clock, "a", "move", {"x": x, "y": y})})
+    assert (moved.data.character.x, moved.data.character.y) == (x, y)
+    assert moved.data.cooldown.total_seconds == 5 * (abs(x) + abs(y))
+    fought = CharacterFightResponseSchema.from_dict({"data": _act(world, clock, "a", "fight", {})})
+    assert fought.data.fight.opponent == "chicken"
+    assert fought.data.characters[0].name == "a"
+    rested = CharacterRestResponseSchema.from_dict({"data": _act(world, clock, "a", "rest", {})})
+    assert rested.data.character.hp == rested.data.character.max_hp
+
+
+def test_cooldown_rejects_with_499_and_counts_idle_time(world, clock):
+    world.act("a", "rest", {})
+    with pytest.raises(StandinError) as exc:
+        world.act("a", "rest", {})
+    assert exc.value.code == 499
+    clock.now += 10
+    world.act("a", "rest", {})
+    load = world.load()["a"]
+    assert (load.actions, load.cooldown_rejections, load.errors) == (2, 1, 0)
+    assert load.cooldown_seconds == 6
+    assert load.idle_seconds == pytest.approx(7)
+    assert world.load()["b"] == CharacterLoad()
+
+
+def test_cooldown_scale_shrinks_every_cooldown(clock):
+    world = StandinWorld(_BUNDLE, ["a"], cooldown_scale=0.1, clock=clock)
+    data = world.act("a", "rest", {})
+    assert data["cooldown"]["total_seconds"] == 1
+    clock.now += 0.31
+    world.act("a", "rest", {})
+
+
+@pytest.mark.parametrize(("action", "body", "code"), [
+    ("teleport", {}, 404),
+    ("move", {"x": 0, "y": 0}, 490),
+    ("move", {"x": 999, "y": 999}, 404),
+    ("fight", {}, 598),
+    ("gathering", {}, 598),
+    ("crafting", {"code": "copper_dagger"}, 598),
+    ("equip", [{"code": "wooden_stick", "slot": "nowhere"}], 422),
+    ("unequip", [{"slot": "shield"}], 491),
+])
+def test_rule_violations_raise_the_live_error_codes(world, action, body, code):
+    with pytest.raises(StandinError) as exc:
+        world.act("a", action, body)
+    assert exc.value.code == code
+    assert world.load()["a"].errors == 1
+
+
+def test_unknown_character_is_498(world):
+    with pytest.raises(StandinError) as exc:
+        world.act("nobody", "rest", {})
+    assert exc.value.code == 498
+
+
+def test_gather_then_equip_swaps_the_worn_weapon(world, clock):
+    x, y = _tile_of(_BUNDLE, "resource", "copper_rocks")
+    _act(world, clock, "a", "move", {"x": x, "y": y})
+    gathered = SkillResponseSchema.from_dict({"data": _act(world, clock, "a", "gathering", {})})
+    assert gathered.data.details.xp > 0
+    _give(world, "a", "copper_dagger", 1)
+    equipped = EquipmentResponseSchema.from_dict(
+        {"data": _act(world, clock, "a", "equip", [{"code": "copper_dagger", "slot": "weapon"}])})
+    char = equipped.data.character
+    assert char.weapon_slot == "copper_dagger"
+    assert {s.code: s.quantity for s in char.inventory if s.code}.get("wooden_stick") == 1
+    _act(world, clock, "a", "unequip", [{"slot": "weapon"}])
+    assert world.read("/characters/a", {})["data"]["weapon_slot"] == ""
+
+
+def test_bank_round_trip_is_shared_across_the_account(world, clock):
+    x, y = _tile_of(_BUNDLE, "bank")
+    _give(world, "a", "copper_ore", 7)
+    _act(world, clock, "a", "move", {"x": x, "y": y})
+    deposited = BankItemTransactionResponseSchema.from_dict(
+        {"data": _act(world, clock, "a", "bank/deposit/item", [{"code": "copper_ore", "quantity": 7}])})
+    assert [(i.code, i.quantity) for i in deposited.data.bank] == [("copper_ore", 7)]
+    assert world.read("/my/bank/items", {})["data"] == [{"code": "copper_ore", "quantity": 7}]
+    _act(world, clock, "b", "move", {"x": x, "y": y})
+    _act(world, clock, "b", "bank/withdraw/item", [{"code": "copper_ore", "quantity": 3}])
+    assert world.read("/my/bank/items", {"code": "copper_ore"})["data"][0]["quantity"] == 4
+    with pytest.raises(StandinError) as exc:
+        world.act("b", "bank/withdraw/item", [{"code": "copper_ore", "quantity": 5}])
+    assert exc.value.code == 404
+
+
+def test_catalog_reads_page_and_filter(world):
+    page = world.read("/items", {"size": "5", "page": "2"})
+    assert len(page["data"]) == 5
+    assert page["page"] == 2 and page["total"] == len(_BUNDLE["items"])
+    assert [m["code"] for m in world.read("/monsters", {"code": "chicken"})["data"]] == ["chicken"]
+    assert world.read("/events/active", {})["data"] == []
+    assert world.read("/", {})["data"]["version"] == "standin"
+    with pytest.raises(StandinError) as exc:
+        world.read("/nope", {})
+    assert exc.value.code == 404
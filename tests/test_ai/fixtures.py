@@ -4,6 +4,9 @@ import attrs
 from artifactsmmo_api_client.models.character_schema import CharacterSchema
 from artifactsmmo_api_client.models.map_layer import MapLayer
 
+from artifactsmmo_cli.ai.game_data import GameData
+from artifactsmmo_cli.ai.goals.base import Goal
+from artifactsmmo_cli.ai.learning.store import LearningStore
 from artifactsmmo_cli.ai.task_lifecycle import derive_task_lifecycle_phase
 from artifactsmmo_cli.ai.world_state import WorldState
 
@@ -79,3 +82,21 @@ def make_state(**overrides) -> WorldState:
             defaults["task_code"], defaults["task_progress"], defaults["task_total"]
         )
     return WorldState(**defaults)
+
+
+class HoldGoal(Goal):
+    """Hold at least one of each code, whatever the HP."""
+
+    hp_monotone = True
+
+    def __init__(self, *codes: str) -> None:
+        self.codes = codes
+
+    def value(self, state: WorldState, game_data: GameData, history: LearningStore | None = None) -> float:
+        return 1.0
+
+    def is_satisfied(self, state: WorldState) -> bool:
+        return all(code in state.inventory for code in self.codes)
+
+    def desired_state(self, state: WorldState, game_data: GameData) -> dict[str, object]:
+        return {}
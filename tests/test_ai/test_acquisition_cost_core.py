@@ -9,8 +9,10 @@ which direction they are protecting.
 
 from artifactsmmo_cli.ai.acquisition_cost_core import (
     UNOBTAINABLE_PER_UNIT,
+    AcquisitionStep,
     RouteOption,
     acquisition_cost,
+    acquisition_steps,
     bundle_acquisition_cost,
 )
 
@@ -432,3 +434,55 @@ class TestBundleAcquisitionCost:
                                       capacity=UNBOUNDED)]}
         total, _paid = bundle_acquisition_cost([("ok", 1), ("nope", 1)], options, {})
         assert total >= UNOBTAINABLE_PER_UNIT
+
+
+class TestAcquisitionSteps:
+    """`acquisition_steps` — the same walk, read out as the legs of one plan.
+
+    The legs are subgoals a planner refines one at a time, so what matters is
+    that they come in an order a plan can take and that each leg's `holding`
+    is what the plan holds once it is done."""
+
+    def test_inputs_come_before_the_craft_that_consumes_them(self):
+        options = {"ring": [craft("jeweler", {"bar": 2})],
+                   "bar": [craft("forge", {"ore": 3})],
+                   "ore": [gather("pit")]}
+        assert acquisition_steps([("ring", 1)], options, {}) == [
+            AcquisitionStep("ore", "gather", 6, 6),
+            AcquisitionStep("bar", "craft", 2, 2),
+            AcquisitionStep("ring", "craft", 1, 1),
+        ]
+
+    def test_holdings_are_credited_and_folded_into_the_target_stock(self):
+        """Two ore held: the gather leg obtains four more and must end holding
+        six, not four, or it would be satisfied before it has gathered enough."""
+        options = {"bar": [craft("forge", {"ore": 3})], "ore": [gather("pit")]}
+        assert acquisition_steps([("bar", 2)], options, {"ore": 2}) == [
+            AcquisitionStep("ore", "gather", 4, 6),
+            AcquisitionStep("bar", "craft", 2, 2),
+        ]
+
+    def test_a_later_leg_sees_what_earlier_crafts_consumed(self):
+        """The second root gathers ore AFTER the first root's craft ate the
+        first batch, so its target stock starts from zero again."""
+        options = {"bar": [craft("forge", {"ore": 2})], "ore": [gather("pit")]}
+        steps = acquisition_steps([("bar", 1), ("ore", 3)], options, {})
+        assert steps is not None
+        assert steps[-1] == AcquisitionStep("ore", "gather", 3, 3)
+
+    def test_the_cheapest_route_is_the_leg(self):
+        options = {"potion": [buy("shop", "gold", 5), craft("lab", {"herb": 1})],
+                   "herb": [gather("meadow")], "gold": []}
+        assert [s.kind for s in acquisition_steps([("potion", 1)], options, {}) or []] == ["gather", "craft"]
+
+    def test_an_unroutable_need_has_no_decomposition(self):
+        options = {"bar": [craft("forge", {"mystery": 1})]}
+        assert acquisition_steps([("bar", 1)], options, {}) is None
+
+    def test_a_cycle_has_no_decomposition(self):
+        options = {"a": [craft("w", {"b": 1})], "b": [craft("w", {"a": 1})]}
+        assert acquisition_steps([("a", 1)], options, {}) is None
+
+    def test_a_held_root_needs_no_leg(self):
+        assert acquisition_steps([("ore", 2)], {"ore": [gather("pit")]}, {"ore": 5}) == []
+        assert acquisition_steps([("ore", 0)], {"ore": [gather("pit")]}, {}) == []
@@ -0,0 +1,158 @@
+"""The abstract planning tier: acquisition goals split into per-item legs.
+
+The decomposition is checked on the real fixture bundle (so the routes are the
+ones `acquisition_options` actually serves), and the payoff on the mixed-source
+feather_coat chain whose flat search is the slowest one in the suite.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from artifactsmmo_cli.ai.acquisition_subgoals import MIN_LEGS, acquisition_subgoals, acquisition_targets
+from artifactsmmo_cli.ai.actions.factory import build_actions
+from artifactsmmo_cli.ai.game_data import GameData
+from artifactsmmo_cli.ai.goals.gathering import GatherMaterialsGoal
+from artifactsmmo_cli.ai.goals.progression import UpgradeEquipmentGoal
+from artifactsmmo_cli.ai.goals.restore_hp import RestoreHPGoal
+from artifactsmmo_cli.ai.planner import GOAPPlanner
+from artifactsmmo_cli.ai.scenario import SCENARIOS, load_bundle_game_data, scenario_state
+from artifactsmmo_cli.ai.selection_context import NO_PROFILE_CONTEXT
+from artifactsmmo_cli.ai.strategy_driver import StrategyArbiter
+from artifactsmmo_cli.ai.tiers.objective import CharacterObjective
+from tests.test_ai.fixtures import make_state
+from tests.test_ai.test_upgrade_reachability_gate import _gd_feather_coat_plannable
+
+_BUNDLE = (Path(__file__).resolve().parent / "scenarios" / "fixtures"
+           / "gamedata_bundle.json")
+
+
+@pytest.fixture(scope="module")
+def game_data():  # type: ignore[no-untyped-def]
+    return load_bundle_game_data(_BUNDLE)
+
+
+@pytest.fixture(scope="module")
+def state(game_data):  # type: ignore[no-untyped-def]
+    return scenario_state(SCENARIOS["l12_deep_chain_grind"], game_data)
+
+
+class TestAcquisitionTargets:
+    def test_a_gather_goal_targets_its_unmet_needs(self, state, game_data):
+        goal = GatherMaterialsGoal("copper_ring", {"copper_ring": 1, "copper_ore": 0})
+        assert acquisition_targets(goal, state, game_data) == {"copper_ring": 1}
+
+    def test_a_skill_grind_has_no_chain(self, state, game_data):
+        goal = GatherMaterialsGoal("copper_ore", {"copper_ore": 2}, skill_grind=True)
+        assert acquisition_targets(goal, state, game_data) == {}
+
+    def test_an_upgrade_targets_the_piece_it_means_to_equip(self, game_data):
+        goal = UpgradeEquipmentGoal(committed_target=("copper_boots", "boots_slot"))
+        assert acquisition_targets(goal, make_state(), game_data) == {"copper_boots": 1}
+
+    def test_an_upgrade_already_worn_has_no_chain(self, game_data):
+        goal = UpgradeEquipmentGoal(committed_target=("copper_boots", "boots_slot"))
+        worn = make_state(equipment={"boots_slot": "copper_boots"})
+        assert acquisition_targets(goal, worn, game_data) == {}
+
+    def test_an_upgrade_with_no_target_has_no_chain(self):
+        assert acquisition_targets(UpgradeEquipmentGoal(), make_state(), GameData()) == {}
+
+    def test_any_other_goal_has_no_chain(self, state, game_data):
+        assert acquisition_targets(RestoreHPGoal(), state, game_data) == {}
+
+
+class TestAcquisitionSubgoals:
+    def test_legs_come_inputs_first_and_end_at_the_goal_item(self, state, game_data):
+        goal = GatherMaterialsGoal("copper_ring", {"copper_ring": 1})
+        legs = acquisition_subgoals(goal, state, game_data, NO_PROFILE_CONTEXT)
+        assert [leg.needed for leg in legs] == [
+            # One ore held, so the gather leg ends HOLDING the full sixty.
+            {"copper_ore": 60}, {"copper_bar": 6}, {"copper_ring": 1}]
+
+    def test_a_rung_exclusion_is_carried_into_every_leg(self, state, game_data):
+        goal = GatherMaterialsGoal("copper_ring", {"copper_ring": 1},
+                                   exclude_recycle=frozenset({"copper_ring"}))
+        legs = acquisition_subgoals(goal, state, game_data, NO_PROFILE_CONTEXT)
+        assert legs and all(leg.exclude_recycle == {"copper_ring"} for leg in legs)
+
+    def test_a_need_with_no_servable_route_has_no_decomposition(self, state, game_data):
+        goal = GatherMaterialsGoal("steel_boots", {"steel_boots": 1})
+        assert acquisition_subgoals(goal, state, game_data, NO_PROFILE_CONTEXT) == []
+
+    def test_a_chain_shorter_than_two_legs_is_left_to_the_flat_search(self, state, game_data):
+        goal = GatherMaterialsGoal("copper_ore", {"copper_ore": 3})
+        assert MIN_LEGS == 2
+        assert acquisition_subgoals(goal, state, game_data, NO_PROFILE_CONTEXT) == []
+
+    def test_a_goal_without_a_chain_has_no_decomposition(self, state, game_data):
+        assert acquisition_subgoals(RestoreHPGoal(), state, game_data, NO_PROFILE_CONTEXT) == []
+
+    def test_bank_stock_counts_as_held_not_as_a_withdraw_leg(self, game_data):
+        """`GatherMaterialsGoal.is_satisfied` counts the bank, so banked ore
+        shrinks the gather leg instead of becoming a leg of its own."""
+        banked = make_state(skills={"mining": 5, "jewelrycrafting": 5},
+                            bank_items={"copper_ore": 50})
+        goal = GatherMaterialsGoal("copper_ring", {"copper_ring": 1})
+        legs = acquisition_subgoals(goal, banked, game_data, NO_PROFILE_CONTEXT)
+        assert [leg.needed for leg in legs] == [
+            {"copper_ore": 60}, {"copper_bar": 6}, {"copper_ring": 1}]
+
+
+def _feather_coat_case():  # type: ignore[no-untyped-def]
+    state = make_state(skills={"gearcrafting": 5}, inventory={"ash_wood": 10},
+                       equipment={"body_armor_slot": None})
+    goal = UpgradeEquipmentGoal(committed_target=("feather_coat", "body_armor_slot"))
+    gd = _gd_feather_coat_plannable()
+    actions = build_actions(gd, state, CharacterObjective.from_game_data(gd), bank_accessible=True,
+                            task_exchange_min_coins=0)
+    return state, goal, gd, actions
+
+
+def test_refining_the_legs_beats_the_flat_search_on_a_mixed_chain():
+    """feather_coat from scratch is the chain `test_upgrade_reachability_gate`
+    drives the flat A* through (~30K nodes, seconds of wall clock). Refined leg
+    by leg it is a few short searches; the plan is a little longer because the
+    legs fixed the route order, and it still equips the coat."""
+    state, goal, gd, actions = _feather_coat_case()
+    legs = acquisition_subgoals(goal, state, gd, NO_PROFILE_CONTEXT)
+    assert [next(iter(leg.needed)) for leg in legs] == ["ash_wood", "ash_plank", "feather", "feather_coat"]
+
+    planner = GOAPPlanner()
+    plan = planner.plan(state, goal, actions, gd, None, budget_seconds=30.0, subgoals=legs)
+    stats = planner.last_stats
+    assert stats.hierarchical is True
+    assert len(plan) <= goal.max_depth
+    assert repr(plan[-1]) == "Equip(feather_coat->body_armor_slot)"
+    assert stats.nodes_explored < 5_000
+
+
+def test_the_arbiter_hands_the_legs_to_the_planner_and_traces_them():
+    state, goal, gd, actions = _feather_coat_case()
+    arbiter = StrategyArbiter(GOAPPlanner(), history=None)
+    plan = arbiter._plans(goal, state, gd, actions, NO_PROFILE_CONTEXT)
+    assert plan
+    assert arbiter.goals_tried[-1]["subgoals"] == [
+        "GatherMaterials(ash_wood, {ash_wood:40})", "GatherMaterials(ash_plank, {ash_plank:2})",
+        "GatherMaterials(feather, {feather:5})", "GatherMaterials(feather_coat, {feather_coat:1})",
+        repr(goal)]
+
+
+@pytest.mark.parametrize("chained", [True, False])
+def test_the_arbiter_hands_legs_only_to_a_goal_with_a_chain(monkeypatch, chained):
+    """A goal with no acquisition targets is planned flat on its whole budget:
+    no probe, no legs to derive."""
+    state, goal, gd, actions = _feather_coat_case()
+    if not chained:
+        goal = RestoreHPGoal()
+    planner = GOAPPlanner()
+    received: list[object] = []
+    plan = planner.plan
+
+    def recording(*args, subgoals=(), **kwargs):  # type: ignore[no-untyped-def]
+        received.append(subgoals)
+        return plan(*args, subgoals=subgoals, **kwargs)
+
+    monkeypatch.setattr(planner, "plan", recording)
+    StrategyArbiter(planner, history=None)._plans(goal, state, gd, actions, NO_PROFILE_CONTEXT)
+    assert received and callable(received[-1]) is chained
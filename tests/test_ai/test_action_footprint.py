@@ -0,0 +1,246 @@
+"""Action footprints (`actions/footprint`) and the planner's partial-order
+reduction over them (`planner._reordered`).
+
+The commuting claim is checked the way the planner relies on it: for every
+ordered pair whose footprints say they commute, running them the other way
+round must be applicable, reach the same state and cost the same — under a
+request floor too. The states are tight on purpose (a bag one stack from full,
+a bank one slot from full), where an unsound claim would show.
+"""
+
+import dataclasses
+from itertools import permutations
+from pathlib import Path
+
+import pytest
+from artifactsmmo_api_client import AuthenticatedClient
+
+from artifactsmmo_cli.ai.actions.base import Action
+from artifactsmmo_cli.ai.actions.deposit_item import DepositItemAction
+from artifactsmmo_cli.ai.actions.equip import EquipAction
+from artifactsmmo_cli.ai.actions.footprint import BANK_SLOTS, GOLD, INVENTORY_QUANTITY, INVENTORY_SLOTS, Footprint
+from artifactsmmo_cli.ai.actions.npc_sell import NpcSellAction
+from artifactsmmo_cli.ai.actions.unequip import UnequipAction
+from artifactsmmo_cli.ai.actions.withdraw_item import WithdrawItemAction
+from artifactsmmo_cli.ai.game_data import GameData
+from artifactsmmo_cli.ai.planner import GOAPPlanner, _state_key
+from artifactsmmo_cli.ai.scenario import load_bundle_game_data
+from artifactsmmo_cli.ai.world_state import WorldState
+from tests.test_ai.fixtures import HoldGoal, make_state
+
+_BUNDLE = (Path(__file__).resolve().parent / "scenarios" / "fixtures"
+           / "gamedata_bundle.json")
+_BANK = (4, 1)
+
+
+@pytest.fixture(scope="module")
+def game_data():  # type: ignore[no-untyped-def]
+    gd = load_bundle_game_data(_BUNDLE)
+    gd._npc_sell_prices = {**gd._npc_sell_prices, "grocer": {"egg": 3, "feather": 2}}
+    gd._npc_locations = {**gd._npc_locations, "grocer": (1, 1)}
+    return gd
+
+
+class TestCommutesWith:
+    def test_a_write_conflicts_with_any_use_of_its_fact(self):
+        stack = ("inventory", "egg")
+        writer = Footprint(writes=frozenset({stack}))
+        for other in (Footprint(writes=frozenset({stack})), Footprint(reads=frozenset({stack})),
+                      Footprint(consumes=frozenset({stack})), Footprint(releases=frozenset({stack}))):
+            assert not writer.commutes_with(other) and not other.commutes_with(writer)
+
+    def test_counters_commute_only_in_one_direction(self):
+        reader = Footprint(reads=frozenset({BANK_SLOTS}))
+        consumer = Footprint(consumes=frozenset({BANK_SLOTS}))
+        releaser = Footprint(releases=frozenset({BANK_SLOTS}))
+        assert reader.commutes_with(reader)
+        assert consumer.commutes_with(consumer)
+        assert releaser.commutes_with(releaser)
+        assert not consumer.commutes_with(releaser) and not releaser.commutes_with(consumer)
+        assert not reader.commutes_with(consumer) and not releaser.commutes_with(reader)
+
+    def test_walks_commute_only_to_the_same_tile_at_the_same_base(self):
+        here = Footprint(travel=(_BANK, 2.0))
+        assert here.commutes_with(Footprint(travel=(_BANK, 2.0)))
+        assert here.commutes_with(Footprint())
+        assert not here.commutes_with(Footprint(travel=((9, 9), 2.0)))
+        assert not here.commutes_with(Footprint(travel=(_BANK, 1.5)))
+
+
+def _tight_state() -> WorldState:
+    inventory = {"copper_ore": 3, "ash_wood": 1, "copper_ring": 2, "copper_boots": 1, "egg": 2, "feather": 1}
+    return make_state(
+        x=9, y=9,
+        inventory=inventory,
+        inventory_max=sum(inventory.values()) + 2,
+        inventory_slots_max=len(inventory) + 1,
+        equipment={**make_state().equipment, "ring1_slot": "copper_ring", "helmet_slot": "copper_helmet",
+                   "utility1_slot": "cooked_chicken"},
+        bank_items={"copper_bar": 2, "copper_ore": 1, "egg": 1},
+    )
+
+
+def _candidates(state: WorldState) -> list[Action]:
+    bank = state.bank_items or {}
+    return [
+        *(DepositItemAction(code, qty, bank_location=_BANK)
+          for code, held in state.inventory.items() for qty in {1, held}),
+        *(WithdrawItemAction(code, qty, bank_location=_BANK)
+          for code, held in bank.items() for qty in {1, held}),
+        WithdrawItemAction("copper_bar", 1, bank_location=(9, 9)),
+        EquipAction("copper_ring", "ring2_slot"), EquipAction("copper_ring", "ring1_slot"),
+        EquipAction("copper_boots", "boots_slot"), EquipAction("cooked_chicken", "utility2_slot"),
+        UnequipAction("ring1_slot"), UnequipAction("helmet_slot"),
+        NpcSellAction("grocer", "egg", 1, npc_location=(1, 1)),
+        NpcSellAction("grocer", "egg", 2, npc_location=(1, 1)),
+        NpcSellAction("grocer", "feather", 1, npc_location=(1, 1)),
+        NpcSellAction("timber_merchant", "ash_wood", 1, npc_location=(2, 4)),
+    ]
+
+
+@pytest.mark.parametrize("bank_room", [1, 2])
+def test_a_pair_that_commutes_is_interchangeable(game_data, bank_room):
+    state = _tight_state()
+    game_data._bank_capacity = len(state.bank_items or {}) + bank_room
+    checked: set[tuple[str, str]] = set()
+    for first, second in permutations(_candidates(state), 2):
+        made = first.footprint(state, game_data)
+        if made is None or not first.is_applicable(state, game_data):
+            continue
+        middle = first.apply(state, game_data)
+        then = second.footprint(middle, game_data)
+        if then is None or not made.commutes_with(then) or not second.is_applicable(middle, game_data):
+            continue
+        assert second.is_applicable(state, game_data), (first, second)
+        swapped = second.apply(state, game_data)
+        assert first.is_applicable(swapped, game_data), (first, second)
+        ahead, behind = second.apply(middle, game_data), first.apply(swapped, game_data)
+        assert _state_key(ahead) == _state_key(behind), (first, second)
+        for floor in (0.0, 30.0):
+            forward = (max(first.cost(state, game_data), floor)
+                       + max(second.cost(middle, game_data), floor))
+            backward = (max(second.cost(state, game_data), floor)
+                        + max(first.cost(swapped, game_data), floor))
+            assert forward == pytest.approx(backward), (first, second, floor)
+        checked.add((type(first).__name__, type(second).__name__))
+    # Every modelled class meets another it commutes with, in both orders.
+    assert {("DepositItemAction", "DepositItemAction"), ("WithdrawItemAction", "WithdrawItemAction"),
+            ("EquipAction", "DepositItemAction"), ("UnequipAction", "EquipAction"),
+            ("NpcSellAction", "NpcSellAction")} <= checked
+
+
+class TestFootprints:
+    def test_an_event_merchant_and_a_utility_slot_are_not_modelled(self, game_data):
+        state = _tight_state()
+        assert NpcSellAction("timber_merchant", "ash_wood", 1, npc_location=(2, 4)).footprint(state, game_data) is None
+        assert NpcSellAction("grocer", "egg", 1).footprint(state, game_data) is None
+        assert EquipAction("cooked_chicken", "utility2_slot").footprint(state, game_data) is None
+        assert Action.footprint(UnequipAction("ring1_slot"), state, game_data) is None
+
+    def test_a_deposit_takes_a_bank_slot_only_for_a_new_code(self, game_data):
+        state = _tight_state()
+        fresh = DepositItemAction("ash_wood", 1, bank_location=_BANK).footprint(state, game_data)
+        banked = DepositItemAction("egg", 1, bank_location=_BANK).footprint(state, game_data)
+        assert fresh.consumes == {BANK_SLOTS} and fresh.releases == {INVENTORY_QUANTITY, INVENTORY_SLOTS}
+        assert banked.reads == {BANK_SLOTS} and banked.releases == {INVENTORY_QUANTITY}
+        assert not fresh.commutes_with(banked)
+
+    def test_a_sale_releases_gold(self, game_data):
+        sale = NpcSellAction("grocer", "egg", 1, npc_location=(1, 1)).footprint(_tight_state(), game_data)
+        assert sale.releases == {GOLD, INVENTORY_QUANTITY} and sale.travel == ((1, 1), 1.5)
+
+
+class TestPlannerReduction:
+    def _withdraw_batch(self, game_data):  # type: ignore[no-untyped-def]
+        game_data._bank_capacity = 50
+        codes = ("copper_bar", "feather", "egg", "ash_wood")
+        state = make_state(bank_items=dict.fromkeys(codes, 3), inventory_max=40)
+        actions: list[Action] = [WithdrawItemAction(code, qty, bank_location=_BANK)
+                                 for code in codes for qty in (1, 3)]
+        return state, HoldGoal(*codes), actions
+
+    def test_a_withdraw_batch_is_planned_in_one_order(self, game_data):
+        state, goal, actions = self._withdraw_batch(game_data)
+        planner = GOAPPlanner()
+        plan = planner.plan(state, goal, actions, game_data)
+        reduced = planner.last_stats
+        assert [action.code for action in plan] == ["copper_bar", "feather", "egg", "ash_wood"]
+        assert reduced.interleavings_pruned > 0
+        # The same search with every footprint withheld: the same cost, dearer.
+        opaque = [_Opaque(action) for action in actions]
+        full = GOAPPlanner()
+        unreduced_plan = full.plan(state, goal, opaque, game_data)
+        cost = sum(action.cost(s, game_data) for action, s in _walk(plan, state, game_data))
+        unreduced_cost = sum(action.cost(s, game_data) for action, s in _walk(unreduced_plan, state, game_data))
+        assert cost == pytest.approx(unreduced_cost)
+        assert full.last_stats.interleavings_pruned == 0
+        assert reduced.nodes_created * 2 < full.last_stats.nodes_created
+
+    def test_an_equally_cheap_revisit_wakes_what_the_first_visit_skipped(self):
+        """`X` then `A` and `A` then `X` reach one state. After `A`, `B` is
+        skipped (it commutes with `A` and is listed first); after `X` it is
+        not. Whichever path closes that state first, `B` is still expanded
+        from it."""
+        b, x, a = _Flag("b", "b", "n"), _Flag("x", "x", "m", "n"), _Flag("a", "a", "m")
+        planner = GOAPPlanner()
+        plan = planner.plan(make_state(), HoldGoal("a", "b", "x"), [b, x, a], GameData())
+        assert len(plan) == 3
+        assert {"a", "x"} in b.applied_at
+
+    def test_a_revisit_skipping_the_same_successors_expands_nothing_more(self):
+        b, x, a = _Flag("b", "b"), _Flag("x", "x", "m"), _Flag("a", "a", "m")
+        planner = GOAPPlanner()
+        plan = planner.plan(make_state(), HoldGoal("a", "b", "x"), [b, x, a], GameData())
+        assert [action.flag for action in plan] == ["b", "x", "a"]
+        assert {"a", "x"} not in b.applied_at
+
+
+def _walk(plan: list[Action], state: WorldState, game_data: GameData):  # type: ignore[no-untyped-def]
+    for action in plan:
+        yield action, state
+        state = action.apply(state, game_data)
+
+
+class _Opaque(Action):
+    """`action` with no footprint: every interleaving is searched."""
+
+    def __init__(self, action: Action) -> None:
+        self.action = action
+
+    def is_applicable(self, state: WorldState, game_data: GameData) -> bool:
+        return self.action.is_applicable(state, game_data)
+
+    def apply(self, state: WorldState, game_data: GameData) -> WorldState:
+        return self.action.apply(state, game_data)
+
+    def cost(self, state: WorldState, game_data: GameData, history=None) -> float:
+        return self.action.cost(state, game_data, history)
+
+    def execute(self, state: WorldState, client: AuthenticatedClient) -> WorldState:
+        raise NotImplementedError("planner-only test action")
+
+
+class _Flag(Action):
+    """Adds one flag to the bag; declares the facts it writes. Records the
+    bags it was applied to."""
+
+    def __init__(self, flag: str, *writes: str) -> None:
+        self.flag = flag
+        self.writes = frozenset(("flag", name) for name in writes)
+        self.applied_at: list[set[str]] = []
+
+    def is_applicable(self, state: WorldState, game_data: GameData) -> bool:
+        return self.flag not in state.inventory
+
+    def apply(self, state: WorldState, game_data: GameData) -> WorldState:
+        self.applied_at.append(set(state.inventory))
+        return dataclasses.replace(state, inventory={**state.inventory, self.flag: 1})
+
+    def cost(self, state: WorldState, game_data: GameData, history=None) -> float:
+        return 1.0
+
+    def footprint(self, state: WorldState, game_data: GameData) -> Footprint:
+        return Footprint(writes=self.writes)
+
+    def execute(self, state: WorldState, client: AuthenticatedClient) -> WorldState:
+        raise NotImplementedError("planner-only test action")
@@ -0,0 +1,109 @@
+"""Interned per-action learning keys (`Action.action_key`) and their use in
+cost lookups, the trace and the plan-body log."""
+
+import dataclasses
+import json
+import sys
+from unittest.mock import MagicMock, patch
+
+from artifactsmmo_cli.ai.actions.base import intern_action_keys
+from artifactsmmo_cli.ai.actions.combat import FightAction
+from artifactsmmo_cli.ai.actions.factory import build_actions
+from artifactsmmo_cli.ai.actions.gathering import GatherAction
+from artifactsmmo_cli.ai.actions.movement import MoveAction
+from artifactsmmo_cli.ai.actions.rest import RestAction
+from artifactsmmo_cli.ai.learning.store import LearningStore
+from artifactsmmo_cli.ai.player import GamePlayer
+from tests.test_ai.fixtures import make_state
+from tests.test_ai.test_actions import make_game_data
+
+
+def test_action_key_is_learning_key():
+    gather = GatherAction(resource_code="ash_tree", quantity=7)
+    assert gather.action_key() == gather.learning_key() == "Gather(ash_tree)"
+    assert MoveAction(x=3, y=4).action_key() == "Move(3,4)"
+
+
+def test_action_key_is_interned_and_computed_once():
+    move = MoveAction(x=3, y=4)
+    with patch.object(MoveAction, "learning_key", autospec=True, return_value="Move(3,4)") as lk:
+        first = move.action_key()
+        second = move.action_key()
+    assert first is second
+    assert first is sys.intern("Move(3,4)")
+    assert lk.call_count == 1
+
+
+def test_action_key_stays_out_of_identity():
+    keyed = MoveAction(x=1, y=2)
+    keyed.action_key()
+    assert keyed == MoveAction(x=1, y=2)
+    assert repr(keyed) == "Move(1,2)"
+
+
+def test_replace_derives_its_own_key():
+    one = GatherAction(resource_code="ash_tree", drop_item_override=None)
+    one.action_key()
+    other = dataclasses.replace(one, drop_item_override="sap")
+    assert other.action_key() == "Gather(ash_tree->sap)"
+
+
+def test_intern_action_keys_stamps_every_action():
+    actions = [MoveAction(x=1, y=1), RestAction()]
+    intern_action_keys(actions)
+    assert [a._action_key for a in actions] == ["Move(1,1)", "Rest"]
+
+
+def test_factory_emits_keyed_actions():
+    gd = make_game_data(monster_locs={"chicken": [(1, 1)]}, resource_locs={"ash_tree": [(2, 2)]})
+    actions = build_actions(gd, None, None, True, 0)
+    assert all(a._action_key is not None for a in actions)
+
+
+def test_cost_reads_learned_stats_by_key():
+    history = MagicMock()
+    history.action_cost.return_value = 5.0
+    history.success_rate.return_value = 1.0
+    state = make_state(x=0, y=0)
+    gd = make_game_data(monster_levels={"chicken": 1})
+    for action in (MoveAction(x=2, y=0), FightAction(monster_code="chicken", locations=frozenset([(1, 1)])),
+                   GatherAction(resource_code="ash_tree", locations=frozenset([(2, 2)]), quantity=3)):
+        intern_action_keys([action])
+        with patch.object(type(action), "__repr__", side_effect=AssertionError("repr on the hot path")):
+            action.cost(state, gd, history)
+        assert history.action_cost.call_args.args[0] is action.action_key()
+        assert history.success_rate.call_args.args[0] is action.action_key()
+
+
+def test_trace_record_carries_action_key():
+    player = GamePlayer(character="hero")
+    player.state = make_state()
+    player.tracer = MagicMock()
+    player._emit_trace("Gather(ash_tree×3)", "FarmItems", "ok", {}, action_key="Gather(ash_tree)")
+    record = player.tracer.write_cycle.call_args[0][0]
+    assert record["action"] == "Gather(ash_tree×3)"
+    assert record["action_key"] == "Gather(ash_tree)"
+
+
+def test_plan_body_logged_by_action_key(tmp_path):
+    store = LearningStore(db_path=str(tmp_path / "l.db"), character="hero")
+    store.start_session()
+    player = GamePlayer(character="hero", dry_run=True, history=store)
+    player._gear_latch._active = False
+    goal = MagicMock()
+    goal.__repr__ = lambda self: "FakeGoal()"
+    plan = [GatherAction(resource_code="ash_tree", locations=frozenset([(2, 2)]), quantity=3)]
+
+    def _fake_decide(state, game_data, actions, ctx_combat_monster):
+        return goal, list(plan), []
+
+    player._decide_band = _fake_decide  # type: ignore[method-assign]
+    with patch("artifactsmmo_cli.ai.player.goal_to_dict", return_value={}):
+        player._plan_or_reuse(make_state(), make_game_data(), [], None)
+    (body,) = store.plan_bodies_for_goal("FakeGoal()")
+    assert body.head_action_repr == "Gather(ash_tree)"
+    assert body.body_json == '["Gather(ash_tree)"]'
+    # The commitment still restores by display repr.
+    row = store.load_plan_commitment()
+    assert row is not None
+    assert json.loads(row.plan_json) == ["Gather(ash_tree×3)"]
@@ -102,5 +102,5 @@ class TestBuyBankExpansionAction:
             with patch("artifactsmmo_cli.ai.actions.bank_expansion.action_buy_bank_expansion",
                        return_value=make_api_result(char)) as mock_exp:
                 a.execute(state, client)
-        MockMove.assert_called_once_with(x=4, y=0)
+        MockMove.assert_called_once_with(x=4, y=0, distances=None)
         mock_exp.assert_called_once_with(client=client, name="testchar")
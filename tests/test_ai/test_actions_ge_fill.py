@@ -109,7 +109,7 @@ class TestGeFillBuyOrderAction:
             with patch("artifactsmmo_cli.ai.actions.ge_fill.action_ge_fill",
                        return_value=make_api_result(char)) as mock_fill:
                 a.execute(state, client)
-        MockMove.assert_called_once_with(x=5, y=1)
+        MockMove.assert_called_once_with(x=5, y=1, distances=None)
         mock_fill.assert_called_once()
         call_kwargs = mock_fill.call_args.kwargs
         assert call_kwargs["name"] == "testchar"
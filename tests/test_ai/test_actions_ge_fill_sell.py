@@ -166,7 +166,7 @@ class TestGeFillSellOrderAction:
             with patch("artifactsmmo_cli.ai.actions.ge_fill_sell.action_ge_buy",
                        return_value=make_api_result(char)) as mock_buy:
                 a.execute(state, client)
-        MockMove.assert_called_once_with(x=5, y=1)
+        MockMove.assert_called_once_with(x=5, y=1, distances=None)
         mock_buy.assert_called_once()
         call_kwargs = mock_buy.call_args.kwargs
         assert call_kwargs["name"] == "testchar"
@@ -80,7 +80,7 @@ class TestNpcSellAction:
             with patch("artifactsmmo_cli.ai.actions.npc_sell.action_npc_sell",
                        return_value=make_api_result(char)) as mock_sell:
                 a.execute(state, client)
-        MockMove.assert_called_once_with(x=2, y=1)
+        MockMove.assert_called_once_with(x=2, y=1, distances=None)
         mock_sell.assert_called_once()
         # Verify the body has the right code+quantity
         call_kwargs = mock_sell.call_args.kwargs
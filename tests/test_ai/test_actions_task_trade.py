@@ -108,7 +108,7 @@ class TestTaskTradeAction:
             with patch("artifactsmmo_cli.ai.actions.task_trade.action_task_trade",
                        return_value=make_api_result(char)) as mock_tt:
                 a.execute(state, client)
-        MockMove.assert_called_once_with(x=1, y=2)
+        MockMove.assert_called_once_with(x=1, y=2, distances=None)
         mock_tt.assert_called_once()
         body = mock_tt.call_args.kwargs["body"]
         assert body.code == "iron_ore"
@@ -182,7 +182,7 @@ class TestRecycleAction:
             with patch("artifactsmmo_cli.ai.actions.recycle.action_recycling",
                        return_value=make_api_result(char)) as mock_recycle:
                 action.execute(state, client)
-        MockMove.assert_called_once_with(x=5, y=0)
+        MockMove.assert_called_once_with(x=5, y=0, distances=None)
         mock_recycle.assert_called_once()
 
     def test_recycle_blocked_when_it_would_breach_the_bag_floor(self):
@@ -464,7 +464,7 @@ class TestNpcBuyAction:
             with patch("artifactsmmo_cli.ai.actions.npc.action_npc_buy",
                        return_value=make_api_result(char)) as mock_buy:
                 action.execute(state, client)
-        MockMove.assert_called_once_with(x=2, y=1)
+        MockMove.assert_called_once_with(x=2, y=1, distances=None)
         mock_buy.assert_called_once()
 
 
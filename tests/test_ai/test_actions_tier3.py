@@ -117,7 +117,7 @@ class TestTaskCancelAction:
             with patch("artifactsmmo_cli.ai.actions.task_cancel.action_task_cancel",
                        return_value=make_api_result(char)) as mock_api:
                 action.execute(state, client)
-        MockMove.assert_called_once_with(x=1, y=2)
+        MockMove.assert_called_once_with(x=1, y=2, distances=None)
         mock_api.assert_called_once()
 
 
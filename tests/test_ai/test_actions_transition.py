@@ -78,7 +78,7 @@ class TestMapTransitionAction:
                    return_value=make_api_result(char)) as mock_t:
             move_cls.return_value.execute.return_value = moved
             a.execute(state, client)
-        move_cls.assert_called_once_with(x=-4, y=9)
+        move_cls.assert_called_once_with(x=-4, y=9, distances=None)
         move_cls.return_value.execute.assert_called_once_with(state, client)
         mock_t.assert_called_once_with(client=client, name="testchar")
 
@@ -0,0 +1,122 @@
+"""batch_picker: the batched scorer equals `_benefit` on every catalog item and
+the batched picker returns `pick_loadout`'s loadout, bit for bit."""
+
+import json
+import random
+from pathlib import Path
+
+import pytest
+
+from artifactsmmo_cli.ai.actions.equip import ITEM_TYPE_TO_SLOTS
+from artifactsmmo_cli.ai.elements import ELEMENTS
+from artifactsmmo_cli.ai.equipment.batch_picker import _columns_for, _ItemColumns, benefits, pick_loadout_batched
+from artifactsmmo_cli.ai.equipment.loadout_picker import _benefit, pick_loadout
+from artifactsmmo_cli.ai.game_data import GameData, ItemStats
+from artifactsmmo_cli.ai.gear_value_core import Combat, Gather, Rank
+from tests.test_ai.fixtures import make_state
+
+_BUNDLE = Path(__file__).parent / "scenarios" / "fixtures" / "gamedata_bundle.json"
+
+
+@pytest.fixture(scope="module")
+def real_gd() -> GameData:
+    return GameData.from_cache_bundle(json.loads(_BUNDLE.read_text()))
+
+
+def _purposes(gd: GameData) -> list[object]:
+    out: list[object] = [Rank(), Rank, Gather("woodcutting"), Gather("mining"), Gather("fishing"),
+                         Gather("alchemy"), Gather("no_such_skill")]
+    for monster in sorted(gd.monster_levels)[::7]:
+        out.append(Combat(monster_attack=gd.monster_attack(monster),
+                          monster_resistance=gd.monster_resistance(monster),
+                          player_attack={"fire": 12, "earth": 3, "air": 7}))
+    return out
+
+
+def test_benefits_match_the_reference_on_every_item(real_gd):
+    codes = sorted(real_gd.all_item_stats)
+    for purpose in _purposes(real_gd):
+        batched = benefits(purpose, [*codes, "no_such_item"], real_gd)
+        assert set(batched) == set(codes)
+        for code in codes:
+            stats = real_gd.item_stats(code)
+            assert stats is not None
+            assert batched[code] == _benefit(stats, purpose), (purpose, code)
+
+
+def test_benefits_reject_an_unknown_purpose(real_gd):
+    with pytest.raises(ValueError, match="unsupported purpose"):
+        benefits(object(), ["copper_dagger"], real_gd)
+
+
+def test_picks_match_the_reference_over_owned_gear_mixes(real_gd):
+    rng = random.Random(20261018)
+    gear = sorted(code for code, s in real_gd.all_item_stats.items() if s.type_ in ITEM_TYPE_TO_SLOTS)
+    purposes = _purposes(real_gd)
+    for _ in range(150):
+        owned = rng.sample(gear, rng.randint(0, 30))
+        inventory = {code: rng.choice([0, 1, 1, 2]) for code in owned}
+        equipment: dict[str, str | None] = {}
+        for code in rng.sample(owned, min(len(owned), 6)):
+            slots = ITEM_TYPE_TO_SLOTS[real_gd.all_item_stats[code].type_]
+            equipment.setdefault(rng.choice(slots), code)
+        state = make_state(level=rng.randint(1, 45), inventory=inventory, equipment=equipment)
+        for purpose in rng.sample(purposes, 4):
+            assert pick_loadout_batched(purpose, state, real_gd) == pick_loadout(purpose, state, real_gd)
+
+
+def test_duplicate_rings_and_unknown_or_blank_equipment():
+    gd = GameData()
+    gd._item_stats = {
+        "copper_ring": ItemStats(code="copper_ring", level=1, type_="ring", resistance={"fire": 5}),
+        "iron_ring": ItemStats(code="iron_ring", level=1, type_="ring", resistance={"fire": 8}),
+        "stick": ItemStats(code="stick", level=1, type_="weapon", attack={"earth": 4}),
+    }
+    purpose = Combat(monster_attack={"fire": 10}, monster_resistance={}, player_attack={"earth": 4})
+    states = [
+        make_state(inventory={"copper_ring": 2}),
+        make_state(inventory={"copper_ring": 1}, equipment={"ring1_slot": "copper_ring"}),
+        make_state(inventory={"iron_ring": 1, "stick": 1}, equipment={"ring1_slot": "relic", "weapon_slot": ""}),
+        make_state(inventory={"copper_ring": 1}, equipment={"ring1_slot": "iron_ring", "ring2_slot": "iron_ring"}),
+    ]
+    for state in states:
+        for p in (purpose, Rank(), Gather("mining")):
+            assert pick_loadout_batched(p, state, gd) == pick_loadout(p, state, gd)
+
+
+def _vec(mapping: dict[str, int]) -> tuple[int, ...]:
+    return tuple(mapping.get(elem, 0) for elem in ELEMENTS)
+
+
+def _element_row(matrix, i: int) -> tuple[int, ...]:
+    return tuple(matrix[i * len(ELEMENTS):(i + 1) * len(ELEMENTS)])
+
+
+def test_item_columns_mirror_the_real_catalog(real_gd):
+    cols = _columns_for(real_gd)
+    assert sorted(cols.ids, key=cols.ids.__getitem__) == sorted(real_gd.all_item_stats)
+    for code, i in cols.ids.items():
+        s = real_gd.item_stats(code)
+        assert s is not None
+        assert (cols.level[i], cols.type_[i], cols.is_tool[i]) == (s.level, s.type_, int(s.subtype == "tool"))
+        assert (cols.critical_strike[i], cols.dmg[i]) == (s.critical_strike, s.dmg)
+        assert cols.flat_combat[i] == s.hp_restore + s.hp_bonus + s.lifesteal + s.combat_buff
+        assert cols.efficiency[i] == s.wisdom + s.prospecting + s.inventory_space + s.haste
+        assert _element_row(cols.attack, i) == _vec(s.attack)
+        assert _element_row(cols.resistance, i) == _vec(s.resistance)
+        assert _element_row(cols.dmg_elements, i) == _vec(s.dmg_elements)
+        for skill, column in cols.skill_effects.items():
+            assert column[i] == s.skill_effects.get(skill, 0)
+    assert _ItemColumns.build({}).skill_effects == {}
+
+
+def test_columns_are_reused_until_the_catalog_grows():
+    gd = GameData()
+    gd._item_stats = {"a": ItemStats(code="a", level=1, type_="ring")}
+    first = _columns_for(gd)
+    assert _columns_for(gd) is first
+    gd._item_stats["b"] = ItemStats(code="b", level=2, type_="ring")
+    grown = _columns_for(gd)
+    assert grown is not first and list(grown.ids) == ["a", "b"]
+    gd._item_stats = {"c": ItemStats(code="c", level=1, type_="ring")}
+    assert list(_columns_for(gd).ids) == ["c"]
@@ -565,6 +565,7 @@ class TestStrategyArbiterIntegration:
                 max_depth_reached = 0
                 timed_out = False
                 node_capped = False
+                subgoals: list = []
             def plan(self, *args, **kwargs):
                 self.__class__.calls += 1
                 return []
@@ -595,6 +596,7 @@ class TestStrategyArbiterIntegration:
                 max_depth_reached = 2
                 timed_out = False
                 node_capped = False
+                subgoals: list = []
             def plan(self, *args, **kwargs):
                 self.__class__.calls += 1
                 return []
@@ -45,6 +45,17 @@ def test_acquisition_method_crafts_when_unaffordable() -> None:
     assert acquisition_method("copper_bar", 1, state, gd, _RESERVE) == Method.CRAFT
 
 
+def test_acquisition_method_crafts_when_the_npc_overcharges_the_market() -> None:
+    """The GE has recently sold copper_bar at 2g: the NPC's 5g is over twice
+    that, so the affordable, faster buy is refused."""
+    gd = _gd_buyable()
+    gd._ge_reference_prices = {"sell": {"copper_bar": 2}}
+    state = make_state(gold=_RESERVE + 1000, inventory={}, x=0, y=0)
+    assert acquisition_method("copper_bar", 1, state, gd, _RESERVE) == Method.CRAFT
+    gd._ge_reference_prices = {"sell": {"copper_bar": 3}}
+    assert acquisition_method("copper_bar", 1, state, gd, _RESERVE) == Method.BUY
+
+
 def test_acquisition_method_crafts_when_no_seller() -> None:
     """Fail-open: no NPC sells the item -> CRAFT."""
     gd = GameData()
@@ -0,0 +1,206 @@
+"""HP dominance (`ai/dominance`) and the planner's pruning on it.
+
+The registry is checked the way the planner relies on it: for every action the
+factory builds, a healthier copy of a state must be at least as able to run it,
+at no greater cost, to a successor that differs only by holding at least as
+much HP — bar a Rest the healthier state does not need.
+"""
+
+import dataclasses
+from pathlib import Path
+
+import pytest
+from artifactsmmo_api_client import AuthenticatedClient
+
+from artifactsmmo_cli.ai import dominance
+from artifactsmmo_cli.ai.actions.base import Action
+from artifactsmmo_cli.ai.actions.consumable import UseConsumableAction
+from artifactsmmo_cli.ai.actions.factory import build_actions
+from artifactsmmo_cli.ai.actions.footprint import Footprint
+from artifactsmmo_cli.ai.actions.rest import RestAction
+from artifactsmmo_cli.ai.dominance import Expanded, HpFrontier, hp_dominance_applies
+from artifactsmmo_cli.ai.game_data import GameData, ItemStats
+from artifactsmmo_cli.ai.goals.gathering import GatherMaterialsGoal
+from artifactsmmo_cli.ai.goals.progression import UpgradeEquipmentGoal
+from artifactsmmo_cli.ai.goals.restore_hp import RestoreHPGoal
+from artifactsmmo_cli.ai.planner import _HP_INDEX, GOAPPlanner, _state_key
+from artifactsmmo_cli.ai.scenario import SCENARIOS, load_bundle_game_data, scenario_state
+from artifactsmmo_cli.ai.tiers.objective import CharacterObjective
+from artifactsmmo_cli.ai.world_state import WorldState
+from tests.test_ai.fixtures import HoldGoal, make_state
+
+_BUNDLE = (Path(__file__).resolve().parent / "scenarios" / "fixtures"
+           / "gamedata_bundle.json")
+_FLEET_FLOOR = 69.0
+"""Seconds per request on the 2026-08-10 five-character run: the floor under
+which rests stop being priced by their deficit."""
+
+
+@pytest.fixture(scope="module")
+def game_data():  # type: ignore[no-untyped-def]
+    return load_bundle_game_data(_BUNDLE)
+
+
+def _actions(game_data: GameData, state: WorldState) -> list[Action]:
+    return build_actions(game_data, state, CharacterObjective.from_game_data(game_data),
+                         bank_accessible=True, task_exchange_min_coins=0)
+
+
+def _without_hp(state: WorldState) -> tuple[object, ...]:
+    key = _state_key(state)
+    return key[:_HP_INDEX] + key[_HP_INDEX + 1:]
+
+
+@pytest.mark.parametrize("scenario", ["l1_fresh", "l12_deep_chain_grind", "l35_artifact_fill"])
+@pytest.mark.parametrize("healthy_share", [1.0, 0.6])
+def test_every_registered_action_is_hp_monotone(game_data, scenario, healthy_share):
+    base = scenario_state(SCENARIOS[scenario], game_data)
+    sick = dataclasses.replace(base, hp=max(1, base.max_hp // 3))
+    healthy = dataclasses.replace(base, hp=int(base.max_hp * healthy_share))
+    checked = 0
+    for action in _actions(game_data, base):
+        if not isinstance(action, dominance._HP_MONOTONE) or not action.is_applicable(sick, game_data):
+            continue
+        if isinstance(action, RestAction) and healthy.hp == healthy.max_hp:
+            assert not action.is_applicable(healthy, game_data)
+            continue
+        assert action.is_applicable(healthy, game_data), repr(action)
+        assert action.cost(healthy, game_data) <= action.cost(sick, game_data), repr(action)
+        after_sick, after_healthy = action.apply(sick, game_data), action.apply(healthy, game_data)
+        assert _without_hp(after_healthy) == _without_hp(after_sick), repr(action)
+        assert after_healthy.hp >= after_sick.hp, repr(action)
+        checked += 1
+    assert checked > 50
+
+
+class TestApplies:
+    def test_a_goal_nobody_declared_is_searched_in_full(self, game_data):
+        assert hp_dominance_applies(HoldGoal(), [RestAction()], make_state(), game_data)
+        assert not hp_dominance_applies(RestoreHPGoal(), [RestAction()], make_state(), game_data)
+
+    def test_the_declared_goals_read_no_hp(self):
+        goals = (GatherMaterialsGoal("copper_ring", {"copper_ring": 1}),
+                 UpgradeEquipmentGoal(committed_target=("copper_ring", "ring1_slot")))
+        states = (make_state(), make_state(inventory={"copper_ring": 1}),
+                  make_state(equipment={**make_state().equipment, "ring1_slot": "copper_ring"}))
+        for goal in goals:
+            assert goal.hp_monotone
+            for state in states:
+                assert goal.is_satisfied(dataclasses.replace(state, hp=1)) == goal.is_satisfied(state)
+
+    def test_an_unregistered_action_class_switches_it_off(self, game_data):
+        assert not hp_dominance_applies(HoldGoal(), [_Hurt(0.0)], make_state(), game_data)
+
+    def test_a_reachable_food_switches_it_off(self, game_data):
+        eat = UseConsumableAction(_item_stats={"cooked_chicken": ItemStats(
+            code="cooked_chicken", level=1, type_="consumable", hp_restore=80)})
+        assert eat.foods == {"cooked_chicken"}
+        assert hp_dominance_applies(HoldGoal(), [eat], make_state(), game_data)
+        holding = make_state(inventory={"cooked_chicken": 1})
+        assert not hp_dominance_applies(HoldGoal(), [eat], holding, game_data)
+
+    def test_food_with_no_reading_of_the_search_switches_it_off(self, game_data, monkeypatch):
+        monkeypatch.setattr(dominance, "_HP_MONOTONE", (_Hurt,))
+        eat = UseConsumableAction()
+        assert not hp_dominance_applies(HoldGoal(), [_Hurt(0.0), eat], make_state(), game_data)
+
+
+class TestHpFrontier:
+    def test_a_dominator_holds_more_hp_no_dearer_and_no_deeper(self):
+        frontier = HpFrontier(tie=1e-6)
+        expanded = Expanded(hp=50, g_score=10.0, depth=2, key=("k",))
+        frontier.add(("b",), expanded)
+        assert frontier.dominator(("b",), 40, 10.0 - 1e-9, 2) is expanded
+        assert frontier.dominator(("b",), 60, 20.0, 3) is None
+        assert frontier.dominator(("b",), 40, 9.0, 3) is None
+        assert frontier.dominator(("b",), 40, 20.0, 1) is None
+        assert frontier.dominator(("other",), 40, 20.0, 3) is None
+
+
+class TestPlannerPruning:
+    def test_a_fight_chain_is_planned_as_cheaply_from_fewer_nodes(self, game_data):
+        """Fight-rest-fight and fight-fight-rest tie under the request floor; the
+        healthier of the two is expanded, the other is not."""
+        state = scenario_state(SCENARIOS["l20_dual_utility"], game_data)
+        actions = _actions(game_data, state)
+        searched = {}
+        for monotone in (True, False):
+            goal = GatherMaterialsGoal("feather", {"feather": 6})
+            goal.hp_monotone = monotone
+            planner = GOAPPlanner()
+            planner.set_action_floor(_FLEET_FLOOR)
+            plan = planner.plan(state, goal, actions, game_data, None)
+            assert plan
+            cost, walked = 0.0, state
+            for action in plan:
+                cost += max(action.cost(walked, game_data), _FLEET_FLOOR)
+                walked = action.apply(walked, game_data)
+            searched[monotone] = (cost, planner.last_stats)
+        (pruned_cost, pruned), (full_cost, full) = searched[True], searched[False]
+        assert pruned_cost == pytest.approx(full_cost)
+        assert full.nodes_dominated == 0 < pruned.nodes_dominated
+        assert pruned.nodes_explored < full.nodes_explored
+
+    @pytest.mark.parametrize(("hurt_cost", "woken"), [(0.0, True), (0.5, False)])
+    def test_an_equally_cheap_dominated_node_wakes_what_its_dominator_skipped(self, monkeypatch, hurt_cost,
+                                                                              woken):
+        """`A` then `Hurt` reaches the bag `{a}` with less HP than `A` alone.
+        After `A`, `B` is skipped (it commutes with `A` and is listed first);
+        after `Hurt`, which touches everything, it is not. When the two cost
+        the same, the hurt node expands `B` itself; when it is dearer, it
+        expands nothing."""
+        monkeypatch.setattr(dominance, "_HP_MONOTONE", (_Hurt, _Flag))
+        b, hurt, a = _Flag("b", "n"), _Hurt(hurt_cost), _Flag("a", "m")
+        planner = GOAPPlanner()
+        plan = planner.plan(make_state(hp=150, max_hp=150), HoldGoal("a", "b"), [b, hurt, a], GameData())
+        assert [repr(action) for action in plan] == ["b", "a"]
+        assert planner.last_stats.nodes_dominated > 0
+        assert (({"a"}, 149) in b.applied_at) is woken
+
+
+class _Flag(Action):
+    """Adds one flag to the bag; declares the facts it writes. Records the
+    (bag, HP) it was applied at."""
+
+    def __init__(self, flag: str, *writes: str) -> None:
+        self.flag = flag
+        self.writes = frozenset(("flag", name) for name in writes)
+        self.applied_at: list[tuple[set[str], int]] = []
+
+    def is_applicable(self, state: WorldState, game_data: GameData) -> bool:
+        return self.flag not in state.inventory
+
+    def apply(self, state: WorldState, game_data: GameData) -> WorldState:
+        self.applied_at.append((set(state.inventory), state.hp))
+        return dataclasses.replace(state, inventory={**state.inventory, self.flag: 1})
+
+    def cost(self, state: WorldState, game_data: GameData, history=None) -> float:
+        return 1.0
+
+    def footprint(self, state: WorldState, game_data: GameData) -> Footprint:
+        return Footprint(writes=self.writes)
+
+    def execute(self, state: WorldState, client: AuthenticatedClient) -> WorldState:
+        raise NotImplementedError("planner-only test action")
+
+    def __repr__(self) -> str:
+        return self.flag
+
+
+class _Hurt(Action):
+    """Loses one HP, once; declares no footprint."""
+
+    def __init__(self, price: float) -> None:
+        self.price = price
+
+    def is_applicable(self, state: WorldState, game_data: GameData) -> bool:
+        return state.hp == state.max_hp
+
+    def apply(self, state: WorldState, game_data: GameData) -> WorldState:
+        return dataclasses.replace(state, hp=state.hp - 1)
+
+    def cost(self, state: WorldState, game_data: GameData, history=None) -> float:
+        return self.price
+
+    def execute(self, state: WorldState, client: AuthenticatedClient) -> WorldState:
+        raise NotImplementedError("planner-only test action")
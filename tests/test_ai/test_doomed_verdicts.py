@@ -0,0 +1,178 @@
+"""The fleet's WALL board — `DoomedVerdict`, its store methods, and the
+`DoomedMemo` that publishes and reads it.
+
+`DoomedMemo` lived in process memory: a restarted child and every sibling at
+the same levels each re-paid a full planning budget to learn a goal does not
+plan. With a store attached the verdict is paid for once.
+"""
+
+import tempfile
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import create_engine
+
+from artifactsmmo_cli.ai.doomed_memo import CYCLE_SECONDS, DoomedMemo
+from artifactsmmo_cli.ai.learning.coordination_store import CoordinationStore, SharedVerdict
+from artifactsmmo_cli.ai.plannability_signature import plannability_signature
+from tests.test_ai.fixtures import make_state
+
+NOW = datetime(2026, 8, 20, 12, 0, 0, tzinfo=timezone.utc)
+GOAL = "GatherMaterials(iron_sword, {iron_sword:1})"
+CATALOG = "a1b2c3d4e5f6a7b8"
+SIG = (12, (("mining", 10), ("weaponcrafting", 5)))
+
+
+@pytest.fixture
+def db(tmp_path):  # type: ignore[no-untyped-def]
+    return str(tmp_path / "coord.db")
+
+
+def _store(db: str, character: str) -> CoordinationStore:
+    return CoordinationStore(db_path=db, character=character)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = NOW
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+def _memo(db: str, character: str, clock: _Clock) -> DoomedMemo:
+    memo = DoomedMemo(clock=clock)
+    memo.share(_store(db, character), CATALOG)
+    return memo
+
+
+def _state(**skills: int):  # type: ignore[no-untyped-def]
+    return make_state(level=12, skills={"mining": 10, "weaponcrafting": 5, **skills})
+
+
+class TestStore:
+    def test_every_characters_verdict_is_read_back_own_included(self, db: str) -> None:
+        _store(db, "Robby").publish_doomed(GOAL, SIG, CATALOG, 2, 600, NOW)
+        c3p0 = _store(db, "C3P0")
+        c3p0.publish_doomed(GOAL, SIG, CATALOG, 1, 300, NOW)
+        verdicts = c3p0.doomed_verdicts(CATALOG)[GOAL]
+        assert sorted(verdicts, key=lambda v: v.failures) == [
+            SharedVerdict(SIG, 1, NOW + timedelta(seconds=300)),
+            SharedVerdict(SIG, 2, NOW + timedelta(seconds=600))]
+
+    def test_a_republish_replaces_the_characters_own_row(self, db: str) -> None:
+        robby = _store(db, "Robby")
+        robby.publish_doomed(GOAL, SIG, CATALOG, 1, 300, NOW)
+        robby.publish_doomed(GOAL, SIG, CATALOG, 2, 600, NOW)
+        assert robby.doomed_verdicts(CATALOG) == {GOAL: [SharedVerdict(SIG, 2, NOW + timedelta(seconds=600))]}
+
+    def test_another_catalog_reads_nothing(self, db: str) -> None:
+        _store(db, "Robby").publish_doomed(GOAL, SIG, CATALOG, 1, 300, NOW)
+        assert _store(db, "C3P0").doomed_verdicts("another") == {}
+
+    def test_clearing_drops_the_own_row_only(self, db: str) -> None:
+        robby, c3p0 = _store(db, "Robby"), _store(db, "C3P0")
+        robby.publish_doomed(GOAL, SIG, CATALOG, 1, 300, NOW)
+        c3p0.publish_doomed(GOAL, SIG, CATALOG, 3, 900, NOW)
+        c3p0.clear_doomed(GOAL, CATALOG)
+        c3p0.clear_doomed(GOAL, CATALOG)
+        assert [v.failures for v in c3p0.doomed_verdicts(CATALOG)[GOAL]] == [1]
+
+    def test_a_naive_datetime_is_refused(self, db: str) -> None:
+        with pytest.raises(ValueError):
+            _store(db, "Robby").publish_doomed(GOAL, SIG, CATALOG, 1, 300, NOW.replace(tzinfo=None))
+
+    def test_every_method_degrades_on_a_db_error(self, db: str, capsys) -> None:
+        robby = _store(db, "Robby")
+        robby._engine = create_engine(f"sqlite:///{tempfile.mkdtemp()}")
+        robby.publish_doomed(GOAL, SIG, CATALOG, 1, 300, NOW)
+        robby.clear_doomed(GOAL, CATALOG)
+        assert robby.doomed_verdicts(CATALOG) == {}
+        out = capsys.readouterr().out
+        for method in ("publish_doomed", "clear_doomed", "doomed_verdicts"):
+            assert f"[coordination] {method} failed" in out
+
+
+class TestSharedMemo:
+    def test_a_siblings_wall_is_not_searched_again(self, db: str) -> None:
+        """THE POINT. Robby's no-plan skips the goal for C3P0 at the same levels."""
+        clock = _Clock()
+        _memo(db, "Robby", clock).mark(GOAL, _state(), cycle=7)
+        assert _memo(db, "C3P0", clock).is_doomed(GOAL, _state(), cycle=0)
+
+    def test_a_restarted_process_inherits_its_own_wall(self, db: str) -> None:
+        clock = _Clock()
+        _memo(db, "Robby", clock).mark(GOAL, _state(), cycle=300)
+        assert _memo(db, "Robby", clock).is_doomed(GOAL, _state(), cycle=0)
+
+    def test_a_verdict_covers_only_characters_with_no_more_unlocks(self, db: str) -> None:
+        clock = _Clock()
+        _memo(db, "Robby", clock).mark(GOAL, _state(weaponcrafting=10), cycle=0)
+        assert _memo(db, "C3P0", clock).is_doomed(GOAL, _state(), cycle=0)
+        assert not _memo(db, "HAL", clock).is_doomed(GOAL, _state(weaponcrafting=11), cycle=0)
+        assert not _memo(db, "Lor", clock).is_doomed(GOAL, _state(alchemy=2), cycle=0)
+
+    def test_the_shared_window_is_the_cycle_window_on_the_wall_clock(self, db: str) -> None:
+        clock = _Clock()
+        _memo(db, "Robby", clock).mark(GOAL, _state(), cycle=0)
+        clock.now = NOW + timedelta(seconds=20 * CYCLE_SECONDS - 1)
+        assert _memo(db, "C3P0", clock).is_doomed(GOAL, _state(), cycle=0)
+        clock.now = NOW + timedelta(seconds=20 * CYCLE_SECONDS)
+        assert not _memo(db, "C3P0", clock).is_doomed(GOAL, _state(), cycle=0)
+
+    def test_a_mark_past_a_siblings_verdict_escalates_it(self, db: str) -> None:
+        """Robby failed twice (20, then 40 cycles); C3P0's first own failure,
+        after that window, is the wall's third: 80 cycles."""
+        clock = _Clock()
+        robby = _memo(db, "Robby", clock)
+        robby.mark(GOAL, _state(), cycle=0)
+        robby.mark(GOAL, _state(), cycle=20)
+        clock.now = NOW + timedelta(seconds=40 * CYCLE_SECONDS)
+        c3p0 = _memo(db, "C3P0", clock)
+        assert not c3p0.is_doomed(GOAL, _state(), cycle=0)
+        c3p0.mark(GOAL, _state(), cycle=0)
+        assert c3p0.is_doomed(GOAL, _state(), cycle=79)
+        assert not c3p0.is_doomed(GOAL, _state(), cycle=80)
+        own = [v for v in c3p0._board.doomed_verdicts(CATALOG)[GOAL] if v.failures == 3]  # type: ignore[union-attr]
+        assert own == [SharedVerdict(plannability_signature(_state()), 3,
+                                     clock.now + timedelta(seconds=80 * CYCLE_SECONDS))]
+
+    def test_a_goal_that_planned_ignores_the_siblings_wall_until_it_fails(self, db: str) -> None:
+        clock = _Clock()
+        _memo(db, "Robby", clock).mark(GOAL, _state(), cycle=0)
+        c3p0 = _memo(db, "C3P0", clock)
+        c3p0.clear(GOAL)
+        assert not c3p0.is_doomed(GOAL, _state(), cycle=1)
+        c3p0.mark(GOAL, _state(), cycle=1)
+        assert c3p0.is_doomed(GOAL, _state(), cycle=2)
+
+    def test_a_plan_clears_the_wall_this_character_published(self, db: str) -> None:
+        clock = _Clock()
+        robby = _memo(db, "Robby", clock)
+        robby.mark(GOAL, _state(), cycle=0)
+        robby.clear(GOAL)
+        assert not _memo(db, "C3P0", clock).is_doomed(GOAL, _state(), cycle=0)
+
+    def test_a_restarted_process_clears_the_wall_it_inherited(self, db: str) -> None:
+        clock = _Clock()
+        _memo(db, "Robby", clock).mark(GOAL, _state(), cycle=0)
+        restarted = _memo(db, "Robby", clock)
+        assert restarted.is_doomed("OtherGoal", _state(), cycle=0) is False
+        restarted.clear(GOAL)
+        assert not _memo(db, "C3P0", clock).is_doomed(GOAL, _state(), cycle=0)
+
+    def test_the_board_is_read_once_per_cycle(self, db: str) -> None:
+        clock = _Clock()
+        c3p0 = _memo(db, "C3P0", clock)
+        assert not c3p0.is_doomed(GOAL, _state(), cycle=0)
+        _memo(db, "Robby", clock).mark(GOAL, _state(), cycle=0)
+        assert not c3p0.is_doomed(GOAL, _state(), cycle=0)
+        assert c3p0.is_doomed(GOAL, _state(), cycle=1)
+
+    def test_no_catalog_keeps_the_memo_private(self, db: str) -> None:
+        clock = _Clock()
+        robby = DoomedMemo(clock=clock)
+        robby.share(_store(db, "Robby"), None)
+        robby.mark(GOAL, _state(), cycle=0)
+        robby.clear(GOAL)
+        assert _store(db, "C3P0").doomed_verdicts(CATALOG) == {}
@@ -156,7 +156,7 @@ def _driver_with_plan(plan, gd, state):
         def __init__(self):
             self.last_stats = type("S", (), {
                 "nodes_explored": 1, "max_depth_reached": 1,
-                "timed_out": False, "node_capped": False})()
+                "timed_out": False, "node_capped": False, "subgoals": []})()
 
         def plan(self, *a, **kw):
             return list(plan)
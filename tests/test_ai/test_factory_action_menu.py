@@ -0,0 +1,130 @@
+"""ActionMenu: the cross-cycle action list reuses every emission block whose
+inputs did not move, emits exactly what `build_actions` would, and returns
+a new list object only when the list changes."""
+
+from artifactsmmo_cli.ai.actions.combat import FightAction
+from artifactsmmo_cli.ai.actions.delete import DeleteItemAction
+from artifactsmmo_cli.ai.actions.equip import EquipAction
+from artifactsmmo_cli.ai.actions.factory import ActionMenu, build_actions
+from artifactsmmo_cli.ai.actions.task_trade import TaskTradeAction
+from artifactsmmo_cli.ai.actions.withdraw_item import WithdrawItemAction
+from artifactsmmo_cli.ai.game_data import GameData, ItemStats
+from artifactsmmo_cli.ai.player import GamePlayer
+from artifactsmmo_cli.ai.world_state import WorldState
+from tests.test_ai.fixtures import make_state
+
+
+def _gd() -> GameData:
+    gd = GameData()
+    gd._item_stats = {
+        "copper_helmet": ItemStats(code="copper_helmet", level=1, type_="helmet",
+                                   crafting_skill="gearcrafting", crafting_level=1),
+        "copper_bar": ItemStats(code="copper_bar", level=1, type_="resource",
+                                crafting_skill="mining", crafting_level=1),
+        "copper_ore": ItemStats(code="copper_ore", level=1, type_="resource"),
+        "satchel": ItemStats(code="satchel", level=1, type_="bag"),
+    }
+    gd._crafting_recipes = {
+        "copper_helmet": {"copper_bar": 6},
+        "copper_bar": {"copper_ore": 10},
+    }
+    gd._resource_drops = {"copper_rocks": "copper_ore"}
+    gd._resource_locations = {"copper_rocks": [(2, 0)]}
+    gd._monster_locations = {"chicken": [(0, 1)]}
+    gd._monster_level = {"chicken": 1}
+    gd._workshop_locations = {"gearcrafting": (3, 0), "mining": (5, 0)}
+    gd._bank_location = (4, 0)
+    gd._taskmaster_location = (1, 2)
+    return gd
+
+
+def _build(menu: ActionMenu, gd: GameData, state: WorldState | None, bank: bool = True) -> list:
+    return menu.build(gd, state, None, bank, 6)
+
+
+def _reprs(actions: list) -> list[str]:
+    return [repr(a) for a in actions]
+
+
+def test_menu_matches_one_shot_factory():
+    gd = _gd()
+    menu = ActionMenu()
+    states = [
+        None,
+        make_state(inventory={"copper_ore": 3}),
+        make_state(inventory={"satchel": 1, "copper_ore": 3}),
+        make_state(inventory={"copper_bar": 2}, task_type="items", task_code="copper_bar",
+                   task_total=8, task_progress=0),
+    ]
+    for state in states:
+        for bank in (True, False):
+            assert _reprs(_build(menu, gd, state, bank)) == _reprs(build_actions(gd, state, None, bank, 6))
+
+
+def test_unchanged_inputs_return_the_same_list():
+    gd = _gd()
+    menu = ActionMenu()
+    state = make_state(inventory={"copper_ore": 3})
+    first = _build(menu, gd, state)
+    assert _build(menu, gd, make_state(inventory={"copper_ore": 9}, hp=3)) is first
+
+
+def test_bank_lock_rebuilds_only_bank_blocks():
+    gd = _gd()
+    menu = ActionMenu()
+    state = make_state(inventory={"copper_ore": 3})
+    open_bank = _build(menu, gd, state)
+    locked = _build(menu, gd, state, bank=False)
+    assert locked is not open_bank
+    fight_before = next(a for a in open_bank if isinstance(a, FightAction))
+    fight_after = next(a for a in locked if isinstance(a, FightAction))
+    assert fight_after is fight_before
+    assert all(not a.accessible for a in locked if isinstance(a, WithdrawItemAction))
+    assert [a.code for a in locked if isinstance(a, DeleteItemAction)] == ["copper_ore"]
+
+
+def test_task_change_rebuilds_task_block():
+    gd = _gd()
+    menu = ActionMenu()
+    _build(menu, gd, make_state())
+    with_task = _build(menu, gd, make_state(task_type="items", task_code="copper_bar",
+                                            task_total=1, task_progress=0))
+    assert [a.code for a in with_task if isinstance(a, TaskTradeAction)] == ["copper_bar"]
+    dropped = _build(menu, gd, make_state())
+    assert not [a for a in dropped if isinstance(a, TaskTradeAction)]
+
+
+def test_acquired_equippable_extends_the_menu():
+    gd = _gd()
+    menu = ActionMenu()
+    before = _build(menu, gd, make_state(inventory={"copper_ore": 3}))
+    after = _build(menu, gd, make_state(inventory={"copper_ore": 3, "satchel": 1}))
+    assert not [a for a in before if isinstance(a, EquipAction) and a.code == "satchel"]
+    assert [a for a in after if isinstance(a, EquipAction) and a.code == "satchel"]
+
+
+def test_game_data_change_rebuilds_everything():
+    menu = ActionMenu()
+    gd = _gd()
+    first = _build(menu, gd, None)
+    gd._crafting_recipes = {**gd._crafting_recipes, "copper_ring": {"copper_bar": 2}}
+    gd._item_stats = {**gd._item_stats, "copper_ring": ItemStats(
+        code="copper_ring", level=1, type_="ring", crafting_skill="jewelrycrafting", crafting_level=1)}
+    grown = _build(menu, gd, None)
+    assert "Craft(copper_ring×1)" in _reprs(grown)
+    assert not set(map(id, grown)) & set(map(id, first))
+    reloaded = _build(menu, _gd(), None)
+    assert not set(map(id, reloaded)) & set(map(id, grown))
+
+
+def test_menu_actions_are_keyed():
+    menu = ActionMenu()
+    assert all(a._action_key is not None for a in _build(menu, _gd(), None))
+
+
+def test_player_reuses_menu_across_cycles():
+    player = GamePlayer(character="hero")
+    player.game_data = _gd()
+    player.state = make_state()
+    first = player._build_actions()
+    assert player._build_actions() is first
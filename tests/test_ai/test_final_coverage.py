@@ -24,6 +24,11 @@ class _NoopCache:
     """Stand-in for GameDataCache: no disk, no URL parsing. read() always misses
     (so load fetches the patched-empty loaders); write() is a no-op."""
 
+    tile_distance_path = None
+    grind_candidate_path = None
+    loadout_path = None
+    ge_market_path = None
+
     def __init__(self, *a, **k):
         pass
 
@@ -1311,6 +1311,168 @@ def test_load_ge_orders_sell_paginates_past_full_page(monkeypatch):
     assert gd.ge_best_sell_order("ore") == ("p2", 3, 4)
 
 
+def _typed_ge_sync(book):
+    """A `get_ge_orders` fake serving full API-shaped orders by side."""
+    from datetime import datetime, timezone
+
+    calls = []
+
+    def fake_sync(client, type_, page, size):
+        calls.append(type_.value)
+        data = [SimpleNamespace(id=oid, type_=type_, code=code, price=price, quantity=qty,
+                                created_at=datetime(2026, 10, 1, tzinfo=timezone.utc))
+                for oid, side, code, price, qty in book if side == type_.value]
+        return SimpleNamespace(data=data if page == 1 else [])
+
+    return fake_sync, calls
+
+
+def test_load_ge_orders_syncs_the_shared_store_once(monkeypatch, tmp_path):
+    """The first child pages both sides into the store; a sibling booting
+    inside the TTL reads the snapshot without a single GE request."""
+    fake_sync, calls = _typed_ge_sync([("b1", "buy", "gem", 9, 2), ("s1", "sell", "gem", 12, 1)])
+    monkeypatch.setattr("artifactsmmo_cli.ai.game_data.get_ge_orders", fake_sync)
+    first = GameData()
+    first._ge_market_path = tmp_path / "ge.db"
+    first._load_ge_orders(client=None)
+    assert calls == ["buy", "sell"]
+    assert first.ge_best_buy_order("gem") == ("b1", 9, 2)
+    assert first.ge_best_sell_order("gem") == ("s1", 12, 1)
+    sibling = GameData()
+    sibling._ge_market_path = tmp_path / "ge.db"
+    sibling._load_ge_orders(client=None)
+    assert calls == ["buy", "sell"]
+    assert sibling._ge_buy_orders == first._ge_buy_orders
+    assert sibling._ge_sell_orders == first._ge_sell_orders
+
+
+def test_load_ge_orders_pages_a_never_synced_side_despite_a_live_claim(monkeypatch, tmp_path):
+    from datetime import datetime, timezone
+
+    from artifactsmmo_cli.ai.ge_market_store import GeMarketStore
+
+    GeMarketStore(tmp_path / "ge.db").claim_sync("sell", datetime.now(tz=timezone.utc))
+    fake_sync, calls = _typed_ge_sync([("s1", "sell", "gem", 12, 1)])
+    monkeypatch.setattr("artifactsmmo_cli.ai.game_data.get_ge_orders", fake_sync)
+    gd = GameData()
+    gd._ge_market_path = tmp_path / "ge.db"
+    gd._load_ge_orders(client=None)
+    assert calls == ["buy", "sell"]
+    assert gd.ge_best_sell_order("gem") == ("s1", 12, 1)
+
+
+def _stale_claimed_sell_side(path):
+    """A store both of whose sides a sibling has just claimed: buy already
+    synced, sell still holding the hour-old snapshot the claim is replacing."""
+    from datetime import datetime, timedelta, timezone
+
+    from artifactsmmo_cli.ai.ge_market_store import BookOrder, GeMarketStore
+
+    now = datetime.now(tz=timezone.utc)
+    store = GeMarketStore(path)
+    store.record_book("buy", [], now)
+    store.record_book("sell", [BookOrder("old", "sell", "gem", 30, 1, now.isoformat())], now - timedelta(hours=1))
+    store.claim_sync("buy", now)
+    store.claim_sync("sell", now)
+    return store
+
+
+def _fake_clock(monkeypatch, on_sleep=lambda: None):
+    clock = [0.0]
+
+    def sleep(seconds):
+        clock[0] += seconds
+        on_sleep()
+
+    monkeypatch.setattr("artifactsmmo_cli.ai.ge_market_store.time",
+                        SimpleNamespace(monotonic=lambda: clock[0], sleep=sleep))
+
+
+def test_load_ge_orders_pages_live_when_a_claimed_side_stays_stale(monkeypatch, tmp_path):
+    """The claimer never lands its sync: after the wait the side is paged,
+    not served from the hour-old snapshot."""
+    _stale_claimed_sell_side(tmp_path / "ge.db")
+    _fake_clock(monkeypatch)
+    fake_sync, calls = _typed_ge_sync([("s1", "sell", "gem", 12, 1)])
+    monkeypatch.setattr("artifactsmmo_cli.ai.game_data.get_ge_orders", fake_sync)
+    gd = GameData()
+    gd._ge_market_path = tmp_path / "ge.db"
+    gd._load_ge_orders(client=None)
+    assert calls == ["sell"]
+    assert gd.ge_best_sell_order("gem") == ("s1", 12, 1)
+
+
+def test_load_ge_orders_waits_for_the_claimers_sync(monkeypatch, tmp_path):
+    from datetime import datetime, timezone
+
+    from artifactsmmo_cli.ai.ge_market_store import BookOrder
+
+    store = _stale_claimed_sell_side(tmp_path / "ge.db")
+    landed = [BookOrder("new", "sell", "gem", 11, 2, "2026-10-01T00:00:00+00:00")]
+    _fake_clock(monkeypatch, lambda: store.record_book("sell", landed, datetime.now(tz=timezone.utc)))
+    fake_sync, calls = _typed_ge_sync([])
+    monkeypatch.setattr("artifactsmmo_cli.ai.game_data.get_ge_orders", fake_sync)
+    gd = GameData()
+    gd._ge_market_path = tmp_path / "ge.db"
+    gd._load_ge_orders(client=None)
+    assert calls == []
+    assert gd.ge_best_sell_order("gem") == ("new", 11, 2)
+    # The history the store holds backs the reference price: 30, then 11.
+    assert gd.ge_reference_price("gem", "sell") == 11
+    assert gd.ge_reference_price("gem", "buy") is None
+
+
+def test_load_ge_orders_falls_back_to_live_when_store_fails(monkeypatch, tmp_path, capsys):
+    import sqlite3
+
+    fake_sync, _ = _typed_ge_sync([("b1", "buy", "gem", 9, 2)])
+    monkeypatch.setattr("artifactsmmo_cli.ai.game_data.get_ge_orders", fake_sync)
+
+    def broken(path):
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr("artifactsmmo_cli.ai.game_data.GeMarketStore", broken)
+    gd = GameData()
+    gd._ge_market_path = tmp_path / "ge.db"
+    gd._load_ge_orders(client=None)
+    assert gd.ge_best_buy_order("gem") == ("b1", 9, 2)
+    assert "paging live" in capsys.readouterr().out
+
+
+def test_load_ge_orders_pages_live_when_the_cache_dir_is_unwritable(monkeypatch, tmp_path, capsys):
+    """`GeMarketStore` creates its directory; an OSError there (a file in the
+    way, a read-only or full disk) must not fail `GameData.load`."""
+    fake_sync, calls = _typed_ge_sync([("b1", "buy", "gem", 9, 2), ("s1", "sell", "gem", 12, 1)])
+    monkeypatch.setattr("artifactsmmo_cli.ai.game_data.get_ge_orders", fake_sync)
+    (tmp_path / "blocked").write_text("")
+    gd = GameData()
+    gd._ge_market_path = tmp_path / "blocked" / "ge.db"
+    gd._load_ge_orders(client=None)
+    assert calls == ["buy", "sell"]
+    assert gd.ge_best_buy_order("gem") == ("b1", 9, 2)
+    assert gd.ge_best_sell_order("gem") == ("s1", 12, 1)
+    assert capsys.readouterr().out.count("paging live") == 1
+
+
+def test_load_ge_orders_pages_live_a_side_the_store_fails_on(monkeypatch, tmp_path, capsys):
+    import sqlite3
+
+    from artifactsmmo_cli.ai.ge_market_store import GeMarketStore
+
+    fake_sync, _ = _typed_ge_sync([("b1", "buy", "gem", 9, 2)])
+    monkeypatch.setattr("artifactsmmo_cli.ai.game_data.get_ge_orders", fake_sync)
+
+    def locked(self, side, now):
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(GeMarketStore, "claim_sync", locked)
+    gd = GameData()
+    gd._ge_market_path = tmp_path / "ge.db"
+    gd._load_ge_orders(client=None)
+    assert gd.ge_best_buy_order("gem") == ("b1", 9, 2)
+    assert capsys.readouterr().out.count("paging live") == 2
+
+
 def test_grand_exchange_location_accessor():
     from artifactsmmo_cli.ai.game_data import GameData
     gd = GameData()
@@ -1,7 +1,7 @@
 import json
 from datetime import datetime, timedelta, timezone
 
-from artifactsmmo_cli.ai.game_data_cache import CACHE_VERSION, GameDataCache
+from artifactsmmo_cli.ai.game_data_cache import CACHE_VERSION, GameDataCache, catalog_digest
 
 _T0 = datetime(2026, 6, 13, 8, 0, 0, tzinfo=timezone.utc)
 _PAGES = {"maps": [{"x": 1, "y": 2}], "items": [{"code": "ash"}], "bank": {"slots": 30}}
@@ -62,3 +62,27 @@ def test_path_keyed_by_host(tmp_path):
     a = GameDataCache("https://api.artifactsmmo.com", cache_dir=tmp_path).path
     b = GameDataCache("https://sandbox.artifactsmmo.com", cache_dir=tmp_path).path
     assert a != b
+
+
+def test_catalog_digest_ignores_the_bank_page():
+    moved = {**_PAGES, "bank": {"slots": 40}}
+    assert catalog_digest(moved) == catalog_digest(_PAGES)
+    assert catalog_digest({**_PAGES, "items": [{"code": "birch"}]}) != catalog_digest(_PAGES)
+
+
+def test_grind_candidate_path_sits_next_to_the_bundle(tmp_path):
+    c = _cache(tmp_path)
+    assert c.grind_candidate_path.parent == c.path.parent
+    assert c.grind_candidate_path.name == "grind-api.artifactsmmo.com.json"
+
+
+def test_loadout_path_sits_next_to_the_bundle(tmp_path):
+    c = _cache(tmp_path)
+    assert c.loadout_path.parent == c.path.parent
+    assert c.loadout_path.name == "loadout-api.artifactsmmo.com.json"
+
+
+def test_ge_market_path_sits_next_to_the_bundle(tmp_path):
+    c = _cache(tmp_path)
+    assert c.ge_market_path.parent == c.path.parent
+    assert c.ge_market_path.name == "ge-api.artifactsmmo.com.db"
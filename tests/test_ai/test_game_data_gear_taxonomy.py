@@ -23,3 +23,7 @@ def test_properties_classify_durable_vs_consumable():
     assert "bag" not in gd.combat_gear_types          # not combat-bearing
     assert "weapon" not in gd.defensive_gear_types
     assert "ring" in gd.defensive_gear_types
+
+
+def test_item_stats_are_slotted():
+    assert not hasattr(ItemStats(code="a", level=1, type_="ring"), "__dict__")
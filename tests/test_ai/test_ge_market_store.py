@@ -0,0 +1,153 @@
+"""GeMarketStore: the shared local GE order book, its diffed sync and the price
+history it accumulates."""
+
+import sqlite3
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+from artifactsmmo_api_client.models.ge_order_type import GEOrderType
+
+from artifactsmmo_cli.ai.ge_market_store import (
+    GE_SYNC_TTL_SECONDS,
+    BookOrder,
+    GeMarketStore,
+    PriceSample,
+    best_order,
+    book_order,
+)
+
+T0 = datetime(2026, 10, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def _order(oid: str, code: str, price: int, quantity: int = 1, side: str = "sell") -> BookOrder:
+    return BookOrder(id=oid, side=side, code=code, price=price, quantity=quantity,
+                     created_at=T0.isoformat())
+
+
+def test_best_order_picks_fill_side_with_deterministic_ties():
+    sells = [_order("a", "gem", 5, 2), _order("b", "gem", 5, 9), _order("c", "gem", 5, 9),
+             _order("d", "gem", 7, 50), _order("e", "ore", 3)]
+    assert best_order("sell", sells) == {"gem": ("c", 5, 9), "ore": ("e", 3, 1)}
+    buys = [_order("a", "gem", 5, side="buy"), _order("b", "gem", 8, side="buy")]
+    assert best_order("buy", buys) == {"gem": ("b", 8, 1)}
+
+
+def test_book_order_converts_api_schema():
+    api = SimpleNamespace(id="o1", type_=GEOrderType.BUY, code="gem", price=4, quantity=2, created_at=T0)
+    assert book_order(api) == BookOrder("o1", "buy", "gem", 4, 2, T0.isoformat())  # type: ignore[arg-type]
+
+
+def test_record_book_round_trips_and_stamps_sync(tmp_path):
+    store = GeMarketStore(tmp_path / "ge.db")
+    assert store.synced_at("sell") is None
+    book = [_order("a", "gem", 5), _order("b", "ore", 3)]
+    assert store.record_book("sell", book, T0) == 2
+    assert store.book("sell") == book
+    assert store.book() == book
+    assert store.book("buy") == []
+    assert store.synced_at("sell") == T0
+    assert store.best_orders("sell") == {"gem": ("a", 5, 1), "ore": ("b", 3, 1)}
+
+
+def test_record_book_is_a_diff(tmp_path):
+    store = GeMarketStore(tmp_path / "ge.db")
+    store.record_book("sell", [_order("a", "gem", 5), _order("b", "ore", 3)], T0)
+    later = T0 + timedelta(minutes=5)
+    assert store.record_book("sell", [_order("a", "gem", 5), _order("c", "ore", 2)], later) == 2
+    assert store.record_book("sell", [_order("a", "gem", 5), _order("c", "ore", 2)], later) == 0
+    assert [o.id for o in store.book("sell")] == ["a", "c"]
+
+
+def test_price_history_samples_only_moves(tmp_path):
+    store = GeMarketStore(tmp_path / "ge.db")
+    store.record_book("sell", [_order("a", "gem", 5, 2)], T0)
+    t1, t2, t3 = (T0 + timedelta(minutes=m) for m in (1, 2, 3))
+    store.record_book("sell", [_order("a", "gem", 5, 2)], t1)  # unchanged: no sample
+    store.record_book("sell", [_order("a", "gem", 5, 2), _order("b", "gem", 4, 1)], t2)
+    store.record_book("sell", [], t3)
+    assert store.price_history("gem", "sell") == [
+        PriceSample("gem", "sell", T0.isoformat(), 5, 2, 1),
+        PriceSample("gem", "sell", t2.isoformat(), 4, 3, 2),
+        PriceSample("gem", "sell", t3.isoformat(), None, 0, 0),
+    ]
+    assert [s.at for s in store.price_history("gem", "sell", since=t2)] == [t2.isoformat(), t3.isoformat()]
+    assert store.price_history("gem", "buy") == []
+
+
+def test_per_code_record_leaves_the_rest_of_the_side(tmp_path):
+    store = GeMarketStore(tmp_path / "ge.db")
+    store.record_book("sell", [_order("a", "gem", 5), _order("b", "ore", 3)], T0)
+    later = T0 + timedelta(minutes=5)
+    store.record_book("sell", [_order("c", "gem", 6), _order("x", "ore", 1)], later, code="gem")
+    assert [o.id for o in store.book("sell")] == ["c", "b"]
+    assert store.book("sell", code="gem") == [_order("c", "gem", 6)]
+    assert store.synced_at("sell") == T0
+
+
+def test_claim_sync_is_exclusive_within_ttl(tmp_path):
+    path = tmp_path / "ge.db"
+    first, sibling = GeMarketStore(path), GeMarketStore(path)
+    assert first.claim_sync("buy", T0)
+    assert not sibling.claim_sync("buy", T0 + timedelta(seconds=5))
+    assert sibling.claim_sync("sell", T0)
+    assert sibling.claim_sync("buy", T0 + timedelta(seconds=GE_SYNC_TTL_SECONDS + 1))
+
+
+def test_is_fresh_needs_both_sides(tmp_path):
+    store = GeMarketStore(tmp_path / "ge.db")
+    store.record_book("buy", [], T0)
+    assert not store.is_fresh(T0)
+    store.record_book("sell", [], T0)
+    assert store.is_fresh(T0 + timedelta(seconds=10))
+    assert not store.is_fresh(T0 + timedelta(seconds=GE_SYNC_TTL_SECONDS + 1))
+    assert store.is_fresh(T0, sides=("buy",))
+
+
+def test_await_sync_waits_for_the_claimers_snapshot(tmp_path, monkeypatch):
+    """A side the claimer is still paging is stale until its record lands;
+    the waiter polls until then instead of reading the old snapshot."""
+    store = GeMarketStore(tmp_path / "ge.db")
+    store.record_book("sell", [], T0 - timedelta(hours=1))
+    naps: list[float] = []
+
+    def claimer_lands(seconds):
+        naps.append(seconds)
+        store.record_book("sell", [_order("a", "gem", 5)], T0 + timedelta(seconds=3))
+
+    monkeypatch.setattr("artifactsmmo_cli.ai.ge_market_store.time.sleep", claimer_lands)
+    assert store.await_sync("sell", T0)
+    assert len(naps) == 1
+    assert store.await_sync("sell", T0)
+    assert len(naps) == 1
+
+
+def test_await_sync_gives_up_on_a_claim_that_never_lands(tmp_path, monkeypatch):
+    store = GeMarketStore(tmp_path / "ge.db")
+    store.record_book("sell", [], T0 - timedelta(hours=1))
+    monkeypatch.setattr("artifactsmmo_cli.ai.ge_market_store.time.sleep", lambda seconds: None)
+    assert not store.await_sync("sell", T0, wait_seconds=0.0)
+
+
+def test_reference_prices_take_the_median_in_force_over_the_window(tmp_path):
+    store = GeMarketStore(tmp_path / "ge.db")
+    before = T0 - timedelta(days=2)
+    store.record_book("sell", [_order("a", "gem", 50), _order("o", "ore", 7), _order("z", "tin", 3)], before)
+    store.record_book("sell", [_order("a", "gem", 40), _order("o", "ore", 7)], before + timedelta(hours=1))
+    store.record_book("sell", [_order("b", "gem", 10), _order("o", "ore", 7)], T0 + timedelta(hours=1))
+    store.record_book("sell", [_order("c", "gem", 12), _order("o", "ore", 7)], T0 + timedelta(hours=2))
+    store.record_book("sell", [_order("o", "ore", 7)], T0 + timedelta(hours=3))
+    store.record_book("sell", [_order("d", "gem", 14), _order("o", "ore", 7)], T0 + timedelta(hours=4))
+    # gem: 40 (in force at T0), 10, 12, emptied, 14 -> median_low 12. ore never
+    # moved in the window, so its price in force is the reference. tin emptied
+    # before the window opened.
+    assert store.reference_prices("sell", T0) == {"gem": 12, "ore": 7}
+    assert store.reference_prices("buy", T0) == {}
+
+
+def test_failed_transaction_rolls_back(tmp_path):
+    store = GeMarketStore(tmp_path / "ge.db")
+    store.record_book("sell", [_order("a", "gem", 5)], T0)
+    with pytest.raises(sqlite3.IntegrityError):
+        store.record_book("sell", [_order("a", "gem", 5), _order("b", None, 1)], T0)  # type: ignore[arg-type]
+    assert store.book("sell") == [_order("a", "gem", 5)]
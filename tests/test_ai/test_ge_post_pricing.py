@@ -1,4 +1,4 @@
-from artifactsmmo_cli.ai.ge_post_pricing import buy_post_price, sell_post_price
+from artifactsmmo_cli.ai.ge_post_pricing import buy_post_price, sell_post_price, within_reference
 
 
 class TestSellPostPrice:
@@ -23,3 +23,17 @@ class TestBuyPostPrice:
     def test_ceilinged_at_alt_cost_minus_margin(self):
         # best_buy+1 = 15 would sit above the ceiling 14; clamp down to the ceiling.
         assert buy_post_price(best_buy=14, alt_cost=15, margin=1) == 14
+
+
+class TestWithinReference:
+    def test_no_history_admits_any_price(self):
+        assert within_reference("buy", 10_000, None)
+        assert within_reference("sell", 1, None)
+
+    def test_buy_refused_over_twice_the_reference(self):
+        assert within_reference("buy", 20, 10)
+        assert not within_reference("buy", 21, 10)
+
+    def test_sell_refused_under_half_the_reference(self):
+        assert within_reference("sell", 5, 10)
+        assert not within_reference("sell", 4, 10)
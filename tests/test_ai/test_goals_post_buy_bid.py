@@ -124,6 +124,16 @@ def test_no_candidate_without_live_buy_anchor():
     assert ge_bid_candidates(_state(), gd, _ctx({"steel": 1}), BID_FILL_HORIZON_SECONDS) == []
 
 
+def test_no_candidate_when_the_bid_overpays_the_recent_market():
+    # Recent best bid 20: overbidding today's spike order at 40 would pay over
+    # twice what the market has been bidding.
+    gd = _steel_gd()
+    gd._ge_reference_prices = {"buy": {"steel": 20}}
+    assert ge_bid_candidates(_state(), gd, _ctx({"steel": 1}), BID_FILL_HORIZON_SECONDS) == []
+    gd._ge_reference_prices = {"buy": {"steel": 21}}
+    assert ge_bid_candidates(_state(), gd, _ctx({"steel": 1}), BID_FILL_HORIZON_SECONDS) == [("steel", 1, 41)]
+
+
 def test_no_candidate_when_venue_is_ge_fill():
     # A standing sell order at 30 <= post_price 41 -> choose_buy_venue3 == GE (fill),
     # not GE_POST: fill the cheaper standing order instead of posting.
@@ -726,6 +726,7 @@ class TestSkillLevelsColumn:
             check.close()   # unclosed connections surface as an unraisable
                             # warning blamed on a LATER test; close explicitly
         assert "skill_levels_json" in cols
+        assert "state_json" in cols
         store.close()
 
 
@@ -10,6 +10,7 @@ from artifactsmmo_cli.ai.liquidation_venue import (
     choose_venue,
     choose_venue3,
     liquidation_venue,
+    post_sell_price,
     realized_proceeds,
 )
 from tests.test_ai.fixtures import make_state
@@ -157,3 +158,21 @@ def test_adapter_chooses_npc_when_neither_buyer_nor_order():
     state = make_state(inventory={"junk": 2})
     # npc_pay 0, ge None → choose_venue returns NPC (the safe default).
     assert liquidation_venue("junk", 2, state, gd) is Venue.NPC
+
+
+def test_post_sell_price_undercuts_the_standing_sell_order():
+    gd = GameData()
+    gd._ge_sell_orders = {"iron_ore": ("s1", 20, 4)}
+    assert post_sell_price("iron_ore", 5, gd) == 19
+    assert post_sell_price("copper_ore", 5, gd) is None  # no anchor: fail closed
+
+
+def test_post_sell_price_refuses_to_follow_a_dump_under_the_recent_market():
+    # A dumped sell order at 9 against a recent best sell of 40: posting at 8
+    # sells for a fifth of the market, so no post.
+    gd = GameData()
+    gd._ge_sell_orders = {"iron_ore": ("s1", 9, 4)}
+    gd._ge_reference_prices = {"sell": {"iron_ore": 40}}
+    assert post_sell_price("iron_ore", 5, gd) is None
+    gd._ge_reference_prices = {"sell": {"iron_ore": 16}}
+    assert post_sell_price("iron_ore", 5, gd) == 8
@@ -13,6 +13,10 @@ unchanged answer proves the memo served.
 """
 
 import gc
+import json
+import random
+from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -21,8 +25,12 @@ from artifactsmmo_cli.ai.actions.gathering import GatherAction
 from artifactsmmo_cli.ai.actions.optimize_loadout import OptimizeLoadoutAction
 from artifactsmmo_cli.ai.equipment.loadout_cache import (
     CACHE_MAX_ENTRIES,
+    LOADOUT_CACHE_VERSION,
+    _cache_for,
     _caches,
+    _inventory_key,
     pick_loadout_cached,
+    save_loadouts,
 )
 from artifactsmmo_cli.ai.equipment.loadout_picker import pick_loadout
 from artifactsmmo_cli.ai.game_data import GameData, ItemStats
@@ -30,6 +38,8 @@ from artifactsmmo_cli.ai.gear_value_core import Combat, Gather, Rank
 from artifactsmmo_cli.ai.task_lifecycle import derive_task_lifecycle_phase
 from artifactsmmo_cli.ai.world_state import WorldState
 
+_BUNDLE = Path(__file__).parent / "scenarios" / "fixtures" / "gamedata_bundle.json"
+
 _ALL_SLOTS: dict[str, str | None] = {
     "weapon_slot": None, "shield_slot": None, "helmet_slot": None,
     "body_armor_slot": None, "leg_armor_slot": None, "boots_slot": None,
@@ -133,15 +143,56 @@ class TestPickLoadoutCached:
             inventory={"iron_axe": 1, "copper_ore": 7, "uncatalogued_drop": 2})
         assert pick_loadout_cached(Gather("woodcutting"), churned, gd) == first
 
-    def test_equippable_count_change_recomputes(self) -> None:
+    def test_spare_copy_of_single_slot_gear_still_hits(self) -> None:
+        """A weapon's occupancy cap is 1 whatever the count, so a second copy
+        in the bag cannot change the pick and must not miss."""
         gd = _gd()
-        pick_loadout_cached(
+        first = pick_loadout_cached(
             Gather("woodcutting"), _make_state(inventory={"iron_axe": 1}), gd)
         _poison(gd)
-        fresh = pick_loadout_cached(
-            Gather("woodcutting"), _make_state(inventory={"iron_axe": 2}), gd)
-        # Two copies = new key = recompute against the poisoned catalog.
-        assert fresh["weapon_slot"] != "iron_axe"
+        assert pick_loadout_cached(
+            Gather("woodcutting"), _make_state(inventory={"iron_axe": 2}), gd) == first
+
+    def test_ring_count_enters_key_up_to_slot_count(self) -> None:
+        gd = _gd()
+        gd._item_stats["copper_ring"] = ItemStats(code="copper_ring", level=1, type_="ring",
+                                                  attack={"earth": 1})
+
+        def key(qty: int) -> tuple[tuple[str, int], ...]:
+            return _inventory_key(_make_state(inventory={"copper_ring": qty, "iron_axe": 0}), gd)
+
+        _cache_for(gd)
+        assert key(1) != key(2)
+        assert key(2) == key(3) == key(7) == (("copper_ring", 2),)
+
+    def test_above_level_gear_still_hits(self) -> None:
+        """Gear above the character's level is never a candidate."""
+        gd = _gd()
+        gd._item_stats["steel_axe"] = ItemStats(code="steel_axe", level=20, type_="weapon",
+                                                subtype="tool", skill_effects={"woodcutting": -30})
+        first = pick_loadout_cached(
+            Gather("woodcutting"), _make_state(inventory={"iron_axe": 1}), gd)
+        _poison(gd)
+        above = _make_state(inventory={"iron_axe": 1, "steel_axe": 1})
+        assert pick_loadout_cached(Gather("woodcutting"), above, gd) == first
+
+    def test_matches_uncached_on_the_real_catalog(self) -> None:
+        """Differential: over many bags drawn from the shipped catalog, every
+        answer — hit or miss — equals a fresh `pick_loadout`, and the projected
+        key does collapse some of them."""
+        gd = GameData.from_cache_bundle(json.loads(_BUNDLE.read_text()))
+        gear = sorted(code for code, stats in gd.all_item_stats.items()
+                      if stats.type_ in ("ring", "weapon", "helmet", "amulet", "artifact") and stats.level <= 15)
+        junk = sorted(code for code, stats in gd.all_item_stats.items() if stats.type_ == "resource")[:5]
+        rng = random.Random(30)
+        purposes = [Gather("mining"), Gather("woodcutting"), Rank()]
+        for _ in range(300):
+            bag = {code: rng.randint(1, 4) for code in rng.sample(gear, 4)}
+            bag.update({code: rng.randint(1, 9) for code in rng.sample(junk, 2)})
+            state = _make_state(level=rng.choice((5, 10, 15)), inventory=bag)
+            purpose = rng.choice(purposes)
+            assert pick_loadout_cached(purpose, state, gd) == pick_loadout(purpose, state, gd)
+        assert len(_caches[id(gd)]) < 300
 
     def test_purpose_distinguishes_entries(self) -> None:
         gd = _gd()
@@ -242,3 +293,64 @@ class TestHotCallersUseCache:
         first = action.cost(state, gd)
         _poison(gd)
         assert action.cost(state, gd) == first
+
+
+class TestPersistence:
+    """`save_loadouts` carries solved entries across restarts and siblings."""
+
+    def _persisting_gd(self, path: Path) -> GameData:
+        gd = _gd()
+        gd._loadout_cache_path = path
+        gd._catalog_digest = "cat"
+        return gd
+
+    def test_restart_is_served_from_the_file(self, tmp_path: Path) -> None:
+        path = tmp_path / "loadout.json"
+        state = _make_state(inventory={"iron_axe": 1})
+        first_gd = self._persisting_gd(path)
+        first = pick_loadout_cached(Gather("woodcutting"), state, first_gd)
+        save_loadouts(first_gd)
+        assert json.loads(path.read_text())["version"] == LOADOUT_CACHE_VERSION
+        restarted = self._persisting_gd(path)
+        with patch("artifactsmmo_cli.ai.equipment.loadout_cache.pick_loadout_batched",
+                   side_effect=AssertionError("re-solved after restart")):
+            assert pick_loadout_cached(Gather("woodcutting"), state, restarted) == first
+
+    def test_other_catalog_reads_as_miss(self, tmp_path: Path) -> None:
+        path = tmp_path / "loadout.json"
+        state = _make_state(inventory={"iron_axe": 1})
+        first_gd = self._persisting_gd(path)
+        pick_loadout_cached(Gather("woodcutting"), state, first_gd)
+        save_loadouts(first_gd)
+        other = self._persisting_gd(path)
+        other._catalog_digest = "other"
+        pick_loadout_cached(Gather("woodcutting"), state, other)
+        assert len(_caches[id(other)]) == 1
+
+    def test_save_merges_sibling_entries(self, tmp_path: Path) -> None:
+        path = tmp_path / "loadout.json"
+        a, b = self._persisting_gd(path), self._persisting_gd(path)
+        pick_loadout_cached(Gather("woodcutting"), _make_state(inventory={"iron_axe": 1}), a)
+        pick_loadout_cached(Gather("woodcutting"), _make_state(inventory={"wooden_stick": 1}), b)
+        save_loadouts(a)
+        save_loadouts(b)
+        assert len(json.loads(path.read_text())["entries"]) == 2
+        assert len(_caches[id(b)]) == 2
+
+    def test_save_is_a_noop_without_path_or_new_entries(self, tmp_path: Path) -> None:
+        path = tmp_path / "loadout.json"
+        gd = _gd()
+        pick_loadout_cached(Gather("woodcutting"), _make_state(inventory={"iron_axe": 1}), gd)
+        save_loadouts(gd)
+        persisting = self._persisting_gd(path)
+        save_loadouts(persisting)
+        assert not path.exists()
+
+    def test_write_failure_is_reported_and_retried(self, tmp_path: Path, capsys) -> None:
+        gd = self._persisting_gd(tmp_path / "loadout.json")
+        pick_loadout_cached(Gather("woodcutting"), _make_state(inventory={"iron_axe": 1}), gd)
+        with patch("artifactsmmo_cli.ai.persisted_memo.os.replace", side_effect=OSError("disk full")):
+            save_loadouts(gd)
+        assert "loadout] cache write failed: disk full" in capsys.readouterr().out
+        save_loadouts(gd)
+        assert gd._loadout_cache_path is not None and gd._loadout_cache_path.exists()
@@ -0,0 +1,94 @@
+"""`memo_stats` — the counters the hot-path memo layers report into, and the
+per-cycle drain the trace record and `CycleSnapshot` carry."""
+
+import pytest
+
+from artifactsmmo_cli.ai import memo_stats
+from artifactsmmo_cli.ai.cycle_snapshot import CycleSnapshot, MemoLayerStats
+from artifactsmmo_cli.ai.equipment.loadout_cache import pick_loadout_cached
+from artifactsmmo_cli.ai.game_data import GameData
+from artifactsmmo_cli.ai.gear_value_core import Rank
+from artifactsmmo_cli.ai.per_state_memo import per_state
+from artifactsmmo_cli.ai.player import GamePlayer
+from tests.test_ai.fixtures import make_state
+
+
+@pytest.fixture(autouse=True)
+def _fresh_counts():  # type: ignore[no-untyped-def]
+    memo_stats.drain()
+    yield
+    memo_stats.set_enabled(True)
+    memo_stats.drain()
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_a_drain_reports_the_layers_used_and_resets_them(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(memo_stats, "perf_counter", clock)
+    entries = [1, 2, 3]
+    counter = memo_stats.memo_counter("test.layer", size=lambda: len(entries))
+    memo_stats.memo_counter("test.idle")
+    started = counter.start()
+    clock.now = 0.004
+    counter.miss(started)
+    counter.hit()
+    counter.hit()
+    assert memo_stats.drain() == {"test.layer": {"hits": 2, "misses": 1, "size": 3, "saved_ms": 8.0}}
+    assert memo_stats.drain() == {}
+
+
+def test_hits_with_no_miss_to_price_them_credit_nothing():
+    counter = memo_stats.memo_counter("test.unsized")
+    counter.hit()
+    assert memo_stats.drain()["test.unsized"] == {"hits": 1, "misses": 0, "size": -1, "saved_ms": 0.0}
+
+
+def test_a_name_registers_one_counter():
+    assert memo_stats.memo_counter("test.once") is memo_stats.memo_counter("test.once")
+
+
+def test_disabled_counters_count_and_report_nothing():
+    counter = memo_stats.memo_counter("test.off")
+    memo_stats.set_enabled(False)
+    counter.miss(counter.start())
+    counter.hit()
+    assert memo_stats.drain() == {}
+    memo_stats.set_enabled(True)
+    assert memo_stats.drain() == {}
+
+
+def test_each_per_state_helper_reports_under_its_own_name():
+    @per_state
+    def held_codes(state, game_data):
+        return len(state.inventory)
+
+    gd, state = GameData(), make_state()
+    held_codes(state, gd)
+    held_codes(state, gd)
+    counts = memo_stats.drain()["per_state.held_codes"]
+    assert (counts["hits"], counts["misses"], counts["size"]) == (1, 1, 1)
+
+
+def test_the_loadout_cache_reports_its_lookups():
+    gd, state = GameData(), make_state()
+    pick_loadout_cached(Rank(), state, gd)
+    pick_loadout_cached(Rank(), state, gd)
+    counts = memo_stats.drain()["loadout_cache"]
+    assert (counts["hits"], counts["misses"]) == (1, 1)
+    assert counts["size"] >= 1
+
+
+def test_the_cycle_drain_rides_the_snapshot():
+    calls: list[CycleSnapshot] = []
+    player = GamePlayer(character="hero", cycle_observer=calls.append)
+    player.state = make_state()
+    memo = {"loadout_cache": {"hits": 9, "misses": 1, "size": 40, "saved_ms": 12.5}}
+    player._notify_observer("Goal()", "Act()", "ok", goal_rank_trace=[], planner_stats={"memo": memo})
+    assert calls[0].memo == [MemoLayerStats(layer="loadout_cache", hits=9, misses=1, size=40, saved_ms=12.5)]
@@ -0,0 +1,57 @@
+"""persisted_memo: the versioned, catalog-tagged on-disk form shared by the
+grind-candidate and loadout memos."""
+
+import json
+from collections import OrderedDict
+
+from artifactsmmo_cli.ai.persisted_memo import read_entries, sync_memo, thaw_key, write_entries
+
+
+def _same(raw):
+    return raw
+
+
+def test_thaw_key_restores_nested_tuples():
+    assert thaw_key(["a", 1, [["b", 2], None]]) == ("a", 1, (("b", 2), None))
+
+
+def test_roundtrip_thaws_keys(tmp_path):
+    path = tmp_path / "memo.json"
+    write_entries(path, 1, "cat", [(("k", (("x", 1),)), {"v": 1})])
+    assert read_entries(path, 1, "cat", _same) == [(("k", (("x", 1),)), {"v": 1})]
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_other_version_catalog_or_corruption_reads_empty(tmp_path):
+    path = tmp_path / "memo.json"
+    write_entries(path, 1, "cat", [(("k",), 1)])
+    assert read_entries(path, 2, "cat", _same) == []
+    assert read_entries(path, 1, "other", _same) == []
+    assert read_entries(tmp_path / "absent.json", 1, "cat", _same) == []
+    path.write_text("{not json")
+    assert read_entries(path, 1, "cat", _same) == []
+
+
+def test_an_undecodable_entry_discards_the_file(tmp_path):
+    path = tmp_path / "memo.json"
+    write_entries(path, 1, "cat", [(("k",), 1), (("j",), "x")])
+    assert read_entries(path, 1, "cat", int) == []
+
+
+def test_sync_adopts_sibling_entries_at_the_cold_end(tmp_path):
+    path = tmp_path / "memo.json"
+    write_entries(path, 1, "cat", [(("sibling",), 7), (("mine",), 0)])
+    cache: OrderedDict = OrderedDict([(("mine",), 1), (("hot",), 2)])
+    sync_memo(cache, path, 1, "cat", _same, _same, persist=10, bound=10)
+    assert list(cache.items()) == [(("sibling",), 7), (("mine",), 1), (("hot",), 2)]
+    written = json.loads(path.read_text())["entries"]
+    assert written == [[["sibling"], 7], [["mine"], 1], [["hot"], 2]]
+
+
+def test_sync_respects_the_bound_and_writes_the_hottest(tmp_path):
+    path = tmp_path / "memo.json"
+    write_entries(path, 1, "cat", [(("sibling",), 7)])
+    cache: OrderedDict = OrderedDict([(("a",), 1), (("b",), 2), (("c",), 3)])
+    sync_memo(cache, path, 1, "cat", _same, _same, persist=2, bound=3)
+    assert list(cache) == [("a",), ("b",), ("c",)]
+    assert json.loads(path.read_text())["entries"] == [[["b"], 2], [["c"], 3]]
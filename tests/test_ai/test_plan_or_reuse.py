@@ -29,6 +29,9 @@ class _Act:
     def __repr__(self):
         return "FakeAct()"
 
+    def action_key(self):
+        return "FakeAct()"
+
 
 def _player_with_stub_plan(plan, goal):
     player = GamePlayer(character="hero", dry_run=True)
@@ -108,6 +111,10 @@ def test_advance_with_history_persists_cursor(tmp_path):
             raise KeyboardInterrupt
 
     class _NoopCache:
+        tile_distance_path = None
+        grind_candidate_path = None
+        loadout_path = None
+        ge_market_path = None
         def __init__(self, *a, **k): pass
         def read(self, ttl_minutes, now=None): return None
         def write(self, raw_pages, now=None): return None
@@ -1,5 +1,5 @@
 """plannability_signature: the (level, skills) key the doomed-memo invalidates on."""
-from artifactsmmo_cli.ai.plannability_signature import plannability_signature
+from artifactsmmo_cli.ai.plannability_signature import plannability_signature, signature_covers
 from tests.test_ai.fixtures import make_state
 
 
@@ -24,3 +24,11 @@ def test_signature_stable_under_inventory_change():
     a = make_state(level=4, skills={"weaponcrafting": 2}, inventory={"copper_ore": 1})
     b = make_state(level=4, skills={"weaponcrafting": 2}, inventory={"copper_ore": 50})
     assert plannability_signature(a) == plannability_signature(b)
+
+
+def test_a_signature_covers_one_with_no_more_unlocks():
+    recorded = plannability_signature(make_state(level=12, skills={"mining": 10, "weaponcrafting": 5}))
+    assert signature_covers(recorded, recorded)
+    assert signature_covers(recorded, plannability_signature(make_state(level=11, skills={"mining": 9})))
+    assert not signature_covers(recorded, plannability_signature(make_state(level=13, skills={"mining": 10})))
+    assert not signature_covers(recorded, plannability_signature(make_state(level=12, skills={"alchemy": 1})))
@@ -278,3 +278,139 @@ def test_planner_invokes_goal_heuristic_on_root_and_children():
     assert goal.asked, "planner never called goal.heuristic"
     assert state in goal.asked, "planner did not ask h for the ROOT state"
     assert plan  # a rest plan still forms — h=0.0 leaves behavior unchanged
+
+
+class TestSubgoalRefinement:
+    """`plan(subgoals=...)`: the legs are refined one short search at a time
+    and concatenated, and anything short of a full refinement falls back to
+    the flat search rather than failing the goal. The flat probe is zeroed so
+    these tiny chains reach the legs at all (see `TestDecompositionGate`)."""
+
+    @pytest.fixture(autouse=True)
+    def _no_flat_probe(self, monkeypatch):
+        monkeypatch.setattr(planner_mod, "_FLAT_PROBE_SECONDS", 0.0)
+
+    @staticmethod
+    def _setup():
+        state = make_state(hp=50, max_hp=150, x=0, y=0, task_code="")
+        gd = make_game_data()
+        gd._taskmaster_location = (1, 2)
+        return state, gd
+
+    def test_legs_are_refined_in_order_and_concatenated(self):
+        state, gd = self._setup()
+        planner = GOAPPlanner()
+        plan = planner.plan(state, RestoreHPGoal(), [RestAction(), AcceptTaskAction(taskmaster_location=(1, 2))],
+                            gd, subgoals=[AcceptTaskGoal()])
+        assert [type(a) for a in plan] == [AcceptTaskAction, RestAction]
+        stats = planner.last_stats
+        assert stats.hierarchical is True
+        assert [(leg.goal, leg.plan_len, leg.refined) for leg in stats.subgoals] == [
+            ("AcceptTask", 1, True), (repr(RestoreHPGoal()), 1, True)]
+        assert stats.nodes_explored == sum(leg.nodes_explored for leg in stats.subgoals)
+
+    def test_a_leg_with_no_plan_falls_back_to_the_flat_search(self):
+        state, gd = self._setup()
+        planner = GOAPPlanner()
+        # No AcceptTaskAction: the first leg cannot be refined.
+        plan = planner.plan(state, RestoreHPGoal(), [RestAction()], gd, subgoals=[AcceptTaskGoal()])
+        assert [type(a) for a in plan] == [RestAction]
+        stats = planner.last_stats
+        assert stats.hierarchical is False
+        assert [(leg.goal, leg.refined) for leg in stats.subgoals] == [("AcceptTask", False)]
+
+    def test_a_refinement_longer_than_max_depth_is_not_returned(self):
+        """The flat search's depth bound holds for the refined plan too."""
+        state, gd = self._setup()
+        planner = GOAPPlanner()
+        plan = planner.plan(state, _ShallowGoal(), [RestAction(), AcceptTaskAction(taskmaster_location=(1, 2))],
+                            gd, subgoals=[AcceptTaskGoal()])
+        assert [type(a) for a in plan] == [RestAction]
+        assert planner.last_stats.hierarchical is False
+        assert all(leg.refined for leg in planner.last_stats.subgoals)
+
+    def test_no_subgoals_is_the_plain_search(self):
+        planner = GOAPPlanner()
+        planner.plan(make_state(hp=50, max_hp=150), RestoreHPGoal(), [RestAction()], make_game_data())
+        assert planner.last_stats.subgoals == []
+        assert planner.last_stats.hierarchical is False
+
+
+class TestDecompositionGate:
+    """The flat search comes first: its plan is the least-cost one, so a goal
+    it solves inside `_FLAT_PROBE_SECONDS` is never decomposed, and the whole
+    call stays inside `budget_seconds` whatever it falls back to."""
+
+    _setup = staticmethod(TestSubgoalRefinement._setup)
+
+    def test_a_chain_the_flat_search_solves_keeps_the_least_cost_plan(self):
+        state, gd = self._setup()
+        derived: list[bool] = []
+
+        def legs():
+            derived.append(True)
+            return [AcceptTaskGoal()]
+
+        planner = GOAPPlanner()
+        plan = planner.plan(state, RestoreHPGoal(), [RestAction(), AcceptTaskAction(taskmaster_location=(1, 2))],
+                            gd, subgoals=legs)
+        assert [type(a) for a in plan] == [RestAction]
+        assert derived == []
+        assert planner.last_stats.hierarchical is False
+        assert planner.last_stats.subgoals == []
+
+    def test_a_conclusive_no_plan_is_not_decomposed(self):
+        state, gd = self._setup()
+        derived: list[bool] = []
+        planner = GOAPPlanner()
+        plan = planner.plan(state, _ShallowGoal(), [MoveAction(x=1, y=0)], gd,
+                            subgoals=lambda: derived.append(True) or [AcceptTaskGoal()])
+        assert plan == []
+        assert derived == []
+
+    def test_a_node_capped_probe_is_neither_decomposed_nor_rerun(self, monkeypatch):
+        state, gd = self._setup()
+        planner = GOAPPlanner()
+        derived: list[bool] = []
+        searches: list[float] = []
+        search = planner._search
+
+        def recording(state, goal, actions, game_data, history, deadline, node_cap):
+            searches.append(deadline)
+            return search(state, goal, actions, game_data, history, deadline, node_cap)
+
+        monkeypatch.setattr(planner, "_search", recording)
+        plan = planner.plan(state, RestoreHPGoal(), [RestAction()], gd, max_nodes=1,
+                            subgoals=lambda: derived.append(True) or [AcceptTaskGoal()])
+        assert plan == []
+        assert planner.last_stats.node_capped is True
+        assert derived == []
+        assert len(searches) == 1
+
+    def test_a_flat_timeout_derives_and_refines_the_legs(self, monkeypatch):
+        monkeypatch.setattr(planner_mod, "_FLAT_PROBE_SECONDS", 0.0)
+        state, gd = self._setup()
+        planner = GOAPPlanner()
+        plan = planner.plan(state, RestoreHPGoal(), [RestAction(), AcceptTaskAction(taskmaster_location=(1, 2))],
+                            gd, subgoals=lambda: [AcceptTaskGoal()])
+        assert [type(a) for a in plan] == [AcceptTaskAction, RestAction]
+        assert planner.last_stats.hierarchical is True
+
+    def test_every_search_ends_inside_the_callers_budget(self, monkeypatch):
+        monkeypatch.setattr(planner_mod, "_FLAT_PROBE_SECONDS", 0.0)
+        state, gd = self._setup()
+        planner = GOAPPlanner()
+        deadlines: list[float] = []
+        search = planner._search
+
+        def recording(state, goal, actions, game_data, history, deadline, node_cap):
+            deadlines.append(deadline)
+            return search(state, goal, actions, game_data, history, deadline, node_cap)
+
+        monkeypatch.setattr(planner, "_search", recording)
+        started = planner_mod.time.monotonic()
+        # No AcceptTaskAction: the leg fails and the flat search runs again.
+        planner.plan(state, RestoreHPGoal(), [RestAction()], gd, budget_seconds=5.0,
+                     subgoals=[AcceptTaskGoal()])
+        assert len(deadlines) == 3  # probe, the failed leg, the flat fallback
+        assert max(deadlines) <= started + 5.0 + 0.05
@@ -97,7 +97,7 @@ class TestAttemptElapsed:
         a 60ms search reads as ~60ms, while the attempts around it stay small."""
         class _SlowPlanner(_ScriptedPlanner):
             def plan(self, state, goal, actions, game_data, history=None, *,
-                     budget_seconds=None):
+                     budget_seconds=None, subgoals=()):
                 if repr(goal) == "AcceptTask":
                     time.sleep(0.06)
                 return super().plan(state, goal, actions, game_data, history,
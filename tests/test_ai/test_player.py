@@ -31,6 +31,7 @@ from artifactsmmo_cli.ai.tiers import ObtainItem, ReachCharLevel
 from artifactsmmo_cli.ai.tiers.objective import CharacterObjective
 from artifactsmmo_cli.ai.tiers.strategy import StrategyDecision, StrategyEngine
 from artifactsmmo_cli.ai.world_state import WorldState
+from artifactsmmo_cli.ai.world_state_codec import state_from_json
 from tests.test_ai.fixtures import make_state
 from tests.test_ai.test_actions import make_game_data
 from tests.test_ai.test_actions_execute import make_api_result, make_char_schema, make_get_character_result
@@ -153,6 +154,7 @@ class TestRecordLearningCycleSkillLevels:
         try:
             store.start_session()
             player = GamePlayer(character="hero", dry_run=False, history=store)
+            player.set_state_recording(1)
             prev = make_state(level=5, skills={"mining": 3, "woodcutting": 2})
             new = make_state(level=5, xp=prev.xp + 10,
                              skills={"mining": 4, "woodcutting": 2})
@@ -169,6 +171,35 @@ class TestRecordLearningCycleSkillLevels:
                     Cycle.action_repr == "Fight(green_slime)")))
             assert len(rows) == 1
             assert json.loads(rows[0].skill_levels_json) == {"mining": 3, "woodcutting": 2}
+            # The decision-replay snapshot is the same PRE-action state.
+            assert state_from_json(rows[0].state_json) == prev
+        finally:
+            store.close()
+
+
+class TestRecordLearningCycleState:
+    """`Cycle.state_json` is kilobytes a row and only the offline replay reads
+    it: written on the sampled cycles of a run that asked, never by default."""
+
+    @pytest.mark.parametrize(("every", "recorded"), [(0, []), (1, [0, 1, 2, 3]), (2, [0, 2])])
+    def test_the_state_is_stored_only_on_sampled_cycles(self, tmp_path, every, recorded):
+        store = LearningStore(db_path=str(tmp_path / "states.db"), character="hero")
+        try:
+            store.start_session()
+            player = GamePlayer(character="hero", dry_run=False, history=store)
+            player.set_state_recording(every)
+            state = make_state()
+            for index in range(4):
+                player._cycle_counter = index
+                player._record_learning_cycle(
+                    prev_state=state, new_state=state, action_repr="Rest", action_class="RestAction",
+                    outcome="ok", selected_goal="RestoreHP", predicted_cost=0.0,
+                    actual_cooldown_seconds=1.0, planner_nodes=1, planner_depth=1,
+                    planner_timed_out=False, plan_len=1,
+                )
+            with Session(store._engine) as s:
+                rows = list(s.exec(select(Cycle).order_by(Cycle.cycle_index)))
+            assert [row.cycle_index for row in rows if row.state_json is not None] == recorded
         finally:
             store.close()
 
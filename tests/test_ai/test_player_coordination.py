@@ -380,6 +380,21 @@ def test_update_coordination_is_a_noop_without_a_store():
     assert ctx.role_skills == frozenset()
 
 
+def test_update_coordination_shares_the_doomed_memo_on_the_catalog(tmp_path):
+    p = GamePlayer(character="hero")
+    p.state = make_state()
+    p.game_data = _make_planner_gd()
+    p.game_data._catalog_digest = "a1b2c3d4e5f6a7b8"
+    store = CoordinationStore(db_path=str(tmp_path / "coord.db"), character="hero")
+    p.set_coordination_store(store)
+    try:
+        p._update_coordination(p.state, p.game_data)
+        p._arbiter._memo.mark("G", p.state, cycle=0)
+        assert list(store.doomed_verdicts("a1b2c3d4e5f6a7b8")) == ["G"]
+    finally:
+        store.close()
+
+
 def test_set_coordination_store_attaches_it():
     p = GamePlayer(character="hero")
     assert p._coordination is None
@@ -50,6 +50,11 @@ def make_minimal_game_data() -> GameData:
 class _NoopCache:
     """Stand-in for GameDataCache in run-loop tests: no disk, no URL parsing.
     read() always misses (so load fetches the patched-empty loaders); write() is a no-op."""
+    tile_distance_path = None
+    grind_candidate_path = None
+    loadout_path = None
+    ge_market_path = None
+
     def __init__(self, *args, **kwargs):
         pass
 
@@ -0,0 +1,150 @@
+"""The regression tier: acquisition legs found backward from the goal's needs.
+
+Checked on the real fixture bundle, at the skill-gated chains the route-priced
+tier (`acquisition_subgoals`) has no decomposition for and the flat A* times
+out on.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from artifactsmmo_cli.ai import planner as planner_mod
+from artifactsmmo_cli.ai import regression
+from artifactsmmo_cli.ai.acquisition_subgoals import acquisition_subgoals
+from artifactsmmo_cli.ai.actions.base import Action
+from artifactsmmo_cli.ai.actions.factory import build_actions
+from artifactsmmo_cli.ai.actions.level_skill import LevelSkill
+from artifactsmmo_cli.ai.game_data import GameData
+from artifactsmmo_cli.ai.goals.gathering import GatherMaterialsGoal
+from artifactsmmo_cli.ai.goals.restore_hp import RestoreHPGoal
+from artifactsmmo_cli.ai.planner import GOAPPlanner
+from artifactsmmo_cli.ai.regression import regression_subgoals
+from artifactsmmo_cli.ai.scenario import SCENARIOS, load_bundle_game_data, scenario_state
+from artifactsmmo_cli.ai.selection_context import NO_PROFILE_CONTEXT
+from artifactsmmo_cli.ai.strategy_driver import StrategyArbiter
+from artifactsmmo_cli.ai.tiers.objective import CharacterObjective
+from artifactsmmo_cli.ai.world_state import WorldState
+from tests.test_ai.test_acquisition_subgoals import _feather_coat_case
+
+_BUNDLE = (Path(__file__).resolve().parent / "scenarios" / "fixtures"
+           / "gamedata_bundle.json")
+
+
+@pytest.fixture(scope="module")
+def game_data():  # type: ignore[no-untyped-def]
+    return load_bundle_game_data(_BUNDLE)
+
+
+@pytest.fixture(scope="module")
+def state(game_data):  # type: ignore[no-untyped-def]
+    """Weaponcrafting 5: the iron_sword craft needs 10."""
+    return scenario_state(SCENARIOS["l12_deep_chain_grind"], game_data)
+
+
+@pytest.fixture(scope="module")
+def actions(game_data, state):  # type: ignore[no-untyped-def]
+    return build_actions(game_data, state, CharacterObjective.from_game_data(game_data),
+                         bank_accessible=True, task_exchange_min_coins=0)
+
+
+def _sword() -> GatherMaterialsGoal:
+    return GatherMaterialsGoal("iron_sword", {"iron_sword": 1})
+
+
+class _ShallowGoal(GatherMaterialsGoal):
+    @property
+    def max_depth(self) -> int:
+        return 2
+
+
+class TestRegressionSubgoals:
+    def test_a_skill_gated_chain_has_no_route_but_regresses(self, state, game_data, actions):
+        goal = _sword()
+        assert acquisition_subgoals(goal, state, game_data, NO_PROFILE_CONTEXT) == []
+        legs = regression_subgoals(goal, state, game_data, actions)
+        assert [leg.needed for leg in legs] == [
+            {"iron_ore": 60}, {"iron_bar": 6}, {"feather": 2}, {"iron_sword": 1}]
+
+    def test_an_exclusion_is_carried_into_every_leg(self, state, game_data, actions):
+        goal = GatherMaterialsGoal("iron_sword", {"iron_sword": 1},
+                                   exclude_recycle=frozenset({"iron_sword"}))
+        legs = regression_subgoals(goal, state, game_data, actions)
+        assert legs and all(leg.exclude_recycle == {"iron_sword"} for leg in legs)
+
+    def test_an_upgrade_regresses_the_piece_it_means_to_equip(self):
+        state, goal, gd, actions = _feather_coat_case()
+        legs = regression_subgoals(goal, state, gd, actions)
+        assert legs[-1].needed == {"feather_coat": 1}
+        assert all(leg.exclude_recycle == frozenset() for leg in legs)
+
+    def test_a_requirement_two_producers_reach_is_expanded_once(self, state, game_data, actions):
+        once = regression_subgoals(_sword(), state, game_data, actions)
+        twice = regression_subgoals(_sword(), state, game_data, actions + actions)
+        assert [leg.needed for leg in twice] == [leg.needed for leg in once]
+
+    def test_a_gate_no_grind_reaches_has_no_decomposition(self, state, game_data, actions):
+        no_grinds = [action for action in actions if not isinstance(action, LevelSkill)]
+        assert regression_subgoals(_sword(), state, game_data, no_grinds) == []
+
+    def test_a_chain_deeper_than_the_goal_searches_has_no_decomposition(self, state, game_data, actions):
+        assert regression_subgoals(_ShallowGoal("iron_sword", {"iron_sword": 1}), state, game_data, actions) == []
+
+    def test_a_search_past_the_node_cap_gives_up(self, state, game_data, actions, monkeypatch):
+        monkeypatch.setattr(regression, "_NODE_CAP", 1)
+        assert regression_subgoals(_sword(), state, game_data, actions) == []
+
+    def test_a_chain_shorter_than_two_legs_is_left_to_the_flat_search(self, state, game_data, actions):
+        goal = GatherMaterialsGoal("copper_ore", {"copper_ore": 3})
+        assert regression_subgoals(goal, state, game_data, actions) == []
+
+    def test_a_goal_without_a_chain_has_no_decomposition(self, state, game_data, actions):
+        assert regression_subgoals(RestoreHPGoal(), state, game_data, actions) == []
+
+    def test_an_action_the_relaxation_cannot_read_is_no_producer(self, state, game_data):
+        assert regression_subgoals(_sword(), state, game_data, [_Unread()]) == []
+
+
+def test_refining_the_regressed_legs_plans_what_the_flat_search_times_out_on(state, game_data, actions):
+    """Flat, the l12 iron_sword search timed out at 10s after ~4K expansions.
+    Leg by leg it is a few short searches, the grind among them."""
+    goal = _sword()
+    planner = GOAPPlanner()
+    plan = planner.plan(state, goal, actions, game_data, None, budget_seconds=30.0,
+                        subgoals=regression_subgoals(goal, state, game_data, actions))
+    stats = planner.last_stats
+    assert stats.hierarchical is True
+    assert any(isinstance(action, LevelSkill) for action in plan)
+    assert repr(plan[-1]) == "Craft(iron_sword×1)"
+    assert stats.nodes_explored < 500
+
+
+def test_the_arbiter_falls_back_to_the_regressed_legs(game_data, monkeypatch):
+    """At l30 the ruby craft is one the craft descent and the route-priced
+    tier both decline. The flat search solves it inside its probe, so the
+    probe is zeroed to reach the legs."""
+    monkeypatch.setattr(planner_mod, "_FLAT_PROBE_SECONDS", 0.0)
+    state = scenario_state(SCENARIOS["l30_band_entry"], game_data)
+    actions = build_actions(game_data, state, CharacterObjective.from_game_data(game_data),
+                            bank_accessible=True, task_exchange_min_coins=0)
+    goal = GatherMaterialsGoal("ruby", {"ruby": 1})
+    arbiter = StrategyArbiter(GOAPPlanner(), history=None)
+    assert arbiter._plans(goal, state, game_data, actions, NO_PROFILE_CONTEXT)
+    assert arbiter.goals_tried[-1]["subgoals"] == [
+        "GatherMaterials(ruby_stone, {ruby_stone:24})", "GatherMaterials(ruby, {ruby:1})", repr(goal)]
+
+
+class _Unread(Action):
+    """An action class `relaxed_reachability` has no reading for."""
+
+    def is_applicable(self, state: WorldState, game_data: GameData) -> bool:
+        return False
+
+    def apply(self, state: WorldState, game_data: GameData) -> WorldState:
+        return state
+
+    def cost(self, state: WorldState, game_data: GameData, history=None) -> float:
+        return 1.0
+
+    def execute(self, state, client):  # type: ignore[no-untyped-def]
+        raise NotImplementedError("planner-only test action")
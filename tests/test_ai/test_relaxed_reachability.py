@@ -0,0 +1,223 @@
+"""The delete-relaxation lower bound (`ai/relaxed_reachability`) and the
+planner's pre-search gate on it.
+
+Checked on the real fixture bundle, where the interesting shapes live: a chain
+whose layers count its crafts, a skill gate that costs a grind layer, a drop
+with no relevant fight. The soundness property — a reading never adds less than
+its action's `apply` — is checked over every applicable action the factory
+builds, not just the hand-picked ones.
+"""
+
+from pathlib import Path
+
+import pytest
+from artifactsmmo_api_client import AuthenticatedClient
+
+from artifactsmmo_cli.ai.actions.base import Action
+from artifactsmmo_cli.ai.actions.claim import ClaimPendingItemAction
+from artifactsmmo_cli.ai.actions.combat import FightAction
+from artifactsmmo_cli.ai.actions.complete_task import CompleteTaskAction
+from artifactsmmo_cli.ai.actions.crafting import CraftAction
+from artifactsmmo_cli.ai.actions.factory import build_actions
+from artifactsmmo_cli.ai.actions.gathering import GatherAction
+from artifactsmmo_cli.ai.actions.ge_cancel_order import GeCancelOrderAction
+from artifactsmmo_cli.ai.actions.ge_fill_sell import GeFillSellOrderAction
+from artifactsmmo_cli.ai.actions.level_skill import LevelSkill
+from artifactsmmo_cli.ai.actions.npc import NpcBuyAction
+from artifactsmmo_cli.ai.actions.optimize_loadout import OptimizeLoadoutAction
+from artifactsmmo_cli.ai.actions.rest import RestAction
+from artifactsmmo_cli.ai.game_data import GameData
+from artifactsmmo_cli.ai.goals.gathering import GatherMaterialsGoal
+from artifactsmmo_cli.ai.goals.progression import UpgradeEquipmentGoal
+from artifactsmmo_cli.ai.goals.restore_hp import RestoreHPGoal
+from artifactsmmo_cli.ai.open_order import OpenOrder, OrderSide
+from artifactsmmo_cli.ai.planner import GOAPPlanner
+from artifactsmmo_cli.ai.relaxed_reachability import (
+    INERT,
+    NO_BOUND,
+    UNREACHABLE,
+    relax,
+    relaxed_plan_length,
+    relaxed_reachable_items,
+)
+from artifactsmmo_cli.ai.scenario import SCENARIOS, load_bundle_game_data, scenario_state
+from artifactsmmo_cli.ai.tiers.objective import CharacterObjective
+from artifactsmmo_cli.ai.world_state import WorldState
+from tests.test_ai.fixtures import make_state
+
+_BUNDLE = (Path(__file__).resolve().parent / "scenarios" / "fixtures"
+           / "gamedata_bundle.json")
+
+
+@pytest.fixture(scope="module")
+def game_data():  # type: ignore[no-untyped-def]
+    return load_bundle_game_data(_BUNDLE)
+
+
+@pytest.fixture(scope="module")
+def fresh(game_data):  # type: ignore[no-untyped-def]
+    """Level 1, every skill at 1, nothing held, nothing a chicken fight wins."""
+    state = scenario_state(SCENARIOS["l1_fresh"], game_data)
+    actions = build_actions(game_data, state, CharacterObjective.from_game_data(game_data),
+                            bank_accessible=True, task_exchange_min_coins=0)
+    return state, actions
+
+
+def _bound(goal, state, game_data, actions):  # type: ignore[no-untyped-def]
+    return relaxed_plan_length(goal, state, game_data, goal.relevant_actions(actions, state, game_data))
+
+
+class _OpaqueAction(Action):
+    """An action class the relaxation has no reading of."""
+
+    def is_applicable(self, state: WorldState, game_data: GameData) -> bool:
+        return True
+
+    def apply(self, state: WorldState, game_data: GameData) -> WorldState:
+        return state
+
+    def cost(self, state: WorldState, game_data: GameData, history=None) -> float:
+        return 1.0
+
+    def execute(self, state: WorldState, client: AuthenticatedClient) -> WorldState:
+        raise NotImplementedError("planner-only test action")
+
+
+class TestRelaxedPlanLength:
+    def test_a_chain_is_bounded_by_its_layers(self, game_data, fresh):
+        """ore -> bar -> boots -> equip: four layers."""
+        state, actions = fresh
+        goal = UpgradeEquipmentGoal(committed_target=("copper_boots", "boots_slot"))
+        assert _bound(goal, state, game_data, actions) == 4.0
+
+    def test_a_skill_gate_costs_its_grind_layer(self, game_data, fresh):
+        """iron_ore needs mining 10: the LevelSkill leg is a layer of its own,
+        and without it nothing mines the ore at all."""
+        state, actions = fresh
+        goal = GatherMaterialsGoal("iron_bar", {"iron_bar": 1})
+        relevant = goal.relevant_actions(actions, state, game_data)
+        assert any(isinstance(action, LevelSkill) for action in relevant)
+        assert relaxed_plan_length(goal, state, game_data, relevant) == 3.0
+        ungrinded = [action for action in relevant if not isinstance(action, LevelSkill)]
+        assert relaxed_plan_length(goal, state, game_data, ungrinded) == UNREACHABLE
+
+    def test_a_drop_no_relevant_fight_yields_is_unreachable(self, game_data, fresh):
+        state, actions = fresh
+        goal = GatherMaterialsGoal("feather", {"feather": 1})
+        assert _bound(goal, state, game_data, actions) == UNREACHABLE
+        chicken = FightAction(monster_code="chicken", locations=frozenset({(0, 1)}))
+        assert relaxed_plan_length(goal, state, game_data, [chicken]) == 1.0
+
+    def test_a_held_finished_target_is_layer_zero(self, game_data):
+        state = make_state(bank_items={"copper_ring": 1})
+        goal = GatherMaterialsGoal("copper_ring", {"copper_bar": 6})
+        assert relaxed_plan_length(goal, state, game_data, []) == 0.0
+
+    def test_a_currency_buy_needs_its_currency(self, game_data):
+        goal = GatherMaterialsGoal("jasper_crystal", {"jasper_crystal": 1})
+        buy = NpcBuyAction(npc_code="tasks_trader", item_code="jasper_crystal")
+        assert relaxed_plan_length(goal, make_state(), game_data, [buy]) == UNREACHABLE
+        coins = make_state(inventory={"tasks_coin": 8})
+        assert relaxed_plan_length(goal, coins, game_data, [buy]) == 1.0
+
+    def test_a_loadout_optimiser_may_wear_any_held_piece(self, game_data):
+        goal = UpgradeEquipmentGoal(committed_target=("copper_boots", "boots_slot"))
+        state = make_state(inventory={"copper_boots": 1})
+        assert relaxed_plan_length(goal, state, game_data, [RestAction()]) == UNREACHABLE
+        assert relaxed_plan_length(goal, state, game_data, [OptimizeLoadoutAction()]) == 1.0
+
+    def test_an_unread_action_class_gives_no_bound(self, game_data):
+        goal = GatherMaterialsGoal("feather", {"feather": 1})
+        assert relaxed_plan_length(goal, make_state(), game_data, [_OpaqueAction()]) == NO_BOUND
+
+    def test_an_unmodelled_goal_gives_no_bound(self, game_data):
+        assert relaxed_plan_length(RestoreHPGoal(), make_state(), game_data, []) == NO_BOUND
+        uncommitted = UpgradeEquipmentGoal()
+        assert relaxed_plan_length(uncommitted, make_state(), game_data, []) == NO_BOUND
+
+    def test_a_gather_or_craft_with_nowhere_to_act_is_inert(self, game_data):
+        """No resource tile, no workshop: `is_applicable` is False everywhere,
+        so the reading adds nothing rather than abstaining."""
+        goal = GatherMaterialsGoal("copper_bar", {"copper_bar": 1})
+        nowhere = [GatherAction(resource_code="copper_rocks"), CraftAction(code="copper_bar")]
+        assert all(relax(action, make_state(), game_data) is INERT for action in nowhere)
+        assert relaxed_plan_length(goal, make_state(), game_data, nowhere) == UNREACHABLE
+
+    def test_root_only_sources_add_what_the_root_offers(self, game_data):
+        """Pending items, open sell orders and the task reward come from the
+        root state, so those readings are read off it."""
+        state = make_state(pending_items=(("p1", "feather"),),
+                           open_orders=(OpenOrder("o1", "egg", 1, 5, OrderSide.SELL, 0),))
+        assert relax(ClaimPendingItemAction(), state, game_data).adds_items == {"feather"}
+        assert relax(GeCancelOrderAction(order_id="o1"), state, game_data).adds_items == {"egg"}
+        assert relax(CompleteTaskAction(taskmaster_location=(1, 2)), state, game_data).adds_items == {"tasks_coin"}
+        fill = GeFillSellOrderAction(order_id="o2", item_code="egg", price=5)
+        assert relax(fill, state, game_data).adds_items == {"egg"}
+
+
+class TestRelaxedReachableItems:
+    def test_the_fixed_point_holds_every_link_of_a_chain(self, game_data, fresh):
+        state, actions = fresh
+        goal = GatherMaterialsGoal("copper_boots", {"copper_boots": 1})
+        reachable = relaxed_reachable_items(state, game_data, goal.relevant_actions(actions, state, game_data))
+        assert reachable is not None
+        assert {"copper_ore", "copper_bar", "copper_boots"} <= reachable
+        assert "feather" not in reachable
+
+    def test_an_unread_action_class_gives_no_answer(self, game_data):
+        assert relaxed_reachable_items(make_state(), game_data, [_OpaqueAction()]) is None
+
+
+@pytest.mark.parametrize("scenario", ["l1_fresh", "l12_deep_chain_grind", "l35_artifact_fill"])
+def test_every_applicable_reading_covers_its_apply(game_data, scenario):
+    """Soundness, action by action: whatever `apply` newly puts in the bag,
+    bank or a slot, and whatever skill it raises, the reading adds; whatever
+    the reading requires, an applicable root already has."""
+    state = scenario_state(SCENARIOS[scenario], game_data)
+    actions = build_actions(game_data, state, CharacterObjective.from_game_data(game_data),
+                            bank_accessible=True, task_exchange_min_coins=0)
+    held = {*state.inventory, *(state.bank_items or {}), *(c for c in state.equipment.values() if c)}
+    checked = 0
+    for action in actions:
+        if not action.is_applicable(state, game_data):
+            continue
+        relaxed = relax(action, state, game_data)
+        assert relaxed is not None, repr(action)
+        after = action.apply(state, game_data)
+        gained = {code for code, qty in {**after.inventory, **(after.bank_items or {})}.items()
+                  if qty > state.inventory.get(code, 0) + (state.bank_items or {}).get(code, 0)}
+        assert gained - held <= relaxed.adds_items, repr(action)
+        worn = {(slot, code) for slot, code in after.equipment.items()
+                if code is not None and state.equipment.get(slot) != code}
+        assert relaxed.wears_anything or worn <= relaxed.adds_worn, repr(action)
+        raised = {skill for skill, level in after.skills.items() if level > state.skills.get(skill, 1)}
+        assert raised <= ({relaxed.adds_skill[0]} if relaxed.adds_skill else set()), repr(action)
+        assert relaxed.needs_items <= held, repr(action)
+        checked += 1
+    assert checked > 50
+
+
+@pytest.mark.parametrize("item", ["copper_ring", "copper_boots", "ash_plank", "copper_helmet"])
+def test_the_bound_never_exceeds_a_plan_the_planner_finds(game_data, fresh, item):
+    state, actions = fresh
+    goal = GatherMaterialsGoal(item, {item: 1})
+    plan = GOAPPlanner().plan(state, goal, actions, game_data, None, budget_seconds=10.0)
+    assert plan and _bound(goal, state, game_data, actions) <= len(plan)
+
+
+class TestPlannerGate:
+    def test_an_unreachable_goal_is_refused_without_a_search(self, game_data, fresh):
+        state, actions = fresh
+        planner = GOAPPlanner()
+        assert planner.plan(state, GatherMaterialsGoal("feather_coat", {"feather_coat": 1}),
+                            actions, game_data, None, budget_seconds=10.0) == []
+        stats = planner.last_stats
+        assert stats.relaxed_unreachable is True
+        assert (stats.nodes_explored, stats.timed_out) == (0, False)
+
+    def test_a_reachable_goal_is_searched(self, game_data, fresh):
+        state, actions = fresh
+        planner = GOAPPlanner()
+        assert planner.plan(state, GatherMaterialsGoal("copper_bar", {"copper_bar": 1}),
+                            actions, game_data, None)
+        assert planner.last_stats.relaxed_unreachable is False
@@ -0,0 +1,71 @@
+"""CompiledRequirementGraph: the closure bitsets answer exactly what the
+stack walk answered — on the real catalog, on cycles, and for roots the graph
+does not know — and the index order is topological."""
+
+import json
+from pathlib import Path
+
+from artifactsmmo_cli.ai import requirement_bitset
+from artifactsmmo_cli.ai.game_data import GameData
+from artifactsmmo_cli.ai.requirement_bitset import compile_requirement_graph
+from artifactsmmo_cli.ai.requirement_graph import build_requirement_graph
+from artifactsmmo_cli.ai.requirement_projections import requirement_closure
+
+_BUNDLE = Path(__file__).parent / "scenarios" / "fixtures" / "gamedata_bundle.json"
+
+
+def _walk(edges, roots):
+    """The pre-compilation stack walk, kept as the oracle."""
+    seen: set[str] = set()
+    stack = list(roots)
+    while stack:
+        item = stack.pop()
+        if item in seen:
+            continue
+        seen.add(item)
+        stack.extend(i for i in edges.get(item, {}) if i not in seen)
+    return frozenset(seen)
+
+
+def test_closure_matches_the_walk_over_the_real_catalog():
+    gd = GameData.from_cache_bundle(json.loads(_BUNDLE.read_text()))
+    graph = build_requirement_graph(gd)
+    compiled = graph.compiled
+    for code in graph.leaves:
+        expected = _walk(graph.edges, [code])
+        assert requirement_closure(graph, [code]) == expected
+        assert compiled.craftables([code]) == {i for i in expected if i in graph.edges}
+    roots = sorted(graph.edges)[:40]
+    assert compiled.closure(roots) == _walk(graph.edges, roots)
+
+
+def test_index_order_is_topological():
+    graph = build_requirement_graph(GameData.from_cache_bundle(json.loads(_BUNDLE.read_text())))
+    compiled = graph.compiled
+    for item, ingredients in graph.edges.items():
+        for ingredient in ingredients:
+            assert compiled.index[ingredient] < compiled.index[item]
+
+
+def test_cycles_share_one_closure():
+    compiled = compile_requirement_graph({"a": {"b": 1}, "b": {"c": 1, "a": 1}, "c": {"d": 1},
+                                          "s": {"s": 1}})
+    assert compiled.closure(["a"]) == compiled.closure(["b"]) == {"a", "b", "c", "d"}
+    assert compiled.closure(["c"]) == {"c", "d"}
+    assert compiled.closure(["s"]) == {"s"}
+
+
+def test_unknown_roots_close_over_themselves():
+    compiled = compile_requirement_graph({"bar": {"ore": 1}}, known=["feather"])
+    assert compiled.closure(["ghost", "bar"]) == {"ghost", "bar", "ore"}
+    assert compiled.closure(["feather"]) == {"feather"}
+    assert compiled.craftables(["ghost"]) == frozenset()
+
+
+def test_decode_memo_is_bounded(monkeypatch):
+    monkeypatch.setattr(requirement_bitset, "DECODE_MEMO_MAX", 2)
+    compiled = compile_requirement_graph({"a": {}, "b": {}, "c": {}})
+    for code in "abc":
+        compiled.closure([code])
+    assert len(compiled._decoded) == 1
+    assert compiled.closure(["a", "b"]) == {"a", "b"}
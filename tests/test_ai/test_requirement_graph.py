@@ -201,6 +201,8 @@ def test_axis2_truncation_is_a_caller_predicate():
     assert requirement_edges(g, "copper_bar", truncate_at=held) == {}
     assert requirement_closure(g, ["copper_dagger"], truncate_at=held) == \
         {"copper_dagger", "copper_bar"}
+    assert requirement_closure(g, ["copper_bar", "copper_dagger"], truncate_at=set().__contains__) == \
+        {"copper_dagger", "copper_bar", "copper_ore"}
 
 
 def test_closure_dedupes_overlapping_roots():
@@ -1,6 +1,11 @@
 """Tests for skill_grind_target: the shallow in-skill item to craft now."""
 
 import dataclasses
+import json
+import random
+from collections import OrderedDict
+from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -8,10 +13,15 @@ from artifactsmmo_cli.ai.game_data import GameData, ItemStats
 from artifactsmmo_cli.ai.selection_context import NO_PROFILE_CONTEXT
 from artifactsmmo_cli.ai.tiers.skill_grind_target import (
     CACHE_MAX_ENTRIES,
+    GRIND_CACHE_VERSION,
+    PERSIST_MAX_ENTRIES,
     _cache_for,
+    _cache_key,
+    _caches,
     build_selectable_grind_candidates,
     has_grind_target,
     is_obtainable,
+    save_grind_candidates,
     skill_grind_target,
 )
 from tests.test_ai._monster_fixture import fill_monster_stat_defaults
@@ -512,3 +522,181 @@ def test_has_grind_target_skips_a_grey_rung_but_finds_a_paying_one():
     del lean._item_stats["iron_dagger"]
     assert has_grind_target("weaponcrafting", grey, lean) is False
     assert skill_grind_target("weaponcrafting", grey, lean) is None
+
+
+def test_a_code_no_rung_reads_is_projected_out_of_the_key():
+    """The bag churns on every gather and fight, and most of that churn is in
+    codes no rung of this skill can read. Those must HIT, or the memo misses
+    on nearly every cycle; a closure material must still miss (the honesty
+    check above)."""
+    gd = _gd()
+    state = make_state(skills={"weaponcrafting": 3}, inventory={"copper_bar": 2})
+    first = build_selectable_grind_candidates("weaponcrafting", state, gd)
+    build_selectable_grind_candidates(
+        "weaponcrafting", make_state(skills={"weaponcrafting": 3},
+                                     inventory={"copper_bar": 2, "raw_fish": 7},
+                                     bank_items={"feather": 40}), gd)
+    assert len(_cache_for(gd)) == 1
+    assert [c.acquire_steps for c in first] == [
+        c.acquire_steps for c in build_selectable_grind_candidates(
+            "weaponcrafting", make_state(skills={"weaponcrafting": 3},
+                                         inventory={"copper_bar": 2, "raw_fish": 7}), gd)]
+
+
+def test_live_overlays_are_part_of_the_key():
+    """An event or raid decides which spawn tiles exist, so a list priced
+    under one overlay must not answer under another."""
+    gd = _gd()
+    state = make_state(skills={"weaponcrafting": 3})
+    build_selectable_grind_candidates("weaponcrafting", state, gd)
+    gd.active_event_codes = {"portal_demon"}
+    build_selectable_grind_candidates("weaponcrafting", state, gd)
+    assert len(_cache_for(gd)) == 2
+
+
+def test_gold_in_the_closure_widens_the_projection_to_saleable_holdings():
+    """A gold-priced vendor puts GOLD in the closure, and gold's SELL route
+    licenses any saleable surplus in the bag — so a saleable code and the
+    pocket gold become determinants there, and only there."""
+    gd = _gd()
+    gd.world.npc_stock = {"smith": {"ash_plank": (5, "gold")}}
+    gd.world.npc_sell_prices = {"fishmonger": {"raw_fish": 3}}
+    state = make_state(skills={"weaponcrafting": 3})
+    build_selectable_grind_candidates("weaponcrafting", state, gd)
+    build_selectable_grind_candidates(
+        "weaponcrafting", make_state(skills={"weaponcrafting": 3}, inventory={"raw_fish": 7}), gd)
+    build_selectable_grind_candidates(
+        "weaponcrafting", make_state(skills={"weaponcrafting": 3}, gold=90), gd)
+    assert len(_cache_for(gd)) == 3
+
+
+_CATALOG = Path(__file__).parent / "scenarios" / "fixtures" / "gamedata_bundle.json"
+
+
+def test_the_projected_key_matches_the_unprojected_walk_on_the_real_catalog():
+    """THE SOUNDNESS DIFFERENTIAL for the holdings projection. Random holdings
+    drawn from the whole real catalog, each state perturbed by one more code:
+    every answer served through the shared memo must equal a cold walk."""
+    gd = GameData.from_cache_bundle(json.loads(_CATALOG.read_text()))
+    codes = sorted(gd.all_item_stats)
+    rng = random.Random(7)
+    skills = ("weaponcrafting", "gearcrafting", "cooking", "mining")
+    bases = [make_state(level=rng.randint(1, 20), skills={s: rng.randint(1, 20) for s in skills},
+                        inventory={rng.choice(codes): rng.randint(1, 9) for _ in range(5)},
+                        bank_items={rng.choice(codes): rng.randint(1, 30) for _ in range(8)})
+             for _ in range(3)]
+    hits = 0
+    for _ in range(12):
+        base = rng.choice(bases)
+        state = dataclasses.replace(base, inventory={**base.inventory, rng.choice(codes): 1})
+        for skill in skills:
+            cache = _cache_for(gd)
+            size = len(cache)
+            shared = build_selectable_grind_candidates(skill, state, gd)
+            hits += len(cache) == size
+            warm = _caches.pop(id(gd))
+            _caches[id(gd)] = OrderedDict()
+            cold = build_selectable_grind_candidates(skill, state, gd)
+            _caches[id(gd)] = warm
+            assert shared == cold, (skill, state.inventory)
+    assert hits, "no state shared an entry, so the differential proved nothing"
+
+
+def _persisting_gd(tmp_path, digest="abc"):
+    gd = _gd()
+    gd._grind_candidate_path = tmp_path / "grind.json"
+    gd._catalog_digest = digest
+    return gd
+
+
+def test_saved_candidates_seed_a_restart(tmp_path):
+    state = make_state(skills={"weaponcrafting": 3}, inventory={"copper_bar": 2})
+    gd = _persisting_gd(tmp_path)
+    first = build_selectable_grind_candidates("weaponcrafting", state, gd)
+    save_grind_candidates(gd)
+    warm = _persisting_gd(tmp_path)
+    with patch("artifactsmmo_cli.ai.tiers.skill_grind_target.acquisition_actions",
+               side_effect=AssertionError("a warm restart must not re-price")):
+        assert build_selectable_grind_candidates("weaponcrafting", state, warm) == first
+
+
+def test_save_is_a_noop_when_nothing_new_was_priced(tmp_path):
+    gd = _persisting_gd(tmp_path)
+    save_grind_candidates(gd)
+    assert not gd._grind_candidate_path.exists()
+    build_selectable_grind_candidates("weaponcrafting", make_state(skills={"weaponcrafting": 3}), gd)
+    save_grind_candidates(gd)
+    gd._grind_candidate_path.unlink()
+    save_grind_candidates(gd)
+    assert not gd._grind_candidate_path.exists()
+
+
+def test_save_keeps_only_the_most_recent_entries(tmp_path):
+    gd = _persisting_gd(tmp_path)
+    cache = _cache_for(gd)
+    for i in range(PERSIST_MAX_ENTRIES + 5):
+        cache[("filler", i, (), (), (), (), (-1, "", 0, ""), (), ())] = []
+    build_selectable_grind_candidates("weaponcrafting", make_state(skills={"weaponcrafting": 3}), gd)
+    save_grind_candidates(gd)
+    entries = json.loads(gd._grind_candidate_path.read_text())["entries"]
+    assert len(entries) == PERSIST_MAX_ENTRIES
+    assert entries[-1][0][0] == "weaponcrafting"
+
+
+@pytest.mark.parametrize("tamper", [
+    lambda raw: {**raw, "catalog": "other"},
+    lambda raw: {**raw, "version": GRIND_CACHE_VERSION + 1},
+    lambda raw: {**raw, "entries": [[["weaponcrafting"], [{"code": "x"}]]]},
+])
+def test_a_stale_or_corrupt_file_seeds_nothing(tmp_path, tamper):
+    gd = _persisting_gd(tmp_path)
+    build_selectable_grind_candidates("weaponcrafting", make_state(skills={"weaponcrafting": 3}), gd)
+    save_grind_candidates(gd)
+    path = gd._grind_candidate_path
+    path.write_text(json.dumps(tamper(json.loads(path.read_text()))))
+    assert len(_cache_for(_persisting_gd(tmp_path))) == 0
+    path.write_text("{not json")
+    assert len(_cache_for(_persisting_gd(tmp_path))) == 0
+
+
+def test_offline_game_data_neither_loads_nor_saves(tmp_path):
+    gd = _gd()
+    build_selectable_grind_candidates("weaponcrafting", make_state(skills={"weaponcrafting": 3}), gd)
+    save_grind_candidates(gd)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_a_failed_write_is_reported_and_retried(tmp_path, capsys):
+    gd = _persisting_gd(tmp_path)
+    build_selectable_grind_candidates("weaponcrafting", make_state(skills={"weaponcrafting": 3}), gd)
+    with patch("artifactsmmo_cli.ai.persisted_memo.os.replace", side_effect=OSError("disk full")):
+        save_grind_candidates(gd)
+    assert "candidate cache write failed" in capsys.readouterr().out
+    save_grind_candidates(gd)
+    assert gd._grind_candidate_path.exists()
+
+
+def test_a_standing_ge_order_is_part_of_the_key():
+    """A GE sell order on a closure code IS a route (GE_FILL, priced in gold),
+    so a new or repriced order must miss rather than serve the old price."""
+    gd = _gd()
+    state = make_state(skills={"weaponcrafting": 3})
+    build_selectable_grind_candidates("weaponcrafting", state, gd)
+    gd._ge_sell_orders = {"copper_bar": ("ord-1", 12, 30)}
+    build_selectable_grind_candidates("weaponcrafting", state, gd)
+    gd._ge_sell_orders = {"copper_bar": ("ord-1", 9, 30)}
+    build_selectable_grind_candidates("weaponcrafting", state, gd)
+    assert len(_cache_for(gd)) == 3
+
+
+def test_the_ge_component_is_read_once_per_book():
+    """The closure's orders are digested once per sell book and skill level;
+    later keys on the same book read no order at all."""
+    gd = _gd()
+    gd._ge_sell_orders = {"copper_bar": ("ord-1", 12, 30)}
+    state = make_state(skills={"weaponcrafting": 3})
+    first = _cache_key("weaponcrafting", state, gd)
+    with patch.object(GameData, "ge_best_sell_order", side_effect=AssertionError("book re-read")):
+        assert _cache_key("weaponcrafting", make_state(skills={"weaponcrafting": 3}, gold=7), gd)[-1] == first[-1]
+    gd._ge_sell_orders = {}
+    assert _cache_key("weaponcrafting", state, gd)[-1] == ""
@@ -0,0 +1,106 @@
+"""`play --profile-slow-cycles` — `SlowCycleProfiler` and the player's decide
+band it wraps.
+
+A decide that finishes inside the threshold must leave nothing behind: no
+file, no `profile` key. One that runs past it leaves a collapsed-stack file and
+a summary naming the frames it spent its time in.
+"""
+
+import sys
+import time
+from unittest.mock import MagicMock
+
+from artifactsmmo_cli.ai.player import GamePlayer
+from artifactsmmo_cli.ai.slow_cycle_profiler import SlowCycleProfiler
+from tests.test_ai.fixtures import make_state
+
+PLANNER_STATS = {"nodes": 0, "depth": 0, "timed_out": False, "plan_len": 1}
+
+
+def _spin(seconds: float) -> None:
+    end = time.monotonic() + seconds
+    while time.monotonic() < end:
+        pass
+
+
+def _profiler(tmp_path, threshold: float) -> SlowCycleProfiler:
+    return SlowCycleProfiler(threshold, str(tmp_path / "trace"), interval_seconds=0.001)
+
+
+def test_a_decide_inside_the_threshold_writes_nothing(tmp_path):
+    profiler = _profiler(tmp_path, threshold=60.0)
+    with profiler.watch(cycle=3):
+        pass
+    assert profiler.take() is None
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_a_slow_decide_writes_a_folded_file_and_a_summary(tmp_path):
+    profiler = _profiler(tmp_path, threshold=0.0)
+    with profiler.watch(cycle=3):
+        _spin(0.2)
+    summary = profiler.take()
+    assert summary is not None
+    assert summary["file"] == str(tmp_path / "trace.cycle-3.folded")
+    lines = (tmp_path / "trace.cycle-3.folded").read_text().splitlines()
+    # `root;...;leaf count`, root first.
+    stack, count = lines[0].rsplit(" ", 1)
+    assert int(count) >= 1
+    assert "_spin (test_slow_cycle_profiler.py:" in stack.split(";")[-1]
+    assert sum(int(line.rsplit(" ", 1)[1]) for line in lines) == summary["samples"]
+    top = summary["top"]
+    assert isinstance(top, list)
+    assert top[0][0].startswith("_spin (")
+    assert summary["decide_seconds"] >= 0.2  # type: ignore[operator]
+    assert profiler.take() is None
+
+
+def test_an_unwritable_profile_still_summarises_and_does_not_raise(tmp_path, capsys):
+    profiler = SlowCycleProfiler(0.0, str(tmp_path / "missing" / "trace"), interval_seconds=0.001)
+    with profiler.watch(cycle=2):
+        _spin(0.05)
+    summary = profiler.take()
+    assert summary is not None
+    assert "file" not in summary
+    assert summary["samples"] >= 1  # type: ignore[operator]
+    assert "profile write failed" in capsys.readouterr().out
+
+
+def test_a_thread_with_no_frame_to_sample_writes_nothing(tmp_path, monkeypatch):
+    monkeypatch.setattr(sys, "_current_frames", lambda: {})
+    profiler = _profiler(tmp_path, threshold=0.0)
+    with profiler.watch(cycle=1):
+        _spin(0.05)
+    assert profiler.take() is None
+
+
+def _player(tmp_path, decide_seconds: float) -> GamePlayer:
+    player = GamePlayer(character="hero", dry_run=True)
+    player._gear_latch._active = False
+    player.state = make_state()
+    player.tracer = MagicMock()
+
+    def _slow_decide(state, game_data, actions, ctx_combat_monster):
+        _spin(decide_seconds)
+        return None, [], []
+
+    # Replace only the expensive band, the collaborator — not the unit under test.
+    player._decide_band = _slow_decide  # type: ignore[method-assign]
+    player.set_slow_cycle_profiler(_profiler(tmp_path, threshold=0.05))
+    return player
+
+
+def test_a_slow_decide_band_rides_the_trace_record_as_profile(tmp_path):
+    player = _player(tmp_path, decide_seconds=0.3)
+    player._plan_or_reuse(player.state, None, [], None)
+    player._emit_trace("Act()", "Goal()", "ok", PLANNER_STATS)
+    record = player.tracer.write_cycle.call_args[0][0]
+    assert record["profile"]["file"] == str(tmp_path / "trace.cycle-0.folded")
+    assert any(frame.startswith("_spin (") for frame, _count in record["profile"]["top"])
+
+
+def test_a_fast_decide_band_leaves_the_record_without_a_profile(tmp_path):
+    player = _player(tmp_path, decide_seconds=0.0)
+    player._plan_or_reuse(player.state, None, [], None)
+    player._emit_trace("Act()", "Goal()", "ok", PLANNER_STATS)
+    assert "profile" not in player.tracer.write_cycle.call_args[0][0]
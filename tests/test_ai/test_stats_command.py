@@ -324,3 +324,47 @@ def test_summary_trace_file_alone_bypasses_no_cycles_short_circuit(tmp_path):
     assert res.exit_code == 0, res.output
     assert "no cycles matched" not in res.output
     assert "Progression-tree shadow divergence" in res.output
+
+
+def _write_memo_trace_file(path: str) -> None:
+    lines = [
+        {"cycle": 0, "planner": {"memo": {
+            "loadout_cache": {"hits": 9, "misses": 1, "size": 40, "saved_ms": 1500.0},
+            "deposit_all": {"hits": 0, "misses": 4, "size": -1, "saved_ms": 0.0}}}},
+    ]
+    with open(path, "w", encoding="utf-8") as fh:
+        for line in lines:
+            fh.write(json.dumps(line) + "\n")
+
+
+def test_summary_trace_file_renders_memo_hit_rates(tmp_path):
+    db = str(tmp_path / "learning.db")
+    _seed_db(db)
+    trace_file = str(tmp_path / "play-trace-Robby.jsonl")
+    _write_memo_trace_file(trace_file)
+    runner = CliRunner()
+    res = runner.invoke(stats_app, [
+        "summary", "--db", db, "--character", "Robby", "--trace-file", trace_file,
+    ])
+    assert res.exit_code == 0, res.output
+    out = res.output
+    assert "Memo hit rates" in out
+    assert out.index("deposit_all") < out.index("loadout_cache")
+    assert "90.0%" in out
+    assert "1.5" in out
+
+
+def test_summary_planner_only_carries_the_memo_hit_rates(tmp_path):
+    db = str(tmp_path / "learning.db")
+    _seed_db(db)
+    trace_file = str(tmp_path / "play-trace-Robby.jsonl")
+    _write_memo_trace_file(trace_file)
+    runner = CliRunner()
+    res = runner.invoke(stats_app, [
+        "summary", "--db", db, "--character", "NoSuchChar", "--planner-only",
+        "--trace-file", trace_file,
+    ])
+    assert res.exit_code == 0, res.output
+    assert "Planner load" in res.output
+    assert "Memo hit rates" in res.output
+    assert "Outcomes" not in res.output
@@ -1392,7 +1392,7 @@ class _SpyPlanner:
         self.calls = 0
         self.last_stats = GOAPPlanner().last_stats
 
-    def plan(self, state, goal, actions, game_data, history=None, *, budget_seconds=None):
+    def plan(self, state, goal, actions, game_data, history=None, *, budget_seconds=None, subgoals=()):
         self.calls += 1
         return []
 
@@ -2013,7 +2013,7 @@ def test_plans_forwards_budget_to_planner():
         def __init__(self):
             self.last_stats = GOAPPlanner().last_stats
 
-        def plan(self, state, goal, actions, game_data, history=None, *, budget_seconds=None):
+        def plan(self, state, goal, actions, game_data, history=None, *, budget_seconds=None, subgoals=()):
             captured["budget"] = budget_seconds
             return []
 
@@ -2140,7 +2140,7 @@ class _TrivialPlanner:
         self._unplannable = unplannable
         self.last_stats = PlanStats()
 
-    def plan(self, state, goal, actions, game_data, history, budget_seconds=None):
+    def plan(self, state, goal, actions, game_data, history, budget_seconds=None, subgoals=()):
         if isinstance(goal, self._unplannable):
             return []
         return [WaitAction()]
@@ -2733,7 +2733,7 @@ class _ScriptedArbiterPlanner:
         self.plannable = set(plannable)
         self.last_stats = GOAPPlanner().last_stats
 
-    def plan(self, state, goal, actions, game_data, history=None, *, budget_seconds=None):
+    def plan(self, state, goal, actions, game_data, history=None, *, budget_seconds=None, subgoals=()):
         if repr(goal) in self.plannable:
             self.last_stats = PlanStats(nodes_explored=3, max_depth_reached=1, timed_out=False)
             return [WaitAction()]
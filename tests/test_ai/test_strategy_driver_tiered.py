@@ -32,7 +32,7 @@ class _ScriptedPlanner:
         self.budgets = []
         self.last_stats = GOAPPlanner().last_stats
 
-    def plan(self, state, goal, actions, game_data, history=None, *, budget_seconds=None):
+    def plan(self, state, goal, actions, game_data, history=None, *, budget_seconds=None, subgoals=()):
         r = repr(goal)
         self.budgets.append((r, budget_seconds))
         if r in self.plannable:
@@ -168,7 +168,7 @@ class _TrivialPlanner:
     def __init__(self) -> None:
         self.last_stats = PlanStats()
 
-    def plan(self, state, goal, actions, game_data, history, budget_seconds=None):
+    def plan(self, state, goal, actions, game_data, history, budget_seconds=None, subgoals=()):
         return [WaitAction()]
 
 
@@ -0,0 +1,360 @@
+"""Exact walking distances (ai/tile_distance) and their wiring into movement
+cost, destination choice, server-path learning and the on-disk table cache."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from artifactsmmo_cli.ai.actions.combat import FightAction
+from artifactsmmo_cli.ai.actions.deposit_all import DepositAllAction
+from artifactsmmo_cli.ai.actions.factory import build_actions
+from artifactsmmo_cli.ai.actions.gathering import GatherAction
+from artifactsmmo_cli.ai.actions.movement import MoveAction, path_steps
+from artifactsmmo_cli.ai.actions.movement_semantic import MoveTo
+from artifactsmmo_cli.ai.nearest_tile import nearest_by_steps, nearest_or_error
+from artifactsmmo_cli.ai.player import GamePlayer
+from artifactsmmo_cli.ai.tile_distance import (
+    TILE_DISTANCE_VERSION,
+    RegionDistances,
+    TileDistanceTable,
+)
+from tests.test_ai.fixtures import make_state
+from tests.test_ai.test_actions import make_game_data
+
+OW = "overworld"
+
+
+def _wall_grid() -> set[tuple[int, int, str]]:
+    """A 5x3 overworld block with a wall at x=2 except the top row:
+
+        y=0  . . . . .
+        y=1  . . # . .
+        y=2  . . # . .
+
+    (1,2) -> (3,2) is Manhattan 2 but 6 walking steps round the wall."""
+    tiles = {(x, y, OW) for x in range(5) for y in range(3)}
+    return tiles - {(2, 1, OW), (2, 2, OW)}
+
+
+def _table() -> TileDistanceTable:
+    return TileDistanceTable(_wall_grid(), set())
+
+
+def test_steps_walk_around_the_wall():
+    assert _table().steps(1, 2, 3, 2, OW) == 6
+
+
+def test_steps_unwalled_pair_equals_manhattan():
+    assert _table().steps(0, 0, 4, 0, OW) == 4
+
+
+def test_unknown_tile_falls_back_to_manhattan():
+    t = _table()
+    assert t.exact_steps(1, 2, 9, 9, OW) is None
+    assert t.steps(1, 2, 9, 9, OW) == 15
+    assert t.steps(40, 40, 41, 41, OW) == 2
+
+
+def test_other_layer_is_not_the_same_region():
+    assert _table().exact_steps(0, 0, 1, 0, "underground") is None
+
+
+def test_separate_components_do_not_answer_each_other():
+    t = TileDistanceTable({(0, 0, OW), (5, 5, OW)}, set())
+    assert t.exact_steps(0, 0, 5, 5, OW) is None
+
+
+def test_restricted_tiles_form_their_own_regions():
+    t = TileDistanceTable({(0, 0, OW), (1, 0, OW)}, {(2, 0, OW), (3, 0, OW)})
+    assert t.exact_steps(2, 0, 3, 0, OW) == 1
+    assert t.exact_steps(1, 0, 2, 0, OW) is None
+
+
+def test_region_compiled_once():
+    t = _table()
+    assert t.region(0, 0, OW) is t.region(4, 2, OW)
+    assert t.region(2, 1, OW) is None
+
+
+def test_region_table_is_compact_array():
+    region = RegionDistances.compile(OW, [(0, 0), (1, 0), (2, 0)])
+    assert region.dist.typecode == "H"
+    assert list(region.dist) == [0, 1, 2, 1, 0, 1, 2, 1, 0]
+    assert region.steps((0, 0), (5, 5)) is None
+
+
+def test_path_goes_around_the_wall():
+    walk = _table().path(1, 2, 3, 2, OW)
+    assert walk == [(1, 1), (1, 0), (2, 0), (3, 0), (3, 1), (3, 2)]
+
+
+def test_path_unknown_or_same_tile_is_empty():
+    t = _table()
+    assert t.path(1, 2, 1, 2, OW) == []
+    assert t.path(2, 1, 3, 2, OW) == []
+
+
+def test_observed_length_overrides_table():
+    t = _table()
+    t.observe(0, 0, 4, 0, OW, 7)
+    assert t.steps(0, 0, 4, 0, OW) == 7
+    assert t.observed == {(0, 0, 4, 0, OW): 7}
+
+
+def test_observe_records_only_disagreements():
+    t = _table()
+    t.observe(1, 2, 3, 2, OW, 6)  # the BFS answer already
+    assert t.observed == {}
+    t.observe(0, 0, 4, 0, OW, 7)
+    t.observe(0, 0, 4, 0, OW, 4)  # back to the BFS answer: still a change
+    assert t.observed == {(0, 0, 4, 0, OW): 4}
+
+
+def test_observe_same_tile_is_ignored():
+    t = _table()
+    t.observe(1, 1, 1, 1, OW, 3)
+    assert t.observed == {}
+
+
+def test_stepper_binds_layer():
+    assert _table().stepper(OW)(1, 2, 3, 2) == 6
+
+
+def test_save_load_roundtrip(tmp_path):
+    path = tmp_path / "tiledist.json"
+    src = _table()
+    src.compile_all()
+    src.save(path)
+    dst = _table()
+    assert dst.load(path) is True
+    assert dst.steps(1, 2, 3, 2, OW) == 6
+    assert dst.region(0, 0, OW).dist == src.region(0, 0, OW).dist
+
+
+def test_observed_distances_persist_and_write_through(tmp_path):
+    path = tmp_path / "tiledist.json"
+    src = _table()
+    src.compile_all()
+    src.save(path)
+    src.observe(0, 0, 4, 0, OW, 7)
+    dst = _table()
+    assert dst.load(path) is True
+    assert dst.steps(0, 0, 4, 0, OW) == 7
+
+
+def test_observed_distances_survive_a_map_change(tmp_path):
+    path = tmp_path / "tiledist.json"
+    src = _table()
+    src.save(path)
+    src.observe(0, 0, 4, 0, OW, 7)
+    other = TileDistanceTable(_wall_grid() | {(9, 9, OW)}, set())
+    other.observe(1, 2, 3, 2, OW, 9)
+    assert other.load(path) is False
+    assert other.observed == {(0, 0, 4, 0, OW): 7, (1, 2, 3, 2, OW): 9}
+
+
+def test_observed_write_failure_is_not_fatal(tmp_path, capsys):
+    t = _table()
+    t.save(tmp_path / "tiledist.json")
+    with patch.object(TileDistanceTable, "save", side_effect=OSError("disk full")):
+        t.observe(0, 0, 4, 0, OW, 7)
+    assert t.steps(0, 0, 4, 0, OW) == 7
+    assert "observed distance write failed" in capsys.readouterr().out
+
+
+def test_load_rejects_other_tile_sets(tmp_path):
+    path = tmp_path / "tiledist.json"
+    _table().save(path)
+    other = TileDistanceTable(_wall_grid() | {(9, 9, OW)}, set())
+    assert other.load(path) is False
+
+
+def test_load_rejects_version_mismatch(tmp_path):
+    path = tmp_path / "tiledist.json"
+    t = _table()
+    t.save(path)
+    raw = json.loads(path.read_text())
+    raw["version"] = TILE_DISTANCE_VERSION + 1
+    path.write_text(json.dumps(raw))
+    assert _table().load(path) is False
+
+
+def test_load_rejects_missing_and_corrupt(tmp_path):
+    assert _table().load(tmp_path / "absent.json") is False
+    bad = tmp_path / "bad.json"
+    bad.write_text("{not json")
+    assert _table().load(bad) is False
+
+
+def _saved_payload(tmp_path):
+    path = tmp_path / "tiledist.json"
+    t = _table()
+    t.compile_all()
+    t.save(path)
+    return path, json.loads(path.read_text())
+
+
+def test_load_rejects_member_mismatch(tmp_path):
+    path, raw = _saved_payload(tmp_path)
+    entry = next(iter(raw["regions"].values()))
+    entry["tiles"] = entry["tiles"][:-1]
+    path.write_text(json.dumps(raw))
+    assert _table().load(path) is False
+
+
+def test_load_rejects_truncated_array(tmp_path):
+    path, raw = _saved_payload(tmp_path)
+    entry = next(iter(raw["regions"].values()))
+    # Whole uint16 entries (4 bytes -> 2), just too few for the region: a
+    # ragged byte count is the ValueError path, not this length check.
+    entry["dist"] = "AAAAAA=="
+    path.write_text(json.dumps(raw))
+    assert _table().load(path) is False
+
+
+def test_nearest_by_steps_prefers_walkable_route():
+    # (3,2) is Manhattan-nearest from (1,2) but 6 steps away; (0,0) is 3.
+    tiles = frozenset([(3, 2), (0, 0)])
+    assert nearest_or_error(1, 2, tiles, "gather") == (3, 2)
+    assert nearest_or_error(1, 2, tiles, "gather", _table().stepper(OW)) == (0, 0)
+    assert nearest_by_steps(1, 2, frozenset(), _table().stepper(OW)) is None
+
+
+def _walled_game_data():
+    gd = make_game_data()
+    gd.world.walkable_tiles.update(_wall_grid())
+    return gd
+
+
+def test_game_data_travel_steps_uses_walkable_grid():
+    gd = _walled_game_data()
+    assert gd.travel_steps(1, 2, 3, 2, OW) == 6
+    assert gd.tile_distances is gd.tile_distances
+
+
+def test_game_data_table_rebuilds_when_tiles_grow():
+    gd = _walled_game_data()
+    first = gd.tile_distances
+    gd.world.walkable_tiles.add((2, 1, OW))
+    assert gd.tile_distances is not first
+    assert gd.travel_steps(1, 2, 3, 2, OW) == 4
+
+
+def test_game_data_rebuild_keeps_observed_distances():
+    gd = _walled_game_data()
+    gd.tile_distances.observe(0, 0, 4, 0, OW, 7)
+    gd.world.walkable_tiles.add((2, 1, OW))
+    assert gd.travel_steps(0, 0, 4, 0, OW) == 7
+
+
+def test_game_data_persists_tables(tmp_path):
+    gd = _walled_game_data()
+    gd._tile_distance_path = tmp_path / "tiledist.json"
+    assert gd.travel_steps(1, 2, 3, 2, OW) == 6
+    assert gd._tile_distance_path.exists()
+    warm = _walled_game_data()
+    warm._tile_distance_path = gd._tile_distance_path
+    with patch.object(RegionDistances, "compile", side_effect=AssertionError("no BFS on a warm boot")):
+        assert warm.travel_steps(1, 2, 3, 2, OW) == 6
+
+
+def test_game_data_cache_write_failure_is_not_fatal(tmp_path, capsys):
+    gd = _walled_game_data()
+    gd._tile_distance_path = tmp_path / "tiledist.json"
+    with patch.object(TileDistanceTable, "save", side_effect=OSError("disk full")):
+        assert gd.travel_steps(1, 2, 3, 2, OW) == 6
+    assert "tile distance cache write failed" in capsys.readouterr().out
+
+
+def test_move_cost_prices_walk_around_wall():
+    gd = _walled_game_data()
+    state = make_state(x=1, y=2)
+    assert MoveAction(x=3, y=2).cost(state, gd) == 30.0
+
+
+def test_fight_apply_uses_path_nearest():
+    gd = _walled_game_data()
+    gd._monster_level = {"chicken": 1}
+    state = make_state(x=1, y=2)
+    fight = FightAction(monster_code="chicken", locations=frozenset([(3, 2), (0, 0)]),
+                        distances=gd.tile_distances)
+    after = fight.apply(state, gd)
+    assert (after.x, after.y) == (0, 0)
+
+
+def test_gather_apply_uses_path_nearest():
+    gd = _walled_game_data()
+    gd._resource_drops = {"ash_tree": "ash_wood"}
+    state = make_state(x=1, y=2)
+    gather = GatherAction(resource_code="ash_tree", locations=frozenset([(3, 2), (0, 0)]),
+                          distances=gd.tile_distances)
+    after = gather.apply(state, gd)
+    assert (after.x, after.y) == (0, 0)
+
+
+def test_moveto_apply_uses_path_nearest():
+    gd = _walled_game_data()
+    move = MoveTo(name="x", destinations=frozenset([(3, 2), (0, 0)]), distances=gd.tile_distances)
+    after = move.apply(make_state(x=1, y=2), gd)
+    assert (after.x, after.y) == (0, 0)
+
+
+def test_moveto_execute_walks_to_path_nearest():
+    table = _table()
+    move = MoveTo(name="x", destinations=frozenset([(3, 2), (0, 0)]), distances=table)
+    with patch.object(MoveAction, "execute", autospec=True, return_value="moved") as ex:
+        assert move.execute(make_state(x=1, y=2), client=None) == "moved"
+    called = ex.call_args.args[0]
+    assert (called.x, called.y) == (0, 0)
+    assert called.distances is table
+
+
+def test_move_execute_learns_server_path_length():
+    table = _table()
+    state = make_state(x=0, y=0)
+    response = MagicMock()
+    response.data.path = [[0, 0], [0, 1], [1, 1], [2, 1], [2, 0], [3, 0], [4, 0]]
+    response.data.character = MagicMock()
+    with patch("artifactsmmo_cli.ai.actions.movement.action_move", return_value=response), \
+            patch("artifactsmmo_cli.ai.actions.movement.WorldState.from_character_schema",
+                  return_value=make_state(x=4, y=0)):
+        MoveAction(x=4, y=0, distances=table).execute(state, client=None)
+    assert table.steps(0, 0, 4, 0, OW) == 6
+
+
+def test_path_steps_with_and_without_start_tile():
+    assert path_steps([[0, 0], [1, 0], [2, 0]], (0, 0)) == 2
+    assert path_steps([[1, 0], [2, 0]], (0, 0)) == 2
+    assert path_steps([], (0, 0)) == 0
+
+
+def test_factory_shares_game_data_table():
+    gd = make_game_data(monster_locs={"chicken": [(1, 1)]}, resource_locs={"ash_tree": [(2, 2)]})
+    gd._monster_level = {"chicken": 1}
+    actions = build_actions(gd, None, None, True, 0)
+    fights = [a for a in actions if isinstance(a, FightAction)]
+    gathers = [a for a in actions if isinstance(a, GatherAction)]
+    assert fights and gathers
+    assert all(a.distances is gd.tile_distances for a in fights + gathers)
+
+
+def test_fixed_destination_move_carries_the_table():
+    table = _table()
+    deposit = DepositAllAction(bank_location=(4, 0))
+    deposit.distances = table
+    with patch.object(MoveAction, "execute", autospec=True, side_effect=RuntimeError("stop")) as ex:
+        with pytest.raises(RuntimeError):
+            deposit.execute(make_state(x=0, y=0), client=None)
+    assert ex.call_args.args[0].distances is table
+
+
+def test_player_attaches_the_table_before_execute():
+    gd = _walled_game_data()
+    player = GamePlayer(character="hero")
+    player.state = make_state(x=0, y=0)
+    player.game_data = gd
+    action = MoveAction(x=4, y=0)
+    with patch.object(MoveAction, "execute", autospec=True, return_value=make_state(x=4, y=0)):
+        player._execute(action, client=MagicMock())
+    assert action.distances is gd.tile_distances
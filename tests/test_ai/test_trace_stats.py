@@ -2,12 +2,15 @@
 
 from datetime import datetime, timezone
 
+import pytest
 from sqlmodel import Session as SqlSession
 from sqlmodel import SQLModel, create_engine
 
 from artifactsmmo_cli.ai.learning.models import Cycle, Session
 from artifactsmmo_cli.ai.trace_stats import (
+    MemoLoad,
     analyze,
+    analyze_memo,
     analyze_tree_divergence,
     list_sessions,
     load_cycles_from_db,
@@ -368,3 +371,21 @@ def test_load_trace_records_skips_malformed_and_non_object_lines(tmp_path):
     records = load_trace_records(str(path))
     assert len(records) == 2
     assert [r["cycle"] for r in records] == [0, 1]
+
+
+def test_analyze_memo_sums_each_layer_coldest_first():
+    records = [
+        {"planner": {"memo": {
+            "loadout_cache": {"hits": 90, "misses": 10, "size": 300, "saved_ms": 900.0},
+            "deposit_all": {"hits": 1, "misses": 3, "size": -1, "saved_ms": 0.5}}}},
+        {"planner": {"memo": {
+            "loadout_cache": {"hits": 10, "misses": 0, "size": 280, "saved_ms": 100.0}}}},
+        {"planner": {"nodes": 5}},
+        {"cycle": 3},
+    ]
+    loads = analyze_memo(records)
+    assert [load.layer for load in loads] == ["deposit_all", "loadout_cache"]
+    cache = loads[1]
+    assert (cache.hits, cache.misses, cache.max_size, cache.saved_ms) == (100, 10, 300, 1000.0)
+    assert cache.hit_rate == pytest.approx(100 / 110)
+    assert MemoLoad(layer="idle").hit_rate == 0.0
@@ -20,6 +20,6 @@ def test_execute_walks_to_portal_first_when_not_there() -> None:
                return_value=make_api_result(char)) as mock_t:
         mock_move_cls.return_value.execute.return_value = moved
         a.execute(state, client)
-    mock_move_cls.assert_called_once_with(x=-4, y=9)
+    mock_move_cls.assert_called_once_with(x=-4, y=9, distances=None)
     mock_move_cls.return_value.execute.assert_called_once_with(state, client)
     mock_t.assert_called_once_with(client=client, name="testchar")
@@ -0,0 +1,66 @@
+"""world_state_codec: a recorded state decodes to the exact WorldState it was."""
+
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from artifactsmmo_cli.ai.open_order import OpenOrder, OrderSide
+from artifactsmmo_cli.ai.raid_info import RaidInfo
+from artifactsmmo_cli.ai.task_lifecycle import TaskLifecyclePhase
+from artifactsmmo_cli.ai.world_state_codec import StateDecodeError, state_from_json, state_to_json
+from tests.test_ai.fixtures import make_state
+
+_AT = datetime(2026, 10, 18, 12, 0, tzinfo=timezone.utc)
+
+
+def test_a_populated_state_round_trips_exactly():
+    state = make_state(
+        inventory={"copper_ore": 12, "ash_wood": 3},
+        equipment={"weapon_slot": "copper_dagger", "utility1_slot": "small_health_potion", "ring1_slot": None},
+        cooldown_expires=_AT,
+        task_code="chicken", task_type="monsters", task_progress=3, task_total=10,
+        bank_items={"feather": 40}, bank_gold=900, bank_capacity=50,
+        pending_items=(("p1", "gift_box"),),
+        skill_xp={"mining": 40}, skill_max_xp={"mining": 150},
+        active_events={"portal": _AT},
+        raids=[RaidInfo(code="r", name="R", monster="m", status="active", next_start_at=_AT,
+                        remaining_hp=10, total_hp=100, window_ends_at=None)],
+        crafting_target="copper_helmet", attack={"fire": 4}, dmg_elements={"fire": 10},
+        utility1_slot_quantity=5, layer="underground",
+        open_orders=(OpenOrder(id="o1", code="feather", qty=5, price=3, side=OrderSide.SELL, age=2),),
+    )
+    decoded = state_from_json(state_to_json(state))
+    assert decoded == state
+    assert decoded.task_lifecycle_phase is TaskLifecyclePhase.IN_PROGRESS
+    assert isinstance(decoded.pending_items, tuple)
+
+
+def test_the_derived_phase_is_not_stored():
+    assert "task_lifecycle_phase" not in json.loads(state_to_json(make_state()))
+
+
+def test_a_field_the_row_predates_takes_its_default_and_unknown_keys_are_ignored():
+    raw = json.loads(state_to_json(make_state()))
+    del raw["open_orders"], raw["raids"], raw["active_events"], raw["layer"]
+    raw["retired_field"] = 1
+    decoded = state_from_json(json.dumps(raw))
+    assert decoded == make_state()
+
+
+@pytest.mark.parametrize("text", [
+    "not json",
+    "[]",
+    json.dumps({"character": "x"}),
+    json.dumps({**json.loads(state_to_json(make_state())), "open_orders": [{"side": "sideways"}]}),
+])
+def test_anything_else_is_a_decode_error(text):
+    with pytest.raises(StateDecodeError):
+        state_from_json(text)
+
+
+def test_a_missing_required_field_is_an_error_not_a_guess():
+    raw = json.loads(state_to_json(make_state()))
+    del raw["cooldown_expires"]
+    with pytest.raises(StateDecodeError):
+        state_from_json(json.dumps(raw))
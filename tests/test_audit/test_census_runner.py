@@ -0,0 +1,121 @@
+"""Shared census runner: in-order results in-process and across a pool, the
+per-cell result cache and its (data, code) generation, and the two digests
+that key it."""
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+
+import pytest
+
+from artifactsmmo_cli.ai.game_data import GameData
+from artifactsmmo_cli.audit.census_runner import CensusCache, bundle_digest, code_digest, run_cells
+
+BUNDLE = Path("tests/test_ai/scenarios/fixtures/gamedata_bundle.json")
+
+
+@dataclass(frozen=True)
+class _Square:
+    cell: int
+    square: int
+    digits: tuple[str, ...]
+
+
+def _square(cell: int, game_data: GameData) -> _Square:
+    return _Square(cell, cell * cell, tuple(str(cell)))
+
+
+def _exploding(cell: int, game_data: GameData) -> _Square:
+    raise AssertionError(f"cell {cell} should have been served from the cache")
+
+
+@dataclass(frozen=True)
+class _Verdict:
+    cell: int
+    planner_failed: bool
+
+
+def _odd_times_out(cell: int, game_data: GameData) -> _Verdict:
+    return _Verdict(cell, cell % 2 == 1)
+
+
+def _three_raises(cell: int, game_data: GameData) -> _Square:
+    if cell == 3:
+        raise RuntimeError("cell 3 errored")
+    return _square(cell, game_data)
+
+
+def _gd() -> GameData:
+    return GameData.from_cache_bundle(json.loads(BUNDLE.read_text()))
+
+
+def _cache(tmp_path: Path, data: str = "data", code: str = "code") -> CensusCache[_Square]:
+    return CensusCache("squares", _Square, data, code, directory=tmp_path)
+
+
+def test_results_keep_cell_order_in_process_and_across_a_pool() -> None:
+    gd = _gd()
+    seen: list[tuple[int, int]] = []
+    serial = run_cells(_square, [3, 12, 1], gd, max_workers=1, progress=lambda done, total: seen.append((done, total)))
+    pooled = run_cells(_square, [3, 12, 1], gd, max_workers=2)
+    assert serial == pooled == [_Square(3, 9, ("3",)), _Square(12, 144, ("1", "2")), _Square(1, 1, ("1",))]
+    assert seen == [(1, 3), (2, 3), (3, 3)]
+    assert run_cells(_square, [], gd) == []
+
+
+def test_cached_cells_are_not_re_run(tmp_path: Path) -> None:
+    gd = _gd()
+    cache = _cache(tmp_path)
+    first = run_cells(_square, [2, 5], gd, max_workers=1, cache=cache)
+    assert cache.path.exists()
+    assert run_cells(_exploding, [2, 5], gd, max_workers=1, cache=cache) == first
+    # A new cell is planned; the cached ones are served and kept.
+    seen: list[tuple[int, int]] = []
+    grown = run_cells(_square, [2, 7, 5], gd, max_workers=1, cache=cache,
+                      progress=lambda done, total: seen.append((done, total)))
+    assert grown == [first[0], _Square(7, 49, ("7",)), first[1]]
+    assert seen == [(1, 3), (2, 3), (3, 3)]
+    assert set(cache.load()) == {"2", "5", "7"}
+
+
+def test_a_new_data_or_code_generation_re_plans_everything(tmp_path: Path) -> None:
+    gd = _gd()
+    run_cells(_square, [2], gd, max_workers=1, cache=_cache(tmp_path))
+    assert _cache(tmp_path, data="other").load() == {}
+    assert _cache(tmp_path, code="other").load() == {}
+    assert run_cells(_square, [2], gd, max_workers=1, cache=_cache(tmp_path, code="other")) == [_Square(2, 4, ("2",))]
+    assert _cache(tmp_path).load() == {}
+
+
+def test_inconclusive_cells_are_returned_but_never_cached(tmp_path: Path) -> None:
+    gd = _gd()
+    cache = CensusCache("verdicts", _Verdict, "data", "code", directory=tmp_path)
+    results = run_cells(_odd_times_out, [1, 2, 3], gd, max_workers=1, cache=cache)
+    assert results == [_Verdict(1, True), _Verdict(2, False), _Verdict(3, True)]
+    assert set(cache.load()) == {"2"}
+
+
+def test_an_erroring_cell_keeps_the_cells_before_it(tmp_path: Path) -> None:
+    gd = _gd()
+    cache = _cache(tmp_path)
+    with pytest.raises(RuntimeError, match="cell 3 errored"):
+        run_cells(_three_raises, [2, 3, 4], gd, max_workers=1, cache=cache)
+    assert set(cache.load()) == {"2"}
+    assert run_cells(_square, [2, 3, 4], gd, max_workers=1, cache=cache)[1] == _Square(3, 9, ("3",))
+    assert set(cache.load()) == {"2", "3", "4"}
+
+
+def test_bundle_digest_is_order_insensitive_and_content_sensitive() -> None:
+    assert bundle_digest({"a": 1, "b": [1, 2]}) == bundle_digest({"b": [1, 2], "a": 1})
+    assert bundle_digest({"a": 1}) != bundle_digest({"a": 2})
+
+
+def test_code_digest_follows_the_import_closure() -> None:
+    census = code_digest("artifactsmmo_cli.audit.recycle_source_completeness")
+    assert census == code_digest("artifactsmmo_cli.audit.recycle_source_completeness")
+    # The planner is in the census's closure: the census's digest is not the
+    # census file alone, and two censuses sharing it still differ.
+    assert census != code_digest("artifactsmmo_cli.audit.shed_reachability_completeness")
+    assert code_digest("artifactsmmo_cli.ai.planner") != code_digest()
+    # Non-package and non-module names contribute nothing.
+    assert code_digest("json", "artifactsmmo_cli.no_such_module") == code_digest()
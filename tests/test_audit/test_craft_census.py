@@ -106,3 +106,18 @@ def test_run_census_multiple_recipes_no_progress() -> None:
     results = run_census(gd, ["copper_bar", "copper_helmet"])
     recipes_in = {r.recipe for r in results}
     assert recipes_in == {"copper_bar", "copper_helmet"}
+
+
+def test_run_census_progress_stays_per_recipe_across_the_pool() -> None:
+    """The cells of every recipe are flattened into one pooled work list, but
+    progress still ticks once per recipe, in list order, once its last cell is
+    in — a recipe with an empty grid (copper_ore is not craftable) included."""
+    gd = _gd()
+    seen: list[tuple[int, int, str]] = []
+
+    def progress(done: int, total: int, recipe: str) -> None:
+        seen.append((done, total, recipe))
+
+    results = run_census(gd, ["copper_bar", "copper_ore", "copper_helmet"], progress, max_workers=2)
+    assert seen == [(1, 3, "copper_bar"), (2, 3, "copper_ore"), (3, 3, "copper_helmet")]
+    assert [r.recipe for r in results] == ["copper_bar"] * 3 + ["copper_helmet"] * (len(results) - 3)
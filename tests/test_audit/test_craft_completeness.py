@@ -70,7 +70,7 @@ def test_classify_gap_real_bundle_new_classes_regression_pin() -> None:
     # and PASSES on that leg — no SKILL_PREREQUISITE classification.
     cell = CraftCell(8, "mining", 5)
     state = census_state("iron_bar", cell, gd)
-    plan = plan_craft("iron_bar", state, gd)
+    plan, _failed = plan_craft("iron_bar", state, gd)
     assert plan and isinstance(plan[0], LevelSkill), [repr(a) for a in plan]
     assert craft_cell_verdict("iron_bar", plan, gd).passed
 
@@ -83,7 +83,8 @@ def test_plan_craft_plans_a_simple_smelt() -> None:
     sc = ScenarioCharacter(name="t", level=5, skills={"mining": 5},
                            derive_combat_stats=True)
     state = scenario_state(sc, gd)
-    plan = plan_craft("copper_bar", state, gd)
+    plan, failed = plan_craft("copper_bar", state, gd)
+    assert not failed
     assert plan, "expected a non-empty plan for copper_bar"
     # first leg is a gather (copper_ore) or a craft toward copper_bar
     assert isinstance(plan[0], (GatherAction, CraftAction)), repr(plan[0])
@@ -33,11 +33,14 @@ def stub_api():
     helpers run unpatched.
     """
     manager = ClientManager()
-    old_client, old_api = manager._client, manager._api
+    old_client, old_api, old_config = manager._client, manager._api, manager._config
     manager._client = Mock(name="stub_client")
     manager._api = Mock(name="stub_api")
+    # No config: nothing names an API host, so no command finds a local GE
+    # store under the real home (see test_trade's `_local_store`).
+    manager._config = None
     yield manager._api
-    manager._client, manager._api = old_client, old_api
+    manager._client, manager._api, manager._config = old_client, old_api, old_config
 
 
 def api_response(data, **extra) -> SimpleNamespace:
@@ -191,6 +191,66 @@ class TestPlayCommandWiring:
                 mock_tracer_cls.assert_called_once_with("/tmp/custom.jsonl")
                 assert "Tracing to /tmp/custom.jsonl" in result.output
 
+    def test_profile_slow_cycles_writes_next_to_the_trace(self, runner):
+        """The folded files are named after the trace file they annotate."""
+        with patch("artifactsmmo_cli.commands.play.GamePlayer") as mock_player_cls:
+            mock_player_cls.return_value = Mock()
+            with patch("artifactsmmo_cli.commands.play.FileTracer"):
+                result = runner.invoke(app, [
+                    "hero", "--trace", "--trace-file", "/tmp/custom.jsonl", "--profile-slow-cycles", "2.5"])
+
+            assert result.exit_code == 0
+            profiler = mock_player_cls.return_value.set_slow_cycle_profiler.call_args.args[0]
+            assert (profiler.threshold_seconds, profiler.base_path) == (2.5, "/tmp/custom")
+            assert "Profiling decides slower than 2.5s to /tmp/custom.cycle-<N>.folded" in result.output
+
+    def test_profile_slow_cycles_without_a_trace_uses_a_generated_base(self, runner):
+        with patch("artifactsmmo_cli.commands.play.GamePlayer") as mock_player_cls:
+            mock_player_cls.return_value = Mock()
+
+            result = runner.invoke(app, ["hero", "--profile-slow-cycles", "0"])
+
+            assert result.exit_code == 0
+            profiler = mock_player_cls.return_value.set_slow_cycle_profiler.call_args.args[0]
+            assert profiler.base_path.startswith("play-profile-hero-")
+
+    def test_record_states_samples_the_pre_decision_state(self, runner):
+        with patch("artifactsmmo_cli.commands.play.GamePlayer") as mock_player_cls:
+            mock_player_cls.return_value = Mock()
+
+            result = runner.invoke(app, ["hero", "--record-states", "10"])
+
+            assert result.exit_code == 0
+            mock_player_cls.return_value.set_state_recording.assert_called_once_with(10)
+
+    def test_no_state_recording_without_record_states(self, runner):
+        with patch("artifactsmmo_cli.commands.play.GamePlayer") as mock_player_cls:
+            mock_player_cls.return_value = Mock()
+
+            result = runner.invoke(app, ["hero"])
+
+            assert result.exit_code == 0
+            mock_player_cls.return_value.set_state_recording.assert_not_called()
+
+    def test_no_memo_stats_turns_the_counters_off(self, runner):
+        with patch("artifactsmmo_cli.commands.play.GamePlayer") as mock_player_cls, \
+                patch("artifactsmmo_cli.commands.play.memo_stats.set_enabled") as set_enabled:
+            mock_player_cls.return_value = Mock()
+
+            assert runner.invoke(app, ["hero"]).exit_code == 0
+            set_enabled.assert_not_called()
+            assert runner.invoke(app, ["hero", "--no-memo-stats"]).exit_code == 0
+            set_enabled.assert_called_once_with(False)
+
+    def test_no_profiler_without_profile_slow_cycles(self, runner):
+        with patch("artifactsmmo_cli.commands.play.GamePlayer") as mock_player_cls:
+            mock_player_cls.return_value = Mock()
+
+            result = runner.invoke(app, ["hero"])
+
+            assert result.exit_code == 0
+            mock_player_cls.return_value.set_slow_cycle_profiler.assert_not_called()
+
     def test_learn_starts_session_and_closes_store(self, runner):
         """--learn opens a LearningStore, starts a session, and closes on exit."""
         with patch("artifactsmmo_cli.commands.play.GamePlayer") as mock_player_cls:
@@ -339,7 +399,7 @@ class FakeWatchApp:
         self._done = threading.Event()
         self.exit_calls: list[tuple[tuple, dict]] = []
 
-    def update_snapshot(self, snap) -> None:
+    def queue_snapshot(self, snap) -> None:
         """No-op observer target (handed to ThreadSafeBridge)."""
 
     def set_planning(self, active: bool) -> None:
@@ -412,7 +472,7 @@ class TestRunWithTui:
                 # Bridge wraps the app's update callback + planning signal, and feeds
                 # both the cycle observer and the planning observer.
                 mock_bridge_cls.assert_called_once_with(
-                    mock_app, mock_app.update_snapshot, planning_handler=mock_app.set_planning
+                    mock_app, mock_app.queue_snapshot, planning_handler=mock_app.set_planning
                 )
                 mock_player.set_cycle_observer.assert_called_once_with(mock_bridge.notify)
                 mock_player.set_planning_observer.assert_called_once_with(mock_bridge.notify_planning)
@@ -115,12 +115,15 @@ class TestAllFlagWiring:
             result = runner.invoke(app, [
                 "--all", "--verbose", "--dry-run", "--trace", "--learn",
                 "--learn-db", "/tmp/l.db", "--tui", "--refresh-game-data",
+                "--profile-slow-cycles", "2.5", "--record-states", "10",
+                "--no-memo-stats",
             ])
 
         assert result.exit_code == 0
         mock_multi_run_cls.assert_called_once_with(
             verbose=True, dry_run=True, trace=True, learn=True,
             learn_db="/tmp/l.db", tui=True, refresh_game_data=True,
+            profile_slow_cycles=2.5, record_states=10, memo_stats=False,
         )
         mock_multi_run.run.assert_called_once_with()
         # The single-character path (mutation lock, GamePlayer, LearningStore)
@@ -1,9 +1,14 @@
 """Tests for trade commands."""
 
+from datetime import datetime, timezone
+from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
+from artifactsmmo_api_client.models.ge_order_type import GEOrderType
 from rich.console import Console
 
+from artifactsmmo_cli.ai.ge_market_store import BookOrder, GeMarketStore
 from artifactsmmo_cli.commands.trade import (
     app,
     calculate_price_stats,
@@ -15,6 +20,26 @@ from artifactsmmo_cli.utils.api_display import MISSING
 from tests.test_commands.conftest import api_error, api_response, cooldown_status, unexpected_status
 
 _GE_ORDERS_SYNC = "artifactsmmo_api_client.api.grand_exchange.get_ge_orders_grandexchange_orders_get.sync"
+_NOW = datetime.now(tz=timezone.utc)
+
+
+def _local_store(monkeypatch, tmp_path, stub_api) -> GeMarketStore:
+    """Configure the stub manager for the real API host and point the cache
+    home at tmp; the store file exists once this returns."""
+    from artifactsmmo_cli.client_manager import ClientManager
+    from artifactsmmo_cli.config import Config
+
+    monkeypatch.setattr(Path, "home", staticmethod(lambda: tmp_path))
+    monkeypatch.setattr(ClientManager(), "_config", Config(token="t", api_base_url="https://api.artifactsmmo.com"))
+    return GeMarketStore(tmp_path / ".cache" / "artifactsmmo" / "ge-api.artifactsmmo.com.db")
+
+
+def _book(oid: str, side: str, code: str, price: int, quantity: int = 1) -> BookOrder:
+    return BookOrder(oid, side, code, price, quantity, _NOW.isoformat())
+
+
+def _api_order(oid: str, code: str, price: int, quantity: int = 1, type_: GEOrderType = GEOrderType.SELL):
+    return SimpleNamespace(id=oid, type_=type_, code=code, price=price, quantity=quantity, created_at=_NOW)
 
 
 class TestTradeCommands:
@@ -999,3 +1024,151 @@ class TestTradeCommands:
 
             assert result.exit_code == 1
             assert "spread failure" in result.stdout
+
+
+class TestLocalMarketStore:
+    """Market commands read the shared local book once a full sync is fresh."""
+
+    def test_trending_reads_fresh_local_book(self, runner, stub_api, monkeypatch, tmp_path):
+        store = _local_store(monkeypatch, tmp_path, stub_api)
+        # Synced NOW, not at `_NOW` (import time): a long suite run can age the
+        # module constant past GE_SYNC_TTL_SECONDS before this test executes.
+        now = datetime.now(tz=timezone.utc)
+        store.record_book("buy", [_book("b1", "buy", "gem", 9)], now)
+        store.record_book("sell", [_book("s1", "sell", "gem", 12), _book("s2", "sell", "ore", 3)], now)
+        with patch(_GE_ORDERS_SYNC) as mock_api:
+            result = runner.invoke(app, ["trending"])
+        assert result.exit_code == 0
+        mock_api.assert_not_called()
+        assert "gem" in result.stdout and "ore" in result.stdout
+
+    def test_stale_local_book_falls_back_to_live_page(self, runner, stub_api, monkeypatch, tmp_path):
+        store = _local_store(monkeypatch, tmp_path, stub_api)
+        store.record_book("buy", [_book("b1", "buy", "gem", 9)], _NOW)
+        with patch(_GE_ORDERS_SYNC) as mock_api:
+            mock_api.return_value = api_response(Mock(data=[]))
+            result = runner.invoke(app, ["spread"])
+        mock_api.assert_called_once()
+        assert "No orders found" in result.stdout
+
+    def test_unopenable_store_is_no_store(self, runner, stub_api, monkeypatch, tmp_path):
+        _local_store(monkeypatch, tmp_path, stub_api)
+        with (
+            patch("artifactsmmo_cli.commands.trade.GeMarketStore", side_effect=OSError("read-only")),
+            patch(_GE_ORDERS_SYNC) as mock_api,
+        ):
+            mock_api.return_value = api_response(Mock(data=[]))
+            result = runner.invoke(app, ["opportunities"])
+        mock_api.assert_called_once()
+        assert "No orders found" in result.stdout
+
+    def test_read_only_commands_do_not_create_the_store(self, runner, stub_api, monkeypatch, tmp_path):
+        from artifactsmmo_cli.client_manager import ClientManager
+        from artifactsmmo_cli.config import Config
+
+        monkeypatch.setattr(Path, "home", staticmethod(lambda: tmp_path))
+        monkeypatch.setattr(ClientManager(), "_config", Config(token="t"))
+        with patch(_GE_ORDERS_SYNC, return_value=api_response(Mock(data=[]))) as mock_api:
+            result = runner.invoke(app, ["spread"])
+        mock_api.assert_called_once()
+        assert "No orders found" in result.stdout
+        assert not (tmp_path / ".cache").exists()
+
+    def test_an_unreadable_store_falls_back_to_the_live_page(self, runner, stub_api, monkeypatch, tmp_path):
+        import sqlite3
+
+        _local_store(monkeypatch, tmp_path, stub_api)
+        with (
+            patch.object(GeMarketStore, "is_fresh", side_effect=sqlite3.OperationalError("database is locked")),
+            patch(_GE_ORDERS_SYNC, return_value=api_response(Mock(data=[]))) as mock_api,
+        ):
+            result = runner.invoke(app, ["trending"])
+        mock_api.assert_called_once()
+        assert "Traceback" not in result.stdout
+
+    def test_ge_sync_pages_both_sides_into_the_store(self, runner, stub_api, monkeypatch, tmp_path):
+        store = _local_store(monkeypatch, tmp_path, stub_api)
+
+        def page(client, type_, page, size):
+            if page > 1:
+                return SimpleNamespace(data=[])
+            return SimpleNamespace(data=[SimpleNamespace(
+                id=f"{type_.value}-{i}", type_=type_, code="gem", price=10 + i, quantity=1, created_at=_NOW)
+                for i in range(size if type_ is GEOrderType.SELL else 2)])
+
+        with patch(_GE_ORDERS_SYNC, side_effect=page):
+            result = runner.invoke(app, ["ge-sync"])
+        assert result.exit_code == 0
+        assert "GE Market Sync" in result.stdout
+        assert len(store.book("buy")) == 2 and len(store.book("sell")) == 100
+        assert store.is_fresh(datetime.now(tz=timezone.utc))
+
+    def test_ge_sync_without_store_exits(self, runner, stub_api):
+        result = runner.invoke(app, ["ge-sync"])
+        assert result.exit_code == 1
+        assert "No local market store" in result.stdout
+
+    def test_ge_sync_api_failure_exits(self, runner, stub_api, monkeypatch, tmp_path):
+        _local_store(monkeypatch, tmp_path, stub_api)
+        with patch(_GE_ORDERS_SYNC, side_effect=unexpected_status(500, "sync failure")):
+            result = runner.invoke(app, ["ge-sync"])
+        assert result.exit_code == 1
+        assert "sync failure" in result.stdout
+
+    def test_analyze_without_a_readable_store_skips_the_trend(self, runner, stub_api, monkeypatch, tmp_path):
+        import sqlite3
+
+        _local_store(monkeypatch, tmp_path, stub_api)
+        with (
+            patch.object(GeMarketStore, "price_history", side_effect=sqlite3.DatabaseError("malformed")),
+            patch(_GE_ORDERS_SYNC, return_value=api_response(Mock(data=[_api_order("o1", "iron_ore", 8, 3)]))),
+            patch("artifactsmmo_cli.commands.trade.get_ge_history_grandexchange_history_code_get.sync",
+                  return_value=api_response(Mock(data=[]))),
+        ):
+            result = runner.invoke(app, ["analyze", "iron_ore"])
+        assert result.exit_code == 0
+        assert "local samples" not in result.stdout
+
+    def test_analyze_reports_local_price_trend(self, runner, stub_api, monkeypatch, tmp_path):
+        """The item page `analyze` fetches is recorded first, so the trend
+        ends on the price it just saw — the store is fed between full syncs."""
+        store = _local_store(monkeypatch, tmp_path, stub_api)
+        store.record_book("sell", [_book("s1", "sell", "iron_ore", 12), _book("s9", "sell", "gem", 4)], _NOW)
+        store.record_book("buy", [_book("b1", "buy", "iron_ore", 5)], _NOW)
+        page = [_api_order("s2", "iron_ore", 8, 3), _api_order("b2", "iron_ore", 6, type_=GEOrderType.BUY)]
+        with (
+            patch(_GE_ORDERS_SYNC, return_value=api_response(Mock(data=page))),
+            patch("artifactsmmo_cli.commands.trade.get_ge_history_grandexchange_history_code_get.sync",
+                  return_value=api_response(Mock(data=[]))),
+        ):
+            result = runner.invoke(app, ["analyze", "iron_ore"])
+        assert result.exit_code == 0
+        assert "Best sell 12g → 8g over 2 local samples" in result.stdout
+        assert [o.id for o in store.book("sell")] == ["s9", "s2"]
+        assert [o.id for o in store.book("buy")] == ["b2"]
+
+    def test_analyze_does_not_record_a_possibly_partial_page(self, runner, stub_api, monkeypatch, tmp_path):
+        store = _local_store(monkeypatch, tmp_path, stub_api)
+        store.record_book("sell", [_book("s1", "sell", "iron_ore", 12)], _NOW)
+        page = [_api_order(f"o{i}", "iron_ore", 8) for i in range(100)]
+        with (
+            patch(_GE_ORDERS_SYNC, return_value=api_response(Mock(data=page))),
+            patch("artifactsmmo_cli.commands.trade.get_ge_history_grandexchange_history_code_get.sync",
+                  return_value=api_response(Mock(data=[]))),
+        ):
+            result = runner.invoke(app, ["analyze", "iron_ore"])
+        assert result.exit_code == 0
+        assert [o.id for o in store.book("sell")] == ["s1"]
+
+    def test_analyze_survives_a_store_that_cannot_record(self, runner, stub_api, monkeypatch, tmp_path):
+        import sqlite3
+
+        _local_store(monkeypatch, tmp_path, stub_api)
+        with (
+            patch.object(GeMarketStore, "record_book", side_effect=sqlite3.OperationalError("database is locked")),
+            patch(_GE_ORDERS_SYNC, return_value=api_response(Mock(data=[_api_order("o1", "iron_ore", 8)]))),
+            patch("artifactsmmo_cli.commands.trade.get_ge_history_grandexchange_history_code_get.sync",
+                  return_value=api_response(Mock(data=[]))),
+        ):
+            result = runner.invoke(app, ["analyze", "iron_ore"])
+        assert result.exit_code == 0
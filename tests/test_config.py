@@ -35,6 +35,15 @@ def test_config_from_environment(monkeypatch):
     assert config.token == "env-token-456"
 
 
+def test_config_api_url_from_environment(monkeypatch):
+    """ARTIFACTSMMO_API_URL overrides the base URL (e.g. the offline stand-in)."""
+    monkeypatch.setenv("ARTIFACTSMMO_TOKEN", "env-token-456")
+    monkeypatch.setenv("ARTIFACTSMMO_API_URL", "http://127.0.0.1:8765")
+    assert Config.from_token_file(Path("nonexistent")).api_base_url == "http://127.0.0.1:8765"
+    monkeypatch.setenv("ARTIFACTSMMO_API_URL", "")
+    assert Config.from_token_file(Path("nonexistent")).api_base_url == "https://api.artifactsmmo.com"
+
+
 def test_config_no_token_raises_error(monkeypatch):
     """Test that missing token raises ValueError."""
     # Clear the env fallback so the no-token path fires regardless of
@@ -1,6 +1,8 @@
 """Tests for main CLI entry point."""
 
 import runpy
+import subprocess
+import sys
 import tempfile
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -189,6 +191,30 @@ def test_main_module_import():
     assert hasattr(artifactsmmo_cli.main, "app")
 
 
+def test_a_command_module_is_imported_only_when_dispatched():
+    """A fresh interpreter, because this process has imported them all."""
+    probe = (
+        "import sys\n"
+        "from artifactsmmo_cli.main import app\n"
+        "assert 'artifactsmmo_cli.commands.stats' not in sys.modules\n"
+        "try:\n"
+        "    app(['stats', '--help'])\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "assert 'artifactsmmo_cli.commands.stats' in sys.modules\n"
+        "assert 'artifactsmmo_cli.commands.play' not in sys.modules\n"
+        "assert 'artifactsmmo_cli.ai.player' not in sys.modules\n"
+    )
+    result = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, timeout=60)
+    assert result.returncode == 0, result.stderr
+
+
+def test_a_lazy_group_keeps_the_name_and_help_it_is_registered_under():
+    result = runner.invoke(app, ["stats", "--help"])
+    assert result.exit_code == 0
+    assert "Inspect AI session traces (traces.jsonl)" in result.output
+
+
 def test_main_module_run_as_script_invokes_app():
     """Running the module as __main__ invokes the Typer app (line 110)."""
     import artifactsmmo_cli.main as main_module
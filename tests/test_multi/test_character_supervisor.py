@@ -1,13 +1,16 @@
 """CharacterSupervisor: one child process, driven by real subprocesses."""
 
 import asyncio
+import io
 import os
 import sys
 
 import pytest
 
+from artifactsmmo_cli.ai.cycle_snapshot import CycleSnapshot
 from artifactsmmo_cli.multi.character_supervisor import CharacterSupervisor
-from artifactsmmo_cli.multi.child_event import ExitEvent, PlanningEvent
+from artifactsmmo_cli.multi.child_event import DeltaEvent, ExitEvent, PlanningEvent, SnapshotEvent
+from artifactsmmo_cli.multi.event_emitter import JsonlEventEmitter
 from artifactsmmo_cli.multi.restart_policy import RestartPolicy
 
 
@@ -134,6 +137,61 @@ async def test_an_unparseable_complete_line_surfaces_as_an_error():
     assert any("protocol" in line for line in supervisor.stderr_tail)
 
 
+def _cycle(cycle_index: int) -> CycleSnapshot:
+    return CycleSnapshot(
+        cycle_index=cycle_index, timestamp="2026-07-30T12:00:00Z", character="hero",
+        x=0, y=0, level=19, xp=cycle_index, max_xp=7200, hp=400, max_hp=475, gold=10,
+        selected_goal="ReachLevel(50)", action="Rest()", outcome="ok",
+        inventory={"iron_ore": cycle_index},
+    )
+
+
+def _emitted(*cycles: int) -> list[str]:
+    """The lines a real emitter writes for these cycles: a keyframe, then deltas."""
+    stream = io.StringIO()
+    emitter = JsonlEventEmitter(character="hero", stream=stream)
+    for cycle in cycles:
+        emitter.snapshot(_cycle(cycle))
+    return stream.getvalue().splitlines()
+
+
+def _writing(*lines: str) -> list[str]:
+    body = "import sys\n"
+    for line in (*lines, ExitEvent(character="hero", reason="normal").model_dump_json()):
+        body += f"sys.stdout.write({line + chr(10)!r})\n"
+    return _child_argv(body + "sys.stdout.flush()\n")
+
+
+@pytest.mark.asyncio
+async def test_deltas_reach_the_callback_as_whole_snapshots():
+    seen = []
+    supervisor = CharacterSupervisor(character="hero", argv=_writing(*_emitted(1, 2, 3)), on_event=seen.append)
+    await _run_with_timeout(supervisor)
+    snapshots = [e for e in seen if isinstance(e, SnapshotEvent)]
+    assert [e.payload for e in snapshots] == [_cycle(1), _cycle(2), _cycle(3)]
+    assert [e.seq for e in snapshots] == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_a_broken_chain_drops_deltas_until_the_next_keyframe():
+    keyframe, second, third = _emitted(1, 2, 3)
+    bad = DeltaEvent(character="hero", seq=2, fields={"mana": 1}).model_dump_json()
+    stale = DeltaEvent(character="hero", seq=2, version=99).model_dump_json()
+    restart = _emitted(4)[0]  # a fresh emitter: a keyframe numbered 1
+    seen = []
+    supervisor = CharacterSupervisor(
+        character="hero", argv=_writing(third, keyframe, bad, second, keyframe, stale, restart), on_event=seen.append)
+    await _run_with_timeout(supervisor)
+    assert [e.payload.cycle_index for e in seen if isinstance(e, SnapshotEvent)] == [1, 1, 4]
+    errors = [line for line in supervisor.stderr_tail if line.startswith("protocol error")]
+    assert errors == [
+        "protocol error: delta 3 without its base snapshot",
+        "protocol error: delta 2 does not apply (no CycleSnapshot field 'mana')",
+        "protocol error: delta 2 without its base snapshot",
+        "protocol error: delta 2 is version 99, expected 1",
+    ]
+
+
 # --- Finding 1: the child must always be reaped, not merely un-watched -----
 
 
@@ -5,6 +5,9 @@ from pydantic import ValidationError
 
 from artifactsmmo_cli.ai.cycle_snapshot import CycleSnapshot
 from artifactsmmo_cli.multi.child_event import (
+    DELTA_VERSION,
+    DeltaEvent,
+    EntryDelta,
     ExitEvent,
     PlanningEvent,
     SnapshotEvent,
@@ -28,6 +31,14 @@ def test_snapshot_event_round_trips():
     assert parsed.payload.character == "hero"
 
 
+def test_delta_event_round_trips():
+    event = DeltaEvent(character="hero", seq=8, fields={"hp": 390},
+                       entries={"inventory": EntryDelta(changed={"iron_ore": 4}, removed=["ash_wood"])})
+    parsed = parse_child_event(event.model_dump_json())
+    assert parsed == event
+    assert parsed.version == DELTA_VERSION
+
+
 def test_planning_event_round_trips():
     parsed = parse_child_event(PlanningEvent(character="hero", active=True).model_dump_json())
     assert isinstance(parsed, PlanningEvent)
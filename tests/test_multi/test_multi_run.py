@@ -72,6 +72,26 @@ def test_child_argv_propagates_the_run_flags():
     assert "/tmp/l.db" in argv
 
 
+def test_child_argv_propagates_the_slow_cycle_threshold_only_when_set():
+    budget = split_budget(parse_rate_limits(_RATES), children=1)
+    argv = _run(profile_slow_cycles=2.5).child_argv("a", budget)
+    assert argv[argv.index("--profile-slow-cycles") + 1] == "2.5"
+    assert "--profile-slow-cycles" not in _run().child_argv("a", budget)
+
+
+def test_child_argv_propagates_the_state_sample_rate_only_when_set():
+    budget = split_budget(parse_rate_limits(_RATES), children=1)
+    argv = _run(record_states=10).child_argv("a", budget)
+    assert argv[argv.index("--record-states") + 1] == "10"
+    assert "--record-states" not in _run().child_argv("a", budget)
+
+
+def test_child_argv_propagates_no_memo_stats_only_when_off():
+    budget = split_budget(parse_rate_limits(_RATES), children=1)
+    assert "--no-memo-stats" in _run(memo_stats=False).child_argv("a", budget)
+    assert "--no-memo-stats" not in _run().child_argv("a", budget)
+
+
 def test_child_argv_never_passes_tui_to_a_child():
     """Only the parent renders; a child TUI would fight for the terminal."""
     budget = split_budget(parse_rate_limits(_RATES), children=1)
@@ -243,7 +263,7 @@ def test_on_event_forwards_a_snapshot_to_the_attached_app():
     mrun._app = mock_app
     event = SnapshotEvent(character="a", payload=_snap())
     mrun._on_event(event)
-    mock_app.update_snapshot.assert_called_once_with(event.payload)
+    mock_app.queue_snapshot.assert_called_once_with(event.payload)
 
 
 def test_on_event_is_a_noop_with_no_app_attached():
@@ -258,7 +278,7 @@ def test_on_event_ignores_non_snapshot_events():
     mock_app = Mock()
     mrun._app = mock_app
     mrun._on_event(PlanningEvent(character="a", active=True))
-    mock_app.update_snapshot.assert_not_called()
+    mock_app.queue_snapshot.assert_not_called()
 
 
 def test_on_event_forwards_planning_for_the_focused_character():
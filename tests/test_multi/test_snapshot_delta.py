@@ -0,0 +1,94 @@
+"""snapshot_delta: the keyframe + delta encoding of the snapshot stream."""
+
+import io
+
+import pytest
+from pydantic import ValidationError
+
+from artifactsmmo_cli.ai.cycle_snapshot import CycleSnapshot, GoalAttempt, PlanTreeNode
+from artifactsmmo_cli.multi import event_emitter
+from artifactsmmo_cli.multi.child_event import DeltaEvent, EntryDelta, SnapshotEvent, parse_child_event
+from artifactsmmo_cli.multi.event_emitter import JsonlEventEmitter
+from artifactsmmo_cli.multi.snapshot_delta import apply_delta, diff
+
+_TREE = (PlanTreeNode(key="k", label="Obtain iron_sword", kind="obtain", status="unmet",
+                      children=(PlanTreeNode(key="c", label="Gather iron_ore", kind="obtain", status="current"),)),)
+
+
+def _snap(cycle_index: int = 1, **overrides) -> CycleSnapshot:
+    fields = dict(
+        cycle_index=cycle_index, timestamp="2026-07-30T12:00:00Z", character="hero",
+        x=0, y=0, level=19, xp=100, max_xp=7200, hp=400, max_hp=475, gold=10,
+        selected_goal="ReachLevel(50)", action="Gather(iron_rocks)", outcome="ok",
+        inventory={"iron_ore": 3, "copper_ore": 9}, equipment={"weapon_slot": "iron_sword", "shield_slot": None},
+        bank_items={f"item_{i}": i for i in range(200)}, plan_tree=_TREE,
+    )
+    fields.update(overrides)
+    return CycleSnapshot(**fields)
+
+
+def _delta(before: CycleSnapshot, after: CycleSnapshot) -> DeltaEvent:
+    fields, entries = diff(before.model_dump(mode="json"), after.model_dump(mode="json"))
+    return DeltaEvent(character="hero", seq=2, fields=fields, entries=entries)
+
+
+def test_an_unchanged_snapshot_is_an_empty_delta():
+    delta = _delta(_snap(), _snap())
+    assert (delta.fields, delta.entries) == ({}, {})
+
+
+def test_a_mapping_field_travels_entry_by_entry():
+    before = _snap()
+    after = _snap(inventory={"iron_ore": 4, "ash_wood": 1},
+                  equipment={"weapon_slot": "iron_sword", "shield_slot": None, "ring1_slot": None})
+    delta = _delta(before, after)
+    assert delta.entries == {
+        "inventory": EntryDelta(changed={"iron_ore": 4, "ash_wood": 1}, removed=["copper_ore"]),
+        "equipment": EntryDelta(changed={"ring1_slot": None}),
+    }
+    assert apply_delta(before, delta) == after
+
+
+def test_every_other_field_travels_whole_and_is_rebuilt_as_its_model():
+    before = _snap()
+    after = _snap(cycle_index=2, hp=380, goals_tried=[GoalAttempt(goal="G", nodes=40)],
+                  plan_tree=(PlanTreeNode(key="k2", label="Fight chicken", kind="step", status="current"),))
+    delta = _delta(before, after)
+    assert set(delta.fields) == {"cycle_index", "hp", "goals_tried", "plan_tree"}
+    rebuilt = apply_delta(before, delta)
+    assert rebuilt == after
+    assert isinstance(rebuilt.plan_tree[0], PlanTreeNode)
+
+
+def test_a_mapping_field_that_was_none_travels_whole():
+    before = _snap(bank_items=None)
+    after = _snap(bank_items={"iron_ore": 5})
+    delta = _delta(before, after)
+    assert delta.fields == {"bank_items": {"iron_ore": 5}}
+    assert apply_delta(before, delta) == after
+    assert apply_delta(after, _delta(after, before)).bank_items is None
+
+
+def test_a_field_the_snapshot_lacks_is_refused():
+    with pytest.raises(ValueError, match="no CycleSnapshot field 'mana'"):
+        apply_delta(_snap(), DeltaEvent(character="hero", seq=2, fields={"mana": 3}))
+
+
+def test_a_value_that_does_not_validate_is_refused():
+    with pytest.raises(ValidationError):
+        apply_delta(_snap(), DeltaEvent(character="hero", seq=2, entries={
+            "inventory": EntryDelta(changed={"iron_ore": "lots"})}))
+
+
+def test_the_emitter_sends_a_keyframe_then_deltas_then_a_keyframe(monkeypatch):
+    monkeypatch.setattr(event_emitter, "KEYFRAME_INTERVAL", 3)
+    stream = io.StringIO()
+    emitter = JsonlEventEmitter(character="hero", stream=stream)
+    for cycle in range(1, 5):
+        emitter.snapshot(_snap(cycle, hp=400 - cycle))
+    lines = stream.getvalue().splitlines()
+    events = [parse_child_event(line) for line in lines]
+    assert [(type(e), e.seq) for e in events] == [  # type: ignore[union-attr]
+        (SnapshotEvent, 1), (DeltaEvent, 2), (DeltaEvent, 3), (SnapshotEvent, 4)]
+    assert events[1].fields == {"cycle_index": 2, "hp": 398}  # type: ignore[union-attr]
+    assert len(lines[1]) * 20 < len(lines[0])
@@ -0,0 +1,64 @@
+"""Tests for scripts/import_budget.py — the gate that keeps command modules
+out of the CLI entry point's import.
+
+The live case is the budget itself: it imports `artifactsmmo_cli.main` in a
+fresh interpreter, so a command module made eager again fails here.
+"""
+
+import pytest
+
+from scripts import import_budget as ib
+
+SAMPLE = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:      2500 |       9000 |     artifactsmmo_cli.config
+some unrelated stderr line
+import time:      3000 |      12000 | artifactsmmo_cli.main
+"""
+
+
+def _lines(*modules: str) -> list[ib.ImportLine]:
+    return [ib.ImportLine(module, 10, 10) for module in modules] + [ib.ImportLine(ib.ENTRY_POINT, 10, 250_000)]
+
+
+def test_parse_importtime_skips_the_header_and_foreign_lines():
+    assert ib.parse_importtime(SAMPLE) == [
+        ib.ImportLine("_io", 120, 120),
+        ib.ImportLine("artifactsmmo_cli.config", 2500, 9000),
+        ib.ImportLine("artifactsmmo_cli.main", 3000, 12000),
+    ]
+    assert ib.total_ms(ib.parse_importtime(SAMPLE)) == 12.0
+
+
+def test_the_entry_point_holds_its_budget():
+    lines = ib.measure()
+    assert ib.violations(lines) == []
+
+
+def test_a_command_module_at_startup_is_a_violation():
+    assert ib.violations(_lines("artifactsmmo_cli.ai.constants", "artifactsmmo_cli.commands.play",
+                                "textual.app")) == [
+        "artifactsmmo_cli.commands.play imported at startup",
+        "textual.app imported at startup",
+    ]
+
+
+def test_too_many_modules_is_a_violation(monkeypatch):
+    monkeypatch.setattr(ib, "MODULE_BUDGET", 2)
+    assert ib.violations(_lines("a", "b")) == ["3 modules imported, budget 2"]
+
+
+def test_max_ms_gates_the_time_only_when_given():
+    assert ib.violations(_lines(), max_ms=None) == []
+    assert ib.violations(_lines(), max_ms=300) == []
+    assert ib.violations(_lines(), max_ms=200) == ["250 ms to import artifactsmmo_cli.main, budget 200 ms"]
+
+
+@pytest.mark.parametrize(("modules", "code"), [((), 0), (("sqlmodel",), 1)])
+def test_main_reports_and_exits_by_the_budget(monkeypatch, capsys, modules, code):
+    monkeypatch.setattr(ib, "measure", lambda: _lines(*modules))
+    assert ib.main(["--top", "1"]) == code
+    out = capsys.readouterr().out
+    assert f"artifactsmmo_cli.main: {len(modules) + 1} modules (budget {ib.MODULE_BUDGET}), 250 ms" in out
+    assert ("OVER BUDGET: sqlmodel imported at startup" in out) is bool(modules)
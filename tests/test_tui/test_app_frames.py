@@ -0,0 +1,114 @@
+"""WatchApp frames: queued snapshots are applied together, once per frame, and
+panes whose inputs did not change are not repainted."""
+
+import pytest
+
+from artifactsmmo_cli.ai.cycle_snapshot import CycleSnapshot
+from artifactsmmo_cli.ai.game_data import GameData
+from artifactsmmo_cli.multi.child_state import ChildState
+from artifactsmmo_cli.tui.app import FRAME_SECONDS, WatchApp
+from artifactsmmo_cli.tui.widgets.inventory_pane import InventoryPane
+from artifactsmmo_cli.tui.widgets.log_pane import LogPane
+from artifactsmmo_cli.tui.widgets.map_pane import MapPane
+from artifactsmmo_cli.tui.widgets.status_pane import StatusPane
+
+
+def _snap(character: str, cycle: int = 1, **overrides) -> CycleSnapshot:
+    base = dict(
+        cycle_index=cycle, timestamp="2026-07-30T12:00:00Z", character=character,
+        x=0, y=0, level=1, xp=0, max_xp=150, hp=120, max_hp=120, gold=0,
+        selected_goal="ReachLevel(50)", action="Rest()", outcome="ok",
+    )
+    base.update(overrides)
+    return CycleSnapshot(**base)
+
+
+def _app(names=("alice", "bob", "carol")) -> WatchApp:
+    return WatchApp(characters=list(names), game_data=GameData())
+
+
+def _count_calls(monkeypatch, cls, method: str) -> list[object]:
+    """Record each call to `cls.method` and still run it."""
+    calls: list[object] = []
+    original = getattr(cls, method)
+
+    def _recording(self, arg):
+        calls.append(arg)
+        return original(self, arg)
+
+    monkeypatch.setattr(cls, method, _recording)
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_a_queued_burst_waits_for_the_frame_and_lands_in_one_repaint(monkeypatch):
+    map_updates = _count_calls(monkeypatch, MapPane, "update_snapshot")
+    app = _app()
+    async with app.run_test() as pilot:
+        for cycle in (1, 2, 3):
+            app.queue_snapshot(_snap("alice", cycle=cycle, x=cycle))
+        app.queue_snapshot(_snap("bob", x=5, y=5))
+        assert app.query_one("#status", StatusPane).snapshot is None
+        await pilot.pause(FRAME_SECONDS * 3)
+        # The state panes jump to the latest cycle, drawn once.
+        assert [snap.cycle_index for snap in map_updates] == [3]
+        assert app.query_one("#status", StatusPane).snapshot.cycle_index == 3
+        # Every cycle is still recorded, and the log is given every one.
+        assert [snap.cycle_index for snap in app._store.recent("alice")] == [1, 2, 3]
+        assert len(app.query_one("#log", LogPane).lines) == 3
+        assert (5, 5, "overworld") in app.query_one("#map", MapPane)._others
+
+
+@pytest.mark.asyncio
+async def test_an_unchanged_inventory_is_not_repainted(monkeypatch):
+    inventory_updates = _count_calls(monkeypatch, InventoryPane, "update_snapshot")
+    app = _app()
+    async with app.run_test():
+        app.update_snapshot(_snap("alice", cycle=1, inventory={"copper_ore": 3}))
+        app.update_snapshot(_snap("alice", cycle=2, inventory={"copper_ore": 3}, gold=10))
+        assert [snap.cycle_index for snap in inventory_updates] == [1]
+        app.update_snapshot(_snap("alice", cycle=3, inventory={"copper_ore": 4}))
+        assert [snap.cycle_index for snap in inventory_updates] == [1, 3]
+
+
+@pytest.mark.asyncio
+async def test_a_sibling_that_did_not_move_does_not_repaint_the_map(monkeypatch):
+    placements = _count_calls(monkeypatch, MapPane, "set_others")
+    app = _app()
+    async with app.run_test():
+        app.update_snapshot(_snap("bob", cycle=1, x=2))
+        app.update_snapshot(_snap("bob", cycle=2, x=2, gold=50))
+        assert len(placements) == 1
+        app.update_snapshot(_snap("bob", cycle=3, x=3))
+        assert len(placements) == 2
+
+
+@pytest.mark.asyncio
+async def test_an_unchanged_roster_is_not_redrawn(monkeypatch):
+    rosters = _count_calls(monkeypatch, MapPane, "set_roster")
+    app = _app()
+    async with app.run_test():
+        dead = ChildState(character="bob", alive=False, restarts=1, last_reason="crash", stderr_tail=())
+        app.update_child_state(dead)
+        app.update_child_state(dead)  # the 1 s poll, nothing new
+        assert len(rosters) == 1
+        app.update_child_state(ChildState(character="bob", alive=True, restarts=1, last_reason=None, stderr_tail=()))
+        assert len(rosters) == 2
+
+
+def test_a_snapshot_queued_before_mount_is_dropped():
+    app = _app()
+    app.queue_snapshot(_snap("alice"))
+    assert app._pending == []
+    assert app._frame_timer is None
+
+
+@pytest.mark.asyncio
+async def test_a_frame_flushed_after_teardown_draws_nothing():
+    app = _app()
+    async with app.run_test():
+        pass
+    app._pending = [_snap("alice")]  # a frame still due when the app exited
+    app._flush_frame()
+    assert app._store.last("alice") is None
+    assert app._pending == []
@@ -46,3 +46,19 @@ def test_max_steps_one_long_line_returns_only_end():
 def test_max_steps_below_one_raises():
     with pytest.raises(ValueError, match="max_steps"):
         glide_path((0, 0), (3, 0), 0)
+
+
+def test_route_replaces_the_straight_line():
+    route = [(1, 1), (1, 0), (2, 0), (3, 0), (3, 1), (3, 2)]
+    assert glide_path((1, 2), (3, 2), 12, route) == route
+
+
+def test_route_is_sampled_to_max_steps():
+    route = [(x, 0) for x in range(1, 41)]
+    g = glide_path((0, 0), (40, 0), 12, route)
+    assert len(g) == 12
+    assert g[-1] == (40, 0)
+
+
+def test_route_not_ending_at_end_is_ignored():
+    assert glide_path((0, 0), (3, 0), 12, [(0, 1)]) == [(1, 0), (2, 0), (3, 0)]